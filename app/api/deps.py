@@ -1,6 +1,7 @@
 """Shared dependencies for API endpoints."""
 
 import asyncio
+from collections.abc import AsyncGenerator
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
@@ -10,7 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import get_settings
 from app.core.constants import ADMIN, FREE_USER, PRO_USER, SUPER_ADMIN, UNLIMITED_CREDITS_ROLES
 from app.core.security import decode_token
-from app.db.session import get_db
+from app.db.session import AdminSessionLocal, get_db, read_session
 from app.models.user import User
 from app.repositories.user import UserProfileRepository, UserRepository
 from app.utils.logger import get_logger
@@ -67,6 +68,8 @@ async def get_current_user_optional(
     if not user_id:
         return None
     
+    session.info["user_id"] = user_id
+    
     # Get user from database
     user_repo = UserRepository()
     try:
@@ -164,6 +167,9 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Lets get_db pin this user's reads to the primary after they write
+    session.info["user_id"] = user_id
+    
     # Get user from database (with multi-tier caching optimization)
     user = None
     
@@ -222,6 +228,33 @@ async def get_current_user(
     return user
 
 
+async def get_read_db(
+    current_user: User = Depends(get_current_user),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency that provides a read-only async database session.
+
+    Uses the read replica when DATABASE_REPLICA_URL is configured, its lag is
+    within REPLICA_MAX_LAG_SECONDS and the current user has not written within
+    READ_YOUR_WRITES_WINDOW_SECONDS; otherwise the primary. Nothing is committed.
+    """
+    async with read_session(current_user.uuid) as session:
+        yield session
+
+
+async def get_admin_read_db(
+    current_user: User = Depends(get_current_user),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Read-only session for admin reporting endpoints.
+
+    Like get_read_db, but reads that stay on the primary use the admin pool
+    (longer statement timeout, separate connections) instead of the request pool.
+    """
+    async with read_session(current_user.uuid, primary_factory=AdminSessionLocal) as session:
+        yield session
+
+
 async def get_current_active_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
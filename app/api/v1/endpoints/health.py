@@ -6,9 +6,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import get_current_user, get_current_super_admin
 from app.clients.connectra_client import ConnectraClient
 from app.core.config import get_settings
-from app.db.session import check_pool_health, get_db
+from app.db.session import check_database_health, get_db, get_replica_status
 from app.middleware.vql_monitoring import VQLMonitoringMiddleware
 from app.models.user import User
+from app.repositories.token_blacklist import get_token_blacklist_filter_stats
+from app.services.activity_sink import get_activity_sink_stats
+from app.services.hedged_verifier import get_hedging_stats
+from app.services.icypeas_service import get_icypeas_poller
+from app.utils.adaptive_limiter import get_provider_limiter_stats
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -131,8 +136,14 @@ async def get_performance_stats(
             "threshold_ms": 1000,
             "count_last_hour": 0,  # TODO: Implement counter tracking
         },
-        "database": check_pool_health(),
+        "database": check_database_health(),
+        "read_replica": get_replica_status(),
         "s3": s3_status,
         "endpoint_performance": perf_stats,
+        "provider_concurrency": get_provider_limiter_stats(),
+        "icypeas_poller": get_icypeas_poller().get_stats(),
+        "email_hedging": get_hedging_stats(),
+        "activity_sink": get_activity_sink_stats(),
+        "token_blacklist_filter": get_token_blacklist_filter_stats(),
     }
 
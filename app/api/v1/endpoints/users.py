@@ -8,7 +8,7 @@ from pydantic import ValidationError
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_active_user, get_current_super_admin
+from app.api.deps import get_admin_read_db, get_current_active_user, get_current_super_admin
 from app.core.constants import VALID_ROLES
 from app.db.session import get_db
 from app.models.user import User, UserProfile
@@ -285,7 +285,7 @@ async def list_all_users(
     offset: int = Query(0, ge=0, description="Number of users to skip"),
     filters: UserFilterParams = Depends(resolve_user_filters),
     current_user: User = Depends(get_current_super_admin),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_admin_read_db),
 ) -> UserListResponse:
     """
     List all users (Super Admin only).
@@ -504,7 +504,7 @@ async def delete_user(
 async def get_user_stats(
     filters: UserFilterParams = Depends(resolve_user_filters),
     current_user: User = Depends(get_current_active_user),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_admin_read_db),
 ) -> UserStatsResponse:
     """
     Get user statistics (Admin/Super Admin only).
@@ -572,7 +572,7 @@ async def get_user_history(
     offset: int = Query(0, ge=0, description="Number of records to skip"),
     filters: UserFilterParams = Depends(resolve_user_filters),
     current_user: User = Depends(get_current_super_admin),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_admin_read_db),
 ) -> UserHistoryListResponse:
     """
     Get user history records (Super Admin only).
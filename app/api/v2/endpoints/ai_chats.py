@@ -5,7 +5,7 @@ from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_read_db
 from app.db.session import get_db
 from app.middleware.rate_limit import rate_limit_by_user
 from app.models.user import User
@@ -49,7 +49,7 @@ async def list_chats(
         description="Order by field. Prepend '-' for descending. Valid: created_at, updated_at, -created_at, -updated_at"
     ),
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> PaginatedAIChatResponse:
     """
     Get a list of all AI chat conversations for the current user with pagination.
@@ -6,8 +6,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
-from app.db.session import get_db
+from app.api.deps import get_current_user, get_read_db
 from app.models.user import ActivityActionType, ActivityServiceType, ActivityStatus, User
 from app.repositories.user import UserActivityRepository
 from app.schemas.user import ActivityStatsResponse, UserActivityItem, UserActivityListResponse
@@ -28,7 +27,7 @@ async def list_activities(
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     offset: int = Query(0, ge=0, description="Number of records to skip"),
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> UserActivityListResponse:
     """
     Get the current user's activity history.
@@ -126,7 +125,7 @@ async def get_activity_stats(
     start_date: Optional[datetime] = Query(None, description="Filter by start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="Filter by end date (ISO format)"),
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> ActivityStatsResponse:
     """
     Get activity statistics for the current user.
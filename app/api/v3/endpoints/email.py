@@ -1,26 +1,35 @@
 """Email finder API endpoints."""
 
 import asyncio
+import csv
+import io
 import json
+import shutil
+import tempfile
 from datetime import timedelta
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
 from fastapi import (
     APIRouter,
     BackgroundTasks,
     Depends,
+    File,
+    Form,
     HTTPException,
     Path,
     Query,
     Request,
     Response,
+    UploadFile,
     status,
 )
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
 from app.core.config import get_settings
-from app.db.session import get_db
+from app.db.session import AsyncSessionLocal, get_db
 from app.models.exports import ExportStatus, ExportType
 from app.models.user import ActivityServiceType, ActivityStatus, User
 from app.repositories.user import UserActivityRepository, UserProfileRepository
@@ -33,6 +42,7 @@ from app.schemas.email import (
     EmailVerifierRequest,
     EmailVerifierResponse,
     SimpleEmailFinderResponse,
+    SimpleEmailResult,
     SingleEmailRequest,
     SingleEmailResponse,
     SingleEmailVerifierFindResponse,
@@ -44,16 +54,24 @@ from app.schemas.exports import EmailExportResponse
 from app.services.activity_service import ActivityService
 from app.services.bulkmailverifier_service import BulkMailVerifierService
 from app.services.credit_service import CreditService
+from app.services.email_finder_cache import EmailFinderCache
 from app.services.email_finder_service import EmailFinderService
+from app.services.email_pattern_service import EmailPatternService
+from app.services.email_verification_store import EmailVerificationStore
+from app.services.export_admission_service import ExportAdmissionService
 from app.services.export_service import ExportService
+from app.services.hedged_verifier import build_single_email_verifier
 from app.services.icypeas_service import IcyPeasService
 from app.services.truelist_service import TruelistService
 from app.tasks.export_tasks import process_email_export
 from app.utils.background_tasks import add_background_task_safe
 from app.utils.catchall_handler import handle_catchall_email
 from app.utils.domain import extract_domain_from_url
+from app.utils.domain_verdicts import is_catchall_domain
 from app.utils.email_generator import generate_email_combinations
+from app.utils.email_precheck import precheck_emails
 from app.utils.logger import get_logger, log_error, log_api_error
+from app.utils.normalization import dedupe_emails
 from app.utils.signed_url import generate_signed_url
 
 settings = get_settings()
@@ -62,13 +80,18 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/email", tags=["Email"])
 service = EmailFinderService()
 export_service = ExportService()
+admission_service = ExportAdmissionService()
 activity_service = ActivityService()
 credit_service = CreditService()
+verification_store = EmailVerificationStore()
+pattern_service = EmailPatternService()
+finder_cache = EmailFinderCache()
 profile_repo = UserProfileRepository()
 activity_repo = UserActivityRepository()
 @router.get("/finder/", response_model=SimpleEmailFinderResponse)
 async def find_emails(
     http_request: Request,
+    background_tasks: BackgroundTasks,
     first_name: str = Query(..., description="Contact first name (case-insensitive partial match)"),
     last_name: str = Query(..., description="Contact last name (case-insensitive partial match)"),
     domain: Optional[str] = Query(None, description="Company domain or website URL (can use website parameter instead)"),
@@ -113,13 +136,42 @@ async def find_emails(
         }
     )
     try:
-        result = await service.find_emails(
-            session=session,
-            first_name=first_name,
-            last_name=last_name,
-            domain=domain,
-            website=website,
-        )
+        # A single contact found by a previous search is served from the finder cache
+        cache_domain = extract_domain_from_url(domain or website or "")
+        cached = None
+        if cache_domain:
+            cached = await finder_cache.lookup(
+                first_name=first_name,
+                last_name=last_name,
+                domain=cache_domain,
+                user_id=current_user.uuid,
+            )
+        if cached and cached.get("contact_uuid"):
+            result = SimpleEmailFinderResponse(
+                emails=[SimpleEmailResult(uuid=cached["contact_uuid"], email=cached["email"])],
+                total=1,
+            )
+        else:
+            result = await service.find_emails(
+                session=session,
+                first_name=first_name,
+                last_name=last_name,
+                domain=domain,
+                website=website,
+            )
+            # Only unambiguous matches are cached so a hit returns exactly what the search would
+            if cache_domain and result.total == 1 and result.emails:
+                add_background_task_safe(
+                    background_tasks,
+                    finder_cache.store,
+                    first_name=first_name,
+                    last_name=last_name,
+                    domain=cache_domain,
+                    email=result.emails[0].email,
+                    source="finder",
+                    user_id=current_user.uuid,
+                    contact_uuid=result.emails[0].uuid,
+                )
         logger.debug(
             "Email finder service call completed",
             extra={
@@ -154,7 +206,11 @@ async def find_emails(
                 user_role = profile.role or "FreeUser"
                 if credit_service.should_deduct_credits(user_role):
                     new_balance = await credit_service.deduct_credits(
-                        session, current_user.uuid, amount=1
+                        session,
+                        current_user.uuid,
+                        amount=1,
+                        reason="email_finder",
+                        allow_overdraft=True,
                     )
         except Exception as credit_exc:
             credit_error_msg = str(credit_exc)
@@ -238,6 +294,18 @@ async def _verify_email_batch(
     valid_emails = []
     batches_processed = 0
     
+    # Serve known results from the shared store and only upload the rest
+    stored = await verification_store.lookup_many(emails)
+    stored_valid = [
+        email for email, entry in stored.items()
+        if entry["status"] == EmailVerificationStatus.VALID.value
+    ]
+    if stored_valid:
+        return stored_valid, batches_processed
+    emails = [email for email in emails if email.lower().strip() not in stored]
+    if not emails:
+        return valid_emails, batches_processed
+    
     try:
         # Upload file
         try:
@@ -303,6 +371,10 @@ async def _verify_email_batch(
             valid_email_file_url = results.get("valid_email_file")
             if valid_email_file_url:
                 valid_emails = await service.download_valid_emails(valid_email_file_url)
+                await verification_store.store_many(
+                    {email: EmailVerificationStatus.VALID.value for email in valid_emails},
+                    provider="bulkmailverifier",
+                )
             
             batches_processed = 1
             
@@ -415,12 +487,13 @@ async def start_email_verification(
             or (use_truelist and settings.TRUELIST_API_KEY)
         )
         
-        # Generate all unique email patterns once
+        # Generate all unique email patterns once, trying the domain's known formats first
         all_unique_emails = generate_email_combinations(
             first_name=first_name,
             last_name=last_name,
             domain=extracted_domain,
             count=email_count,
+            pattern_weights=await pattern_service.get_domain_weights(extracted_domain),
         )
         total_unique_patterns = len(all_unique_emails)
         
@@ -453,6 +526,13 @@ async def start_email_verification(
         first_email = None
         first_email_status = None
         
+        # Known catch-all domain: every candidate would verify as CATCHALL, so report
+        # the top-ranked candidate without spending verification credits
+        if is_catchall_domain(extracted_domain) and all_unique_emails:
+            first_email = all_unique_emails[0]
+            first_email_status = EmailVerificationStatus.CATCHALL
+            total_batches = 0
+        
         # Process all unique patterns in batches
         for batch_number in range(1, total_batches + 1):
             # Calculate batch slice
@@ -476,7 +556,6 @@ async def start_email_verification(
                     email_status_map = await _verify_emails_batch_direct(
                         emails=batch_emails,
                         service=service,
-                        batch_size=20,  # Process 20 emails concurrently per batch
                     )
                 
                 # Track first email found with valid, catchall, or risky status
@@ -526,6 +605,15 @@ async def start_email_verification(
             if first_email is not None:
                 break
         
+        # Learn the domain's format from the confirmed address
+        if first_email and first_email_status == EmailVerificationStatus.VALID:
+            await pattern_service.record_valid_email(
+                email=first_email,
+                first_name=first_name,
+                last_name=last_name,
+                domain=extracted_domain,
+            )
+        
         # Prepare response
         # If first_email is CATCHALL and provider is Truelist, try IcyPeas fallback
         icypeas_certainty: Optional[str] = None
@@ -765,19 +853,40 @@ async def start_single_email_verification(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Unsupported provider: {provider}",
             )
+        # Slow single checks are hedged to the other provider when enabled
+        service = build_single_email_verifier(provider.value, service)
         
-        # Generate all unique email patterns once at the start
+        # Generate all unique email patterns once at the start, known formats first
         all_unique_emails = generate_email_combinations(
             first_name=first_name,
             last_name=last_name,
             domain=extracted_domain,
             count=email_count,
+            pattern_weights=await pattern_service.get_domain_weights(extracted_domain),
         )
         total_unique_patterns = len(all_unique_emails)
         
         if total_unique_patterns == 0:
             return SingleEmailVerifierFindResponse(valid_email=None, status=None)
         
+        # Known catch-all domain: skip per-candidate checks and go to the catch-all path
+        if is_catchall_domain(extracted_domain):
+            found_email = all_unique_emails[0]
+            email_status = EmailVerificationStatus.CATCHALL
+            if use_truelist:
+                try:
+                    found_email, email_status, _ = await handle_catchall_email(
+                        first_name=first_name,
+                        last_name=last_name,
+                        domain=extracted_domain,
+                        catchall_email=found_email,
+                        catchall_status=email_status,
+                    )
+                except Exception:
+                    # On any IcyPeas error, keep original catchall
+                    pass
+            return SingleEmailVerifierFindResponse(valid_email=found_email, status=email_status)
+        
         # Calculate number of batches needed
         total_batches = (total_unique_patterns + email_count - 1) // email_count
         
@@ -812,6 +921,14 @@ async def start_single_email_verification(
                 total_emails_checked += emails_checked
                 
                 if found_email:
+                    if email_status == EmailVerificationStatus.VALID:
+                        await pattern_service.record_valid_email(
+                            email=found_email,
+                            first_name=first_name,
+                            last_name=last_name,
+                            domain=extracted_domain,
+                        )
+                    
                     # If Truelist and catchall, try IcyPeas fallback
                     if use_truelist and email_status == EmailVerificationStatus.CATCHALL:
                         try:
@@ -880,15 +997,18 @@ async def start_single_email_verification(
 async def _verify_emails_batch_direct(
     emails: list[str],
     service: BulkMailVerifierService,
-    batch_size: int = 20,
+    batch_size: int = 200,
 ) -> dict[str, EmailVerificationStatus]:
     """
     Verify a list of emails using direct API calls in batches.
     
+    Actual concurrency is bounded by the shared BulkMailVerifier adaptive
+    limiter, so batches only cap how many calls are scheduled at once.
+    
     Args:
         emails: List of email addresses to verify
         service: BulkMailVerifierService instance
-        batch_size: Number of emails to process concurrently per batch
+        batch_size: Number of emails scheduled per batch
         
     Returns:
         Dictionary mapping email address to EmailVerificationStatus
@@ -902,6 +1022,12 @@ async def _verify_emails_batch_direct(
     for email in emails:
         email_status_map[email.lower().strip()] = EmailVerificationStatus.UNKNOWN
     
+    # Undeliverable addresses (bad syntax / no mail host) are invalid without a paid call
+    rejected = await precheck_emails(emails)
+    for email_key in rejected:
+        email_status_map[email_key] = EmailVerificationStatus.INVALID
+    emails = [email for email in emails if email.lower().strip() not in rejected]
+    
     try:
         # Process emails in batches
         total_batches = (len(emails) + batch_size - 1) // batch_size
@@ -943,48 +1069,6 @@ async def _verify_emails_batch_direct(
     return email_status_map
 
 
-async def _get_email_from_activities(
-    session: AsyncSession,
-    user_id: str,
-    first_name: str,
-    last_name: str,
-    domain: str,
-) -> Optional[str]:
-    """
-    Get email from previous successful search in user_activities table.
-    
-    Args:
-        session: Database session
-        user_id: User ID
-        first_name: First name
-        last_name: Last name
-        domain: Domain
-        
-    Returns:
-        Email address if found in previous activity, None otherwise
-    """
-    try:
-        activity = await activity_repo.find_previous_email_search(
-            session=session,
-            user_id=user_id,
-            first_name=first_name,
-            last_name=last_name,
-            domain=domain,
-        )
-        
-        if activity and activity.result_summary:
-            # Extract email from result_summary
-            # Format: {"email": "user@example.com", "source": "verifier", "status": "valid"}
-            email = activity.result_summary.get("email")
-            if email and email.strip():
-                return email.strip()
-        
-        return None
-    except Exception:
-        # If query fails, return None (don't block the main flow)
-        return None
-
-
 def detect_email_column(raw_headers: list[str]) -> Optional[str]:
     """
     Auto-detect email column from CSV headers.
@@ -1201,7 +1285,8 @@ async def _verify_emails_concurrent_until_valid(
         emails: List of email addresses to verify
         service: BulkMailVerifierService instance
         verified_emails_set: Optional set to track verified emails (will be updated in-place)
-        max_concurrent: Maximum number of concurrent verifications (default: 5)
+        max_concurrent: Maximum number of concurrent verifications for this call (default: 5).
+            The shared provider adaptive limiter still bounds concurrency across calls.
         
     Returns:
         Tuple of (email: str | None, status: EmailVerificationStatus | None, emails_checked: int)
@@ -1363,6 +1448,15 @@ async def _verify_emails_with_status(
     for email in emails:
         email_status_map[email.lower().strip()] = EmailVerificationStatus.UNKNOWN
     
+    # Serve known results from the shared store and only upload the rest
+    stored = await verification_store.lookup_many(emails)
+    for email, entry in stored.items():
+        email_status_map[email] = EmailVerificationStatus(entry["status"])
+    emails = [email for email in emails if email.lower().strip() not in stored]
+    if not emails:
+        return email_status_map
+    downloaded: dict[str, str] = {}
+    
     try:
         # Upload file
         try:
@@ -1419,24 +1513,30 @@ async def _verify_emails_with_status(
                 valid_emails = await service.download_valid_emails(valid_email_file_url)
                 for email in valid_emails:
                     email_status_map[email.lower().strip()] = EmailVerificationStatus.VALID
+                    downloaded[email] = EmailVerificationStatus.VALID.value
             
             # Download invalid emails
             if invalid_email_file_url and invalid_email_file_url.strip():
                 invalid_emails = await service.download_invalid_emails(invalid_email_file_url)
                 for email in invalid_emails:
                     email_status_map[email.lower().strip()] = EmailVerificationStatus.INVALID
+                    downloaded[email] = EmailVerificationStatus.INVALID.value
             
             # Download catchall emails
             if catchall_email_file_url and catchall_email_file_url.strip():
                 catchall_emails = await service.download_catchall_emails(catchall_email_file_url)
                 for email in catchall_emails:
                     email_status_map[email.lower().strip()] = EmailVerificationStatus.CATCHALL
+                    downloaded[email] = EmailVerificationStatus.CATCHALL.value
             
             # Download unknown emails
             if unknown_email_file_url and unknown_email_file_url.strip():
                 unknown_emails = await service.download_unknown_emails(unknown_email_file_url)
                 for email in unknown_emails:
                     email_status_map[email.lower().strip()] = EmailVerificationStatus.UNKNOWN
+                    downloaded[email] = EmailVerificationStatus.UNKNOWN.value
+            
+            await verification_store.store_many(downloaded, provider="bulkmailverifier")
             
         finally:
             # Clean up - delete the uploaded file
@@ -1541,6 +1641,12 @@ async def bulk_email_verifier(
                     "original_email": email,
                 })
         
+        # Verify each distinct address once; results fan back out to every row
+        # through email_status_map, which is keyed by the normalized email.
+        emails_to_verify = dedupe_emails(emails_to_verify)
+        unique_emails = dedupe_emails(email_data["email"] for email_data in emails_data)
+        duplicate_count = len(emails_data) - len(unique_emails)
+        
         provider = request.provider
         use_bmv = provider == EmailProvider.BULKMAILVERIFIER
         use_truelist = provider == EmailProvider.TRUELIST
@@ -1564,7 +1670,6 @@ async def bulk_email_verifier(
             email_status_map = await _verify_emails_batch_direct(
                 emails=emails_to_verify,
                 service=service,
-                batch_size=20,  # Process 20 emails concurrently per batch
             )
         elif use_truelist:
             service = TruelistService()
@@ -1719,6 +1824,7 @@ async def bulk_email_verifier(
             invalid_count=invalid_count,
             catchall_count=catchall_count,
             unknown_count=unknown_count,
+            duplicate_count=duplicate_count,
             download_url=download_url,
             export_id=export_id,
             expires_at=expires_at,
@@ -1737,6 +1843,8 @@ async def bulk_email_verifier(
                     "invalid": invalid_count,
                     "catchall": catchall_count,
                     "unknown": unknown_count,
+                    "unique_emails": len(unique_emails),
+                    "duplicates_skipped": duplicate_count,
                 },
                 status=ActivityStatus.SUCCESS,
                 request=http_request,
@@ -1796,6 +1904,241 @@ async def bulk_email_verifier(
         ) from exc
 
 
+def _read_csv_rows(reader: csv.DictReader, limit: int) -> list[dict[str, Any]]:
+    """Read up to limit rows from a CSV reader (blocking; run in a threadpool)."""
+    rows = []
+    for row in reader:
+        rows.append(row)
+        if len(rows) >= limit:
+            break
+    return rows
+
+
+async def _stream_verification_results(
+    reader: csv.DictReader,
+    email_column: str,
+    provider: EmailProvider,
+    service: Any,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Verify CSV rows batch by batch and yield one result per row as soon as it is known.
+
+    Only EMAIL_STREAM_BATCH_ROWS rows are held in memory at a time. Within a batch,
+    distinct emails are split into provider-sized chunks verified concurrently
+    (EMAIL_STREAM_MAX_CONCURRENT_CHUNKS at a time); each chunk's rows are yielded
+    when that chunk completes.
+    """
+    use_truelist = provider == EmailProvider.TRUELIST
+    chunk_size = 51 if use_truelist else 20
+    semaphore = asyncio.Semaphore(max(1, settings.EMAIL_STREAM_MAX_CONCURRENT_CHUNKS))
+
+    async def verify_chunk(chunk: list[str]) -> dict[str, EmailVerificationStatus]:
+        async with semaphore:
+            if use_truelist:
+                truelist_results = await service.verify_emails(chunk)
+                return {
+                    email: EmailVerificationStatus(
+                        truelist_results.get(email, {}).get("mapped_status", EmailVerificationStatus.UNKNOWN)
+                    )
+                    for email in chunk
+                }
+            return await _verify_emails_batch_direct(emails=chunk, service=service)
+
+    row_number = 0
+    while True:
+        rows = await run_in_threadpool(_read_csv_rows, reader, settings.EMAIL_STREAM_BATCH_ROWS)
+        if not rows:
+            break
+
+        rows_by_email: dict[str, list[tuple[int, dict[str, Any]]]] = {}
+        for row in rows:
+            row_number += 1
+            email = (row.get(email_column) or "").strip().lower()
+            if not email:
+                yield {"row": row_number, "email": None, "status": None, "error": "missing email", "raw_row": row}
+                continue
+            rows_by_email.setdefault(email, []).append((row_number, row))
+
+        emails = list(rows_by_email)
+        tasks = [
+            asyncio.create_task(verify_chunk(emails[i : i + chunk_size]))
+            for i in range(0, len(emails), chunk_size)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    status_map = await next_done
+                except Exception as chunk_exc:
+                    log_error(
+                        "Streaming verification chunk failed (non-fatal, reporting unknown)",
+                        chunk_exc,
+                        "app.api.v3.endpoints.email",
+                        context={"provider": provider.value},
+                    )
+                    continue
+                for email, verification_status in status_map.items():
+                    for number, row in rows_by_email.pop(email, []):
+                        yield {
+                            "row": number,
+                            "email": (row.get(email_column) or "").strip(),
+                            "status": verification_status.value,
+                            "raw_row": row,
+                        }
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        # Rows whose chunk failed
+        for email, entries in rows_by_email.items():
+            for number, row in entries:
+                yield {
+                    "row": number,
+                    "email": (row.get(email_column) or "").strip(),
+                    "status": EmailVerificationStatus.UNKNOWN.value,
+                    "raw_row": row,
+                }
+
+
+@router.post("/bulk/verifier/stream/")
+async def bulk_email_verifier_stream(
+    file: UploadFile = File(..., description="CSV file with an email column"),
+    provider: EmailProvider = Form(..., description="Email verification provider to use"),
+    email_column: Optional[str] = Form(None, description="Email column name (auto-detected if omitted)"),
+    current_user: User = Depends(get_current_user),
+    http_request: Request = None,
+) -> StreamingResponse:
+    """
+    Verify a CSV upload and stream results as NDJSON.
+    
+    The file is read incrementally and verified in bounded concurrent batches.
+    Each line of the response is a JSON object for one CSV row
+    ({"row", "email", "status", "raw_row"}) written as soon as its status is
+    known, so rows may arrive out of order. The last line is
+    {"summary": {...}} with per-status counts. The activity is logged on its
+    own session after the summary, since request-scoped sessions are closed
+    before the body streams.
+    
+    Args:
+        file: CSV upload (UTF-8, header row required)
+        provider: Verification provider
+        email_column: Optional email column name; detected with detect_email_column otherwise
+        current_user: Current authenticated user
+        
+    Returns:
+        StreamingResponse with media type application/x-ndjson
+    """
+    # The upload is closed once this handler returns, before the body streams, so
+    # move it to a spooled file (memory up to 1 MB, disk beyond) that the generator owns
+    spool = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    await run_in_threadpool(shutil.copyfileobj, file.file, spool)
+    spool.seek(0)
+    text_stream = io.TextIOWrapper(spool, encoding="utf-8-sig", errors="replace", newline="")
+    try:
+        reader = csv.DictReader(text_stream)
+        raw_headers = await run_in_threadpool(lambda: reader.fieldnames) or []
+        if not raw_headers:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="CSV file is empty or has no header row",
+            )
+    
+        if email_column and email_column not in raw_headers:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Column '{email_column}' not found in CSV headers",
+            )
+        if not email_column:
+            try:
+                email_column = detect_email_column(list(raw_headers))
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e),
+                ) from e
+        if not email_column:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Could not detect email column. Please provide email_column.",
+            )
+    
+        if provider == EmailProvider.BULKMAILVERIFIER:
+            if not settings.BULKMAILVERIFIER_EMAIL or not settings.BULKMAILVERIFIER_PASSWORD:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=(
+                        "BulkMailVerifier credentials not configured. "
+                        "Please configure BULKMAILVERIFIER_EMAIL and BULKMAILVERIFIER_PASSWORD environment variables."
+                    ),
+                )
+            service = BulkMailVerifierService()
+        elif provider == EmailProvider.TRUELIST:
+            service = TruelistService()
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported provider: {provider}",
+            )
+    except Exception:
+        text_stream.close()
+        raise
+    
+    async def generate_ndjson():
+        counts = {verification_status.value: 0 for verification_status in EmailVerificationStatus}
+        total = 0
+        missing = 0
+        try:
+            async for result in _stream_verification_results(reader, email_column, provider, service):
+                total += 1
+                if result["status"] is None:
+                    missing += 1
+                else:
+                    counts[result["status"]] += 1
+                yield json.dumps(result, default=str) + "\n"
+        except Exception as exc:
+            log_error(
+                "Streaming bulk email verification failed",
+                exc,
+                "app.api.v3.endpoints.email",
+                context={"user_id": current_user.uuid, "rows_streamed": total},
+            )
+            yield json.dumps({"error": "Failed to verify emails", "rows_streamed": total}) + "\n"
+        finally:
+            text_stream.close()
+        
+        summary = {"total": total, "missing_email": missing, **counts}
+        yield json.dumps({"summary": summary}) + "\n"
+        
+        try:
+            async with AsyncSessionLocal() as activity_session:
+                await activity_service.log_search_activity(
+                    session=activity_session,
+                    user_id=current_user.uuid,
+                    service_type=ActivityServiceType.EMAIL,
+                    request_params={"email_count": total, "streaming": True},
+                    result_count=total,
+                    result_summary=summary,
+                    status=ActivityStatus.SUCCESS,
+                    request=http_request,
+                )
+                await activity_session.commit()
+        except Exception as activity_exc:
+            log_error(
+                "Failed to log streaming bulk email verification activity",
+                activity_exc,
+                "app.api.v3.endpoints.email",
+                context={"user_id": current_user.uuid, "operation": "log_activity"},
+            )
+    
+    return StreamingResponse(
+        generate_ndjson(),
+        media_type="application/x-ndjson",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable buffering in nginx
+        },
+    )
+
+
 @router.post("/single/verifier/", response_model=SingleEmailVerifierResponse)
 async def single_email_verifier(
     request: SingleEmailVerifierRequest,
@@ -1856,7 +2199,7 @@ async def single_email_verifier(
             )
         
         if use_bmv:
-            service = BulkMailVerifierService()
+            service = build_single_email_verifier(provider.value, BulkMailVerifierService())
             result = await service.verify_single_email(request.email)
             # Map the result status to EmailVerificationStatus enum
             mapped_status = result.get("mapped_status", "unknown")
@@ -1869,7 +2212,7 @@ async def single_email_verifier(
                 result=VerifiedEmailResult(email=request.email, status=verification_status),
             )
         elif use_truelist:
-            service = TruelistService()
+            service = build_single_email_verifier(provider.value, TruelistService())
             result = await service.verify_single_email(request.email)
             # Map the result status to EmailVerificationStatus enum
             mapped_status = result.get("mapped_status", "unknown")
@@ -2140,6 +2483,17 @@ async def export_emails(
             }
         )
         
+        # Contacts without an email need a finder/verifier lookup, which
+        # dominates the cost of the export
+        lookups = sum(1 for contact in contacts_data if not contact.get("email"))
+        admission = await admission_service.admit(
+            session,
+            current_user.uuid,
+            ExportType.emails,
+            len(contacts_data),
+            provider_calls_per_row=lookups / len(contacts_data),
+        )
+        
         # Create export record with status "pending"
         export = await export_service.create_export(
             session,
@@ -2153,6 +2507,7 @@ async def export_emails(
         export.email_contacts_json = contacts_json
         export.contact_count = len(request.contacts)
         export.total_records = len(request.contacts)
+        export.estimated_cost = admission["estimated_cost"]
         # Flush to persist changes without committing (transaction managed by get_db())
         await session.flush()
         
@@ -2181,6 +2536,7 @@ async def export_emails(
             activity_id,
             track_status=True,
             cpu_bound=False,  # I/O-bound task (database and file operations)
+            start_delay=admission["start_delay_seconds"],
         )
         
         # Deduct credits for FreeUser and ProUser (after export is queued successfully)
@@ -2192,7 +2548,12 @@ async def export_emails(
                 if credit_service.should_deduct_credits(user_role):
                     credit_amount = len(request.contacts)
                     new_balance = await credit_service.deduct_credits(
-                        session, current_user.uuid, amount=credit_amount
+                        session,
+                        current_user.uuid,
+                        amount=credit_amount,
+                        reason="email_export",
+                        reference=export.export_id,
+                        allow_overdraft=True,
                     )
         except Exception as credit_exc:
             pass
@@ -2212,6 +2573,8 @@ async def export_emails(
             contact_count=len(request.contacts),
             company_count=0,
             status=export.status,
+            estimated_completion_at=admission["estimated_completion_at"],
+            admission_decision=admission["decision"],
         )
             
     except HTTPException:
@@ -2286,7 +2649,8 @@ async def get_single_email(
         SingleEmailResponse with email address, source, and status (when found via verifier).
         - source="verifier": Email verified as valid/catchall, status indicates verification result
         - source="pattern_fallback": Best-guess pattern when all verifications failed, status=None
-        - source="cache": Cached result, status=None
+        - source="cache": Result of a previous search served from the finder cache,
+          status is the stored verification status
         - source=None: No email found
     """
     try:
@@ -2316,17 +2680,16 @@ async def get_single_email(
                 detail=f"Could not extract valid domain from: {domain_input}",
             )
         
-        # Check user_activities for previous successful search
-        cached_email = await _get_email_from_activities(
-            session=session,
-            user_id=current_user.uuid,
+        # Check the finder cache for a previous successful search
+        cached = await finder_cache.lookup(
             first_name=first_name,
             last_name=last_name,
             domain=extracted_domain,
+            user_id=current_user.uuid,
         )
         
-        if cached_email:
-            return SingleEmailResponse(email=cached_email, source="user_activities", status=None)
+        if cached:
+            return SingleEmailResponse(email=cached["email"], source="cache", status=cached["status"])
         
         # Initialize services
         email_finder_service = EmailFinderService()
@@ -2358,11 +2721,13 @@ async def get_single_email(
         # Step 2: Email verification with Truelist (RE-ENABLED for accuracy)
         if not email_found and bulk_verifier_service:
             # Generate email patterns (increased from 5 to 10 for better coverage)
+            # Rank by the domain's learned formats so the right one lands in the top 10
             all_emails = generate_email_combinations(
                 first_name=first_name,
                 last_name=last_name,
                 domain=extracted_domain,
                 count=10,
+                pattern_weights=await pattern_service.get_domain_weights(extracted_domain),
             )
         
         # Step 2.5: Run actual verification with Truelist
@@ -2371,6 +2736,10 @@ async def get_single_email(
                 if all_emails:
                     # Wrap verification step in timeout
                     async def _verification_work():
+                        # Known catch-all domain: every candidate would come back CATCHALL
+                        if is_catchall_domain(extracted_domain):
+                            return all_emails[0], EmailVerificationStatus.CATCHALL, 0
+                        
                         # Track verified emails to prevent duplicates
                         verified_emails_set = set()
                         
@@ -2384,13 +2753,13 @@ async def get_single_email(
                                 last_name=last_name,
                             )
                         else:
-                            # Use concurrent verification for other providers
-                            max_concurrent = 5
+                            # Use concurrent verification for other providers; at most 5 per
+                            # lookup, within what the shared provider limiter allows
                             found_email, email_status, emails_checked = await _verify_emails_concurrent_until_valid(
                                 emails=all_emails,
                                 service=bulk_verifier_service,
                                 verified_emails_set=verified_emails_set,
-                                max_concurrent=max_concurrent,
+                                max_concurrent=5,
                             )
                         
                         if found_email:
@@ -2421,9 +2790,30 @@ async def get_single_email(
                             else:
                                 source = "verifier"
                             
+                            # Learn the domain's format off the critical path
+                            if email_status == EmailVerificationStatus.VALID:
+                                add_background_task_safe(
+                                    background_tasks,
+                                    pattern_service.record_valid_email,
+                                    email=email_found,
+                                    first_name=first_name,
+                                    last_name=last_name,
+                                    domain=extracted_domain,
+                                )
+                            
                             # Store in cache for future requests (only if email is verified as valid/catchall)
                             if email_found and email_status is not None:
-                                _store_in_cache(cache_key, email_found)
+                                add_background_task_safe(
+                                    background_tasks,
+                                    finder_cache.store,
+                                    first_name=first_name,
+                                    last_name=last_name,
+                                    domain=extracted_domain,
+                                    email=email_found,
+                                    status=email_status,
+                                    source=source,
+                                    user_id=current_user.uuid,
+                                )
                             
                             # Skip IcyPeas fallback for speed optimization (saves ~3.4s)
                             # Keep catchall as-is (don't convert to valid) for accurate status reporting
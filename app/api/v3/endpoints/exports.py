@@ -4,13 +4,14 @@ import io
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
 from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_admin, get_current_user
+from app.api.deps import get_current_admin, get_current_user, get_read_db
 from app.db.session import get_db
 from app.models.exports import ExportStatus, ExportType
 from app.models.user import User
@@ -22,12 +23,14 @@ from app.schemas.exports import (
     CompanyExportResponse,
     ContactExportRequest,
     ContactExportResponse,
+    DeltaExportSummary,
     ExportListResponse,
     ExportStatusResponse,
     UserExportDetail,
 )
 from app.schemas.filters import ExportFilterParams
 from app.services.credit_service import CreditService
+from app.services.export_admission_service import ExportAdmissionService
 from app.services.export_service import ExportService
 from app.services.s3_service import S3Service
 from app.tasks.export_tasks import process_company_export, process_contact_export
@@ -38,6 +41,7 @@ from app.utils.signed_url import verify_signed_url
 
 router = APIRouter()
 service = ExportService()
+admission_service = ExportAdmissionService()
 s3_service = S3Service()
 credit_service = CreditService()
 profile_repo = UserProfileRepository()
@@ -56,6 +60,52 @@ async def resolve_export_filters(request: Request) -> ExportFilterParams:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=message) from exc
 
 
+async def _apply_delta_selection(
+    session: AsyncSession,
+    user_id: str,
+    export_type: ExportType,
+    request: ContactExportRequest | CompanyExportRequest,
+    uuids: list[str],
+) -> tuple[list[str], Optional[list[str]], Optional[dict]]:
+    """
+    Resolve the UUIDs a (possibly delta) export should process.
+    
+    Returns:
+        Tuple of (uuids_to_export, tombstone_uuids, delta_selection). For
+        non-delta requests the input UUIDs are returned unchanged.
+    """
+    if not request.delta:
+        return uuids, None, None
+    
+    selection = await service.select_delta_uuids(
+        session,
+        user_id,
+        export_type,
+        request.segment_key,
+        uuids,
+    )
+    tombstone_uuids = selection["deleted_uuids"] if request.include_tombstones else None
+    return selection["changed_uuids"], tombstone_uuids, selection
+
+
+def _mark_delta_export(export, request, selection: Optional[dict]) -> Optional[DeltaExportSummary]:
+    """Copy delta selection details onto the export record and build the response summary."""
+    if selection is None:
+        return None
+    export.is_delta = True
+    export.segment_key = request.segment_key
+    export.delta_since = selection["since"]
+    export.delta_watermark = selection["watermark"]
+    return DeltaExportSummary(
+        segment_key=request.segment_key,
+        since=selection["since"],
+        changed_count=len(selection["changed_uuids"]),
+        unchanged_count=selection["unchanged_count"],
+        tombstone_count=len(selection["deleted_uuids"]),
+        empty=not selection["changed_uuids"],
+    )
+
+
 @router.post("/contacts/export", response_model=ContactExportResponse, status_code=status.HTTP_201_CREATED)
 async def create_contact_export(
     background_tasks: BackgroundTasks,
@@ -70,6 +120,9 @@ async def create_contact_export(
     Accepts a list of contact UUIDs and generates a CSV file containing all contact,
     company, and metadata fields. Returns a signed temporary download URL that expires
     after 24 hours.
+    
+    With ``delta=true`` only contacts whose ``updated_at`` is newer than the
+    watermark stored for ``segment_key`` are exported (and charged).
     """
     if not request.contact_uuids:
         raise HTTPException(
@@ -90,16 +143,30 @@ async def create_contact_export(
     )
     
     try:
+        contact_uuids, tombstone_uuids, delta_selection = await _apply_delta_selection(
+            session,
+            current_user.uuid,
+            ExportType.contacts,
+            request,
+            request.contact_uuids,
+        )
+        
+        admission = await admission_service.admit(
+            session, current_user.uuid, ExportType.contacts, len(contact_uuids)
+        )
+        
         # Create export record with status "pending"
         export = await service.create_export(
             session,
             current_user.uuid,
             ExportType.contacts,
-            contact_uuids=request.contact_uuids,
+            contact_uuids=contact_uuids,
         )
         
         # Set total_records for progress tracking
-        export.total_records = len(request.contact_uuids)
+        export.total_records = len(contact_uuids)
+        export.estimated_cost = admission["estimated_cost"]
+        delta_summary = _mark_delta_export(export, request, delta_selection)
         # Flush to persist changes without committing (transaction managed by get_db())
         await session.flush()
         
@@ -121,9 +188,11 @@ async def create_contact_export(
             background_tasks,
             process_contact_export,
             export.export_id,
-            request.contact_uuids,
+            contact_uuids,
+            tombstone_uuids,
             track_status=True,
             cpu_bound=False,  # I/O-bound task (database and file operations)
+            start_delay=admission["start_delay_seconds"],
         )
         
         # Deduct credits for FreeUser and ProUser (after export is queued successfully)
@@ -133,9 +202,14 @@ async def create_contact_export(
             if profile:
                 user_role = profile.role or "FreeUser"
                 if credit_service.should_deduct_credits(user_role):
-                    credit_amount = len(request.contact_uuids)
+                    credit_amount = len(contact_uuids)
                     await credit_service.deduct_credits(
-                        session, current_user.uuid, amount=credit_amount
+                        session,
+                        current_user.uuid,
+                        amount=credit_amount,
+                        reason="contact_export",
+                        reference=export.export_id,
+                        allow_overdraft=True,
                     )
                     logger.debug(
                         "Credits deducted for export",
@@ -181,8 +255,11 @@ async def create_contact_export(
             export_id=export.export_id,
             download_url="",  # Will be generated when export completes
             expires_at=expires_at,
-            contact_count=len(request.contact_uuids),
+            contact_count=len(contact_uuids),
             status=export.status,
+            delta=delta_summary,
+            estimated_completion_at=admission["estimated_completion_at"],
+            admission_decision=admission["decision"],
         )
             
     except HTTPException:
@@ -279,7 +356,7 @@ async def get_export_status(
 @router.get("/", response_model=ExportListResponse)
 async def list_exports(
     filters: ExportFilterParams = Depends(resolve_export_filters),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> ExportListResponse:
     """
@@ -311,6 +388,7 @@ async def list_exports(
 async def download_export(
     export_id: str,
     token: str = Query(..., description="Signed URL token for authentication"),
+    tombstones: bool = Query(False, description="Download the tombstone CSV of a delta export instead of the data file"),
     filters: ExportFilterParams = Depends(resolve_export_filters),
     session: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -319,7 +397,8 @@ async def download_export(
     Download a CSV export file using a signed URL.
     
     The token must be valid and the export must belong to the requesting user.
-    The export must not have expired.
+    The export must not have expired. Pass ``tombstones=true`` to fetch the
+    deleted-UUID file produced by a delta export.
     """
     # Verify signed URL token
     token_payload = verify_signed_url(token)
@@ -365,22 +444,32 @@ async def download_export(
             detail=f"Export is not ready (status: {export.status})",
         )
     
-    # Check if file exists
-    if not export.file_path:
-        # Export file path missing
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Export file not found",
-        )
-    
-    # Determine filename
-    filename = export.file_name or f"export_{export_id}.csv"
+    # Resolve which file to serve (data file or delta tombstone file)
+    if tombstones:
+        if not export.tombstone_file_path:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Tombstone file not available for this export",
+            )
+        source_path = export.tombstone_file_path
+        filename = Path(source_path).name
+    else:
+        # Check if file exists
+        if not export.file_path:
+            # Export file path missing
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Export file not found",
+            )
+        source_path = export.file_path
+        # Determine filename
+        filename = export.file_name or f"export_{export_id}.csv"
     
     # Check if file is in S3 or local
-    if s3_service.is_s3_key(export.file_path):
+    if s3_service.is_s3_key(source_path):
         # Download from S3 and stream to user
         try:
-            s3_key = export.file_path
+            s3_key = source_path
             # Extract key from full S3 URL if needed
             if s3_key.startswith("https://"):
                 parts = s3_key.split(".s3.")
@@ -411,7 +500,7 @@ async def download_export(
             )
     else:
         # Local file
-        file_path = Path(export.file_path)
+        file_path = Path(source_path)
         if not file_path.exists():
             # Export file does not exist
             raise HTTPException(
@@ -443,6 +532,9 @@ async def create_company_export(
     Accepts a list of company UUIDs and generates a CSV file containing all company
     and company metadata fields. Returns a signed temporary download URL that expires
     after 24 hours.
+    
+    With ``delta=true`` only companies whose ``updated_at`` is newer than the
+    watermark stored for ``segment_key`` are exported (and charged).
     """
     # Processing: Received company export request with user ID and company count
     
@@ -465,16 +557,30 @@ async def create_company_export(
         )
     
     try:
+        company_uuids, tombstone_uuids, delta_selection = await _apply_delta_selection(
+            session,
+            current_user.uuid,
+            ExportType.companies,
+            request,
+            request.company_uuids,
+        )
+        
+        admission = await admission_service.admit(
+            session, current_user.uuid, ExportType.companies, len(company_uuids)
+        )
+        
         # Create export record with status "pending"
         export = await service.create_export(
             session,
             current_user.uuid,
             ExportType.companies,
-            company_uuids=request.company_uuids,
+            company_uuids=company_uuids,
         )
         
         # Set total_records for progress tracking
-        export.total_records = len(request.company_uuids)
+        export.total_records = len(company_uuids)
+        export.estimated_cost = admission["estimated_cost"]
+        delta_summary = _mark_delta_export(export, request, delta_selection)
         # Flush to persist changes without committing (transaction managed by get_db())
         await session.flush()
         
@@ -496,9 +602,11 @@ async def create_company_export(
             background_tasks,
             process_company_export,
             export.export_id,
-            request.company_uuids,
+            company_uuids,
+            tombstone_uuids,
             track_status=True,
             cpu_bound=False,  # I/O-bound task (database and file operations)
+            start_delay=admission["start_delay_seconds"],
         )
         
         # Deduct credits for FreeUser and ProUser (after export is queued successfully)
@@ -508,9 +616,14 @@ async def create_company_export(
             if profile:
                 user_role = profile.role or "FreeUser"
                 if credit_service.should_deduct_credits(user_role):
-                    credit_amount = len(request.company_uuids)
+                    credit_amount = len(company_uuids)
                     await credit_service.deduct_credits(
-                        session, current_user.uuid, amount=credit_amount
+                        session,
+                        current_user.uuid,
+                        amount=credit_amount,
+                        reason="company_export",
+                        reference=export.export_id,
+                        allow_overdraft=True,
                     )
                     logger.debug(
                         "Credits deducted for export",
@@ -556,8 +669,11 @@ async def create_company_export(
             export_id=export.export_id,
             download_url="",  # Will be generated when export completes
             expires_at=expires_at,
-            company_count=len(request.company_uuids),
+            company_count=len(company_uuids),
             status=export.status,
+            delta=delta_summary,
+            estimated_completion_at=admission["estimated_completion_at"],
+            admission_decision=admission["decision"],
         )
             
     except HTTPException:
@@ -594,6 +710,7 @@ async def create_chunked_contact_export(
     
     Accepts multiple chunks of contact UUIDs and creates separate export jobs for each chunk.
     If merge is True, the chunks will be processed and merged into a single export file.
+    The whole request is subject to admission control before any chunk is enqueued.
     """
     if not request.chunks:
         raise HTTPException(
@@ -610,6 +727,10 @@ async def create_chunked_contact_export(
         )
     
     try:
+        admission = await admission_service.admit(
+            session, current_user.uuid, ExportType.contacts, total_count
+        )
+        
         # Create main export record
         all_uuids = [uuid for chunk in request.chunks for uuid in chunk]
         main_export = await service.create_export(
@@ -626,6 +747,7 @@ async def create_chunked_contact_export(
         
         # Create chunk export records and enqueue tasks
         chunk_ids = []
+        chunk_amounts = []
         
         for i, chunk_uuids in enumerate(request.chunks):
             if not chunk_uuids:
@@ -639,10 +761,15 @@ async def create_chunked_contact_export(
                 contact_uuids=chunk_uuids,
             )
             chunk_export.total_records = len(chunk_uuids)
+            # Cost is tracked per chunk so the main record does not double count the backlog
+            chunk_export.estimated_cost = admission_service.estimate_cost(
+                ExportType.contacts, len(chunk_uuids)
+            )
             # Flush to persist changes without committing (transaction managed by get_db())
             await session.flush()
             
             chunk_ids.append(chunk_export.export_id)
+            chunk_amounts.append(len(chunk_uuids))
             
             # Enqueue background task for this chunk
             # Note: This is a long-running task that might be better suited for Celery in the future
@@ -653,6 +780,7 @@ async def create_chunked_contact_export(
                 chunk_uuids,
                 track_status=True,
                 cpu_bound=False,  # I/O-bound task (database and file operations)
+                start_delay=admission["start_delay_seconds"],
             )
         
         # If merge is requested, start background task to monitor chunk completion and merge
@@ -667,15 +795,20 @@ async def create_chunked_contact_export(
             )
         
         # Deduct credits for FreeUser and ProUser (after chunked export is created successfully)
-        # Deduct credits for total count across all chunks (1 credit per contact UUID)
+        # Deduct credits for total count across all chunks (1 credit per contact UUID),
+        # recording one ledger entry per chunk
         try:
             profile = await profile_repo.get_by_user_id(session, current_user.uuid)
             if profile:
                 user_role = profile.role or "FreeUser"
                 if credit_service.should_deduct_credits(user_role):
-                    credit_amount = total_count
-                    await credit_service.deduct_credits(
-                        session, current_user.uuid, amount=credit_amount
+                    await credit_service.deduct_credits_batch(
+                        session,
+                        current_user.uuid,
+                        chunk_amounts,
+                        reason="contact_export",
+                        references=chunk_ids,
+                        allow_overdraft=True,
                     )
         except Exception:
             pass  # Credit deduction failed but export continues
@@ -685,6 +818,8 @@ async def create_chunked_contact_export(
             chunk_ids=chunk_ids,
             total_count=total_count,
             status=main_export.status,
+            estimated_completion_at=admission["estimated_completion_at"],
+            admission_decision=admission["decision"],
         )
         
     except HTTPException:
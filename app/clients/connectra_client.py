@@ -584,6 +584,7 @@ class ConnectraClient:
         uuids: List[str],
         entity_type: str = "contact",
         batch_size: int = 100,
+        select_columns: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Batch search for contacts or companies by UUID list.
@@ -592,6 +593,7 @@ class ConnectraClient:
             uuids: List of UUIDs to search for
             entity_type: "contact" or "company"
             batch_size: Number of UUIDs per batch query
+            select_columns: Optional columns to return (all columns when None)
 
         Returns:
             List of all matching records
@@ -612,6 +614,7 @@ class ConnectraClient:
             filter_obj = VQLFilter(and_=[condition])
             vql_query = VQLQuery(
                 filters=filter_obj,
+                select_columns=select_columns,
                 limit=batch_size,
                 offset=0
             )
@@ -626,6 +629,51 @@ class ConnectraClient:
 
         return all_results
 
+    async def batch_search_by_linkedin_urls(
+        self,
+        linkedin_urls: List[str],
+        entity_type: str = "contact",
+        batch_size: int = 100,
+        limit: int = 1000,
+    ) -> List[Dict[str, Any]]:
+        """
+        Batch search for contacts or companies by LinkedIn URL list.
+
+        Args:
+            linkedin_urls: LinkedIn URLs to match exactly
+            entity_type: "contact" or "company"
+            batch_size: Number of URLs per IN query
+            limit: Maximum records returned per batch query
+
+        Returns:
+            List of all matching records
+        """
+
+        all_results = []
+
+        for i in range(0, len(linkedin_urls), batch_size):
+            batch_urls = linkedin_urls[i:i + batch_size]
+
+            condition = VQLCondition(
+                field="linkedin_url",
+                operator=VQLOperator.IN,
+                value=batch_urls
+            )
+            vql_query = VQLQuery(
+                filters=VQLFilter(and_=[condition]),
+                limit=limit,
+                offset=0
+            )
+
+            if entity_type == "contact":
+                response = await self.search_contacts(vql_query)
+            else:
+                response = await self.search_companies(vql_query)
+
+            all_results.extend(response.get("data", []))
+
+        return all_results
+
     async def batch_get_contacts_by_uuids(
         self,
         contact_uuids: List[str],
@@ -43,12 +43,28 @@ class Settings(BaseSettings):
     DATABASE_POOL_RECYCLE: int = 1800
     DATABASE_POOL_PRE_PING: bool = True  # Verify connections before using
     DATABASE_POOL_RESET_ON_RETURN: str = "commit"  # Better connection reuse
+    DATABASE_STATEMENT_TIMEOUT_MS: int = Field(2000, alias="DATABASE_STATEMENT_TIMEOUT_MS", description="statement_timeout of request pool connections (milliseconds)")
+    # Background pool: exports, verification, merges and other jobs in app/tasks
+    DATABASE_BACKGROUND_POOL_SIZE: int = Field(10, alias="DATABASE_BACKGROUND_POOL_SIZE", description="Connection pool size for background jobs")
+    DATABASE_BACKGROUND_MAX_OVERFLOW: int = Field(10, alias="DATABASE_BACKGROUND_MAX_OVERFLOW", description="Maximum overflow connections for background jobs")
+    DATABASE_BACKGROUND_POOL_TIMEOUT: int = Field(120, alias="DATABASE_BACKGROUND_POOL_TIMEOUT", description="Seconds a background job waits for a pooled connection")
+    DATABASE_BACKGROUND_STATEMENT_TIMEOUT_MS: int = Field(300000, alias="DATABASE_BACKGROUND_STATEMENT_TIMEOUT_MS", description="statement_timeout of background pool connections (milliseconds)")
+    # Admin pool: super admin reporting queries
+    DATABASE_ADMIN_POOL_SIZE: int = Field(3, alias="DATABASE_ADMIN_POOL_SIZE", description="Connection pool size for admin and reporting queries")
+    DATABASE_ADMIN_MAX_OVERFLOW: int = Field(2, alias="DATABASE_ADMIN_MAX_OVERFLOW", description="Maximum overflow connections for admin and reporting queries")
+    DATABASE_ADMIN_POOL_TIMEOUT: int = Field(30, alias="DATABASE_ADMIN_POOL_TIMEOUT", description="Seconds an admin query waits for a pooled connection")
+    DATABASE_ADMIN_STATEMENT_TIMEOUT_MS: int = Field(30000, alias="DATABASE_ADMIN_STATEMENT_TIMEOUT_MS", description="statement_timeout of admin pool connections (milliseconds)")
     # Connection pool monitoring
     ENABLE_POOL_MONITORING: bool = Field(True, alias="ENABLE_POOL_MONITORING")  # Enable pool statistics tracking
     POOL_MONITORING_INTERVAL: int = Field(60, alias="POOL_MONITORING_INTERVAL")  # Log pool stats every N seconds
     DATABASE_URL: Optional[str] = None
     DATABASE_REPLICA_URL: Optional[str] = Field(None, alias="DATABASE_REPLICA_URL", description="Optional replica database URL for read operations")
     USE_REPLICA: bool = Field(False, alias="USE_REPLICA", description="Whether to use replica database for read operations")
+    DATABASE_REPLICA_POOL_SIZE: int = Field(25, alias="DATABASE_REPLICA_POOL_SIZE", description="Connection pool size of the replica engine")
+    DATABASE_REPLICA_MAX_OVERFLOW: int = Field(50, alias="DATABASE_REPLICA_MAX_OVERFLOW", description="Maximum overflow connections of the replica engine")
+    REPLICA_MAX_LAG_SECONDS: float = Field(5.0, alias="REPLICA_MAX_LAG_SECONDS", description="Route reads to the primary while replica replay lag exceeds this many seconds")
+    REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = Field(5.0, alias="REPLICA_LAG_CHECK_INTERVAL_SECONDS", description="How long a replica lag measurement is reused before it is checked again")
+    READ_YOUR_WRITES_WINDOW_SECONDS: float = Field(10.0, alias="READ_YOUR_WRITES_WINDOW_SECONDS", description="Seconds after a user's write during which their reads stay on the primary")
     # Query compression and caching
     ENABLE_QUERY_COMPRESSION: bool = True  # Enable PostgreSQL query compression
     QUERY_CACHE_TTL: int = 300  # Query result cache TTL in seconds
@@ -86,6 +102,13 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     ALGORITHM: str = "HS256"
+    # In-memory Bloom filter in front of the refresh token blacklist table
+    ENABLE_TOKEN_BLACKLIST_FILTER: bool = Field(True, alias="ENABLE_TOKEN_BLACKLIST_FILTER", description="Answer definite blacklist misses from an in-memory Bloom filter instead of the database")
+    TOKEN_BLACKLIST_FILTER_SYNC_SECONDS: float = Field(5.0, alias="TOKEN_BLACKLIST_FILTER_SYNC_SECONDS", description="Fetch entries blacklisted by other workers at most this often; also the longest a revocation on another worker can go unseen")
+    TOKEN_BLACKLIST_FILTER_SYNC_OVERLAP_SECONDS: int = Field(60, alias="TOKEN_BLACKLIST_FILTER_SYNC_OVERLAP_SECONDS", description="Re-read entries this far behind the sync watermark to catch late commits")
+    TOKEN_BLACKLIST_FILTER_BUCKET_HOURS: int = Field(24, alias="TOKEN_BLACKLIST_FILTER_BUCKET_HOURS", description="Width of the token expiry buckets; a bucket is dropped once its tokens have expired")
+    TOKEN_BLACKLIST_FILTER_CAPACITY: int = Field(100000, alias="TOKEN_BLACKLIST_FILTER_CAPACITY", description="Expected blacklisted tokens per bucket")
+    TOKEN_BLACKLIST_FILTER_ERROR_RATE: float = Field(0.001, alias="TOKEN_BLACKLIST_FILTER_ERROR_RATE", description="Target false positive rate of each bucket")
 
     # CORS
     # Allowed origins for browser-based clients (frontend applications)
@@ -166,10 +189,77 @@ class Settings(BaseSettings):
     # Truelist Configuration
     TRUELIST_API_KEY: Optional[str] = Field(None, alias="TRUELIST_API_KEY")
     TRUELIST_BASE_URL: str = Field("https://app.truelist.io", alias="TRUELIST_BASE_URL")
+    TRUELIST_MAX_CONCURRENT_CHUNKS: int = Field(10, alias="TRUELIST_MAX_CONCURRENT_CHUNKS", description="Maximum 51-email chunks sent to Truelist concurrently per verify call")
 
     # IcyPeas API Configuration
     ICYPEAS_API_KEY: Optional[str] = Field(None, alias="ICYPEAS_API_KEY")
     ICYPEAS_BASE_URL: str = Field("https://app.icypeas.com/api", alias="ICYPEAS_BASE_URL")
+    ICYPEAS_POLL_MIN_INTERVAL: float = Field(0.2, alias="ICYPEAS_POLL_MIN_INTERVAL", description="Shortest delay between shared IcyPeas poll ticks")
+    ICYPEAS_POLL_MAX_INTERVAL: float = Field(2.0, alias="ICYPEAS_POLL_MAX_INTERVAL", description="Longest delay between shared IcyPeas poll ticks")
+
+    # Shared email verification result store (LRU in front of email_verification_results)
+    ENABLE_EMAIL_VERIFICATION_STORE: bool = Field(True, alias="ENABLE_EMAIL_VERIFICATION_STORE", description="Reuse verification results across providers, workers and exports")
+    EMAIL_VERIFICATION_CACHE_SIZE: int = Field(10000, alias="EMAIL_VERIFICATION_CACHE_SIZE", description="Maximum number of verification results kept in the in-process LRU")
+    EMAIL_VERIFICATION_TTL_VALID_DAYS: int = Field(30, alias="EMAIL_VERIFICATION_TTL_VALID_DAYS", description="Days a valid verification result is reused")
+    EMAIL_VERIFICATION_TTL_INVALID_DAYS: int = Field(90, alias="EMAIL_VERIFICATION_TTL_INVALID_DAYS", description="Days an invalid verification result is reused")
+    EMAIL_VERIFICATION_TTL_CATCHALL_DAYS: int = Field(7, alias="EMAIL_VERIFICATION_TTL_CATCHALL_DAYS", description="Days a catchall verification result is reused")
+    EMAIL_VERIFICATION_TTL_UNKNOWN_DAYS: int = Field(1, alias="EMAIL_VERIFICATION_TTL_UNKNOWN_DAYS", description="Days an unknown verification result is reused")
+    EMAIL_VERIFICATION_STORE_RETRY_SECONDS: int = Field(60, alias="EMAIL_VERIFICATION_STORE_RETRY_SECONDS", description="Seconds to serve from memory only after a database error")
+
+    # Email finder result cache (first/last/domain -> found email)
+    ENABLE_EMAIL_FINDER_CACHE: bool = Field(True, alias="ENABLE_EMAIL_FINDER_CACHE", description="Answer repeated finder/single lookups from the finder cache")
+    EMAIL_FINDER_CACHE_SHARED: bool = Field(True, alias="EMAIL_FINDER_CACHE_SHARED", description="Share found emails across users instead of caching per user")
+    EMAIL_FINDER_CACHE_SIZE: int = Field(10000, alias="EMAIL_FINDER_CACHE_SIZE", description="Maximum number of finder results kept in the in-process LRU")
+    EMAIL_FINDER_CACHE_TTL_DAYS: int = Field(30, alias="EMAIL_FINDER_CACHE_TTL_DAYS", description="Days a found email is reused")
+
+    # Streaming bulk verification (CSV upload in, NDJSON out)
+    EMAIL_STREAM_BATCH_ROWS: int = Field(500, alias="EMAIL_STREAM_BATCH_ROWS", description="CSV rows read and verified per batch by the streaming verifier")
+    EMAIL_STREAM_MAX_CONCURRENT_CHUNKS: int = Field(5, alias="EMAIL_STREAM_MAX_CONCURRENT_CHUNKS", description="Provider chunks verified concurrently per streaming batch")
+
+    # Free syntax/MX precheck before paid verification
+    ENABLE_EMAIL_PRECHECK: bool = Field(True, alias="ENABLE_EMAIL_PRECHECK", description="Mark addresses with bad syntax or no mail host invalid without a provider call")
+    EMAIL_PRECHECK_DNS_TIMEOUT: float = Field(2.0, alias="EMAIL_PRECHECK_DNS_TIMEOUT", description="Seconds allowed for one domain's MX/A lookup")
+    EMAIL_PRECHECK_MX_TTL: int = Field(21600, alias="EMAIL_PRECHECK_MX_TTL", description="Seconds a domain with a mail host stays cached")
+    EMAIL_PRECHECK_NEGATIVE_TTL: int = Field(900, alias="EMAIL_PRECHECK_NEGATIVE_TTL", description="Seconds a domain without a mail host stays cached")
+    EMAIL_PRECHECK_CACHE_SIZE: int = Field(20000, alias="EMAIL_PRECHECK_CACHE_SIZE", description="Maximum number of domains kept in the MX cache")
+
+    # Domain catch-all verdict cache (skips per-candidate checks on catch-all domains)
+    ENABLE_DOMAIN_VERDICT_CACHE: bool = Field(True, alias="ENABLE_DOMAIN_VERDICT_CACHE", description="Skip candidate verification for domains known to be catch-all")
+    DOMAIN_VERDICT_CACHE_SIZE: int = Field(20000, alias="DOMAIN_VERDICT_CACHE_SIZE", description="Maximum number of domain verdicts kept in memory")
+    DOMAIN_VERDICT_TTL_SECONDS: int = Field(604800, alias="DOMAIN_VERDICT_TTL_SECONDS", description="Seconds a domain verdict is trusted before it is re-learned")
+
+    # Learned per-domain email pattern ranking for candidate generation
+    ENABLE_EMAIL_PATTERN_RANKING: bool = Field(True, alias="ENABLE_EMAIL_PATTERN_RANKING", description="Order generated candidates by the domain's learned pattern frequencies")
+    EMAIL_PATTERN_INDEX_SIZE: int = Field(5000, alias="EMAIL_PATTERN_INDEX_SIZE", description="Maximum number of domains kept in the in-process pattern index")
+    EMAIL_PATTERN_INDEX_TTL: int = Field(3600, alias="EMAIL_PATTERN_INDEX_TTL", description="Seconds before a domain's pattern weights are reloaded from the database")
+
+    # Adaptive (AIMD) concurrency limits for external verification providers
+    PROVIDER_CONCURRENCY_INITIAL: float = Field(5, alias="PROVIDER_CONCURRENCY_INITIAL", description="Starting concurrent calls per provider")
+    PROVIDER_CONCURRENCY_MIN: float = Field(1, alias="PROVIDER_CONCURRENCY_MIN", description="Lowest concurrency a provider is throttled to")
+    PROVIDER_CONCURRENCY_MAX: float = Field(50, alias="PROVIDER_CONCURRENCY_MAX", description="Highest concurrency a provider may grow to")
+    PROVIDER_LATENCY_TARGET_SECONDS: float = Field(2.0, alias="PROVIDER_LATENCY_TARGET_SECONDS", description="Calls slower than this do not grow the limit")
+    PROVIDER_CONCURRENCY_DECREASE_FACTOR: float = Field(0.5, alias="PROVIDER_CONCURRENCY_DECREASE_FACTOR", description="Multiplier applied to the limit on 429/5xx/timeouts")
+
+    # Hedged single-email verification (secondary provider when the primary is slow)
+    ENABLE_EMAIL_HEDGING: bool = Field(False, alias="ENABLE_EMAIL_HEDGING", description="Send slow single-email checks to the secondary provider as well")
+    EMAIL_HEDGE_BUDGET_RATIO: float = Field(0.1, alias="EMAIL_HEDGE_BUDGET_RATIO", description="Maximum share of single-email checks that may be hedged")
+    EMAIL_HEDGE_PERCENTILE: float = Field(0.9, alias="EMAIL_HEDGE_PERCENTILE", description="Primary latency percentile after which a check is hedged")
+    EMAIL_HEDGE_DEFAULT_DELAY: float = Field(2.0, alias="EMAIL_HEDGE_DEFAULT_DELAY", description="Hedge delay in seconds until enough latency samples exist")
+    EMAIL_HEDGE_MIN_DELAY: float = Field(0.25, alias="EMAIL_HEDGE_MIN_DELAY", description="Shortest hedge delay in seconds")
+    EMAIL_HEDGE_MIN_SAMPLES: int = Field(20, alias="EMAIL_HEDGE_MIN_SAMPLES", description="Latency samples needed before the percentile is trusted")
+    EMAIL_HEDGE_LATENCY_WINDOW: int = Field(200, alias="EMAIL_HEDGE_LATENCY_WINDOW", description="Recent calls per provider kept for the latency percentile")
+
+    # Hourly user activity rollups (activity stats read rollups plus a raw tail)
+    ENABLE_ACTIVITY_ROLLUPS: bool = Field(True, alias="ENABLE_ACTIVITY_ROLLUPS", description="Answer activity stats from user_activity_rollups plus recent raw activity")
+    ACTIVITY_ROLLUP_SETTLE_HOURS: int = Field(24, alias="ACTIVITY_ROLLUP_SETTLE_HOURS", description="Hours an activity stays raw before compaction, so late status updates are counted")
+    ACTIVITY_ROLLUP_CHUNK_HOURS: int = Field(24, alias="ACTIVITY_ROLLUP_CHUNK_HOURS", description="Hours of activity compacted per committed transaction")
+
+    # Buffered activity/history writes (bounded queue flushed with multi-row inserts)
+    ENABLE_ACTIVITY_SINK: bool = Field(True, alias="ENABLE_ACTIVITY_SINK", description="Write search activities and login history through the buffered activity sink")
+    ACTIVITY_SINK_MAX_QUEUE: int = Field(10000, alias="ACTIVITY_SINK_MAX_QUEUE", description="Records buffered before new ones are dropped")
+    ACTIVITY_SINK_BATCH_SIZE: int = Field(200, alias="ACTIVITY_SINK_BATCH_SIZE", description="Records written per multi-row insert")
+    ACTIVITY_SINK_FLUSH_INTERVAL_MS: int = Field(500, alias="ACTIVITY_SINK_FLUSH_INTERVAL_MS", description="Longest time a record waits in the buffer before a flush")
+    ACTIVITY_SINK_MAX_RETRIES: int = Field(3, alias="ACTIVITY_SINK_MAX_RETRIES", description="Retries for a failed batch before its records are dropped")
 
     # Connectra VQL Service Configuration
     CONNECTRA_BASE_URL: str = Field("http://18.234.210.191:8000", alias="CONNECTRA_BASE_URL")
@@ -211,6 +301,15 @@ class Settings(BaseSettings):
     MAX_CONCURRENT_BACKGROUND_TASKS: int = Field(10, alias="MAX_CONCURRENT_BACKGROUND_TASKS")  # Maximum concurrent background tasks
     BACKGROUND_TASK_TIMEOUT: float = Field(30.0, alias="BACKGROUND_TASK_TIMEOUT")  # Timeout in seconds for waiting for tasks during shutdown
     
+    # Export admission control configuration
+    ENABLE_EXPORT_ADMISSION_CONTROL: bool = Field(True, alias="ENABLE_EXPORT_ADMISSION_CONTROL", description="Estimate export cost and queue/delay/reject exports when the backlog is too large")
+    EXPORT_ADMISSION_DELAY_THRESHOLD: float = Field(600.0, alias="EXPORT_ADMISSION_DELAY_THRESHOLD", description="Estimated backlog (seconds) above which new exports are delayed")
+    EXPORT_ADMISSION_REJECT_THRESHOLD: float = Field(3600.0, alias="EXPORT_ADMISSION_REJECT_THRESHOLD", description="Estimated backlog (seconds) above which new exports are rejected")
+    EXPORT_ADMISSION_MAX_DELAY: float = Field(300.0, alias="EXPORT_ADMISSION_MAX_DELAY", description="Maximum start delay (seconds) applied to delayed exports")
+    EXPORT_DEFAULT_SECONDS_PER_COST_UNIT: float = Field(0.0005, alias="EXPORT_DEFAULT_SECONDS_PER_COST_UNIT", description="Fallback seconds per cost unit (row x column x provider call) before calibration data exists")
+    EXPORT_CALIBRATION_SAMPLE_SIZE: int = Field(50, alias="EXPORT_CALIBRATION_SAMPLE_SIZE", description="Number of recent completed exports used to calibrate the cost model")
+    EXPORT_CALIBRATION_TTL: int = Field(300, alias="EXPORT_CALIBRATION_TTL", description="Seconds to cache the calibrated cost model")
+    
     # Redis caching configuration (optional)
     REDIS_URL: Optional[str] = Field(None, alias="REDIS_URL", description="Redis connection URL for caching (e.g., redis://localhost:6379/0)")
     ENABLE_REDIS_CACHE: bool = Field(False, alias="ENABLE_REDIS_CACHE", description="Enable Redis backend for query cache (requires REDIS_URL)")
@@ -1,14 +1,18 @@
 """Async SQLAlchemy session management for FastAPI dependencies."""
 
+import asyncio
 import atexit
 import threading
 import time
-from collections.abc import AsyncGenerator
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
 from urllib.parse import parse_qs, urlparse
 
 from fastapi import HTTPException
 from fastapi.exceptions import RequestValidationError
-from sqlalchemy import event
+from sqlalchemy import event, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -16,6 +20,7 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
 from app.utils.logger import get_logger, log_database_operation, log_error
@@ -52,48 +57,93 @@ if settings.ENABLE_QUERY_COMPRESSION:
         "application_name": "appointment360_api",
     }
 
-engine: AsyncEngine = create_async_engine(
+REQUEST_POOL = "request"
+BACKGROUND_POOL = "background"
+ADMIN_POOL = "admin"
+REPLICA_POOL = "replica"
+
+
+def create_pool_engine(
+    name: str,
+    url: str,
+    pool_size: int,
+    max_overflow: int,
+    pool_timeout: int,
+    statement_timeout_ms: int,
+) -> AsyncEngine:
+    """
+    Create an engine with its own connection pool and statement timeout.
+
+    The pool name is part of the connection's application_name, so sessions of
+    each pool can be told apart in pg_stat_activity.
+    """
+    application_name = "appointment360_api" if name == REQUEST_POOL else f"appointment360_api_{name}"
+    return create_async_engine(
+        url,
+        echo=settings.DATABASE_ECHO,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+        connect_args={
+            **connect_args,
+            # CRITICAL: Add asyncpg-specific connection timeouts for remote RDS
+            "timeout": 5.0,  # 5 second connection timeout
+            # Client-side guard one second above the server-side statement timeout
+            "command_timeout": statement_timeout_ms / 1000 + 1.0,
+            "server_settings": {
+                "application_name": application_name,
+                "statement_timeout": str(statement_timeout_ms),
+            }
+        },
+    )
+
+
+# Interactive API requests
+engine: AsyncEngine = create_pool_engine(
+    REQUEST_POOL,
     enhanced_database_url,
-    echo=settings.DATABASE_ECHO,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
     pool_timeout=settings.DATABASE_POOL_TIMEOUT,
-    pool_recycle=settings.DATABASE_POOL_RECYCLE,
-    pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
-    connect_args={
-        **connect_args,
-        # CRITICAL: Add asyncpg-specific connection timeouts for remote RDS
-        "timeout": 5.0,  # 5 second connection timeout
-        "command_timeout": 3.0,  # 3 second command timeout
-        "server_settings": {
-            "application_name": "appointment360_api",
-            "statement_timeout": "2000",  # 2 second SQL statement timeout
-        }
-    },
+    statement_timeout_ms=settings.DATABASE_STATEMENT_TIMEOUT_MS,
 )
 
-# Set up query monitoring if enabled
-if settings.ENABLE_QUERY_MONITORING:
-    try:
-        query_monitor = get_query_monitor()
-        query_monitor.slow_query_threshold = settings.SLOW_QUERY_THRESHOLD
-        query_monitor.setup_engine_monitoring(engine)
-    except Exception:
-        pass  # Query monitoring setup failed (non-critical)
-
-# Add connection pool event listeners for monitoring
-# For async engines, we use sync_engine for event listeners
-try:
-    sync_engine = engine.sync_engine
-    
-    @event.listens_for(sync_engine, "connect")
-    def set_connection_settings(dbapi_conn, connection_record):
-        """Set connection-level settings for optimal performance."""
-        if settings.ENABLE_QUERY_COMPRESSION:
-            pass  # Placeholder for connection-level optimizations
+# Background jobs (exports, verification, merges, app/tasks) so a burst of
+# jobs cannot starve API requests of connections
+background_engine: AsyncEngine = create_pool_engine(
+    BACKGROUND_POOL,
+    enhanced_database_url,
+    pool_size=settings.DATABASE_BACKGROUND_POOL_SIZE,
+    max_overflow=settings.DATABASE_BACKGROUND_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_BACKGROUND_POOL_TIMEOUT,
+    statement_timeout_ms=settings.DATABASE_BACKGROUND_STATEMENT_TIMEOUT_MS,
+)
 
-    # Connection pool statistics
-    pool_stats = {
+# Super admin reporting queries: few connections, longer statements
+admin_engine: AsyncEngine = create_pool_engine(
+    ADMIN_POOL,
+    enhanced_database_url,
+    pool_size=settings.DATABASE_ADMIN_POOL_SIZE,
+    max_overflow=settings.DATABASE_ADMIN_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_ADMIN_POOL_TIMEOUT,
+    statement_timeout_ms=settings.DATABASE_ADMIN_STATEMENT_TIMEOUT_MS,
+)
+
+# Engines by pool name, for monitoring
+pool_engines: Dict[str, AsyncEngine] = {
+    REQUEST_POOL: engine,
+    BACKGROUND_POOL: background_engine,
+    ADMIN_POOL: admin_engine,
+}
+
+# Connection pool statistics per pool name
+pool_stats: Dict[str, dict] = {}
+
+
+def _empty_pool_stats() -> dict:
+    return {
         "checkouts": 0,
         "checkins": 0,
         "invalidated": 0,
@@ -102,12 +152,40 @@ try:
         "max_wait_time": 0.0,
         "total_wait_time": 0.0,
     }
-    
+
+
+def setup_pool_monitoring(name: str, async_engine: AsyncEngine) -> None:
+    """Register query monitoring and pool event listeners for one named pool."""
+    pool_engines[name] = async_engine
+    stats = pool_stats.setdefault(name, _empty_pool_stats())
+
+    # Set up query monitoring if enabled
+    if settings.ENABLE_QUERY_MONITORING:
+        try:
+            query_monitor = get_query_monitor()
+            query_monitor.slow_query_threshold = settings.SLOW_QUERY_THRESHOLD
+            query_monitor.setup_engine_monitoring(async_engine)
+        except Exception:
+            pass  # Query monitoring setup failed (non-critical)
+
+    # Add connection pool event listeners for monitoring
+    # For async engines, we use sync_engine for event listeners
+    try:
+        sync_engine = async_engine.sync_engine
+    except AttributeError:
+        return  # sync_engine not available, skip event listeners
+
+    @event.listens_for(sync_engine, "connect")
+    def set_connection_settings(dbapi_conn, connection_record):
+        """Set connection-level settings for optimal performance."""
+        if settings.ENABLE_QUERY_COMPRESSION:
+            pass  # Placeholder for connection-level optimizations
+
     @event.listens_for(sync_engine, "checkout")
     def receive_checkout(dbapi_conn, connection_record, connection_proxy):
         """Log connection checkout for monitoring."""
         checkout_start = time.time()
-        pool_stats["checkouts"] += 1
+        stats["checkouts"] += 1
         
         if settings.ENABLE_POOL_MONITORING:
             pool = sync_engine.pool
@@ -120,14 +198,14 @@ try:
             # This is approximate - actual wait happens before this event
             wait_time = time.time() - checkout_start
             if wait_time > 0:
-                pool_stats["wait_times"].append(wait_time)
-                pool_stats["total_wait_time"] += wait_time
-                if wait_time > pool_stats["max_wait_time"]:
-                    pool_stats["max_wait_time"] = wait_time
+                stats["wait_times"].append(wait_time)
+                stats["total_wait_time"] += wait_time
+                if wait_time > stats["max_wait_time"]:
+                    stats["max_wait_time"] = wait_time
                 
                 # Keep only last 1000 wait times to avoid memory issues
-                if len(pool_stats["wait_times"]) > 1000:
-                    pool_stats["wait_times"] = pool_stats["wait_times"][-1000:]
+                if len(stats["wait_times"]) > 1000:
+                    stats["wait_times"] = stats["wait_times"][-1000:]
             
             # Calculate pool usage percentage
             usage_percentage = (checked_out / size * 100) if size > 0 else 0.0
@@ -139,6 +217,7 @@ try:
                     "Slow connection checkout",
                     extra={
                         "context": {
+                            "pool": name,
                             "wait_time_ms": wait_time * 1000,
                             "pool_size": size,
                             "checked_out": checked_out,
@@ -155,6 +234,7 @@ try:
                     "Database connection pool saturation warning",
                     extra={
                         "context": {
+                            "pool": name,
                             "usage_percentage": usage_percentage,
                             "pool_size": size,
                             "checked_out": checked_out,
@@ -171,6 +251,7 @@ try:
                     "Database connection pool near exhaustion",
                     extra={
                         "context": {
+                            "pool": name,
                             "usage_percentage": usage_percentage,
                             "pool_size": size,
                             "checked_out": checked_out,
@@ -186,7 +267,7 @@ try:
     @event.listens_for(sync_engine, "checkin")
     def receive_checkin(dbapi_conn, connection_record):
         """Log connection checkin for monitoring."""
-        pool_stats["checkins"] += 1
+        stats["checkins"] += 1
         if settings.ENABLE_POOL_MONITORING:
             pool = sync_engine.pool
             size = pool.size()
@@ -202,6 +283,7 @@ try:
                     "Connection checked in (pool still saturated)",
                     extra={
                         "context": {
+                            "pool": name,
                             "usage_percentage": usage_percentage,
                             "pool_size": size,
                             "checked_out": checked_out,
@@ -214,14 +296,15 @@ try:
     @event.listens_for(sync_engine, "invalidate")
     def receive_invalidate(dbapi_conn, connection_record, exception):
         """Log connection invalidation."""
-        pool_stats["invalidated"] += 1
+        stats["invalidated"] += 1
         if exception:
             logger.warning(
                 "Database connection invalidated",
                 exc_info=exception,
                 extra={
                     "context": {
-                        "total_invalidated": pool_stats["invalidated"],
+                        "pool": name,
+                        "total_invalidated": stats["invalidated"],
                         "error_type": type(exception).__name__ if exception else None,
                     }
                 }
@@ -229,166 +312,181 @@ try:
         else:
             logger.warning(
                 "Database connection invalidated",
-                extra={"context": {"total_invalidated": pool_stats["invalidated"]}}
-            )
-    
-    def get_pool_stats() -> dict:
-        """Get current connection pool statistics."""
-        try:
-            pool = sync_engine.pool
-            size = pool.size()
-            checked_out = pool.checkedout()
-            checked_in = pool.checkedin()
-            overflow = pool.overflow()
-            
-            # Calculate wait time statistics
-            wait_times = pool_stats["wait_times"]
-            avg_wait_time = (
-                pool_stats["total_wait_time"] / len(wait_times)
-                if wait_times else 0.0
+                extra={"context": {"pool": name, "total_invalidated": stats["invalidated"]}}
             )
-            
-            # Clamp overflow to 0 if negative (SQLAlchemy async engine bug)
-            # Overflow should never be negative - it represents connections beyond pool size
-            normalized_overflow = max(0, overflow) if overflow is not None else 0
-            
-            # Calculate usage percentage
-            usage_percentage = (checked_out / size * 100) if size > 0 else 0.0
-            
-            # Health status logic: idle pools (0% usage) should be healthy, not warning
-            # Healthy: < 70% usage AND (no overflow OR normalized overflow is 0)
-            # Warning: 70-90% usage OR (some overflow but < 10% of pool size)
-            # Critical: > 90% usage OR high overflow
-            if usage_percentage < 70.0 and normalized_overflow == 0:
-                health_status = "healthy"
-            elif usage_percentage < 90.0 and normalized_overflow < size * 0.1:
-                health_status = "warning"
-            else:
-                health_status = "critical"
-            
-            return {
-                "size": size,
-                "checked_in": checked_in,
-                "checked_out": checked_out,
-                "overflow": normalized_overflow,  # Return normalized overflow
-                "usage_percentage": usage_percentage,
-                "total_checkouts": pool_stats["checkouts"],
-                "total_checkins": pool_stats["checkins"],
-                "total_invalidated": pool_stats["invalidated"],
-                "wait_time_stats": {
-                    "avg_wait_time_seconds": avg_wait_time,
-                    "max_wait_time_seconds": pool_stats["max_wait_time"],
-                    "total_wait_time_seconds": pool_stats["total_wait_time"],
-                    "samples": len(wait_times),
-                },
-                "health_status": health_status,
-            }
-        except Exception as exc:
-            # Warning condition: Pool stats could not be retrieved with error details
-            return {}
-    
-    def check_pool_health() -> dict:
-        """Check connection pool health and return status."""
-        stats = get_pool_stats()
-        if not stats:
-            return {
-                "status": "unknown",
-                "message": "Could not retrieve pool statistics",
-            }
+
+
+def get_pool_stats(name: str = REQUEST_POOL) -> dict:
+    """Get current connection pool statistics for one named pool."""
+    try:
+        pool = pool_engines[name].sync_engine.pool
+        stats = pool_stats[name]
+        size = pool.size()
+        checked_out = pool.checkedout()
+        checked_in = pool.checkedin()
+        overflow = pool.overflow()
         
-        size = stats.get("size", 0)
-        checked_out = stats.get("checked_out", 0)
-        overflow = stats.get("overflow", 0)
-        usage_percentage = stats.get("usage_percentage", 0.0)
-        avg_wait_time = stats.get("wait_time_stats", {}).get("avg_wait_time_seconds", 0.0)
+        # Calculate wait time statistics
+        wait_times = stats["wait_times"]
+        avg_wait_time = (
+            stats["total_wait_time"] / len(wait_times)
+            if wait_times else 0.0
+        )
         
-        # Normalize overflow to handle negative values (SQLAlchemy async engine issue)
+        # Clamp overflow to 0 if negative (SQLAlchemy async engine bug)
+        # Overflow should never be negative - it represents connections beyond pool size
         normalized_overflow = max(0, overflow) if overflow is not None else 0
         
-        # Health check criteria (consistent with get_pool_stats)
-        # Healthy: < 70% usage, no overflow, low wait time
-        # Warning: 70-90% usage or some overflow (< 10% of pool) or moderate wait time
-        # Critical: > 90% usage or high overflow or high wait time
-        usage_ratio = checked_out / size if size > 0 else 0.0
+        # Calculate usage percentage
+        usage_percentage = (checked_out / size * 100) if size > 0 else 0.0
         
-        # Use consistent logic with get_pool_stats, but also consider wait time
-        if usage_ratio < 0.7 and normalized_overflow == 0 and avg_wait_time < 0.1:
-            status = "healthy"
-        elif usage_ratio < 0.9 and normalized_overflow < size * 0.1 and avg_wait_time < 0.5:
-            status = "warning"
+        # Health status logic: idle pools (0% usage) should be healthy, not warning
+        # Healthy: < 70% usage AND (no overflow OR normalized overflow is 0)
+        # Warning: 70-90% usage OR (some overflow but < 10% of pool size)
+        # Critical: > 90% usage OR high overflow
+        if usage_percentage < 70.0 and normalized_overflow == 0:
+            health_status = "healthy"
+        elif usage_percentage < 90.0 and normalized_overflow < size * 0.1:
+            health_status = "warning"
         else:
-            status = "critical"
-        
-        # Use normalized overflow in message
-        message = (
-            f"Pool usage: {usage_percentage:.1f}% ({checked_out}/{size}), "
-            f"overflow: {normalized_overflow}, avg wait: {avg_wait_time*1000:.1f}ms"
-        )
+            health_status = "critical"
         
         return {
-            "status": status,
-            "message": message,
-            "stats": stats,
+            "pool": name,
+            "size": size,
+            "checked_in": checked_in,
+            "checked_out": checked_out,
+            "overflow": normalized_overflow,  # Return normalized overflow
+            "usage_percentage": usage_percentage,
+            "total_checkouts": stats["checkouts"],
+            "total_checkins": stats["checkins"],
+            "total_invalidated": stats["invalidated"],
+            "wait_time_stats": {
+                "avg_wait_time_seconds": avg_wait_time,
+                "max_wait_time_seconds": stats["max_wait_time"],
+                "total_wait_time_seconds": stats["total_wait_time"],
+                "samples": len(wait_times),
+            },
+            "health_status": health_status,
         }
+    except Exception as exc:
+        # Warning condition: Pool stats could not be retrieved with error details
+        return {}
+
+
+def check_pool_health(name: str = REQUEST_POOL) -> dict:
+    """Check connection pool health and return status."""
+    stats = get_pool_stats(name)
+    if not stats:
+        return {
+            "status": "unknown",
+            "message": "Could not retrieve pool statistics",
+        }
+    
+    size = stats.get("size", 0)
+    checked_out = stats.get("checked_out", 0)
+    overflow = stats.get("overflow", 0)
+    usage_percentage = stats.get("usage_percentage", 0.0)
+    avg_wait_time = stats.get("wait_time_stats", {}).get("avg_wait_time_seconds", 0.0)
+    
+    # Normalize overflow to handle negative values (SQLAlchemy async engine issue)
+    normalized_overflow = max(0, overflow) if overflow is not None else 0
+    
+    # Health check criteria (consistent with get_pool_stats)
+    # Healthy: < 70% usage, no overflow, low wait time
+    # Warning: 70-90% usage or some overflow (< 10% of pool) or moderate wait time
+    # Critical: > 90% usage or high overflow or high wait time
+    usage_ratio = checked_out / size if size > 0 else 0.0
+    
+    # Use consistent logic with get_pool_stats, but also consider wait time
+    if usage_ratio < 0.7 and normalized_overflow == 0 and avg_wait_time < 0.1:
+        status = "healthy"
+    elif usage_ratio < 0.9 and normalized_overflow < size * 0.1 and avg_wait_time < 0.5:
+        status = "warning"
+    else:
+        status = "critical"
+    
+    # Use normalized overflow in message
+    message = (
+        f"Pool usage: {usage_percentage:.1f}% ({checked_out}/{size}), "
+        f"overflow: {normalized_overflow}, avg wait: {avg_wait_time*1000:.1f}ms"
+    )
     
-    # Log pool statistics periodically if enabled
-    if settings.ENABLE_POOL_MONITORING and settings.POOL_MONITORING_INTERVAL > 0:
-        def log_pool_stats():
-            """Periodically log pool statistics."""
-            while True:
-                time.sleep(settings.POOL_MONITORING_INTERVAL)
-                stats = get_pool_stats()
-                if stats:
-                    usage_percentage = stats.get("usage_percentage", 0.0)
-                    health_status = stats.get("health_status", "unknown")
-                    wait_stats = stats.get("wait_time_stats", {})
-                    avg_wait_time = wait_stats.get("avg_wait_time_seconds", 0.0) * 1000
-                    
-                    # Log at appropriate level based on health status
-                    if health_status == "critical":
-                        logger.error(
-                            "Database connection pool health check: CRITICAL",
-                            extra={
-                                "context": stats,
-                                "performance": {
-                                    "avg_wait_time_ms": avg_wait_time,
-                                }
+    return {
+        "status": status,
+        "message": message,
+        "stats": stats,
+    }
+
+
+def check_database_health() -> dict:
+    """Request pool health (as check_pool_health) plus the health of every named pool."""
+    health = check_pool_health(REQUEST_POOL)
+    health["pools"] = {name: check_pool_health(name) for name in pool_engines}
+    return health
+
+
+for _pool_name, _pool_engine in list(pool_engines.items()):
+    setup_pool_monitoring(_pool_name, _pool_engine)
+
+# Log pool statistics periodically if enabled
+if settings.ENABLE_POOL_MONITORING and settings.POOL_MONITORING_INTERVAL > 0:
+    def log_pool_stats():
+        """Periodically log statistics of every named pool."""
+        while True:
+            time.sleep(settings.POOL_MONITORING_INTERVAL)
+            for name in list(pool_engines):
+                stats = get_pool_stats(name)
+                if not stats:
+                    continue
+                usage_percentage = stats.get("usage_percentage", 0.0)
+                health_status = stats.get("health_status", "unknown")
+                wait_stats = stats.get("wait_time_stats", {})
+                avg_wait_time = wait_stats.get("avg_wait_time_seconds", 0.0) * 1000
+                
+                # Log at appropriate level based on health status
+                if health_status == "critical":
+                    logger.error(
+                        "Database connection pool health check: CRITICAL",
+                        extra={
+                            "context": stats,
+                            "performance": {
+                                "avg_wait_time_ms": avg_wait_time,
                             }
-                        )
-                    elif health_status == "warning":
-                        logger.warning(
-                            "Database connection pool health check: WARNING",
-                            extra={
-                                "context": stats,
-                                "performance": {
-                                    "avg_wait_time_ms": avg_wait_time,
-                                }
+                        }
+                    )
+                elif health_status == "warning":
+                    logger.warning(
+                        "Database connection pool health check: WARNING",
+                        extra={
+                            "context": stats,
+                            "performance": {
+                                "avg_wait_time_ms": avg_wait_time,
                             }
-                        )
-                    elif usage_percentage > 70.0:  # Log healthy but busy pools as info
-                        logger.info(
-                            "Database connection pool health check: healthy (high usage)",
-                            extra={
-                                "context": stats,
-                                "performance": {
-                                    "avg_wait_time_ms": avg_wait_time,
-                                }
+                        }
+                    )
+                elif usage_percentage > 70.0:  # Log healthy but busy pools as info
+                    logger.info(
+                        "Database connection pool health check: healthy (high usage)",
+                        extra={
+                            "context": stats,
+                            "performance": {
+                                "avg_wait_time_ms": avg_wait_time,
                             }
-                        )
-                    # Don't log healthy pools with low usage (to reduce log noise)
-        
-        # Start monitoring thread (daemon so it doesn't block shutdown)
-        monitor_thread = threading.Thread(target=log_pool_stats, daemon=True)
-        monitor_thread.start()
-    
-    # Log pool stats on shutdown
-    def log_final_pool_stats():
-        """Log final pool statistics on application shutdown."""
-        get_pool_stats()  # Retrieve stats for potential future use
+                        }
+                    )
+                # Don't log healthy pools with low usage (to reduce log noise)
     
-    atexit.register(log_final_pool_stats)
-except AttributeError:
-    pass  # sync_engine not available, skip event listeners
+    # Start monitoring thread (daemon so it doesn't block shutdown)
+    monitor_thread = threading.Thread(target=log_pool_stats, daemon=True)
+    monitor_thread.start()
+
+# Log pool stats on shutdown
+def log_final_pool_stats():
+    """Log final pool statistics on application shutdown."""
+    get_pool_stats()  # Retrieve stats for potential future use
+
+atexit.register(log_final_pool_stats)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -396,10 +494,209 @@ AsyncSessionLocal = async_sessionmaker(
     class_=AsyncSession,
 )
 
+BackgroundSessionLocal = async_sessionmaker(
+    bind=background_engine,
+    expire_on_commit=False,
+    class_=AsyncSession,
+)
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+AdminSessionLocal = async_sessionmaker(
+    bind=admin_engine,
+    expire_on_commit=False,
+    class_=AsyncSession,
+)
+
+# Optional read replica with its own engine and pool. Read-only endpoints get
+# sessions from it through get_read_db (app.api.deps) unless the replica lags
+# too far behind or the user wrote recently (read-your-writes).
+replica_engine: Optional[AsyncEngine] = None
+ReplicaSessionLocal: Optional[async_sessionmaker] = None
+if settings.USE_REPLICA and settings.DATABASE_REPLICA_URL:
+    replica_engine = create_pool_engine(
+        REPLICA_POOL,
+        enhance_database_url(settings.DATABASE_REPLICA_URL, settings.ENABLE_QUERY_COMPRESSION),
+        pool_size=settings.DATABASE_REPLICA_POOL_SIZE,
+        max_overflow=settings.DATABASE_REPLICA_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        statement_timeout_ms=settings.DATABASE_STATEMENT_TIMEOUT_MS,
+    )
+    setup_pool_monitoring(REPLICA_POOL, replica_engine)
+    ReplicaSessionLocal = async_sessionmaker(
+        bind=replica_engine,
+        expire_on_commit=False,
+        class_=AsyncSession,
+    )
+
+# Replay lag in seconds; 0 when the replica has replayed everything it received
+# (pg_last_xact_replay_timestamp alone grows while the primary is idle)
+REPLICA_LAG_SQL = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+
+_replica_state = {
+    "lag_seconds": None,
+    "healthy": False,
+    "checked_at": None,  # time.monotonic() of the last lag check
+    "replica_reads": 0,
+    "primary_reads": 0,
+    "lag_fallbacks": 0,
+    "pinned_fallbacks": 0,
+}
+_replica_check_lock = asyncio.Lock()
+
+# Users who committed a write recently: user_id -> pin expiry (time.monotonic())
+_recent_writers: OrderedDict[str, float] = OrderedDict()
+_RECENT_WRITERS_MAX_SIZE = 10000
+
+
+def pin_to_primary(user_id: str) -> None:
+    """Route the user's reads to the primary for READ_YOUR_WRITES_WINDOW_SECONDS."""
+    _recent_writers[user_id] = time.monotonic() + settings.READ_YOUR_WRITES_WINDOW_SECONDS
+    _recent_writers.move_to_end(user_id)
+    while len(_recent_writers) > _RECENT_WRITERS_MAX_SIZE:
+        _recent_writers.popitem(last=False)
+
+
+def is_pinned_to_primary(user_id: Optional[str]) -> bool:
+    """Return True if the user wrote within the read-your-writes window."""
+    if not user_id:
+        return False
+    expires_at = _recent_writers.get(user_id)
+    if expires_at is None:
+        return False
+    if time.monotonic() >= expires_at:
+        _recent_writers.pop(user_id, None)
+        return False
+    return True
+
+
+async def measure_replica_lag() -> float:
+    """Return the replica's replay lag in seconds."""
+    async with replica_engine.connect() as conn:
+        if conn.dialect.name != "postgresql":
+            return 0.0
+        lag = (await conn.execute(text(REPLICA_LAG_SQL))).scalar()
+        return float(lag or 0.0)
+
+
+async def replica_available() -> bool:
     """
-    FastAPI dependency that provides an async database session.
+    Return whether the replica is configured, reachable and within REPLICA_MAX_LAG_SECONDS.
+
+    The measurement is cached for REPLICA_LAG_CHECK_INTERVAL_SECONDS; while one
+    request refreshes it, concurrent requests use the previous result.
+    """
+    if ReplicaSessionLocal is None:
+        return False
+    checked_at = _replica_state["checked_at"]
+    if checked_at is not None and time.monotonic() - checked_at < settings.REPLICA_LAG_CHECK_INTERVAL_SECONDS:
+        return _replica_state["healthy"]
+    if _replica_check_lock.locked():
+        return _replica_state["healthy"]
+
+    async with _replica_check_lock:
+        was_healthy = _replica_state["healthy"]
+        try:
+            lag = await measure_replica_lag()
+            _replica_state["lag_seconds"] = lag
+            _replica_state["healthy"] = lag <= settings.REPLICA_MAX_LAG_SECONDS
+        except Exception as exc:
+            _replica_state["lag_seconds"] = None
+            _replica_state["healthy"] = False
+            logger.warning(
+                "Replica lag check failed, routing reads to primary",
+                extra={"context": {"error": str(exc), "error_type": type(exc).__name__}}
+            )
+        _replica_state["checked_at"] = time.monotonic()
+        if was_healthy != _replica_state["healthy"]:
+            logger.info(
+                "Replica routing changed",
+                extra={
+                    "context": {
+                        "healthy": _replica_state["healthy"],
+                        "lag_seconds": _replica_state["lag_seconds"],
+                        "max_lag_seconds": settings.REPLICA_MAX_LAG_SECONDS,
+                    }
+                }
+            )
+    return _replica_state["healthy"]
+
+
+async def should_use_replica(user_id: Optional[str] = None) -> bool:
+    """Decide whether a read for user_id can be served by the replica."""
+    if ReplicaSessionLocal is None:
+        return False
+    if is_pinned_to_primary(user_id):
+        _replica_state["pinned_fallbacks"] += 1
+        return False
+    if not await replica_available():
+        _replica_state["lag_fallbacks"] += 1
+        return False
+    return True
+
+
+@asynccontextmanager
+async def read_session(
+    user_id: Optional[str] = None,
+    primary_factory: Optional[async_sessionmaker] = None,
+) -> AsyncIterator[AsyncSession]:
+    """
+    Open a session for read-only work, on the replica when it is safe to do so.
+
+    ``session.info["using_replica"]`` tells callers where the session points.
+    Nothing is committed; the transaction is discarded when the session closes.
+
+    Args:
+        user_id: Reading user, used for read-your-writes pinning
+        primary_factory: Session factory used when the read stays on the
+            primary (defaults to the request pool)
+    """
+    use_replica = await should_use_replica(user_id)
+    factory = ReplicaSessionLocal if use_replica else (primary_factory or AsyncSessionLocal)
+    _replica_state["replica_reads" if use_replica else "primary_reads"] += 1
+    async with factory() as session:
+        session.info["using_replica"] = use_replica
+        yield session
+
+
+def get_replica_status() -> dict:
+    """Return replica routing state and counters for monitoring."""
+    checked_at = _replica_state["checked_at"]
+    return {
+        "enabled": ReplicaSessionLocal is not None,
+        "healthy": _replica_state["healthy"],
+        "lag_seconds": _replica_state["lag_seconds"],
+        "max_lag_seconds": settings.REPLICA_MAX_LAG_SECONDS,
+        "seconds_since_check": round(time.monotonic() - checked_at, 1) if checked_at is not None else None,
+        "pinned_users": len(_recent_writers),
+        "replica_reads": _replica_state["replica_reads"],
+        "primary_reads": _replica_state["primary_reads"],
+        "lag_fallbacks": _replica_state["lag_fallbacks"],
+        "pinned_fallbacks": _replica_state["pinned_fallbacks"],
+    }
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush_writes(session, flush_context):
+    """Remember that the session wrote, for read-your-writes pinning."""
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_writes(orm_execute_state):
+    """Remember bulk INSERT/UPDATE/DELETE statements executed through the session."""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["has_writes"] = True
+
+
+@asynccontextmanager
+async def _transaction_scope(session_factory: async_sessionmaker) -> AsyncIterator[AsyncSession]:
+    """
+    Provide a session from session_factory for the duration of one transaction.
 
     Commits the transaction on successful completion, rolls back on exception.
     Handles cases where the session is already in an invalid/rolled-back state.
@@ -411,7 +708,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     
     # Use context manager to ensure proper connection pool management
     # The context manager ensures connections are returned to the pool
-    async with AsyncSessionLocal() as session:
+    async with session_factory() as session:
         try:
             yield session
             # Commit transaction on successful completion
@@ -419,6 +716,9 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.commit()
             commit_duration = (time.time() - commit_start) * 1000
             log_database_operation("COMMIT", duration_ms=commit_duration)
+            # user_id is set by get_current_user on the request's session
+            if session.info.get("has_writes") and session.info.get("user_id"):
+                pin_to_primary(session.info["user_id"])
         except Exception as exc:
             # Distinguish between different exception types for proper logging
             # Validation errors and HTTP exceptions are not database errors
@@ -496,3 +796,24 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             # Re-raise to propagate the error
             raise
 
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency that provides an async database session from the request pool.
+
+    Commits the transaction on successful completion, rolls back on exception.
+    """
+    async with _transaction_scope(AsyncSessionLocal) as session:
+        yield session
+
+
+async def get_background_db() -> AsyncGenerator[AsyncSession, None]:
+    """Provide a session from the background pool (exports, verification, merges)."""
+    async with _transaction_scope(BackgroundSessionLocal) as session:
+        yield session
+
+
+async def get_admin_db() -> AsyncGenerator[AsyncSession, None]:
+    """Provide a session from the admin pool for reporting queries."""
+    async with _transaction_scope(AdminSessionLocal) as session:
+        yield session
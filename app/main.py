@@ -28,7 +28,10 @@ from app.core.middleware import (
     TimingMiddleware,
 )
 from app.middleware.performance_monitor import PerformanceMonitorMiddleware
-from app.db.session import check_pool_health
+from app.db.session import AsyncSessionLocal, check_database_health
+from app.repositories.token_blacklist import TokenBlacklistRepository
+from app.services.bulkmailverifier_service import close_http_client as close_bulkmailverifier_client
+from app.services.icypeas_service import close_http_client as close_icypeas_client
 from app.utils.background_tasks import initialize_task_limiting, wait_for_active_tasks
 from app.utils.cache_helpers import get_lru_cache_stats
 from app.utils.logger import get_logger, log_error, log_api_error, get_validation_suggestion
@@ -153,6 +156,14 @@ async def lifespan(app: FastAPI):
         except Exception as exc:
             log_error("Cache warming failed", exc, "app.main")
     
+    # Load the token blacklist Bloom filter (lookups use the database until it is loaded)
+    if settings.ENABLE_TOKEN_BLACKLIST_FILTER:
+        try:
+            async with AsyncSessionLocal() as session:
+                await TokenBlacklistRepository().load_blacklist_filter(session)
+        except Exception as exc:
+            log_error("Failed to load token blacklist filter", exc, "app.main")
+    
     # Log security configuration
     if settings.TRUSTED_HOSTS:
         logger.info(
@@ -177,6 +188,13 @@ async def lifespan(app: FastAPI):
         extra={"context": {"tasks_completed": tasks_completed}}
     )
     
+    # Close pooled HTTP clients for external email providers
+    try:
+        await close_bulkmailverifier_client()
+        await close_icypeas_client()
+    except Exception as exc:
+        log_error("Error closing provider HTTP clients", exc, "app.main")
+    
     # Cleanup thread pool
     try:
         if _thread_pool:
@@ -440,6 +458,7 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     return JSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail},
+        headers=exc.headers,
     )
 
 
@@ -619,8 +638,8 @@ async def health_check():
 
 @app.get("/health/db", tags=["Health"])
 async def database_health_check():
-    """Database connection pool health check endpoint."""
-    health = check_pool_health()
+    """Database connection pool health check endpoint (request pool plus every named pool)."""
+    health = check_database_health()
     return health
 
 
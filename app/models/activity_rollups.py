@@ -0,0 +1,43 @@
+"""SQLAlchemy model for pre-aggregated user activity counts."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.db.types import EnumValue
+from app.models.user import ActivityActionType, ActivityServiceType, ActivityStatus
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class UserActivityRollup(Base):
+    """
+    Number of activities per user, hour, service, action and status.
+
+    Rows are rebuilt from ``user_activities`` by the compaction job in
+    ``app.tasks.activity_rollup_tasks``. Every hour before the compaction
+    watermark (the latest ``bucket_start`` plus one hour) is fully rolled up,
+    so activity stats only read raw activities after it.
+    """
+
+    __tablename__ = "user_activity_rollups"
+
+    user_id: Mapped[str] = mapped_column(Text, primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    service_type: Mapped[str] = mapped_column(
+        EnumValue(ActivityServiceType, "activity_service_type"), primary_key=True
+    )
+    action_type: Mapped[str] = mapped_column(
+        EnumValue(ActivityActionType, "activity_action_type"), primary_key=True
+    )
+    status: Mapped[str] = mapped_column(
+        EnumValue(ActivityStatus, "activity_status"), primary_key=True
+    )
+    activity_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("idx_user_activity_rollups_bucket_start", "bucket_start"),
+    )
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Numeric, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Numeric, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -114,3 +114,31 @@ class AddonPackage(Base):
         Index("idx_addon_packages_is_active", "is_active"),
     )
 
+
+
+class CreditLedgerEntry(Base):
+    """
+    Append-only record of a change to a user's credit balance.
+    
+    Written in the same transaction as the balance update, so the ledger and
+    ``user_profiles.credits`` always agree. ``delta`` is negative for
+    deductions; ``balance_after`` is the balance the update returned.
+    """
+
+    __tablename__ = "credit_ledger"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    user_id: Mapped[str] = mapped_column(Text, nullable=False)
+    delta: Mapped[int] = mapped_column(nullable=False)
+    balance_after: Mapped[int] = mapped_column(nullable=False)
+    reason: Mapped[str] = mapped_column(String(50), nullable=False)
+    reference: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+    __table_args__ = (
+        Index("idx_credit_ledger_user_created", "user_id", "created_at"),
+    )
@@ -11,12 +11,14 @@ Migration: Use app.clients.connectra_client.ConnectraClient for all queries.
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import BigInteger, DateTime, Index, Text
+from sqlalchemy import BigInteger, DateTime, Index, Text, event, inspect
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
 from app.db.types import StringList
+from app.utils.domain import extract_domain_from_url
 from app.utils.logger import get_logger
+from app.utils.sales_navigator_utils import canonical_linkedin_key
 
 logger = get_logger(__name__)
 
@@ -88,6 +90,7 @@ class Company(Base):
             postgresql_ops={"text_search": "gin_trgm_ops"},
         ),
         Index("idx_companies_created_at", "created_at"),
+        Index("idx_companies_updated_at", "updated_at"),
         Index(
             "idx_companies_annual_revenue_industries",
             "annual_revenue",
@@ -110,6 +113,7 @@ class CompanyMetadata(Base):
         doc="Matches Company.uuid",
     )
     linkedin_url: Mapped[Optional[str]] = mapped_column(Text)
+    linkedin_key: Mapped[Optional[str]] = mapped_column(Text, doc="Canonical linkedin_url used for exact lookups")
     linkedin_sales_url: Mapped[Optional[str]] = mapped_column(Text)
     facebook_url: Mapped[Optional[str]] = mapped_column(Text)
     twitter_url: Mapped[Optional[str]] = mapped_column(Text)
@@ -138,5 +142,27 @@ class CompanyMetadata(Base):
         Index("idx_companies_metadata_city", "city"),
         Index("idx_companies_metadata_state", "state"),
         Index("idx_companies_metadata_country", "country"),
+        Index("idx_companies_metadata_normalized_domain", "normalized_domain"),
+        Index("idx_companies_metadata_linkedin_key", "linkedin_key"),
     )
 
+
+@event.listens_for(CompanyMetadata, "before_insert")
+@event.listens_for(CompanyMetadata, "before_update")
+def _sync_normalized_domain(mapper, connection, target: CompanyMetadata) -> None:
+    """Keep normalized_domain derived from website on every ORM write."""
+    if target.website:
+        domain = extract_domain_from_url(target.website)
+        if domain:
+            target.normalized_domain = domain
+
+
+@event.listens_for(CompanyMetadata, "before_insert")
+@event.listens_for(CompanyMetadata, "before_update")
+def _sync_linkedin_key(mapper, connection, target: CompanyMetadata) -> None:
+    """Keep linkedin_key derived from linkedin_url on every ORM write."""
+    state = inspect(target)
+    if state.persistent and not state.attrs.linkedin_url.history.has_changes():
+        return
+    target.linkedin_key = canonical_linkedin_key(target.linkedin_url)
+
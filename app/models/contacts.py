@@ -17,12 +17,15 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Text,
+    event,
+    inspect,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
 from app.db.types import StringList
 from app.utils.logger import get_logger
+from app.utils.sales_navigator_utils import canonical_linkedin_key
 
 logger = get_logger(__name__)
 
@@ -82,6 +85,7 @@ class Contact(Base):
         Index("idx_contacts_email_company", "email", "company_id"),
         Index("idx_contacts_name_company", "first_name", "last_name", "company_id"),
         Index("idx_contacts_created_at", "created_at"),
+        Index("idx_contacts_updated_at", "updated_at"),
         Index("idx_contacts_seniority", "seniority"),
         Index("idx_contacts_seniority_company_id", "seniority", "company_id"),
         Index(
@@ -118,6 +122,7 @@ class ContactMetadata(Base):
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     uuid: Mapped[str] = mapped_column(Text, unique=True, index=True, nullable=False)
     linkedin_url: Mapped[Optional[str]] = mapped_column(Text, default="_")
+    linkedin_key: Mapped[Optional[str]] = mapped_column(Text, doc="Canonical linkedin_url used for exact lookups")
     linkedin_sales_url: Mapped[Optional[str]] = mapped_column(Text, default="_")
     facebook_url: Mapped[Optional[str]] = mapped_column(Text, default="_")
     twitter_url: Mapped[Optional[str]] = mapped_column(Text, default="_")
@@ -140,5 +145,16 @@ class ContactMetadata(Base):
         Index("idx_contacts_metadata_city", "city"),
         Index("idx_contacts_metadata_state", "state"),
         Index("idx_contacts_metadata_country", "country"),
+        Index("idx_contacts_metadata_linkedin_key", "linkedin_key"),
     )
 
+
+@event.listens_for(ContactMetadata, "before_insert")
+@event.listens_for(ContactMetadata, "before_update")
+def _sync_linkedin_key(mapper, connection, target: ContactMetadata) -> None:
+    """Keep linkedin_key derived from linkedin_url on every ORM write."""
+    state = inspect(target)
+    if state.persistent and not state.attrs.linkedin_url.history.has_changes():
+        return
+    target.linkedin_key = canonical_linkedin_key(target.linkedin_url)
+
@@ -0,0 +1,41 @@
+"""SQLAlchemy model for cached email finder results."""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Index, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class EmailFinderCacheEntry(Base):
+    """
+    Email found for a (first name, last name, domain) lookup.
+    
+    Keyed by the normalized name and domain so repeated finder/single lookups
+    are answered with a primary-key read instead of scanning activity history.
+    ``scope`` is "global" when results are shared across users, otherwise the
+    user UUID that owns the entry.
+    """
+
+    __tablename__ = "email_finder_cache"
+
+    scope: Mapped[str] = mapped_column(Text, primary_key=True)
+    first_name: Mapped[str] = mapped_column(Text, primary_key=True)
+    last_name: Mapped[str] = mapped_column(Text, primary_key=True)
+    domain: Mapped[str] = mapped_column(Text, primary_key=True)
+    email: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[Optional[str]] = mapped_column(String(32))
+    source: Mapped[Optional[str]] = mapped_column(String(32))
+    contact_uuid: Mapped[Optional[str]] = mapped_column(Text)
+    found_by: Mapped[Optional[str]] = mapped_column(Text)
+    found_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("idx_email_finder_cache_expires_at", "expires_at"),
+    )
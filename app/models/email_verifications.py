@@ -0,0 +1,32 @@
+"""SQLAlchemy model for persisted email verification results."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class EmailVerificationResult(Base):
+    """
+    Latest verification verdict for an email address.
+    
+    Shared by every verification provider (BulkMailVerifier, Truelist, IcyPeas)
+    so the same address is not paid for twice while its result is fresh.
+    """
+
+    __tablename__ = "email_verification_results"
+
+    email: Mapped[str] = mapped_column(Text, primary_key=True)
+    status: Mapped[str] = mapped_column(String(32), nullable=False)
+    provider: Mapped[str] = mapped_column(String(64), nullable=False)
+    verified_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("idx_email_verification_results_expires_at", "expires_at"),
+    )
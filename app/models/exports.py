@@ -5,7 +5,7 @@ from enum import Enum as PyEnum
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import BigInteger, DateTime, Float, ForeignKey, Index, Integer, Text
+from sqlalchemy import BigInteger, Boolean, DateTime, Float, ForeignKey, Index, Integer, Text
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -100,6 +100,36 @@ class UserExport(Base):
     progress_percentage: Mapped[Optional[float]] = mapped_column(Float, default=None)
     estimated_time_remaining: Mapped[Optional[int]] = mapped_column(Integer, default=None)
     error_message: Mapped[Optional[str]] = mapped_column(Text, default=None)
+    # Cost model / admission control fields
+    estimated_cost: Mapped[Optional[float]] = mapped_column(
+        Float,
+        default=None,
+        comment="Estimated work units (rows x columns x provider calls) computed at admission time.",
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=None)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=None)
+    # Delta export fields
+    is_delta: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    segment_key: Mapped[Optional[str]] = mapped_column(
+        Text,
+        default=None,
+        comment="Caller-supplied segment identifier. Only populated for delta exports.",
+    )
+    delta_since: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=False),
+        default=None,
+        comment="Watermark the delta export started from (rows with updated_at > delta_since).",
+    )
+    delta_watermark: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=False),
+        default=None,
+        comment="Max updated_at seen by this export. Promoted to the segment watermark on completion.",
+    )
+    tombstone_file_path: Mapped[Optional[str]] = mapped_column(
+        Text,
+        default=None,
+        comment="S3 key or local path of the tombstone CSV listing deleted UUIDs.",
+    )
 
     __table_args__ = (
         Index("idx_user_exports_user_id", "user_id"),
@@ -110,3 +140,38 @@ class UserExport(Base):
         Index("idx_user_exports_export_type", "export_type"),
     )
 
+
+
+class ExportWatermark(Base):
+    """Tracks the last exported ``updated_at`` per user segment for delta exports."""
+
+    __tablename__ = "export_watermarks"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    user_id: Mapped[str] = mapped_column(
+        Text,
+        ForeignKey("users.uuid", ondelete="CASCADE"),
+        nullable=False,
+    )
+    export_type: Mapped[ExportType] = mapped_column(
+        SQLEnum(ExportType, name="export_type"),
+        nullable=False,
+    )
+    segment_key: Mapped[str] = mapped_column(Text, nullable=False)
+    watermark: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=False))
+    last_export_id: Mapped[Optional[str]] = mapped_column(Text)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=datetime_utcnow,
+        onupdate=datetime_utcnow,
+    )
+
+    __table_args__ = (
+        Index(
+            "idx_export_watermarks_user_type_segment",
+            "user_id",
+            "export_type",
+            "segment_key",
+            unique=True,
+        ),
+    )
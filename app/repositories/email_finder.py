@@ -5,17 +5,14 @@ from __future__ import annotations
 import time
 from typing import Optional
 
-from sqlalchemy import Select, and_, case, func, or_, select
+from sqlalchemy import Select, and_, case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.companies import Company, CompanyMetadata
 from app.models.contacts import Contact, ContactMetadata
 from app.repositories.base import AsyncRepository
-from app.utils.batch_lookup import (
-    batch_fetch_companies_by_uuids,
-    batch_fetch_company_metadata_by_uuids,
-    batch_fetch_contact_metadata_by_uuids,
-)
+from app.utils.batch_lookup import fetch_contacts_with_relations
+from app.utils.domain import extract_domain_from_url
 from app.utils.logger import get_logger, log_database_query, log_database_error
 
 logger = get_logger(__name__)
@@ -31,47 +28,8 @@ class EmailFinderRepository(AsyncRepository):
 
     @staticmethod
     def _normalize_domain(domain: str) -> str:
-        """Normalize domain for comparison (lowercase, no www)."""
-        normalized = domain.lower().strip()
-        if normalized.startswith("www."):
-            normalized = normalized[4:]
-        return normalized
-
-    @staticmethod
-    def _extract_domain_from_website_sql(website_column, normalized_domain: str):
-        """
-        Extract normalized domain from website column using SQL functions.
-        
-        Uses PostgreSQL-specific functions to extract domain from URLs:
-        1. Remove protocol (http://, https://)
-        2. Extract hostname (everything before first /)
-        3. Remove port number
-        4. Remove www. prefix
-        5. Convert to lowercase
-        
-        Args:
-            website_column: SQLAlchemy column reference (CompanyMetadata.website)
-            normalized_domain: The normalized domain string to match against
-            
-        Returns:
-            SQLAlchemy expression that extracts and normalizes domain from website column
-        """
-        # Step 1: Remove protocol (http://, https://)
-        no_protocol = func.regexp_replace(
-            func.coalesce(website_column, ""),
-            r"^https?://",
-            "",
-            "i"
-        )
-        # Step 2: Extract hostname (everything before first /)
-        hostname = func.split_part(no_protocol, "/", 1)
-        # Step 3: Remove port number
-        no_port = func.split_part(hostname, ":", 1)
-        # Step 4: Remove www. prefix and convert to lowercase
-        domain_expression = func.lower(
-            func.regexp_replace(no_port, r"^www\.", "", "i")
-        )
-        return domain_expression
+        """Normalize domain the same way companies_metadata.normalized_domain is maintained."""
+        return extract_domain_from_url(domain) or domain.lower().strip()
 
     async def check_companies_exist_by_domain(
         self,
@@ -81,91 +39,35 @@ class EmailFinderRepository(AsyncRepository):
         """
         Check if any companies exist for the given domain.
         
-        Searches companies_metadata table using dual strategy:
-        1. Check normalized_domain column (existing)
-        2. Extract domain from website column and match (new)
+        Uses an equality match on the indexed companies_metadata.normalized_domain
+        column, which is kept in sync with the website on every write path.
         
         Args:
             session: Database session
             domain: Company domain to check (normalized, case-insensitive)
             
         Returns:
-            True if at least one company matches the domain via either strategy, False otherwise
+            True if at least one company matches the domain, False otherwise
         """
         normalized_domain = self._normalize_domain(domain)
-        
-        # Strategy 1: Check normalized_domain column
-        normalized_domain_subq = select(CompanyMetadata.uuid).where(
-            CompanyMetadata.normalized_domain == normalized_domain,
-            CompanyMetadata.normalized_domain.isnot(None)
-        )
-        
-        # Strategy 2: Extract domain from website column and match
-        website_domain_expression = self._extract_domain_from_website_sql(
-            CompanyMetadata.website,
-            normalized_domain
-        )
-        website_subq = select(CompanyMetadata.uuid).where(
-            and_(
-                CompanyMetadata.website.isnot(None),
-                func.trim(CompanyMetadata.website) != "",
-                website_domain_expression == normalized_domain
-            )
-        )
-        
-        # Combine both strategies with OR condition
-        combined_subq = select(CompanyMetadata.uuid).where(
-            or_(
-                CompanyMetadata.uuid.in_(normalized_domain_subq),
-                CompanyMetadata.uuid.in_(website_subq)
-            )
-        ).distinct()
-        
-        # Compiling SQL query for debugging
-        try:
-            _compiled = combined_subq.compile(compile_kwargs={"literal_binds": False})
-        except Exception:
-            # Error handling: SQL could not be compiled
-            pass
+        stmt = select(CompanyMetadata.uuid).where(
+            CompanyMetadata.normalized_domain == normalized_domain
+        ).limit(1)
         
         start_time = time.time()
         try:
-            # Execute query to get count and UUIDs
-            result = await session.execute(combined_subq)
-            rows = result.scalars().all()
-            company_uuids = list(rows)
-            count = len(company_uuids)
-            exists = count > 0
+            result = await session.execute(stmt)
+            exists = result.scalar_one_or_none() is not None
             
             duration_ms = (time.time() - start_time) * 1000
-            
             log_database_query(
                 query_type="SELECT",
                 table="companies_metadata",
                 filters={"domain": normalized_domain},
-                result_count=count,
+                result_count=1 if exists else 0,
                 duration_ms=duration_ms,
                 logger_name="app.repositories.email_finder",
             )
-            
-            # Check which strategy found results (only if companies exist)
-            if not exists:
-                # No companies found with domain using either normalized_domain column or website extraction
-                return False
-            
-            # Check normalized_domain strategy
-            normalized_start = time.time()
-            normalized_result = await session.execute(normalized_domain_subq)
-            normalized_uuids = list(normalized_result.scalars().all())
-            normalized_count = len(normalized_uuids)
-            normalized_duration = (time.time() - normalized_start) * 1000
-            
-            # Check website extraction strategy
-            website_start = time.time()
-            website_result = await session.execute(website_subq)
-            website_uuids = list(website_result.scalars().all())
-            website_count = len(website_uuids)
-            website_duration = (time.time() - website_start) * 1000
         except Exception as exc:
             duration_ms = (time.time() - start_time) * 1000
             log_database_error(
@@ -191,7 +93,7 @@ class EmailFinderRepository(AsyncRepository):
         Find email addresses by contact name and company domain using optimized approach.
         
         This method uses an optimized strategy:
-        1. Find company UUIDs from companies_metadata (prioritize normalized_domain, fallback to website extraction)
+        1. Find company UUIDs from companies_metadata by normalized_domain equality
         2. Validate company UUIDs exist in companies table
         3. Find contact emails using cached company UUIDs (no subquery re-execution)
         
@@ -206,7 +108,6 @@ class EmailFinderRepository(AsyncRepository):
             List of tuples (uuid, email) where uuid is contact UUID and email is email address
             
         Note:
-            - Prioritizes normalized_domain column (indexed) over website extraction
             - Caches company UUIDs to avoid re-executing subqueries
             - Uses direct UUID list filtering instead of nested subqueries
             - Uses idx_companies_metadata_normalized_domain index
@@ -253,37 +154,16 @@ class EmailFinderRepository(AsyncRepository):
         self, session: AsyncSession, normalized_domain: str
     ) -> list[str]:
         """
-        Get company UUIDs from companies_metadata using dual strategy.
+        Get company UUIDs from companies_metadata by normalized domain.
         
         Returns:
             List of company metadata UUIDs
         """
-        # Strategy 1: Check normalized_domain column (FAST - uses index)
-        normalized_domain_stmt = select(CompanyMetadata.uuid).where(
-            CompanyMetadata.normalized_domain == normalized_domain,
-            CompanyMetadata.normalized_domain.isnot(None)
+        stmt = select(CompanyMetadata.uuid).where(
+            CompanyMetadata.normalized_domain == normalized_domain
         )
-        normalized_result = await session.execute(normalized_domain_stmt)
-        normalized_uuids = list(normalized_result.scalars().all())
-        
-        # Strategy 2: Only if normalized_domain found nothing, try website extraction (SLOW)
-        website_uuids = []
-        if not normalized_uuids:
-            # Trying slow website extraction which may take 20+ seconds
-            website_domain_expression = self._extract_domain_from_website_sql(
-                CompanyMetadata.website, normalized_domain
-            )
-            website_stmt = select(CompanyMetadata.uuid).where(
-                and_(
-                    CompanyMetadata.website.isnot(None),
-                    func.trim(CompanyMetadata.website) != "",
-                    website_domain_expression == normalized_domain
-                )
-            ).limit(1000)
-            website_result = await session.execute(website_stmt)
-            website_uuids = list(website_result.scalars().all())
-        
-        return list(set(normalized_uuids + website_uuids))
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
 
     async def _validate_company_uuids(
         self, session: AsyncSession, company_meta_uuids: list[str]
@@ -432,39 +312,8 @@ class EmailFinderRepository(AsyncRepository):
             # Additional emails beyond the first 10
             pass
         
-        # Fetch contacts only (no joins)
-        stmt: Select = select(Contact).where(Contact.email.in_(emails))
-        
-        # Compiling SQL query for debugging
-        try:
-            _compiled = stmt.compile(compile_kwargs={"literal_binds": False})
-        except Exception:
-            # Error handling: SQL could not be compiled
-            pass
-        
-        result = await session.execute(stmt)
-        contacts = result.scalars().all()
-        
-        # Extract foreign keys
-        company_ids = {c.company_id for c in contacts if c.company_id}
-        contact_uuids = {c.uuid for c in contacts}
-        
-        # Batch fetch related entities
-        companies_dict = await batch_fetch_companies_by_uuids(session, company_ids)
-        contact_meta_dict = await batch_fetch_contact_metadata_by_uuids(session, contact_uuids)
-        
-        # Extract company UUIDs from fetched companies
-        company_uuids = {c.uuid for c in companies_dict.values()}
-        company_meta_dict = await batch_fetch_company_metadata_by_uuids(session, company_uuids)
-        
-        # Reconstruct tuples
-        rows = []
-        for contact in contacts:
-            company = companies_dict.get(contact.company_id) if contact.company_id else None
-            contact_meta = contact_meta_dict.get(contact.uuid)
-            company_meta = company_meta_dict.get(company.uuid) if company else None
-            rows.append((contact, contact_meta, company, company_meta))
-        
+        # Contacts and their related entities in a single joined query
+        rows = await fetch_contacts_with_relations(session, Contact.email.in_(emails))
         
         # Extract and log field statistics
         uuids_extracted = 0
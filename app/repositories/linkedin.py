@@ -13,14 +13,15 @@ from app.models.companies import Company, CompanyMetadata
 from app.models.contacts import Contact, ContactMetadata
 from app.repositories.base import AsyncRepository
 from app.utils.batch_lookup import (
-    batch_fetch_companies_by_uuids,
     batch_fetch_company_metadata_by_uuids,
     batch_fetch_contact_metadata_by_uuids,
     fetch_company_by_uuid,
     fetch_company_metadata_by_uuid,
     fetch_contact_metadata_by_uuid,
+    fetch_contacts_with_relations,
 )
 from app.utils.logger import get_logger, log_database_query, log_database_error
+from app.utils.sales_navigator_utils import canonical_linkedin_key
 
 logger = get_logger(__name__)
 
@@ -41,50 +42,17 @@ class LinkedInRepository(AsyncRepository):
         
         Returns tuples of (Contact, ContactMetadata, Company, CompanyMetadata).
         """
+        linkedin_key = canonical_linkedin_key(linkedin_url)
+        if not linkedin_key:
+            return []
+        
         start_time = time.time()
         try:
-            # Use EXISTS subquery to filter contacts by LinkedIn URL in metadata
-            stmt: Select = (
-                select(Contact)
-                .where(
-                    exists(
-                        select(1)
-                        .select_from(ContactMetadata)
-                        .where(
-                            and_(
-                                ContactMetadata.uuid == Contact.uuid,
-                                ContactMetadata.linkedin_url.isnot(None),
-                                ContactMetadata.linkedin_url != "_",
-                                ContactMetadata.linkedin_url.ilike(f"%{linkedin_url}%"),
-                            )
-                        )
-                    )
-                )
+            # Filter on the indexed canonical key; related entities come from the same joined query
+            rows = await fetch_contacts_with_relations(
+                session, ContactMetadata.linkedin_key == linkedin_key
             )
             
-            result = await session.execute(stmt)
-            contacts = result.scalars().all()
-            
-            # Extract foreign keys
-            company_ids = {c.company_id for c in contacts if c.company_id}
-            contact_uuids = {c.uuid for c in contacts}
-            
-            # Batch fetch related entities
-            companies_dict = await batch_fetch_companies_by_uuids(session, company_ids)
-            contact_meta_dict = await batch_fetch_contact_metadata_by_uuids(session, contact_uuids)
-            
-            # Extract company UUIDs from fetched companies
-            company_uuids = {c.uuid for c in companies_dict.values()}
-            company_meta_dict = await batch_fetch_company_metadata_by_uuids(session, company_uuids)
-            
-            # Reconstruct tuples
-            rows = []
-            for contact in contacts:
-                company = companies_dict.get(contact.company_id) if contact.company_id else None
-                contact_meta = contact_meta_dict.get(contact.uuid)
-                company_meta = company_meta_dict.get(company.uuid) if company else None
-                rows.append((contact, contact_meta, company, company_meta))
-            
             duration_ms = (time.time() - start_time) * 1000
             
             log_database_query(
@@ -116,8 +84,11 @@ class LinkedInRepository(AsyncRepository):
         
         Returns tuples of (Company, CompanyMetadata).
         """
-        # Use EXISTS subquery to filter companies by LinkedIn URL in metadata
+        linkedin_key = canonical_linkedin_key(linkedin_url)
+        if not linkedin_key:
+            return []
         
+        # Use EXISTS subquery on the indexed canonical key in metadata
         stmt: Select = (
             select(Company)
             .where(
@@ -127,8 +98,7 @@ class LinkedInRepository(AsyncRepository):
                     .where(
                         and_(
                             CompanyMetadata.uuid == Company.uuid,
-                            CompanyMetadata.linkedin_url.isnot(None),
-                            CompanyMetadata.linkedin_url.ilike(f"%{linkedin_url}%"),
+                            CompanyMetadata.linkedin_key == linkedin_key,
                         )
                     )
                 )
@@ -154,8 +124,11 @@ class LinkedInRepository(AsyncRepository):
         
         Returns tuple of (Contact, ContactMetadata, Company, CompanyMetadata) or None.
         """
-        # Use EXISTS subquery to find contact by exact LinkedIn URL
+        linkedin_key = canonical_linkedin_key(linkedin_url)
+        if not linkedin_key:
+            return None
         
+        # Use EXISTS subquery to find contact by the canonical LinkedIn key
         stmt: Select = (
             select(Contact)
             .where(
@@ -165,9 +138,7 @@ class LinkedInRepository(AsyncRepository):
                     .where(
                         and_(
                             ContactMetadata.uuid == Contact.uuid,
-                            ContactMetadata.linkedin_url.isnot(None),
-                            ContactMetadata.linkedin_url != "_",
-                            ContactMetadata.linkedin_url.ilike(linkedin_url),
+                            ContactMetadata.linkedin_key == linkedin_key,
                         )
                     )
                 )
@@ -197,8 +168,11 @@ class LinkedInRepository(AsyncRepository):
         
         Returns tuple of (Company, CompanyMetadata) or None.
         """
-        # Use EXISTS subquery to find company by exact LinkedIn URL
+        linkedin_key = canonical_linkedin_key(linkedin_url)
+        if not linkedin_key:
+            return None
         
+        # Use EXISTS subquery to find company by the canonical LinkedIn key
         stmt: Select = (
             select(Company)
             .where(
@@ -208,8 +182,7 @@ class LinkedInRepository(AsyncRepository):
                     .where(
                         and_(
                             CompanyMetadata.uuid == Company.uuid,
-                            CompanyMetadata.linkedin_url.isnot(None),
-                            CompanyMetadata.linkedin_url.ilike(linkedin_url),
+                            CompanyMetadata.linkedin_key == linkedin_key,
                         )
                     )
                 )
@@ -259,46 +232,17 @@ class LinkedInRepository(AsyncRepository):
         Step 1 of sequential query: Query contacts_metadata table only.
         Returns list of ContactMetadata objects.
         
-        Optimized for performance:
-        - Uses GIN trigram index for ILIKE pattern matching
-        - Extracts username from URL for more specific matching
-        - Adds LIMIT to prevent excessive results
+        Matches the canonical key (see ``canonical_linkedin_key``) by equality,
+        which uses idx_contacts_metadata_linkedin_key.
         """
-        # Normalize and extract username from LinkedIn URL for better matching
-        # LinkedIn URLs typically: https://www.linkedin.com/in/username or /in/username
-        normalized_url = linkedin_url.strip()
-        
-        # Extract username part if it's a full URL
-        # This helps with index usage by making the pattern more specific
-        if "/in/" in normalized_url:
-            # Extract the username part after /in/
-            url_parts = normalized_url.split("/in/")
-            if len(url_parts) > 1:
-                username_part = url_parts[-1].split("?")[0].split("/")[0].strip()
-                if username_part:
-                    # Use the username part for more efficient matching
-                    search_pattern = f"%{username_part}%"
-                else:
-                    search_pattern = f"%{normalized_url}%"
-            else:
-                search_pattern = f"%{normalized_url}%"
-        else:
-            # Use the full URL if no /in/ pattern found
-            search_pattern = f"%{normalized_url}%"
-        
-        # Build query with optimized pattern matching
-        # The GIN trigram index (idx_contacts_metadata_linkedin_url_gin) will be used
-        # Adding LIMIT to prevent excessive results and improve performance
+        linkedin_key = canonical_linkedin_key(linkedin_url)
+        if not linkedin_key:
+            return []
+        
         stmt: Select = (
             select(ContactMetadata)
-            .where(
-                and_(
-                    ContactMetadata.linkedin_url.isnot(None),
-                    ContactMetadata.linkedin_url != "_",
-                    ContactMetadata.linkedin_url.ilike(search_pattern),
-                )
-            )
-            .limit(1000)  # Reasonable limit to prevent full table scans
+            .where(ContactMetadata.linkedin_key == linkedin_key)
+            .limit(1000)  # Reasonable limit for duplicated profiles
         )
         
         result = await session.execute(stmt)
@@ -494,38 +438,21 @@ class LinkedInRepository(AsyncRepository):
         
         Step 1 of sequential query for companies: Query companies_metadata table only.
         Returns list of CompanyMetadata objects.
+        
+        Matches the canonical key (see ``canonical_linkedin_key``) by equality,
+        which uses idx_companies_metadata_linkedin_key.
         """
-        # Normalize and extract company identifier from LinkedIn URL
-        normalized_url = linkedin_url.strip()
-        
-        # Extract company identifier if it's a full URL
-        # LinkedIn company URLs typically: https://www.linkedin.com/company/company-name
-        if "/company/" in normalized_url:
-            url_parts = normalized_url.split("/company/")
-            if len(url_parts) > 1:
-                company_part = url_parts[-1].split("?")[0].split("/")[0].strip()
-                if company_part:
-                    search_pattern = f"%{company_part}%"
-                else:
-                    search_pattern = f"%{normalized_url}%"
-            else:
-                search_pattern = f"%{normalized_url}%"
-        else:
-            search_pattern = f"%{normalized_url}%"
+        linkedin_key = canonical_linkedin_key(linkedin_url)
+        if not linkedin_key:
+            return []
         
         stmt: Select = (
             select(CompanyMetadata)
-            .where(
-                and_(
-                    CompanyMetadata.linkedin_url.isnot(None),
-                    CompanyMetadata.linkedin_url.ilike(search_pattern),
-                )
-            )
-            .limit(1000)  # Reasonable limit to prevent full table scans
+            .where(CompanyMetadata.linkedin_key == linkedin_key)
+            .limit(1000)  # Reasonable limit for duplicated profiles
         )
         
         result = await session.execute(stmt)
         company_metadata_list = result.scalars().all()
         
         return list(company_metadata_list)
-
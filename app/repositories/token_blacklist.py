@@ -1,18 +1,91 @@
-"""Repository for token blacklist operations."""
+"""Repository for token blacklist operations.
 
-from datetime import datetime, timezone
-from typing import Optional
+Blacklist lookups are fronted by a process-wide ``ExpiringBloomFilter`` of
+unexpired blacklisted tokens, bucketed by token expiry. It is loaded at
+startup (``load_blacklist_filter``), updated when this worker blacklists a
+token, and brought up to date with entries written by other workers by a delta
+fetch at most every TOKEN_BLACKLIST_FILTER_SYNC_SECONDS. A filter miss for a
+valid, unexpired token is a definite "not blacklisted"; everything else
+(possible positives, undecodable or expired tokens, a stale or unloaded
+filter) is checked against the database.
+"""
 
-from sqlalchemy import Select, delete, select
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import Select, delete, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.core.security import decode_token
 from app.models.token_blacklist import TokenBlacklist
 from app.repositories.base import AsyncRepository
-from app.utils.logger import get_logger, log_database_query
+from app.utils.bloom_filter import ExpiringBloomFilter
+from app.utils.logger import get_logger, log_database_query, log_error
 
+settings = get_settings()
 logger = get_logger(__name__)
 
+_blacklist_filter: Optional[ExpiringBloomFilter] = None
+_filter_state: Dict[str, Any] = {
+    "synced_at": None,  # time.monotonic() of the last successful load or sync
+    "watermark": None,  # latest blacklisted_at seen
+    "filter_misses": 0,
+    "db_checks": 0,
+    "false_positives": 0,
+    "sync_failures": 0,
+}
+
+
+def _new_filter() -> ExpiringBloomFilter:
+    return ExpiringBloomFilter(
+        bucket_seconds=settings.TOKEN_BLACKLIST_FILTER_BUCKET_HOURS * 3600,
+        capacity_per_bucket=settings.TOKEN_BLACKLIST_FILTER_CAPACITY,
+        error_rate=settings.TOKEN_BLACKLIST_FILTER_ERROR_RATE,
+    )
+
+
+def _token_expiry(token: str) -> Tuple[bool, Optional[datetime]]:
+    """Return (valid, expires_at) for a token, as stored by create_blacklist_entry."""
+    payload = decode_token(token)
+    if payload is None:
+        return False, None
+    if "exp" not in payload:
+        return True, None
+    return True, datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+
+
+def _advance_watermark(blacklisted_at: Optional[datetime]) -> None:
+    if blacklisted_at is None:
+        return
+    watermark = _filter_state["watermark"]
+    if watermark is None or blacklisted_at > watermark:
+        _filter_state["watermark"] = blacklisted_at
+
+
+def reset_blacklist_filter() -> None:
+    """Discard the in-memory filter; lookups go to the database until it is reloaded."""
+    global _blacklist_filter
+    _blacklist_filter = None
+    _filter_state["synced_at"] = None
+    _filter_state["watermark"] = None
+
+
+def get_token_blacklist_filter_stats() -> Dict[str, Any]:
+    """Return filter size and hit/miss counters for monitoring."""
+    synced_at = _filter_state["synced_at"]
+    return {
+        "enabled": settings.ENABLE_TOKEN_BLACKLIST_FILTER,
+        "loaded": _blacklist_filter is not None,
+        "seconds_since_sync": round(time.monotonic() - synced_at, 1) if synced_at is not None else None,
+        "filter_misses": _filter_state["filter_misses"],
+        "db_checks": _filter_state["db_checks"],
+        "false_positives": _filter_state["false_positives"],
+        "sync_failures": _filter_state["sync_failures"],
+        **(_blacklist_filter.get_stats() if _blacklist_filter is not None else {}),
+    }
+
 
 class TokenBlacklistRepository(AsyncRepository[TokenBlacklist]):
     """Data access helpers for token blacklist queries."""
@@ -53,6 +126,9 @@ class TokenBlacklistRepository(AsyncRepository[TokenBlacklist]):
         session.add(blacklist_entry)
         await session.flush()
         await session.refresh(blacklist_entry)
+        if _blacklist_filter is not None:
+            # A rolled-back insert only leaves a false positive, which the DB check resolves
+            _blacklist_filter.add(token, expires_at)
         return blacklist_entry
 
     async def is_token_blacklisted(
@@ -70,12 +146,114 @@ class TokenBlacklistRepository(AsyncRepository[TokenBlacklist]):
         Returns:
             True if token is blacklisted, False otherwise
         """
-        stmt: Select[tuple[TokenBlacklist]] = select(self.model).where(self.model.token == token)
+        might_be_blacklisted = True
+        if settings.ENABLE_TOKEN_BLACKLIST_FILTER and _blacklist_filter is not None:
+            if await self._filter_is_fresh(session):
+                valid, expires_at = _token_expiry(token)
+                if valid and (expires_at is None or expires_at > datetime.now(timezone.utc)):
+                    might_be_blacklisted = _blacklist_filter.might_contain(token, expires_at)
+                    if not might_be_blacklisted:
+                        _filter_state["filter_misses"] += 1
+                        return False
+
+        _filter_state["db_checks"] += 1
+        stmt: Select[tuple[str]] = select(self.model.token).where(self.model.token == token)
         result = await session.execute(stmt)
-        entry = result.scalar_one_or_none()
-        is_blacklisted = entry is not None
+        is_blacklisted = result.scalar_one_or_none() is not None
+        if not is_blacklisted and not might_be_blacklisted:
+            _filter_state["false_positives"] += 1
         return is_blacklisted
 
+    async def _filter_is_fresh(self, session: AsyncSession) -> bool:
+        """
+        Sync the filter if it is older than the sync interval; return whether it is current.
+
+        The sync runs in a savepoint so that a failure leaves the caller's
+        transaction usable for the database fallback.
+        """
+        synced_at = _filter_state["synced_at"]
+        if synced_at is not None and time.monotonic() - synced_at < settings.TOKEN_BLACKLIST_FILTER_SYNC_SECONDS:
+            return True
+        try:
+            async with session.begin_nested():
+                await self.sync_blacklist_filter(session)
+        except Exception as exc:
+            _filter_state["sync_failures"] += 1
+            log_error(
+                "Token blacklist filter sync failed, checking the database",
+                exc,
+                "app.repositories.token_blacklist",
+            )
+            return False
+        return True
+
+    async def load_blacklist_filter(self, session: AsyncSession) -> int:
+        """
+        Build the in-memory filter from all unexpired blacklist entries.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Number of entries loaded
+        """
+        global _blacklist_filter
+        start_time = time.time()
+        now = datetime.now(timezone.utc)
+        bloom = _new_filter()
+        stmt = select(self.model.token, self.model.expires_at).where(
+            or_(self.model.expires_at.is_(None), self.model.expires_at > now)
+        )
+        watermark = (await session.execute(select(func.max(self.model.blacklisted_at)))).scalar_one_or_none()
+        result = await session.stream(stmt.execution_options(yield_per=5000))
+        loaded = 0
+        async for token, expires_at in result:
+            bloom.add(token, expires_at, now=now)
+            loaded += 1
+
+        _blacklist_filter = bloom
+        _filter_state["watermark"] = watermark
+        _filter_state["synced_at"] = time.monotonic()
+        logger.info(
+            "Token blacklist filter loaded",
+            extra={
+                "context": {"entries": loaded, **bloom.get_stats()},
+                "performance": {"duration_ms": (time.time() - start_time) * 1000},
+            }
+        )
+        return loaded
+
+    async def sync_blacklist_filter(self, session: AsyncSession) -> int:
+        """
+        Add entries blacklisted since the last sync (e.g. by other workers) to the filter.
+
+        Re-reads TOKEN_BLACKLIST_FILTER_SYNC_OVERLAP_SECONDS behind the watermark
+        so entries committed after later-stamped ones are not missed, and drops
+        filter buckets whose tokens have expired.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Number of entries fetched
+        """
+        if _blacklist_filter is None:
+            return await self.load_blacklist_filter(session)
+
+        now = datetime.now(timezone.utc)
+        stmt = select(self.model.token, self.model.expires_at, self.model.blacklisted_at)
+        watermark = _filter_state["watermark"]
+        if watermark is not None:
+            since = watermark - timedelta(seconds=settings.TOKEN_BLACKLIST_FILTER_SYNC_OVERLAP_SECONDS)
+            stmt = stmt.where(self.model.blacklisted_at >= since)
+        rows = (await session.execute(stmt)).all()
+        for token, expires_at, blacklisted_at in rows:
+            _blacklist_filter.add(token, expires_at, now=now)
+            _advance_watermark(blacklisted_at)
+        _blacklist_filter.prune(now)
+        _filter_state["synced_at"] = time.monotonic()
+        return len(rows)
+
     async def cleanup_expired_tokens(
         self,
         session: AsyncSession,
@@ -94,6 +272,8 @@ class TokenBlacklistRepository(AsyncRepository[TokenBlacklist]):
         result = await session.execute(stmt)
         count = result.rowcount
         await session.flush()
+        if _blacklist_filter is not None:
+            _blacklist_filter.prune(now)
         return count
 
     async def get_by_token(
@@ -2,14 +2,15 @@
 
 import asyncio
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from sqlalchemy import Select, and_, func, inspect, select
-from sqlalchemy import func as sql_func
+from sqlalchemy import Select, func, inspect, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import load_only, noload
 
+from app.core.config import get_settings
+from app.models.activity_rollups import UserActivityRollup
 from app.models.user import (
     ActivityActionType,
     ActivityServiceType,
@@ -25,9 +26,27 @@ from app.utils.logger import get_logger, log_database_query, log_error, log_data
 from app.utils.query_cache import get_query_cache
 from app.utils.validation import is_valid_uuid
 
+settings = get_settings()
 logger = get_logger(__name__)
 
 
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes (e.g. from SQLite) as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def floor_to_hour(value: datetime) -> datetime:
+    """Truncate a datetime to the start of its hour (naive values are treated as UTC)."""
+    return _as_utc(value).replace(minute=0, second=0, microsecond=0)
+
+
+def _ceil_to_hour(value: datetime) -> datetime:
+    floored = floor_to_hour(value)
+    return floored if floored == _as_utc(value) else floored + timedelta(hours=1)
+
+
 class UserRepository(AsyncRepository[User]):
     """Data access helpers for user-centric queries."""
 
@@ -1000,57 +1019,6 @@ class UserActivityRepository(AsyncRepository[UserActivity]):
         
         return activity_records, total
 
-    async def find_previous_email_search(
-        self,
-        session: AsyncSession,
-        user_id: str,
-        first_name: str,
-        last_name: str,
-        domain: str,
-    ) -> Optional[UserActivity]:
-        """
-        Find a previous successful email search with matching parameters.
-        
-        Args:
-            session: Database session
-            user_id: User ID
-            first_name: First name to match
-            last_name: Last name to match
-            domain: Domain to match
-            
-        Returns:
-            Most recent matching UserActivity record if found, None otherwise
-        """
-        # Normalize inputs for matching (case-insensitive)
-        first_name_norm = first_name.lower().strip()
-        last_name_norm = last_name.lower().strip()
-        domain_norm = domain.lower().strip()
-        
-        # Query for matching activities
-        # Match: user_id, service_type='email', action_type='search', status='success'
-        # and request_params JSONB matches first_name, last_name, domain
-        stmt = (
-            select(self.model)
-            .where(
-                and_(
-                    self.model.user_id == user_id,
-                    self.model.service_type == ActivityServiceType.EMAIL.value,
-                    self.model.action_type == ActivityActionType.SEARCH.value,
-                    self.model.status == ActivityStatus.SUCCESS.value,
-                    # Match request_params JSONB fields (case-insensitive)
-                    sql_func.lower(self.model.request_params['first_name'].astext) == first_name_norm,
-                    sql_func.lower(self.model.request_params['last_name'].astext) == last_name_norm,
-                    sql_func.lower(self.model.request_params['domain'].astext) == domain_norm,
-                )
-            )
-            .order_by(self.model.created_at.desc())
-            .limit(1)
-        )
-        
-        result = await session.execute(stmt)
-        activity = result.scalar_one_or_none()
-        return activity
-
     async def get_activity_stats(
         self,
         session: AsyncSession,
@@ -1071,60 +1039,63 @@ class UserActivityRepository(AsyncRepository[UserActivity]):
             Dictionary with activity statistics
         """
         
-        # Build base query
-        base_stmt = select(self.model).where(self.model.user_id == user_id)
-        if start_date:
-            base_stmt = base_stmt.where(self.model.created_at >= start_date)
-        if end_date:
-            base_stmt = base_stmt.where(self.model.created_at <= end_date)
-        
-        # Get total count
-        total_stmt = select(func.count(self.model.id)).where(self.model.user_id == user_id)
-        if start_date:
-            total_stmt = total_stmt.where(self.model.created_at >= start_date)
-        if end_date:
-            total_stmt = total_stmt.where(self.model.created_at <= end_date)
-        total_result = await session.execute(total_stmt)
-        total_activities = total_result.scalar_one()
-        
-        # Get counts by service type
-        by_service_stmt = (
-            select(self.model.service_type, func.count(self.model.id))
-            .where(self.model.user_id == user_id)
-            .group_by(self.model.service_type)
-        )
-        if start_date:
-            by_service_stmt = by_service_stmt.where(self.model.created_at >= start_date)
-        if end_date:
-            by_service_stmt = by_service_stmt.where(self.model.created_at <= end_date)
-        service_result = await session.execute(by_service_stmt)
-        by_service_type = {row[0]: row[1] for row in service_result.all()}
-        
-        # Get counts by action type
-        by_action_stmt = (
-            select(self.model.action_type, func.count(self.model.id))
-            .where(self.model.user_id == user_id)
-            .group_by(self.model.action_type)
-        )
-        if start_date:
-            by_action_stmt = by_action_stmt.where(self.model.created_at >= start_date)
-        if end_date:
-            by_action_stmt = by_action_stmt.where(self.model.created_at <= end_date)
-        action_result = await session.execute(by_action_stmt)
-        by_action_type = {row[0]: row[1] for row in action_result.all()}
-        
-        # Get counts by status
-        by_status_stmt = (
-            select(self.model.status, func.count(self.model.id))
+        counts: dict[tuple[str, str, str], int] = {}
+
+        def add_counts(rows) -> None:
+            for service_type, action_type, status, count in rows:
+                key = tuple(str(getattr(value, "value", value)) for value in (service_type, action_type, status))
+                counts[key] = counts.get(key, 0) + int(count or 0)
+
+        # Whole hours before the compaction watermark come from the hourly rollups;
+        # the partial hours at the range edges and everything after it are read raw
+        rollup_start = _ceil_to_hour(start_date) if start_date else None
+        rollup_end = await self.get_rollup_watermark(session) if settings.ENABLE_ACTIVITY_ROLLUPS else None
+        if rollup_end is not None and end_date:
+            rollup_end = min(rollup_end, floor_to_hour(end_date))
+        use_rollups = rollup_end is not None and (rollup_start is None or rollup_start < rollup_end)
+
+        if use_rollups:
+            rollup_stmt = (
+                select(
+                    UserActivityRollup.service_type,
+                    UserActivityRollup.action_type,
+                    UserActivityRollup.status,
+                    func.sum(UserActivityRollup.activity_count),
+                )
+                .where(UserActivityRollup.user_id == user_id, UserActivityRollup.bucket_start < rollup_end)
+                .group_by(UserActivityRollup.service_type, UserActivityRollup.action_type, UserActivityRollup.status)
+            )
+            if rollup_start is not None:
+                rollup_stmt = rollup_stmt.where(UserActivityRollup.bucket_start >= rollup_start)
+            add_counts((await session.execute(rollup_stmt)).all())
+
+        raw_stmt = (
+            select(self.model.service_type, self.model.action_type, self.model.status, func.count(self.model.id))
             .where(self.model.user_id == user_id)
-            .group_by(self.model.status)
+            .group_by(self.model.service_type, self.model.action_type, self.model.status)
         )
         if start_date:
-            by_status_stmt = by_status_stmt.where(self.model.created_at >= start_date)
+            raw_stmt = raw_stmt.where(self.model.created_at >= start_date)
         if end_date:
-            by_status_stmt = by_status_stmt.where(self.model.created_at <= end_date)
-        status_result = await session.execute(by_status_stmt)
-        by_status = {row[0]: row[1] for row in status_result.all()}
+            raw_stmt = raw_stmt.where(self.model.created_at <= end_date)
+        if use_rollups:
+            if rollup_start is not None:
+                raw_stmt = raw_stmt.where(
+                    or_(self.model.created_at < rollup_start, self.model.created_at >= rollup_end)
+                )
+            else:
+                raw_stmt = raw_stmt.where(self.model.created_at >= rollup_end)
+        add_counts((await session.execute(raw_stmt)).all())
+
+        by_service_type: dict[str, int] = {}
+        by_action_type: dict[str, int] = {}
+        by_status: dict[str, int] = {}
+        for (service_type, action_type, status), count in counts.items():
+            if not count:
+                continue
+            by_service_type[service_type] = by_service_type.get(service_type, 0) + count
+            by_action_type[action_type] = by_action_type.get(action_type, 0) + count
+            by_status[status] = by_status.get(status, 0) + count
         
         # Get recent activities (last 24 hours)
         recent_date = datetime.now() - timedelta(hours=24)
@@ -1136,7 +1107,7 @@ class UserActivityRepository(AsyncRepository[UserActivity]):
         recent_activities = recent_result.scalar_one()
         
         stats = {
-            "total_activities": total_activities,
+            "total_activities": sum(counts.values()),
             "by_service_type": by_service_type,
             "by_action_type": by_action_type,
             "by_status": by_status,
@@ -1145,3 +1116,18 @@ class UserActivityRepository(AsyncRepository[UserActivity]):
         
         return stats
 
+    async def get_rollup_watermark(self, session: AsyncSession) -> Optional[datetime]:
+        """
+        Return the end of the compacted range of ``user_activity_rollups``.
+
+        Every activity created before the returned time is counted in the rollups.
+
+        Returns:
+            The latest rollup bucket start plus one hour, or None if nothing was compacted
+        """
+        result = await session.execute(select(func.max(UserActivityRollup.bucket_start)))
+        latest = result.scalar_one_or_none()
+        if latest is None:
+            return None
+        return _as_utc(latest) + timedelta(hours=1)
+
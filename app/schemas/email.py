@@ -258,6 +258,10 @@ class BulkEmailVerifierResponse(BaseModel):
     invalid_count: int = Field(0, description="Number of invalid emails")
     catchall_count: int = Field(0, description="Number of catchall emails")
     unknown_count: int = Field(0, description="Number of unknown emails")
+    duplicate_count: int = Field(
+        0,
+        description="Number of repeated emails that reused another row's verification result",
+    )
     download_url: Optional[str] = Field(
         default=None,
         description="Signed URL for downloading CSV file with verification results. Only present when CSV context provided.",
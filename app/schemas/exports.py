@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from app.models.exports import ExportStatus, ExportType
 from app.utils.logger import get_logger
@@ -11,7 +11,44 @@ from app.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-class ContactExportRequest(BaseModel):
+class DeltaExportOptions(BaseModel):
+    """Optional delta (incremental) export settings shared by export requests."""
+
+    delta: bool = Field(
+        False,
+        description="Only export rows whose updated_at is newer than the segment watermark",
+    )
+    segment_key: Optional[str] = Field(
+        None,
+        min_length=1,
+        max_length=255,
+        description="Stable identifier of the exported segment. Required when delta is true.",
+    )
+    include_tombstones: bool = Field(
+        False,
+        description="Write a tombstone CSV listing requested UUIDs that no longer exist",
+    )
+
+    @model_validator(mode="after")
+    def validate_segment_key(self) -> "DeltaExportOptions":
+        """Require a segment key whenever delta mode is requested."""
+        if self.delta and not self.segment_key:
+            raise ValueError("segment_key is required when delta is true")
+        return self
+
+
+class DeltaExportSummary(BaseModel):
+    """Summary of a delta export selection returned on creation."""
+
+    segment_key: str
+    since: Optional[datetime] = Field(None, description="Watermark the export started from (None on first run)")
+    changed_count: int = Field(0, description="Rows changed since the watermark and included in the export")
+    unchanged_count: int = Field(0, description="Rows skipped because they did not change")
+    tombstone_count: int = Field(0, description="Requested UUIDs that no longer exist")
+    empty: bool = Field(False, description="True when no rows changed; the data file then contains only the header row")
+
+
+class ContactExportRequest(DeltaExportOptions):
     """Request schema for creating a contact export."""
 
     contact_uuids: List[str] = Field(..., description="List of contact UUIDs to export", min_length=1)
@@ -25,11 +62,14 @@ class ContactExportResponse(BaseModel):
     expires_at: datetime
     contact_count: int
     status: ExportStatus
+    delta: Optional[DeltaExportSummary] = None
+    estimated_completion_at: Optional[datetime] = Field(None, description="Estimated time the export will be ready")
+    admission_decision: Optional[str] = Field(None, description="Admission control decision: admit or delay")
 
     model_config = ConfigDict(from_attributes=True)
 
 
-class CompanyExportRequest(BaseModel):
+class CompanyExportRequest(DeltaExportOptions):
     """Request schema for creating a company export."""
 
     company_uuids: List[str] = Field(..., description="List of company UUIDs to export", min_length=1)
@@ -43,6 +83,9 @@ class CompanyExportResponse(BaseModel):
     expires_at: datetime
     company_count: int
     status: ExportStatus
+    delta: Optional[DeltaExportSummary] = None
+    estimated_completion_at: Optional[datetime] = Field(None, description="Estimated time the export will be ready")
+    admission_decision: Optional[str] = Field(None, description="Admission control decision: admit or delay")
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -64,6 +107,9 @@ class UserExportDetail(BaseModel):
     created_at: datetime
     expires_at: Optional[datetime] = None
     download_url: Optional[str] = None
+    is_delta: bool = False
+    segment_key: Optional[str] = None
+    delta_since: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -105,6 +151,8 @@ class ChunkedExportResponse(BaseModel):
     chunk_ids: List[str] = Field(..., description="List of chunk export IDs")
     total_count: int = Field(..., description="Total number of records across all chunks")
     status: ExportStatus
+    estimated_completion_at: Optional[datetime] = Field(None, description="Estimated time the export will be ready")
+    admission_decision: Optional[str] = Field(None, description="Admission control decision: admit or delay")
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -118,5 +166,7 @@ class EmailExportResponse(BaseModel):
     contact_count: int
     company_count: int
     status: ExportStatus
+    estimated_completion_at: Optional[datetime] = Field(None, description="Estimated time the export will be ready")
+    admission_decision: Optional[str] = Field(None, description="Admission control decision: admit or delay")
 
     model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -1,16 +1,21 @@
 """Service layer for user activity tracking."""
 
 import time
+from datetime import datetime, timezone
 from typing import Optional
 
 from fastapi import Request
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.models.user import ActivityActionType, ActivityServiceType, ActivityStatus, UserActivity
 from app.repositories.user import UserActivityRepository
+from app.services.activity_sink import get_activity_sink
 from app.utils.logger import get_logger, log_error
+from app.utils.validation import is_valid_uuid
 
+settings = get_settings()
 logger = get_logger(__name__)
 
 
@@ -66,6 +71,9 @@ class ActivityService:
         """
         Log a search activity.
         
+        With ENABLE_ACTIVITY_SINK the record is queued on the activity sink and
+        written in a batch after the request instead of inside its transaction.
+        
         Args:
             session: Database session
             user_id: User ID
@@ -81,19 +89,39 @@ class ActivityService:
         try:
             ip_address, user_agent = self._extract_request_info(request)
             
-            await self.activity_repo.create_activity(
-                session=session,
-                user_id=user_id,
-                service_type=service_type,
-                action_type=ActivityActionType.SEARCH,
-                status=status,
-                request_params=request_params,
-                result_count=result_count,
-                result_summary=result_summary,
-                error_message=error_message,
-                ip_address=ip_address,
-                user_agent=user_agent,
-            )
+            if settings.ENABLE_ACTIVITY_SINK:
+                if not is_valid_uuid(user_id):
+                    raise ValueError(f"user_id must be a valid UUID format, got: {user_id}")
+                get_activity_sink().submit(
+                    UserActivity,
+                    {
+                        "user_id": user_id,
+                        "service_type": service_type,
+                        "action_type": ActivityActionType.SEARCH,
+                        "status": status,
+                        "request_params": request_params,
+                        "result_count": result_count,
+                        "result_summary": result_summary,
+                        "error_message": error_message,
+                        "ip_address": ip_address,
+                        "user_agent": user_agent,
+                        "created_at": datetime.now(timezone.utc),
+                    },
+                )
+            else:
+                await self.activity_repo.create_activity(
+                    session=session,
+                    user_id=user_id,
+                    service_type=service_type,
+                    action_type=ActivityActionType.SEARCH,
+                    status=status,
+                    request_params=request_params,
+                    result_count=result_count,
+                    result_summary=result_summary,
+                    error_message=error_message,
+                    ip_address=ip_address,
+                    user_agent=user_agent,
+                )
             
             duration_ms = (time.time() - start_time) * 1000
             logger.debug(
@@ -0,0 +1,234 @@
+"""Buffered, batched writer for user activity and history records.
+
+Search activity and login history rows are written for every request, but the
+caller never reads them back. Instead of an INSERT and flush inside the request
+transaction, records are put on a bounded in-process queue and a background
+flusher writes them with one multi-row INSERT per table every
+ACTIVITY_SINK_FLUSH_INTERVAL_MS milliseconds or ACTIVITY_SINK_BATCH_SIZE records,
+whichever comes first.
+
+Delivery is at-least-once while the process shuts down gracefully: failed
+batches are retried, and ``drain`` (registered as a shutdown hook of
+``wait_for_active_tasks``) writes everything still queued. When the queue is
+full new records are dropped and counted instead of slowing requests down.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import insert
+
+from app.core.config import get_settings
+from app.db.session import BackgroundSessionLocal
+from app.utils.background_tasks import register_shutdown_hook
+from app.utils.logger import get_logger, log_error
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+# (model, column values, enqueued at monotonic seconds)
+SinkRecord = Tuple[Any, Dict[str, Any], float]
+
+
+class ActivitySink:
+    """Bounded queue plus background flusher issuing multi-row inserts."""
+
+    def __init__(
+        self,
+        session_factory=None,
+        max_queue: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_retries: Optional[int] = None,
+    ) -> None:
+        self.session_factory = session_factory or BackgroundSessionLocal
+        self.max_queue = max_queue or settings.ACTIVITY_SINK_MAX_QUEUE
+        self.batch_size = batch_size or settings.ACTIVITY_SINK_BATCH_SIZE
+        self.flush_interval = (
+            flush_interval if flush_interval is not None else settings.ACTIVITY_SINK_FLUSH_INTERVAL_MS / 1000
+        )
+        self.max_retries = max_retries if max_retries is not None else settings.ACTIVITY_SINK_MAX_RETRIES
+        self._queue: Optional[asyncio.Queue[SinkRecord]] = None
+        # Records taken off the queue but not yet written
+        self._pending: List[SinkRecord] = []
+        self._flusher: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._stats = {
+            "submitted": 0,
+            "written": 0,
+            "dropped": 0,
+            "failed_batches": 0,
+            "flushes": 0,
+            "write_latency_ms_total": 0.0,
+            "write_latency_ms_max": 0.0,
+        }
+
+    def _ensure_started(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._flush_lock = asyncio.Lock()
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._run())
+
+    def submit(self, model: Any, values: Dict[str, Any]) -> bool:
+        """
+        Queue one row for insertion.
+
+        Args:
+            model: Mapped class to insert into (e.g. UserActivity)
+            values: Column values for the row
+
+        Returns:
+            True if queued, False if the queue was full and the record was dropped
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((model, values, time.monotonic()))
+        except asyncio.QueueFull:
+            self._stats["dropped"] += 1
+            if self._stats["dropped"] == 1 or self._stats["dropped"] % 1000 == 0:
+                logger.warning(
+                    "Activity sink queue full, dropping records",
+                    extra={"context": {"dropped": self._stats["dropped"], "max_queue": self.max_queue}}
+                )
+            return False
+        self._stats["submitted"] += 1
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            # Wait for the first record, then give the batch up to flush_interval to fill
+            self._pending.append(await self._queue.get())
+            deadline = time.monotonic() + self.flush_interval
+            while len(self._pending) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    self._pending.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            async with self._flush_lock:
+                batch, self._pending = self._pending, []
+                await self._write_with_retries(batch)
+
+    def _take_queued(self) -> List[SinkRecord]:
+        batch, self._pending = self._pending, []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _write_with_retries(self, batch: List[SinkRecord]) -> None:
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self._write(batch)
+                return
+            except Exception as exc:
+                self._stats["failed_batches"] += 1
+                if attempt >= self.max_retries:
+                    self._stats["dropped"] += len(batch)
+                    log_error(
+                        "Activity sink batch write failed, dropping records",
+                        exc,
+                        "app.services.activity_sink",
+                        context={"records": len(batch), "attempts": attempt + 1}
+                    )
+                    return
+                await asyncio.sleep(min(5.0, 0.1 * (2 ** attempt)))
+
+    async def _write(self, batch: List[SinkRecord]) -> None:
+        by_model: Dict[Any, List[Dict[str, Any]]] = {}
+        for model, values, _ in batch:
+            by_model.setdefault(model, []).append(values)
+
+        async with self.session_factory() as session:
+            for model, rows in by_model.items():
+                await session.execute(insert(model), rows)
+            await session.commit()
+
+        now = time.monotonic()
+        latencies = [(now - enqueued_at) * 1000 for _, _, enqueued_at in batch]
+        self._stats["flushes"] += 1
+        self._stats["written"] += len(batch)
+        self._stats["write_latency_ms_total"] += sum(latencies)
+        self._stats["write_latency_ms_max"] = max(self._stats["write_latency_ms_max"], max(latencies))
+
+    async def flush(self) -> None:
+        """Write every record queued so far."""
+        if self._queue is None:
+            return
+        async with self._flush_lock:
+            while True:
+                batch = self._take_queued()
+                if not batch:
+                    return
+                await self._write_with_retries(batch)
+
+    async def drain(self) -> None:
+        """Stop the flusher and write everything still queued (graceful shutdown)."""
+        if self._flusher is not None and not self._flusher.done():
+            # Let an in-flight write finish before cancelling the loop; records the
+            # loop was still collecting stay in _pending and are written by flush()
+            async with self._flush_lock:
+                self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+        self._flusher = None
+        await self.flush()
+        logger.info("Activity sink drained", extra={"context": self.get_stats()})
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return queue depth, drop/write counters and enqueue-to-commit latency."""
+        written = self._stats["written"]
+        return {
+            "enabled": settings.ENABLE_ACTIVITY_SINK,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue": self.max_queue,
+            "submitted": self._stats["submitted"],
+            "written": written,
+            "dropped": self._stats["dropped"],
+            "failed_batches": self._stats["failed_batches"],
+            "flushes": self._stats["flushes"],
+            "avg_write_latency_ms": round(self._stats["write_latency_ms_total"] / written, 2) if written else None,
+            "max_write_latency_ms": round(self._stats["write_latency_ms_max"], 2),
+        }
+
+
+_activity_sink: Optional[ActivitySink] = None
+
+
+async def _drain_activity_sink() -> None:
+    if _activity_sink is not None:
+        await _activity_sink.drain()
+
+
+def get_activity_sink() -> ActivitySink:
+    """Return the process-wide activity sink."""
+    global _activity_sink
+    if _activity_sink is None:
+        _activity_sink = ActivitySink()
+        register_shutdown_hook(_drain_activity_sink)
+    return _activity_sink
+
+
+def set_activity_sink(sink: Optional[ActivitySink]) -> None:
+    """Replace the process-wide activity sink (used by tests)."""
+    global _activity_sink
+    _activity_sink = sink
+    if sink is not None:
+        register_shutdown_hook(_drain_activity_sink)
+
+
+def get_activity_sink_stats() -> Dict[str, Any]:
+    """Return activity sink counters for monitoring."""
+    if _activity_sink is None:
+        return {"enabled": settings.ENABLE_ACTIVITY_SINK, "queued": 0, "submitted": 0, "written": 0, "dropped": 0}
+    return _activity_sink.get_stats()
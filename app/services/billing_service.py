@@ -14,6 +14,7 @@ from app.repositories.billing import (
     SubscriptionPlanRepository,
 )
 from app.repositories.user import UserProfileRepository
+from app.services.credit_service import CreditService
 from app.utils.logger import get_logger, log_error, log_api_error
 
 logger = get_logger(__name__)
@@ -295,6 +296,7 @@ class BillingService:
         self.plan_repo = plan_repository or SubscriptionPlanRepository()
         self.period_repo = period_repository or SubscriptionPlanPeriodRepository()
         self.addon_repo = addon_repository or AddonPackageRepository()
+        self.credit_service = CreditService()
 
     async def get_billing_info(
         self,
@@ -679,9 +681,10 @@ class BillingService:
             package = ADDON_PACKAGES[package_id]
             package_credits = package["credits"]
         
-        # Add credits to existing balance
-        current_credits = profile.credits or 0
-        profile.credits = current_credits + package_credits
+        # Add credits to existing balance atomically so concurrent deductions are not lost
+        await self.credit_service.add_credits(
+            session, user_id, package_credits, reason="addon_purchase", reference=package_id
+        )
         
         await session.commit()
         await session.refresh(profile)
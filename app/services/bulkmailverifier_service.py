@@ -1,5 +1,6 @@
 """Service for interacting with BulkMailVerifier API."""
 
+import asyncio
 import csv
 import io
 import re
@@ -10,11 +11,40 @@ import httpx
 from fastapi import HTTPException, status
 
 from app.core.config import get_settings
+from app.services.email_verification_store import EmailVerificationStore
+from app.utils.adaptive_limiter import get_provider_limiter
 from app.utils.logger import get_logger, log_error, log_external_api_call
 
 settings = get_settings()
 logger = get_logger(__name__)
 
+# Default timeout for API calls; file uploads and downloads get the longer one
+_REQUEST_TIMEOUT = 30.0
+_TRANSFER_TIMEOUT = 60.0
+
+# Shared httpx client for connection pooling (reused across service instances)
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+# Tokens are shared across instances so one login serves every caller
+_access_token: Optional[str] = None
+_refresh_token: Optional[str] = None
+_login_lock: Optional[asyncio.Lock] = None
+
+
+def _get_login_lock() -> asyncio.Lock:
+    global _login_lock
+    if _login_lock is None:
+        _login_lock = asyncio.Lock()
+    return _login_lock
+
+
+async def close_http_client() -> None:
+    """Close the shared BulkMailVerifier HTTP client (called on shutdown)."""
+    global _shared_http_client
+    if _shared_http_client is not None and not _shared_http_client.is_closed:
+        await _shared_http_client.aclose()
+    _shared_http_client = None
+
 
 class BulkMailVerifierService:
     """Service for BulkMailVerifier API operations."""
@@ -24,12 +54,60 @@ class BulkMailVerifierService:
         self.base_url = settings.BULKMAILVERIFIER_BASE_URL
         self.email = settings.BULKMAILVERIFIER_EMAIL
         self.password = settings.BULKMAILVERIFIER_PASSWORD
-        self._access_token: Optional[str] = None
-        self._refresh_token: Optional[str] = None
+        self.verification_store = EmailVerificationStore()
+
+    @property
+    def _access_token(self) -> Optional[str]:
+        return _access_token
+
+    @_access_token.setter
+    def _access_token(self, value: Optional[str]) -> None:
+        global _access_token
+        _access_token = value
+
+    @property
+    def _refresh_token(self) -> Optional[str]:
+        return _refresh_token
+
+    @_refresh_token.setter
+    def _refresh_token(self, value: Optional[str]) -> None:
+        global _refresh_token
+        _refresh_token = value
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get or create shared HTTP client for connection reuse."""
+        global _shared_http_client
+        if _shared_http_client is None or _shared_http_client.is_closed:
+            _shared_http_client = httpx.AsyncClient(
+                timeout=_REQUEST_TIMEOUT,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            )
+        return _shared_http_client
 
     async def _ensure_authenticated(self) -> None:
-        """Ensure we have a valid access token, login if needed."""
-        if not self._access_token:
+        """
+        Ensure we have a valid access token, login if needed.
+        
+        Login is single-flight: concurrent callers wait on one login request
+        instead of each authenticating separately.
+        """
+        if self._access_token:
+            return
+        async with _get_login_lock():
+            if not self._access_token:
+                await self.login()
+
+    async def _refresh_access_token(self, stale_token: Optional[str]) -> None:
+        """
+        Replace an access token the API rejected.
+        
+        If another coroutine already refreshed the token while we waited for
+        the lock, its token is reused and no extra login is made.
+        """
+        async with _get_login_lock():
+            if self._access_token and self._access_token != stale_token:
+                return
+            self._access_token = None
             await self.login()
 
     def _validate_email_format(self, email: str) -> bool:
@@ -118,43 +196,43 @@ class BulkMailVerifierService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, json=payload)
-                response.raise_for_status()
-                data = response.json()
-                
-                duration_ms = (time.time() - start_time) * 1000
-                log_external_api_call(
-                    service_name="BulkMailVerifier",
-                    method="POST",
-                    url=url,
-                    status_code=response.status_code,
-                    duration_ms=duration_ms,
-                    request_data={"email": self.email},  # Don't log password
-                    response_data={"has_access_token": bool(data.get("access"))},
-                    logger_name="app.services.bulkmailverifier",
+            client = self._get_http_client()
+            response = await client.post(url, json=payload)
+            response.raise_for_status()
+            data = response.json()
+            
+            duration_ms = (time.time() - start_time) * 1000
+            log_external_api_call(
+                service_name="BulkMailVerifier",
+                method="POST",
+                url=url,
+                status_code=response.status_code,
+                duration_ms=duration_ms,
+                request_data={"email": self.email},  # Don't log password
+                response_data={"has_access_token": bool(data.get("access"))},
+                logger_name="app.services.bulkmailverifier",
+            )
+            
+            self._access_token = data.get("access")
+            self._refresh_token = data.get("refresh")
+            
+            if not self._access_token:
+                logger.error(
+                    "BulkMailVerifier login failed: no access token in response",
+                    extra={"context": {"response_keys": list(data.keys())}}
                 )
-                
-                self._access_token = data.get("access")
-                self._refresh_token = data.get("refresh")
-                
-                if not self._access_token:
-                    logger.error(
-                        "BulkMailVerifier login failed: no access token in response",
-                        extra={"context": {"response_keys": list(data.keys())}}
-                    )
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail="Failed to get access token from BulkMailVerifier",
-                    )
-                
-                logger.info(
-                    "BulkMailVerifier login successful",
-                    extra={"performance": {"duration_ms": duration_ms}}
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Failed to get access token from BulkMailVerifier",
                 )
-                
-                return {"access": self._access_token, "refresh": self._refresh_token}
-                
+            
+            logger.info(
+                "BulkMailVerifier login successful",
+                extra={"performance": {"duration_ms": duration_ms}}
+            )
+            
+            return {"access": self._access_token, "refresh": self._refresh_token}
+            
         except httpx.HTTPStatusError as e:
             duration_ms = (time.time() - start_time) * 1000
             log_external_api_call(
@@ -210,6 +288,16 @@ class BulkMailVerifierService:
                 detail=f"Invalid email format: {email}. Please provide a valid email address.",
             )
         
+        # Reuse a fresh result from any provider before paying for another check
+        stored = await self.verification_store.lookup(email)
+        if stored:
+            return {
+                "email": email,
+                "mapped_status": stored["status"],
+                "provider": stored["provider"],
+                "cached": True,
+            }
+        
         logger.debug(
             "Email verification request",
             extra={"context": {"email": email}}
@@ -227,40 +315,42 @@ class BulkMailVerifierService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            client = self._get_http_client()
+            async with get_provider_limiter("bulkmailverifier"):
                 response = await client.post(url, json=payload, headers=headers)
                 response.raise_for_status()
-                data = response.json()
-                
-                duration_ms = (time.time() - start_time) * 1000
-                mapped_status = self._map_verification_status(data)
-                
-                log_external_api_call(
-                    service_name="BulkMailVerifier",
-                    method="POST",
-                    url=url,
-                    status_code=response.status_code,
-                    duration_ms=duration_ms,
-                    request_data={"email": email},
-                    response_data={"mapped_status": mapped_status, "result": data.get("result")},
-                    logger_name="app.services.bulkmailverifier",
-                )
-                
-                logger.info(
-                    "Email verification completed",
-                    extra={
-                        "context": {
-                            "email": email,
-                            "status": mapped_status,
-                        },
-                        "performance": {"duration_ms": duration_ms}
-                    }
-                )
-                
-                result = data.copy()
-                result["mapped_status"] = mapped_status
-                return result
-                
+            data = response.json()
+            
+            duration_ms = (time.time() - start_time) * 1000
+            mapped_status = self._map_verification_status(data)
+            
+            log_external_api_call(
+                service_name="BulkMailVerifier",
+                method="POST",
+                url=url,
+                status_code=response.status_code,
+                duration_ms=duration_ms,
+                request_data={"email": email},
+                response_data={"mapped_status": mapped_status, "result": data.get("result")},
+                logger_name="app.services.bulkmailverifier",
+            )
+            
+            logger.info(
+                "Email verification completed",
+                extra={
+                    "context": {
+                        "email": email,
+                        "status": mapped_status,
+                    },
+                    "performance": {"duration_ms": duration_ms}
+                }
+            )
+            
+            result = data.copy()
+            result["mapped_status"] = mapped_status
+            await self.verification_store.store(email, mapped_status, provider="bulkmailverifier")
+            return result
+            
         except httpx.TimeoutException as e:
             duration_ms = (time.time() - start_time) * 1000
             log_external_api_call(
@@ -360,47 +450,48 @@ class BulkMailVerifierService:
             # Handle 401 Unauthorized - token might be expired, try to re-authenticate once
             if e.response.status_code == 401:
                 try:
-                    # Clear token and re-authenticate
-                    self._access_token = None
-                    await self._ensure_authenticated()
+                    # Refresh the rejected token (shared with concurrent callers)
+                    await self._refresh_access_token(headers["Authorization"].removeprefix("Bearer "))
                     
                     # Retry the request
-                    async with httpx.AsyncClient(timeout=30.0) as client:
+                    client = self._get_http_client()
+                    async with get_provider_limiter("bulkmailverifier"):
                         response = await client.post(url, json=payload, headers={
                             "Authorization": f"Bearer {self._access_token}",
                             "Content-Type": "application/json",
                         })
                         response.raise_for_status()
-                        data = response.json()
-                        
-                        duration_ms = (time.time() - start_time) * 1000
-                        mapped_status = self._map_verification_status(data)
-                        
-                        log_external_api_call(
-                            service_name="BulkMailVerifier",
-                            method="POST",
-                            url=url,
-                            status_code=response.status_code,
-                            duration_ms=duration_ms,
-                            request_data={"email": email},
-                            response_data={"mapped_status": mapped_status, "result": data.get("result")},
-                            logger_name="app.services.bulkmailverifier",
-                        )
-                        
-                        logger.info(
-                            "Email verification completed (after retry)",
-                            extra={
-                                "context": {
-                                    "email": email,
-                                    "status": mapped_status,
-                                },
-                                "performance": {"duration_ms": duration_ms}
-                            }
-                        )
-                        
-                        result = data.copy()
-                        result["mapped_status"] = mapped_status
-                        return result
+                    data = response.json()
+                    
+                    duration_ms = (time.time() - start_time) * 1000
+                    mapped_status = self._map_verification_status(data)
+                    
+                    log_external_api_call(
+                        service_name="BulkMailVerifier",
+                        method="POST",
+                        url=url,
+                        status_code=response.status_code,
+                        duration_ms=duration_ms,
+                        request_data={"email": email},
+                        response_data={"mapped_status": mapped_status, "result": data.get("result")},
+                        logger_name="app.services.bulkmailverifier",
+                    )
+                    
+                    logger.info(
+                        "Email verification completed (after retry)",
+                        extra={
+                            "context": {
+                                "email": email,
+                                "status": mapped_status,
+                            },
+                            "performance": {"duration_ms": duration_ms}
+                        }
+                    )
+                    
+                    result = data.copy()
+                    result["mapped_status"] = mapped_status
+                    await self.verification_store.store(email, mapped_status, provider="bulkmailverifier")
+                    return result
                 except Exception as retry_error:
                     # If retry fails, log and raise original error
                     logger.warning(
@@ -536,58 +627,60 @@ class BulkMailVerifierService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            client = self._get_http_client()
+            async with get_provider_limiter("bulkmailverifier"):
                 response = await client.post(
                     url,
                     headers=headers,
                     files=files,
+                    timeout=_TRANSFER_TIMEOUT,
                 )
                 response.raise_for_status()
-                data = response.json()
-                
-                slug = data.get("slug")
-                number_of_emails = data.get("number_of_emails")
-                upload_status = data.get("status", "unknown")
-                
-                if not slug:
-                    logger.error(
-                        "BulkMailVerifier upload failed: no slug in response",
-                        extra={"context": {"response_keys": list(data.keys())}}
-                    )
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail="Failed to get slug from BulkMailVerifier upload",
-                    )
-                
-                duration_ms = (time.time() - start_time) * 1000
-                log_external_api_call(
-                    service_name="BulkMailVerifier",
-                    method="POST",
-                    url=url,
-                    status_code=response.status_code,
-                    duration_ms=duration_ms,
-                    request_data={"email_count": len(emails)},
-                    response_data={"slug": slug, "number_of_emails": number_of_emails},
-                    logger_name="app.services.bulkmailverifier",
+            data = response.json()
+            
+            slug = data.get("slug")
+            number_of_emails = data.get("number_of_emails")
+            upload_status = data.get("status", "unknown")
+            
+            if not slug:
+                logger.error(
+                    "BulkMailVerifier upload failed: no slug in response",
+                    extra={"context": {"response_keys": list(data.keys())}}
                 )
-                
-                logger.info(
-                    "File uploaded to BulkMailVerifier",
-                    extra={
-                        "context": {
-                            "slug": slug,
-                            "email_count": number_of_emails,
-                        },
-                        "performance": {"duration_ms": duration_ms}
-                    }
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Failed to get slug from BulkMailVerifier upload",
                 )
-                
-                return {
-                    "slug": slug,
-                    "number_of_emails": number_of_emails,
-                    "status": upload_status,
+            
+            duration_ms = (time.time() - start_time) * 1000
+            log_external_api_call(
+                service_name="BulkMailVerifier",
+                method="POST",
+                url=url,
+                status_code=response.status_code,
+                duration_ms=duration_ms,
+                request_data={"email_count": len(emails)},
+                response_data={"slug": slug, "number_of_emails": number_of_emails},
+                logger_name="app.services.bulkmailverifier",
+            )
+            
+            logger.info(
+                "File uploaded to BulkMailVerifier",
+                extra={
+                    "context": {
+                        "slug": slug,
+                        "email_count": number_of_emails,
+                    },
+                    "performance": {"duration_ms": duration_ms}
                 }
-                
+            )
+            
+            return {
+                "slug": slug,
+                "number_of_emails": number_of_emails,
+                "status": upload_status,
+            }
+            
         except httpx.HTTPStatusError as e:
             duration_ms = (time.time() - start_time) * 1000
             log_external_api_call(
@@ -644,33 +737,33 @@ class BulkMailVerifierService:
         )
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-                
-                duration_ms = (time.time() - start_time) * 1000
-                log_external_api_call(
-                    service_name="BulkMailVerifier",
-                    method="POST",
-                    url=url,
-                    status_code=response.status_code,
-                    duration_ms=duration_ms,
-                    request_data={"slug": slug},
-                    response_data=data,
-                    logger_name="app.services.bulkmailverifier",
-                )
-                
-                logger.info(
-                    "Verification started",
-                    extra={
-                        "context": {"slug": slug},
-                        "performance": {"duration_ms": duration_ms}
-                    }
-                )
-                
-                return data
-                
+            client = self._get_http_client()
+            response = await client.post(url, headers=headers)
+            response.raise_for_status()
+            data = response.json()
+            
+            duration_ms = (time.time() - start_time) * 1000
+            log_external_api_call(
+                service_name="BulkMailVerifier",
+                method="POST",
+                url=url,
+                status_code=response.status_code,
+                duration_ms=duration_ms,
+                request_data={"slug": slug},
+                response_data=data,
+                logger_name="app.services.bulkmailverifier",
+            )
+            
+            logger.info(
+                "Verification started",
+                extra={
+                    "context": {"slug": slug},
+                    "performance": {"duration_ms": duration_ms}
+                }
+            )
+            
+            return data
+            
         except httpx.HTTPStatusError as e:
             duration_ms = (time.time() - start_time) * 1000
             log_external_api_call(
@@ -725,25 +818,25 @@ class BulkMailVerifierService:
             "Authorization": f"Bearer {self._access_token}",
         }
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-                
-                duration_ms = (time.time() - start_time) * 1000
-                log_external_api_call(
-                    service_name="BulkMailVerifier",
-                    method="POST",
-                    url=url,
-                    status_code=response.status_code,
-                    duration_ms=duration_ms,
-                    request_data={"slug": slug},
-                    response_data={"status": data.get("status")},
-                    logger_name="app.services.bulkmailverifier",
-                )
-                
-                return data
-                
+            client = self._get_http_client()
+            response = await client.post(url, headers=headers)
+            response.raise_for_status()
+            data = response.json()
+            
+            duration_ms = (time.time() - start_time) * 1000
+            log_external_api_call(
+                service_name="BulkMailVerifier",
+                method="POST",
+                url=url,
+                status_code=response.status_code,
+                duration_ms=duration_ms,
+                request_data={"slug": slug},
+                response_data={"status": data.get("status")},
+                logger_name="app.services.bulkmailverifier",
+            )
+            
+            return data
+            
         except httpx.HTTPStatusError as e:
             duration_ms = (time.time() - start_time) * 1000
             log_external_api_call(
@@ -799,25 +892,25 @@ class BulkMailVerifierService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-                
-                duration_ms = (time.time() - start_time) * 1000
-                log_external_api_call(
-                    service_name="BulkMailVerifier",
-                    method="POST",
-                    url=url,
-                    status_code=response.status_code,
-                    duration_ms=duration_ms,
-                    request_data={"slug": slug},
-                    response_data={"has_valid_file": bool(data.get("valid_email_file"))},
-                    logger_name="app.services.bulkmailverifier",
-                )
-                
-                return data
-                
+            client = self._get_http_client()
+            response = await client.post(url, headers=headers)
+            response.raise_for_status()
+            data = response.json()
+            
+            duration_ms = (time.time() - start_time) * 1000
+            log_external_api_call(
+                service_name="BulkMailVerifier",
+                method="POST",
+                url=url,
+                status_code=response.status_code,
+                duration_ms=duration_ms,
+                request_data={"slug": slug},
+                response_data={"has_valid_file": bool(data.get("valid_email_file"))},
+                logger_name="app.services.bulkmailverifier",
+            )
+            
+            return data
+            
         except httpx.HTTPStatusError as e:
             duration_ms = (time.time() - start_time) * 1000
             log_external_api_call(
@@ -877,31 +970,31 @@ class BulkMailVerifierService:
         headers = {"Authorization": f"Bearer {self._access_token}"}
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(file_url, headers=headers)
-                response.raise_for_status()
-                
-                csv_reader = csv.DictReader(io.StringIO(response.text))
-                emails = []
-                for row in csv_reader:
-                    email = row.get("email") or row.get("Email")
-                    if email:
-                        emails.append(email.strip())
-                
-                duration_ms = (time.time() - start_time) * 1000
-                logger.info(
-                    f"CSV download and parse completed: {error_context}",
-                    extra={
-                        "context": {
-                            "error_context": error_context,
-                            "email_count": len(emails),
-                        },
-                        "performance": {"duration_ms": duration_ms}
-                    }
-                )
-                
-                return emails
-                
+            client = self._get_http_client()
+            response = await client.get(file_url, headers=headers, timeout=_TRANSFER_TIMEOUT)
+            response.raise_for_status()
+            
+            csv_reader = csv.DictReader(io.StringIO(response.text))
+            emails = []
+            for row in csv_reader:
+                email = row.get("email") or row.get("Email")
+                if email:
+                    emails.append(email.strip())
+            
+            duration_ms = (time.time() - start_time) * 1000
+            logger.info(
+                f"CSV download and parse completed: {error_context}",
+                extra={
+                    "context": {
+                        "error_context": error_context,
+                        "email_count": len(emails),
+                    },
+                    "performance": {"duration_ms": duration_ms}
+                }
+            )
+            
+            return emails
+            
         except httpx.HTTPStatusError as e:
             duration_ms = (time.time() - start_time) * 1000
             log_external_api_call(
@@ -968,22 +1061,22 @@ class BulkMailVerifierService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-                
-                duration_ms = (time.time() - start_time) * 1000
-                logger.info(
-                    "List deleted from BulkMailVerifier",
-                    extra={
-                        "context": {"slug": slug},
-                        "performance": {"duration_ms": duration_ms}
-                    }
-                )
-                
-                return data
-                
+            client = self._get_http_client()
+            response = await client.post(url, headers=headers)
+            response.raise_for_status()
+            data = response.json()
+            
+            duration_ms = (time.time() - start_time) * 1000
+            logger.info(
+                "List deleted from BulkMailVerifier",
+                extra={
+                    "context": {"slug": slug},
+                    "performance": {"duration_ms": duration_ms}
+                }
+            )
+            
+            return data
+            
         except httpx.HTTPStatusError as e:
             duration_ms = (time.time() - start_time) * 1000
             # Don't raise exception for delete failures - list may already be deleted
@@ -1028,38 +1121,38 @@ class BulkMailVerifierService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # POST with empty formdata as per Postman collection
-                response = await client.post(url, headers=headers, data={})
-                response.raise_for_status()
-                
-                # Try to parse as JSON first, fallback to text
-                try:
-                    data = response.json()
-                    duration_ms = (time.time() - start_time) * 1000
-                    log_external_api_call(
-                        service_name="BulkMailVerifier",
-                        method="POST",
-                        url=url,
-                        status_code=response.status_code,
-                        duration_ms=duration_ms,
-                        response_data={"has_credits": "credits" in data},
-                        logger_name="app.services.bulkmailverifier",
-                    )
-                    return data
-                except Exception as json_exc:
-                    # If not JSON, return as text
-                    text_data = response.text
-                    duration_ms = (time.time() - start_time) * 1000
-                    logger.debug(
-                        "BulkMailVerifier credits response is not JSON",
-                        extra={
-                            "context": {"raw_response": text_data[:200]},
-                            "performance": {"duration_ms": duration_ms}
-                        }
-                    )
-                    return {"credits": text_data, "raw_response": text_data}
-                
+            client = self._get_http_client()
+            # POST with empty formdata as per Postman collection
+            response = await client.post(url, headers=headers, data={})
+            response.raise_for_status()
+            
+            # Try to parse as JSON first, fallback to text
+            try:
+                data = response.json()
+                duration_ms = (time.time() - start_time) * 1000
+                log_external_api_call(
+                    service_name="BulkMailVerifier",
+                    method="POST",
+                    url=url,
+                    status_code=response.status_code,
+                    duration_ms=duration_ms,
+                    response_data={"has_credits": "credits" in data},
+                    logger_name="app.services.bulkmailverifier",
+                )
+                return data
+            except Exception as json_exc:
+                # If not JSON, return as text
+                text_data = response.text
+                duration_ms = (time.time() - start_time) * 1000
+                logger.debug(
+                    "BulkMailVerifier credits response is not JSON",
+                    extra={
+                        "context": {"raw_response": text_data[:200]},
+                        "performance": {"duration_ms": duration_ms}
+                    }
+                )
+                return {"credits": text_data, "raw_response": text_data}
+            
         except httpx.HTTPStatusError as e:
             duration_ms = (time.time() - start_time) * 1000
             log_external_api_call(
@@ -1116,26 +1209,26 @@ class BulkMailVerifierService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # POST with empty formdata as per Postman collection
-                response = await client.post(url, headers=headers, data={})
-                response.raise_for_status()
-                data = response.json()
-                
-                duration_ms = (time.time() - start_time) * 1000
-                list_count = len(data.get("lists", [])) if isinstance(data, dict) else 0
-                log_external_api_call(
-                    service_name="BulkMailVerifier",
-                    method="POST",
-                    url=url,
-                    status_code=response.status_code,
-                    duration_ms=duration_ms,
-                    response_data={"list_count": list_count},
-                    logger_name="app.services.bulkmailverifier",
-                )
-                
-                return data
-                
+            client = self._get_http_client()
+            # POST with empty formdata as per Postman collection
+            response = await client.post(url, headers=headers, data={})
+            response.raise_for_status()
+            data = response.json()
+            
+            duration_ms = (time.time() - start_time) * 1000
+            list_count = len(data.get("lists", [])) if isinstance(data, dict) else 0
+            log_external_api_call(
+                service_name="BulkMailVerifier",
+                method="POST",
+                url=url,
+                status_code=response.status_code,
+                duration_ms=duration_ms,
+                response_data={"list_count": list_count},
+                logger_name="app.services.bulkmailverifier",
+            )
+            
+            return data
+            
         except httpx.HTTPStatusError as e:
             duration_ms = (time.time() - start_time) * 1000
             log_external_api_call(
@@ -1199,38 +1292,38 @@ class BulkMailVerifierService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                
-                # Return CSV content as string
-                csv_content = response.text
-                duration_ms = (time.time() - start_time) * 1000
-                log_external_api_call(
-                    service_name="BulkMailVerifier",
-                    method="GET",
-                    url=url,
-                    status_code=response.status_code,
-                    duration_ms=duration_ms,
-                    request_data={"file_type": file_type, "slug": slug},
-                    response_data={"content_length": len(csv_content)},
-                    logger_name="app.services.bulkmailverifier",
-                )
-                
-                logger.info(
-                    "Result file downloaded from BulkMailVerifier",
-                    extra={
-                        "context": {
-                            "file_type": file_type,
-                            "slug": slug,
-                            "content_length": len(csv_content),
-                        },
-                        "performance": {"duration_ms": duration_ms}
-                    }
-                )
-                
-                return csv_content
-                
+            client = self._get_http_client()
+            response = await client.get(url, headers=headers, timeout=_TRANSFER_TIMEOUT)
+            response.raise_for_status()
+            
+            # Return CSV content as string
+            csv_content = response.text
+            duration_ms = (time.time() - start_time) * 1000
+            log_external_api_call(
+                service_name="BulkMailVerifier",
+                method="GET",
+                url=url,
+                status_code=response.status_code,
+                duration_ms=duration_ms,
+                request_data={"file_type": file_type, "slug": slug},
+                response_data={"content_length": len(csv_content)},
+                logger_name="app.services.bulkmailverifier",
+            )
+            
+            logger.info(
+                "Result file downloaded from BulkMailVerifier",
+                extra={
+                    "context": {
+                        "file_type": file_type,
+                        "slug": slug,
+                        "content_length": len(csv_content),
+                    },
+                    "performance": {"duration_ms": duration_ms}
+                }
+            )
+            
+            return csv_content
+            
         except httpx.HTTPStatusError as e:
             duration_ms = (time.time() - start_time) * 1000
             
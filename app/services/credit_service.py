@@ -1,16 +1,30 @@
 """Credit management service for handling user credit operations."""
 
 import time
+from typing import Optional, Sequence
 
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.constants import ADMIN, FREE_USER, PRO_USER, SUPER_ADMIN, UNLIMITED_CREDITS_ROLES
+from app.models.billing import CreditLedgerEntry
+from app.models.user import UserProfile
 from app.repositories.user import UserProfileRepository
 from app.utils.logger import get_logger, log_error
 
 logger = get_logger(__name__)
 
 
+class InsufficientCreditsError(ValueError):
+    """Raised when a deduction would take a balance below zero."""
+
+    def __init__(self, user_id: str, amount: int, balance: int) -> None:
+        super().__init__(f"Insufficient credits for user_id {user_id}: need {amount}, have {balance}")
+        self.user_id = user_id
+        self.amount = amount
+        self.balance = balance
+
+
 class CreditService:
     """Business logic for credit management and deduction."""
 
@@ -32,51 +46,170 @@ class CreditService:
             return False
         return True
 
+    async def _apply_delta(
+        self,
+        session: AsyncSession,
+        user_id: str,
+        delta: int,
+        allow_overdraft: bool = False,
+    ) -> Optional[int]:
+        """
+        Change a balance with one UPDATE ... RETURNING.
+        
+        Unless allow_overdraft is set, negative deltas only apply while the
+        balance covers them. Either way concurrent updates cannot be lost.
+        The row lock is held only for this statement (until the caller's commit).
+        
+        Returns:
+            New balance, or None if the profile is missing or the balance is too low
+        """
+        stmt = (
+            update(UserProfile)
+            .where(UserProfile.user_id == user_id)
+            .values(credits=UserProfile.credits + delta)
+            .returning(UserProfile.credits)
+        )
+        if delta < 0 and not allow_overdraft:
+            stmt = stmt.where(UserProfile.credits >= -delta)
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def _raise_not_applied(self, session: AsyncSession, user_id: str, amount: int) -> None:
+        balance = (
+            await session.execute(select(UserProfile.credits).where(UserProfile.user_id == user_id))
+        ).scalar_one_or_none()
+        if balance is None:
+            logger.error(
+                "Credit deduction failed: user profile not found",
+                extra={
+                    "context": {
+                        "user_id": user_id,
+                    }
+                }
+            )
+            raise ValueError(f"User profile not found for user_id: {user_id}")
+        logger.info(
+            "Credit deduction rejected: insufficient credits",
+            extra={
+                "context": {
+                    "user_id": user_id,
+                    "amount": amount,
+                    "balance": balance,
+                }
+            }
+        )
+        raise InsufficientCreditsError(user_id, amount, balance)
+
     async def deduct_credits(
         self,
         session: AsyncSession,
         user_id: str,
         amount: int = 1,
+        reason: str = "usage",
+        reference: Optional[str] = None,
+        allow_overdraft: bool = False,
     ) -> int:
         """
         Deduct credits from user profile.
         
+        The balance is updated atomically in SQL and a ledger entry is written
+        in the same transaction (flushed, not committed).
+        
+        Charges for work that has already been done or queued must pass
+        allow_overdraft=True: the balance may then go negative and the ledger
+        entry records the overdraft (negative balance_after) instead of the
+        charge being rejected.
+        
         Args:
             session: Database session
             user_id: User UUID
             amount: Number of credits to deduct (default: 1)
+            reason: Ledger reason (e.g. "email_finder", "contact_export")
+            reference: Optional ledger reference (e.g. export ID)
+            allow_overdraft: Apply the charge even if it exceeds the balance
+            
+        Returns:
+            New credit balance after deduction
+            
+        Raises:
+            ValueError: If the user profile does not exist
+            InsufficientCreditsError: If the balance is lower than amount
+                (only without allow_overdraft)
+        """
+        return await self.deduct_credits_batch(
+            session,
+            user_id,
+            [amount],
+            reason=reason,
+            references=[reference],
+            allow_overdraft=allow_overdraft,
+        )
+
+    async def deduct_credits_batch(
+        self,
+        session: AsyncSession,
+        user_id: str,
+        amounts: Sequence[int],
+        reason: str = "usage",
+        references: Optional[Sequence[Optional[str]]] = None,
+        allow_overdraft: bool = False,
+    ) -> int:
+        """
+        Deduct several charges (e.g. the chunks of an export) all or nothing.
+        
+        One UPDATE deducts the total and one multi-row INSERT records a ledger
+        entry per charge with its running balance.
+        
+        Args:
+            session: Database session
+            user_id: User UUID
+            amounts: Credits per charge
+            reason: Ledger reason shared by all charges
+            references: Optional ledger reference per charge
+            allow_overdraft: Apply the charges even if they exceed the balance
             
         Returns:
-            New credit balance after deduction (can be negative)
+            New credit balance after deduction
+            
+        Raises:
+            ValueError: If the user profile does not exist or an amount is negative
+            InsufficientCreditsError: If the balance is lower than the total
+                (only without allow_overdraft)
         """
         start_time = time.time()
+        amounts = list(amounts)
+        if any(amount < 0 for amount in amounts):
+            raise ValueError("Credit amounts must not be negative")
+        total = sum(amounts)
         logger.debug(
             "Credit deduction request",
             extra={
                 "context": {
                     "user_id": user_id,
-                    "amount": amount,
+                    "amount": total,
+                    "charges": len(amounts),
                 }
             }
         )
         
-        profile = await self.profile_repo.get_by_user_id(session, user_id)
-        if not profile:
-            logger.error(
-                "Credit deduction failed: user profile not found",
-                extra={
-                    "context": {
-                        "user_id": user_id,
-                    }
-                }
-            )
-            raise ValueError(f"User profile not found for user_id: {user_id}")
-        
-        current_credits = profile.credits or 0
-        new_credits = current_credits - amount
+        new_credits = await self._apply_delta(session, user_id, -total, allow_overdraft=allow_overdraft)
+        if new_credits is None:
+            await self._raise_not_applied(session, user_id, total)
         
-        # Update profile with new credit balance
-        await self.profile_repo.update_profile(session, profile, credits=new_credits)
+        references = list(references) if references is not None else [None] * len(amounts)
+        balance = new_credits + total
+        ledger_rows = []
+        for amount, reference in zip(amounts, references):
+            balance -= amount
+            ledger_rows.append({
+                "user_id": user_id,
+                "delta": -amount,
+                "balance_after": balance,
+                "reason": reason,
+                "reference": reference,
+            })
+        if ledger_rows:
+            await session.execute(insert(CreditLedgerEntry), ledger_rows)
         await session.flush()
         
         duration_ms = (time.time() - start_time) * 1000
@@ -85,14 +218,67 @@ class CreditService:
             extra={
                 "context": {
                     "user_id": user_id,
-                    "amount": amount,
-                    "previous_balance": current_credits,
+                    "amount": total,
+                    "charges": len(amounts),
+                    "reason": reason,
+                    "previous_balance": new_credits + total,
                     "new_balance": new_credits,
                 },
                 "performance": {"duration_ms": duration_ms}
             }
         )
+        if new_credits < 0:
+            logger.warning(
+                "Credit balance overdrawn",
+                extra={
+                    "context": {
+                        "user_id": user_id,
+                        "amount": total,
+                        "reason": reason,
+                        "new_balance": new_credits,
+                    }
+                }
+            )
+        
+        return new_credits
+
+    async def add_credits(
+        self,
+        session: AsyncSession,
+        user_id: str,
+        amount: int,
+        reason: str,
+        reference: Optional[str] = None,
+    ) -> int:
+        """
+        Add credits to a user profile atomically and record a ledger entry.
         
+        Args:
+            session: Database session
+            user_id: User UUID
+            amount: Number of credits to add
+            reason: Ledger reason (e.g. "addon_purchase")
+            reference: Optional ledger reference (e.g. package ID)
+            
+        Returns:
+            New credit balance
+            
+        Raises:
+            ValueError: If the user profile does not exist
+        """
+        new_credits = await self._apply_delta(session, user_id, amount)
+        if new_credits is None:
+            raise ValueError(f"User profile not found for user_id: {user_id}")
+        await session.execute(
+            insert(CreditLedgerEntry).values(
+                user_id=user_id,
+                delta=amount,
+                balance_after=new_credits,
+                reason=reason,
+                reference=reference,
+            )
+        )
+        await session.flush()
         return new_credits
 
     async def get_user_credits(self, session: AsyncSession, user_id: str) -> int:
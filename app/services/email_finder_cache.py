@@ -0,0 +1,259 @@
+"""Cache of email finder results keyed by (first name, last name, domain).
+
+Finding an email for a person spends provider credits, and the same person is
+looked up again and again by different users and exports. Found emails are kept
+in an in-process LRU backed by the ``email_finder_cache`` table, so repeated
+lookups are answered with a primary-key read instead of scanning JSONB activity
+history. When ``EMAIL_FINDER_CACHE_SHARED`` is enabled every user reads the same
+"global" entries; otherwise entries are scoped to the user that found them.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db.session import AsyncSessionLocal
+from app.models.email_finder_cache import EmailFinderCacheEntry
+from app.utils.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+GLOBAL_SCOPE = "global"
+
+CacheKey = Tuple[str, str, str, str]
+
+# In-process LRU: (scope, first, last, domain) -> {"email", "status", "source", "contact_uuid", "found_at", "expires_at"}
+_finder_cache: OrderedDict[CacheKey, Dict[str, Any]] = OrderedDict()
+
+# While set, database access is skipped and only the LRU is used
+_db_retry_after: float = 0.0
+
+
+def _normalize(value: Optional[str]) -> str:
+    return " ".join((value or "").split()).lower()
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes (e.g. from SQLite) as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def clear_finder_cache() -> None:
+    """Drop all in-process cached finder results."""
+    global _db_retry_after
+    _finder_cache.clear()
+    _db_retry_after = 0.0
+
+
+class EmailFinderCache:
+    """Read-through/write-through cache for found emails."""
+
+    def __init__(self, session_factory=None) -> None:
+        self.session_factory = session_factory or AsyncSessionLocal
+
+    @staticmethod
+    def make_key(
+        first_name: Optional[str],
+        last_name: Optional[str],
+        domain: Optional[str],
+        user_id: Optional[str] = None,
+    ) -> Optional[CacheKey]:
+        """Build the normalized cache key, or None if a name part is missing."""
+        first, last, domain = _normalize(first_name), _normalize(last_name), _normalize(domain)
+        if not first or not last or not domain:
+            return None
+        scope = GLOBAL_SCOPE if settings.EMAIL_FINDER_CACHE_SHARED else (user_id or GLOBAL_SCOPE)
+        return (scope, first, last, domain)
+
+    @staticmethod
+    def _db_available() -> bool:
+        return time.time() >= _db_retry_after
+
+    @staticmethod
+    def _mark_db_unavailable(operation: str, exc: Exception) -> None:
+        global _db_retry_after
+        _db_retry_after = time.time() + settings.EMAIL_VERIFICATION_STORE_RETRY_SECONDS
+        logger.warning(
+            "Email finder cache database unavailable, using in-memory cache only",
+            extra={
+                "context": {
+                    "operation": operation,
+                    "error": str(exc),
+                    "retry_seconds": settings.EMAIL_VERIFICATION_STORE_RETRY_SECONDS,
+                }
+            }
+        )
+
+    @staticmethod
+    def _cache_put(key: CacheKey, entry: Dict[str, Any]) -> None:
+        _finder_cache[key] = entry
+        _finder_cache.move_to_end(key)
+        while len(_finder_cache) > settings.EMAIL_FINDER_CACHE_SIZE:
+            _finder_cache.popitem(last=False)
+
+    async def lookup(
+        self,
+        first_name: str,
+        last_name: str,
+        domain: str,
+        user_id: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached finder result for a person, if any.
+
+        The table is read on a short-lived session so that a failed read never
+        aborts the caller's transaction.
+
+        Args:
+            first_name: Contact first name (any case)
+            last_name: Contact last name (any case)
+            domain: Email domain
+            user_id: UUID of the requesting user (used when results are not shared)
+
+        Returns:
+            {"email", "status", "source", "contact_uuid", "found_at", "expires_at"}
+            for an unexpired entry, otherwise None
+        """
+        if not settings.ENABLE_EMAIL_FINDER_CACHE:
+            return None
+        key = self.make_key(first_name, last_name, domain, user_id)
+        if key is None:
+            return None
+
+        now = datetime.now(timezone.utc)
+        entry = _finder_cache.get(key)
+        if entry is not None:
+            if entry["expires_at"] > now:
+                _finder_cache.move_to_end(key)
+                return entry
+            del _finder_cache[key]
+
+        if not self._db_available():
+            return None
+        try:
+            row = await self._select_row(key, now)
+        except Exception as exc:
+            self._mark_db_unavailable("lookup", exc)
+            return None
+        if row is None:
+            return None
+
+        entry = {
+            "email": row.email,
+            "status": row.status,
+            "source": row.source,
+            "contact_uuid": row.contact_uuid,
+            "found_at": _as_utc(row.found_at),
+            "expires_at": _as_utc(row.expires_at),
+        }
+        self._cache_put(key, entry)
+        return entry
+
+    async def _select_row(
+        self,
+        key: CacheKey,
+        now: datetime,
+    ) -> Optional[EmailFinderCacheEntry]:
+        scope, first, last, domain = key
+        stmt = select(EmailFinderCacheEntry).where(
+            EmailFinderCacheEntry.scope == scope,
+            EmailFinderCacheEntry.first_name == first,
+            EmailFinderCacheEntry.last_name == last,
+            EmailFinderCacheEntry.domain == domain,
+            EmailFinderCacheEntry.expires_at > now,
+        )
+        async with self.session_factory() as own_session:
+            result = await own_session.execute(stmt)
+            return result.scalar_one_or_none()
+
+    async def store(
+        self,
+        first_name: str,
+        last_name: str,
+        domain: str,
+        email: str,
+        status: Optional[str] = None,
+        source: Optional[str] = None,
+        user_id: Optional[str] = None,
+        contact_uuid: Optional[str] = None,
+        session: Optional[AsyncSession] = None,
+    ) -> None:
+        """
+        Record a found email for a person.
+
+        Args:
+            first_name: Contact first name
+            last_name: Contact last name
+            domain: Email domain
+            email: Email address that was found
+            status: Verification status of the email, if known
+            source: Where the email came from (e.g. "database", "truelist")
+            user_id: UUID of the user that found it
+            contact_uuid: Contact the email belongs to, if known
+            session: Optional session to write with (flushed, not committed), inside a
+                savepoint so a failed write leaves the caller's transaction usable.
+                When omitted the entry is committed in a separate short-lived session.
+        """
+        if not settings.ENABLE_EMAIL_FINDER_CACHE or not email:
+            return
+        key = self.make_key(first_name, last_name, domain, user_id)
+        if key is None:
+            return
+
+        now = datetime.now(timezone.utc)
+        status = str(getattr(status, "value", status)) if status is not None else None
+        entry = {
+            "email": email.strip().lower(),
+            "status": status,
+            "source": source,
+            "contact_uuid": contact_uuid,
+            "found_at": now,
+            "expires_at": now + timedelta(days=settings.EMAIL_FINDER_CACHE_TTL_DAYS),
+        }
+        self._cache_put(key, entry)
+
+        if not self._db_available():
+            return
+
+        scope, first, last, domain = key
+        stmt = pg_insert(EmailFinderCacheEntry).values(
+            scope=scope,
+            first_name=first,
+            last_name=last,
+            domain=domain,
+            found_by=user_id,
+            **entry,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["scope", "first_name", "last_name", "domain"],
+            set_={
+                "email": stmt.excluded.email,
+                "status": stmt.excluded.status,
+                "source": stmt.excluded.source,
+                "contact_uuid": stmt.excluded.contact_uuid,
+                "found_by": stmt.excluded.found_by,
+                "found_at": stmt.excluded.found_at,
+                "expires_at": stmt.excluded.expires_at,
+            },
+        )
+        try:
+            if session is not None:
+                async with session.begin_nested():
+                    await session.execute(stmt)
+            else:
+                async with self.session_factory() as own_session:
+                    await own_session.execute(stmt)
+                    await own_session.commit()
+        except Exception as exc:
+            self._mark_db_unavailable("store", exc)
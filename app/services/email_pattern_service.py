@@ -0,0 +1,208 @@
+"""Per-domain email pattern index used to rank generated candidates.
+
+The ``email_patterns`` table records how many contacts of a company follow each
+format (``first.last``, ``flast``...). This service aggregates those counts per
+email domain (joined through ``companies_metadata.normalized_domain``) and keeps
+them in an in-process LRU, so candidate generation can try the formats a domain
+actually uses first. Every confirmed valid email bumps the index immediately
+and is persisted to ``email_patterns`` on a best-effort basis.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db.session import AsyncSessionLocal
+from app.models.companies import CompanyMetadata
+from app.models.email_patterns import EmailPattern
+from app.repositories.email_patterns import EmailPatternRepository
+from app.utils.email_generator import (
+    PATTERN_FORMATS,
+    detect_pattern_format,
+    normalize_pattern_format,
+)
+from app.utils.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+# In-process index: domain -> {"weights": {pattern_format: count}, "loaded_at": epoch seconds}
+_pattern_index: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+
+
+def _normalize_domain(domain: Optional[str]) -> str:
+    return (domain or "").strip().lower()
+
+
+def clear_pattern_index() -> None:
+    """Drop all cached per-domain pattern weights."""
+    _pattern_index.clear()
+
+
+class EmailPatternService:
+    """Learned per-domain pattern frequencies for candidate ranking."""
+
+    def __init__(
+        self,
+        email_pattern_repo: Optional[EmailPatternRepository] = None,
+        session_factory=None,
+    ) -> None:
+        self.email_pattern_repo = email_pattern_repo or EmailPatternRepository()
+        self.session_factory = session_factory or AsyncSessionLocal
+
+    @staticmethod
+    def _index_put(domain: str, weights: Dict[str, float]) -> None:
+        _pattern_index[domain] = {"weights": weights, "loaded_at": time.time()}
+        _pattern_index.move_to_end(domain)
+        while len(_pattern_index) > settings.EMAIL_PATTERN_INDEX_SIZE:
+            _pattern_index.popitem(last=False)
+
+    async def get_domain_weights(
+        self,
+        domain: str,
+        session: Optional[AsyncSession] = None,
+    ) -> Dict[str, float]:
+        """
+        Return learned pattern frequencies for a domain.
+
+        Args:
+            domain: Email domain (e.g. "example.com")
+            session: Optional session to read with; a short-lived one is opened otherwise
+
+        Returns:
+            Mapping of pattern format -> contact count. Empty when ranking is
+            disabled, nothing is known about the domain or the lookup fails.
+        """
+        domain = _normalize_domain(domain)
+        if not settings.ENABLE_EMAIL_PATTERN_RANKING or not domain:
+            return {}
+
+        entry = _pattern_index.get(domain)
+        if entry is not None and time.time() - entry["loaded_at"] < settings.EMAIL_PATTERN_INDEX_TTL:
+            _pattern_index.move_to_end(domain)
+            return entry["weights"]
+
+        try:
+            weights = await self._load_weights(domain, session)
+        except Exception as exc:
+            logger.warning(
+                "Email pattern lookup failed, using default candidate order",
+                extra={"context": {"domain": domain, "error": str(exc)}}
+            )
+            return entry["weights"] if entry is not None else {}
+
+        self._index_put(domain, weights)
+        return weights
+
+    async def _load_weights(
+        self,
+        domain: str,
+        session: Optional[AsyncSession],
+    ) -> Dict[str, float]:
+        stmt = (
+            select(EmailPattern.pattern_format, func.coalesce(func.sum(EmailPattern.contact_count), 0))
+            .join(CompanyMetadata, CompanyMetadata.uuid == EmailPattern.company_uuid)
+            .where(CompanyMetadata.normalized_domain == domain)
+            .group_by(EmailPattern.pattern_format)
+        )
+        if session is not None:
+            result = await session.execute(stmt)
+            rows = result.all()
+        else:
+            async with self.session_factory() as own_session:
+                result = await own_session.execute(stmt)
+                rows = result.all()
+
+        weights: Dict[str, float] = {}
+        for pattern_format, contact_count in rows:
+            format_name = normalize_pattern_format(pattern_format)
+            if format_name in PATTERN_FORMATS and contact_count:
+                weights[format_name] = weights.get(format_name, 0) + float(contact_count)
+        return weights
+
+    async def record_valid_email(
+        self,
+        email: str,
+        first_name: str,
+        last_name: str,
+        domain: str,
+        session: Optional[AsyncSession] = None,
+    ) -> Optional[str]:
+        """
+        Learn from a confirmed valid email.
+
+        Updates the in-process index right away and increments (or creates) the
+        matching ``email_patterns`` row of the domain's company.
+
+        Args:
+            email: Email address confirmed valid by a provider
+            first_name: Contact first name
+            last_name: Contact last name
+            domain: Email domain
+            session: Optional session to write with (flushed, not committed). When
+                omitted the update is committed in a separate short-lived session.
+
+        Returns:
+            The detected pattern format, or None if the email follows no known format
+        """
+        domain = _normalize_domain(domain)
+        if not settings.ENABLE_EMAIL_PATTERN_RANKING or not domain:
+            return None
+        format_name = detect_pattern_format(email, first_name, last_name)
+        if format_name is None:
+            return None
+
+        weights = dict(await self.get_domain_weights(domain, session=session))
+        weights[format_name] = weights.get(format_name, 0) + 1
+        self._index_put(domain, weights)
+
+        try:
+            if session is not None:
+                await self._persist(session, domain, format_name)
+                await session.flush()
+            else:
+                async with self.session_factory() as own_session:
+                    await self._persist(own_session, domain, format_name)
+                    await own_session.commit()
+        except Exception as exc:
+            logger.warning(
+                "Failed to persist learned email pattern",
+                extra={"context": {"domain": domain, "pattern_format": format_name, "error": str(exc)}}
+            )
+        return format_name
+
+    async def _persist(self, session: AsyncSession, domain: str, format_name: str) -> None:
+        company_uuid = (
+            await session.execute(
+                select(CompanyMetadata.uuid).where(CompanyMetadata.normalized_domain == domain).limit(1)
+            )
+        ).scalar_one_or_none()
+        if company_uuid is None:
+            # Domain is not linked to a company: the in-process index still learns
+            return
+
+        pattern = await self.email_pattern_repo.increment_contact_count_by_pattern_format(
+            session, company_uuid, format_name
+        )
+        if pattern is None:
+            now = datetime.utcnow()
+            session.add(
+                EmailPattern(
+                    uuid=str(uuid.uuid4()),
+                    company_uuid=company_uuid,
+                    pattern_format=format_name,
+                    pattern_string=format_name,
+                    contact_count=1,
+                    is_auto_extracted=True,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
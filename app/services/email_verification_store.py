@@ -0,0 +1,245 @@
+"""Shared store for email verification results.
+
+Verification calls are paid per address, so results are reused across
+providers, workers and exports. Lookups hit an in-process LRU first and fall
+back to the ``email_verification_results`` table, keyed by the lowercased
+email. Each status has its own TTL: definitive verdicts (valid/invalid) are
+kept for weeks while unknown results expire after a day.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db.session import AsyncSessionLocal
+from app.models.email_verifications import EmailVerificationResult
+from app.schemas.email import EmailVerificationStatus
+from app.utils.domain_verdicts import record_verification_results
+from app.utils.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+# In-process LRU: email -> {"status", "provider", "verified_at", "expires_at"}
+_verification_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+
+# While set, database access is skipped and only the LRU is used
+_db_retry_after: float = 0.0
+
+
+def _normalize_email(email: Optional[str]) -> str:
+    return (email or "").strip().lower()
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes (e.g. from SQLite) as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def clear_verification_cache() -> None:
+    """Drop all in-process cached verification results."""
+    global _db_retry_after
+    _verification_cache.clear()
+    _db_retry_after = 0.0
+
+
+class EmailVerificationStore:
+    """Read-through/write-through store for verification verdicts."""
+
+    def __init__(self, session_factory=None) -> None:
+        self.session_factory = session_factory or AsyncSessionLocal
+
+    @staticmethod
+    def ttl_for_status(status_value: str) -> timedelta:
+        """Return how long a result with the given status may be reused."""
+        days_by_status = {
+            EmailVerificationStatus.VALID.value: settings.EMAIL_VERIFICATION_TTL_VALID_DAYS,
+            EmailVerificationStatus.INVALID.value: settings.EMAIL_VERIFICATION_TTL_INVALID_DAYS,
+            EmailVerificationStatus.CATCHALL.value: settings.EMAIL_VERIFICATION_TTL_CATCHALL_DAYS,
+        }
+        return timedelta(days=days_by_status.get(status_value, settings.EMAIL_VERIFICATION_TTL_UNKNOWN_DAYS))
+
+    @staticmethod
+    def _db_available() -> bool:
+        return time.time() >= _db_retry_after
+
+    @staticmethod
+    def _mark_db_unavailable(operation: str, exc: Exception) -> None:
+        global _db_retry_after
+        _db_retry_after = time.time() + settings.EMAIL_VERIFICATION_STORE_RETRY_SECONDS
+        logger.warning(
+            "Email verification store database unavailable, using in-memory cache only",
+            extra={
+                "context": {
+                    "operation": operation,
+                    "error": str(exc),
+                    "retry_seconds": settings.EMAIL_VERIFICATION_STORE_RETRY_SECONDS,
+                }
+            }
+        )
+
+    @staticmethod
+    def _cache_put(email: str, entry: Dict[str, Any]) -> None:
+        _verification_cache[email] = entry
+        _verification_cache.move_to_end(email)
+        while len(_verification_cache) > settings.EMAIL_VERIFICATION_CACHE_SIZE:
+            _verification_cache.popitem(last=False)
+
+    async def lookup_many(
+        self,
+        emails: Iterable[str],
+        session: Optional[AsyncSession] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Return fresh stored results for the given emails.
+
+        Args:
+            emails: Email addresses (any case)
+            session: Optional session to read with; a short-lived one is opened otherwise
+
+        Returns:
+            Mapping of lowercased email -> {"status", "provider", "verified_at", "expires_at"}
+            for every email with an unexpired result. Missing emails are omitted.
+        """
+        if not settings.ENABLE_EMAIL_VERIFICATION_STORE:
+            return {}
+
+        now = datetime.now(timezone.utc)
+        found: Dict[str, Dict[str, Any]] = {}
+        misses: list[str] = []
+        for email in dict.fromkeys(_normalize_email(e) for e in emails):
+            if not email:
+                continue
+            entry = _verification_cache.get(email)
+            if entry is not None:
+                if entry["expires_at"] > now:
+                    _verification_cache.move_to_end(email)
+                    found[email] = entry
+                    continue
+                del _verification_cache[email]
+            misses.append(email)
+
+        if misses and self._db_available():
+            try:
+                rows = await self._select_rows(misses, now, session)
+            except Exception as exc:
+                self._mark_db_unavailable("lookup", exc)
+                rows = []
+            for row in rows:
+                entry = {
+                    "status": row.status,
+                    "provider": row.provider,
+                    "verified_at": _as_utc(row.verified_at),
+                    "expires_at": _as_utc(row.expires_at),
+                }
+                self._cache_put(row.email, entry)
+                found[row.email] = entry
+
+        return found
+
+    async def lookup(
+        self,
+        email: str,
+        session: Optional[AsyncSession] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Return the fresh stored result for a single email, if any."""
+        results = await self.lookup_many([email], session=session)
+        return results.get(_normalize_email(email))
+
+    async def _select_rows(
+        self,
+        emails: list[str],
+        now: datetime,
+        session: Optional[AsyncSession],
+    ) -> list[EmailVerificationResult]:
+        stmt = select(EmailVerificationResult).where(
+            EmailVerificationResult.email.in_(emails),
+            EmailVerificationResult.expires_at > now,
+        )
+        if session is not None:
+            result = await session.execute(stmt)
+            return list(result.scalars().all())
+        async with self.session_factory() as own_session:
+            result = await own_session.execute(stmt)
+            return list(result.scalars().all())
+
+    async def store_many(
+        self,
+        statuses: Dict[str, str],
+        provider: str,
+        session: Optional[AsyncSession] = None,
+    ) -> None:
+        """
+        Record verification results.
+
+        Args:
+            statuses: Mapping of email -> mapped status (valid, invalid, catchall, unknown)
+            provider: Provider that produced the results (e.g. "truelist")
+            session: Optional session to write with (flushed, not committed). When omitted
+                the results are committed in a separate short-lived session.
+        """
+        # Every fresh provider verdict also teaches us about its domain
+        record_verification_results(statuses)
+
+        if not settings.ENABLE_EMAIL_VERIFICATION_STORE or not statuses:
+            return
+
+        now = datetime.now(timezone.utc)
+        rows: Dict[str, Dict[str, Any]] = {}
+        for email, status_value in statuses.items():
+            key = _normalize_email(email)
+            if not key:
+                continue
+            status_value = str(getattr(status_value, "value", status_value) or EmailVerificationStatus.UNKNOWN.value)
+            entry = {
+                "status": status_value,
+                "provider": provider,
+                "verified_at": now,
+                "expires_at": now + self.ttl_for_status(status_value),
+            }
+            self._cache_put(key, entry)
+            rows[key] = {"email": key, **entry}
+
+        if not rows or not self._db_available():
+            return
+
+        stmt = pg_insert(EmailVerificationResult).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["email"],
+            set_={
+                "status": stmt.excluded.status,
+                "provider": stmt.excluded.provider,
+                "verified_at": stmt.excluded.verified_at,
+                "expires_at": stmt.excluded.expires_at,
+            },
+        )
+        try:
+            if session is not None:
+                await session.execute(stmt)
+                await session.flush()
+            else:
+                async with self.session_factory() as own_session:
+                    await own_session.execute(stmt)
+                    await own_session.commit()
+        except Exception as exc:
+            self._mark_db_unavailable("store", exc)
+
+    async def store(
+        self,
+        email: str,
+        status_value: str,
+        provider: str,
+        session: Optional[AsyncSession] = None,
+    ) -> None:
+        """Record a single verification result."""
+        await self.store_many({email: status_value}, provider, session=session)
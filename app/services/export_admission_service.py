@@ -0,0 +1,219 @@
+"""Cost estimation and admission control for export jobs.
+
+Exports are expensive background jobs. Before one is enqueued we estimate its
+work in cost units (rows x columns x (1 + provider calls per row)), convert it
+to seconds using a rate calibrated from recently completed exports, and compare
+the backlog already queued against configured thresholds to decide whether the
+export runs now, starts after a delay, or is rejected.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.exports import ExportStatus, ExportType, UserExport
+from app.utils.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+# Number of CSV columns written per row by each export type
+EXPORT_COLUMN_COUNTS: Dict[ExportType, int] = {
+    ExportType.contacts: 48,
+    ExportType.companies: 24,
+    ExportType.emails: 4,
+}
+
+ADMISSION_ADMIT = "admit"
+ADMISSION_DELAY = "delay"
+ADMISSION_REJECT = "reject"
+
+# Calibrated seconds-per-cost-unit cache: export_type -> (rate, computed_at)
+_calibration_cache: Dict[ExportType, tuple[float, float]] = {}
+
+
+class ExportAdmissionService:
+    """Estimate export cost and decide whether new exports may be enqueued."""
+
+    def estimate_cost(
+        self,
+        export_type: ExportType,
+        row_count: int,
+        provider_calls_per_row: float = 0.0,
+    ) -> float:
+        """Return the estimated work units for an export."""
+        columns = EXPORT_COLUMN_COUNTS.get(export_type, 1)
+        return float(row_count) * columns * (1.0 + max(0.0, provider_calls_per_row))
+
+    async def get_seconds_per_unit(
+        self,
+        session: AsyncSession,
+        export_type: ExportType,
+    ) -> float:
+        """
+        Return the seconds-per-cost-unit rate calibrated from past exports.
+
+        Uses the most recent completed exports of the same type that recorded
+        both an estimated cost and processing timestamps. Falls back to
+        EXPORT_DEFAULT_SECONDS_PER_COST_UNIT when no history exists.
+        """
+        cached = _calibration_cache.get(export_type)
+        if cached and time.time() - cached[1] < settings.EXPORT_CALIBRATION_TTL:
+            return cached[0]
+
+        rate = settings.EXPORT_DEFAULT_SECONDS_PER_COST_UNIT
+        stmt = (
+            select(UserExport.estimated_cost, UserExport.started_at, UserExport.completed_at)
+            .where(
+                UserExport.export_type == export_type,
+                UserExport.status == ExportStatus.completed,
+                UserExport.estimated_cost > 0,
+                UserExport.started_at.is_not(None),
+                UserExport.completed_at.is_not(None),
+            )
+            .order_by(UserExport.completed_at.desc())
+            .limit(settings.EXPORT_CALIBRATION_SAMPLE_SIZE)
+        )
+        result = await session.execute(stmt)
+        total_units = 0.0
+        total_seconds = 0.0
+        for estimated_cost, started_at, completed_at in result.all():
+            duration = (completed_at - started_at).total_seconds()
+            if duration <= 0:
+                continue
+            total_units += estimated_cost
+            total_seconds += duration
+        if total_units > 0:
+            rate = total_seconds / total_units
+
+        _calibration_cache[export_type] = (rate, time.time())
+        return rate
+
+    async def get_backlog_seconds(self, session: AsyncSession) -> float:
+        """Estimate the seconds of export work already pending or processing."""
+        stmt = (
+            select(UserExport.export_type, func.coalesce(func.sum(UserExport.estimated_cost), 0.0))
+            .where(UserExport.status.in_([ExportStatus.pending, ExportStatus.processing]))
+            .group_by(UserExport.export_type)
+        )
+        result = await session.execute(stmt)
+        backlog = 0.0
+        for export_type, units in result.all():
+            backlog += float(units or 0.0) * await self.get_seconds_per_unit(session, export_type)
+        # Background tasks run concurrently, so the queue drains in parallel
+        workers = max(1, settings.MAX_CONCURRENT_BACKGROUND_TASKS)
+        return backlog / workers
+
+    async def evaluate(
+        self,
+        session: AsyncSession,
+        export_type: ExportType,
+        row_count: int,
+        provider_calls_per_row: float = 0.0,
+    ) -> Dict[str, Any]:
+        """
+        Estimate an export and decide whether to admit, delay or reject it.
+
+        Returns:
+            Dictionary with keys: decision, estimated_cost, estimated_duration_seconds,
+            backlog_seconds, start_delay_seconds, estimated_completion_at and
+            retry_after_seconds (only set when rejected)
+        """
+        estimated_cost = self.estimate_cost(export_type, row_count, provider_calls_per_row)
+        seconds_per_unit = await self.get_seconds_per_unit(session, export_type)
+        estimated_duration = estimated_cost * seconds_per_unit
+
+        backlog_seconds = 0.0
+        decision = ADMISSION_ADMIT
+        start_delay = 0.0
+        retry_after: Optional[int] = None
+        if settings.ENABLE_EXPORT_ADMISSION_CONTROL:
+            # Decide on the work already queued; the export's own duration only
+            # moves its completion time, so a large export is never turned away
+            # for its size alone
+            backlog_seconds = await self.get_backlog_seconds(session)
+            if backlog_seconds > settings.EXPORT_ADMISSION_REJECT_THRESHOLD:
+                decision = ADMISSION_REJECT
+                # Time until the queue drains below the reject threshold
+                retry_after = max(
+                    1, math.ceil(backlog_seconds - settings.EXPORT_ADMISSION_REJECT_THRESHOLD)
+                )
+            elif backlog_seconds > settings.EXPORT_ADMISSION_DELAY_THRESHOLD:
+                decision = ADMISSION_DELAY
+                start_delay = min(
+                    settings.EXPORT_ADMISSION_MAX_DELAY,
+                    backlog_seconds - settings.EXPORT_ADMISSION_DELAY_THRESHOLD,
+                )
+
+        wait_seconds = max(backlog_seconds, start_delay)
+        estimated_completion_at = datetime.now(timezone.utc) + timedelta(
+            seconds=wait_seconds + estimated_duration
+        )
+
+        logger.info(
+            "Export admission evaluated",
+            extra={
+                "context": {
+                    "export_type": export_type,
+                    "row_count": row_count,
+                    "decision": decision,
+                    "estimated_cost": estimated_cost,
+                    "estimated_duration_seconds": estimated_duration,
+                    "backlog_seconds": backlog_seconds,
+                    "start_delay_seconds": start_delay,
+                }
+            }
+        )
+        return {
+            "decision": decision,
+            "estimated_cost": estimated_cost,
+            "estimated_duration_seconds": estimated_duration,
+            "backlog_seconds": backlog_seconds,
+            "start_delay_seconds": start_delay,
+            "estimated_completion_at": estimated_completion_at,
+            "retry_after_seconds": retry_after,
+        }
+
+    async def admit(
+        self,
+        session: AsyncSession,
+        user_id: str,
+        export_type: ExportType,
+        row_count: int,
+        provider_calls_per_row: float = 0.0,
+    ) -> Dict[str, Any]:
+        """
+        Evaluate an export, raising 503 with Retry-After when it is rejected.
+
+        Returns:
+            Admission evaluation dictionary from evaluate
+        """
+        admission = await self.evaluate(session, export_type, row_count, provider_calls_per_row)
+        if admission["decision"] == ADMISSION_REJECT:
+            logger.warning(
+                "Export rejected by admission control",
+                extra={
+                    "context": {
+                        "user_id": user_id,
+                        "export_type": export_type,
+                        "row_count": row_count,
+                        "backlog_seconds": admission["backlog_seconds"],
+                        "estimated_duration_seconds": admission["estimated_duration_seconds"],
+                    },
+                    "user_id": user_id,
+                }
+            )
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Export system is at capacity. Please retry later.",
+                headers={"Retry-After": str(admission["retry_after_seconds"])},
+            )
+        return admission
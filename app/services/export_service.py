@@ -14,7 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.clients.connectra_client import ConnectraClient
 from app.core.config import get_settings
-from app.models.exports import ExportStatus, ExportType, UserExport
+from app.models.exports import ExportStatus, ExportType, ExportWatermark, UserExport
 from app.schemas.filters import ExportFilterParams
 from app.services.s3_service import S3Service
 from app.services.vql_transformer import VQLTransformer
@@ -25,6 +25,23 @@ from app.utils.signed_url import generate_signed_url
 settings = get_settings()
 logger = get_logger(__name__)
 
+# UUIDs per Connectra query during delta selection (only uuid/updated_at are selected)
+DELTA_SELECTION_CHUNK_SIZE = 500
+
+
+def _parse_updated_at(value) -> Optional[datetime]:
+    """Parse a Connectra ``updated_at`` into the naive UTC form watermarks are stored in."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
 
 class ExportService:
     """Encapsulate export job orchestration."""
@@ -429,6 +446,8 @@ class ExportService:
         else:
             export.file_name = Path(file_path).name
         export.status = status
+        if status == ExportStatus.completed:
+            export.completed_at = datetime.now(timezone.utc)
         if contact_count is not None:
             export.contact_count = contact_count
         if company_count is not None:
@@ -480,6 +499,197 @@ class ExportService:
         
         return export
 
+    async def get_watermark(
+        self,
+        session: AsyncSession,
+        user_id: str,
+        export_type: ExportType,
+        segment_key: str,
+    ) -> Optional[ExportWatermark]:
+        """Return the stored delta watermark for a user segment, if any."""
+        stmt = select(ExportWatermark).where(
+            ExportWatermark.user_id == user_id,
+            ExportWatermark.export_type == export_type,
+            ExportWatermark.segment_key == segment_key,
+        )
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def select_delta_uuids(
+        self,
+        session: AsyncSession,
+        user_id: str,
+        export_type: ExportType,
+        segment_key: str,
+        uuids: list[str],
+    ) -> dict:
+        """
+        Narrow a segment to the rows changed since its last successful export.
+        
+        Reads ``updated_at`` from Connectra, the same source the export file is
+        generated from, and compares it with the segment watermark. Rows without
+        ``updated_at`` are always treated as changed. Requested UUIDs Connectra
+        no longer returns are reported as deleted so callers can emit tombstones.
+        
+        Returns:
+            Dictionary with keys: changed_uuids, deleted_uuids, unchanged_count,
+            since (previous watermark) and watermark (max updated_at seen)
+        """
+        if export_type == ExportType.contacts:
+            entity_type = "contact"
+        elif export_type == ExportType.companies:
+            entity_type = "company"
+        else:
+            raise ValueError(f"Delta exports are not supported for {export_type}")
+        
+        stored = await self.get_watermark(session, user_id, export_type, segment_key)
+        since = stored.watermark if stored else None
+        
+        # De-duplicate while keeping the caller's order
+        unique_uuids = list(dict.fromkeys(uuids))
+        updated_at_by_uuid: dict[str, Optional[datetime]] = {}
+        async with ConnectraClient() as client:
+            records = await client.batch_search_by_uuids(
+                unique_uuids,
+                entity_type=entity_type,
+                batch_size=DELTA_SELECTION_CHUNK_SIZE,
+                select_columns=["uuid", "updated_at"],
+            )
+        for record in records:
+            if record.get("uuid"):
+                updated_at_by_uuid[record["uuid"]] = _parse_updated_at(record.get("updated_at"))
+        
+        changed_uuids: list[str] = []
+        deleted_uuids: list[str] = []
+        watermark = since
+        for row_uuid in unique_uuids:
+            if row_uuid not in updated_at_by_uuid:
+                deleted_uuids.append(row_uuid)
+                continue
+            updated_at = updated_at_by_uuid[row_uuid]
+            if updated_at is None or since is None or updated_at > since:
+                changed_uuids.append(row_uuid)
+            if updated_at is not None and (watermark is None or updated_at > watermark):
+                watermark = updated_at
+        
+        unchanged_count = len(unique_uuids) - len(changed_uuids) - len(deleted_uuids)
+        logger.info(
+            "Delta export selection computed",
+            extra={
+                "context": {
+                    "user_id": user_id,
+                    "export_type": export_type,
+                    "segment_key": segment_key,
+                    "requested_count": len(unique_uuids),
+                    "changed_count": len(changed_uuids),
+                    "unchanged_count": unchanged_count,
+                    "deleted_count": len(deleted_uuids),
+                    "since": since.isoformat() if since else None,
+                },
+                "user_id": user_id,
+            }
+        )
+        return {
+            "changed_uuids": changed_uuids,
+            "deleted_uuids": deleted_uuids,
+            "unchanged_count": unchanged_count,
+            "since": since,
+            "watermark": watermark,
+        }
+
+    async def advance_watermark(
+        self,
+        session: AsyncSession,
+        export_id: str,
+    ) -> Optional[ExportWatermark]:
+        """
+        Promote a completed delta export's watermark to its segment.
+        
+        Called only after the export file has been produced so that a failed
+        export never causes changed rows to be skipped on the next run.
+        """
+        stmt = select(UserExport).where(UserExport.export_id == export_id)
+        result = await session.execute(stmt)
+        export = result.scalar_one_or_none()
+        if not export or not export.is_delta or not export.segment_key:
+            return None
+        
+        watermark_row = await self.get_watermark(
+            session, export.user_id, export.export_type, export.segment_key
+        )
+        if watermark_row is None:
+            watermark_row = ExportWatermark(
+                user_id=export.user_id,
+                export_type=export.export_type,
+                segment_key=export.segment_key,
+            )
+            session.add(watermark_row)
+        
+        # Never move a watermark backwards (e.g. an older export finishing late)
+        if export.delta_watermark is not None and (
+            watermark_row.watermark is None or export.delta_watermark > watermark_row.watermark
+        ):
+            watermark_row.watermark = export.delta_watermark
+        watermark_row.last_export_id = export.export_id
+        
+        await session.commit()
+        logger.info(
+            "Delta export watermark advanced",
+            extra={
+                "context": {
+                    "export_id": export_id,
+                    "segment_key": export.segment_key,
+                    "watermark": watermark_row.watermark.isoformat() if watermark_row.watermark else None,
+                },
+                "user_id": export.user_id,
+            }
+        )
+        return watermark_row
+
+    async def generate_tombstone_csv(
+        self,
+        export_id: str,
+        deleted_uuids: list[str],
+    ) -> str:
+        """
+        Write the tombstone CSV (one ``uuid`` per deleted row) for a delta export.
+        
+        Returns:
+            S3 key or local file path to the generated CSV file
+        """
+        csv_buffer = io.StringIO()
+        writer = csv.writer(csv_buffer)
+        writer.writerow(["uuid", "deleted"])
+        for deleted_uuid in deleted_uuids:
+            writer.writerow([deleted_uuid, "true"])
+        csv_content = csv_buffer.getvalue().encode("utf-8")
+        csv_buffer.close()
+        
+        file_name = f"{export_id}_tombstones.csv"
+        if settings.S3_BUCKET_NAME:
+            try:
+                s3_key = f"{self.s3_service.exports_prefix}{file_name}"
+                await self.s3_service.upload_file(
+                    file_content=csv_content,
+                    s3_key=s3_key,
+                    content_type="text/csv",
+                )
+                return s3_key
+            except Exception as s3_exc:
+                log_error(
+                    "Failed to upload tombstone CSV to S3, falling back to local storage",
+                    s3_exc,
+                    "app.services.export_service",
+                    context={"export_id": export_id},
+                )
+        
+        exports_dir = Path(settings.UPLOAD_DIR) / "exports"
+        exports_dir.mkdir(parents=True, exist_ok=True)
+        file_path = exports_dir / file_name
+        async with aiofiles.open(file_path, "wb") as async_file:
+            await async_file.write(csv_content)
+        return str(file_path)
+
     async def generate_company_csv(
         self,
         session: AsyncSession,
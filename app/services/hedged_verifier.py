@@ -0,0 +1,225 @@
+"""Hedged single-email verification across providers.
+
+Single-email endpoints wait on one provider, so a stalled provider makes the
+user wait for its full timeout. With hedging enabled, the check is sent to the
+primary provider first; if no answer arrives within the primary's recent p90
+latency, the same check is sent to the secondary provider. Whichever answer
+arrives first wins and the other call is cancelled.
+
+Hedges cost an extra paid call, so they are budget-aware: a hedge is only sent
+while hedges stay under EMAIL_HEDGE_BUDGET_RATIO of recent primary calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from app.core.config import get_settings
+from app.services.bulkmailverifier_service import BulkMailVerifierService
+from app.services.truelist_service import TruelistService
+from app.utils.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+# Budget counters are halved once this many calls were seen, so the budget
+# follows recent traffic instead of the whole process lifetime
+_BUDGET_WINDOW_CALLS = 1000
+
+
+class ProviderLatencyTracker:
+    """Rolling window of call latencies for one provider."""
+
+    def __init__(self, window: int) -> None:
+        self._samples: Deque[float] = deque(maxlen=max(1, window))
+
+    def record(self, latency: float) -> None:
+        self._samples.append(latency)
+
+    def percentile(self, quantile: float) -> Optional[float]:
+        """Return the latency at the given quantile, or None with too few samples."""
+        if len(self._samples) < settings.EMAIL_HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(quantile * len(ordered)) - 1))
+        return ordered[index]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+class HedgeBudget:
+    """Caps hedged calls to a share of primary calls."""
+
+    def __init__(self, ratio: float) -> None:
+        self.ratio = ratio
+        self.calls = 0
+        self.hedges = 0
+
+    def record_call(self) -> None:
+        self.calls += 1
+        if self.calls > _BUDGET_WINDOW_CALLS:
+            self.calls //= 2
+            self.hedges //= 2
+
+    def try_acquire(self) -> bool:
+        """Reserve one hedge if the budget allows it."""
+        # Always allow one hedge so a cold process can still protect its first calls
+        if self.hedges >= max(1.0, self.ratio * self.calls):
+            return False
+        self.hedges += 1
+        return True
+
+
+_latency_trackers: Dict[str, ProviderLatencyTracker] = {}
+_hedge_budget: Optional[HedgeBudget] = None
+_hedge_stats = {"calls": 0, "hedged": 0, "hedge_wins": 0, "budget_denied": 0}
+
+
+def get_latency_tracker(provider: str) -> ProviderLatencyTracker:
+    """Return the process-wide latency tracker for a provider."""
+    tracker = _latency_trackers.get(provider)
+    if tracker is None:
+        tracker = ProviderLatencyTracker(settings.EMAIL_HEDGE_LATENCY_WINDOW)
+        _latency_trackers[provider] = tracker
+    return tracker
+
+
+def get_hedge_budget() -> HedgeBudget:
+    """Return the process-wide hedge budget."""
+    global _hedge_budget
+    if _hedge_budget is None:
+        _hedge_budget = HedgeBudget(settings.EMAIL_HEDGE_BUDGET_RATIO)
+    return _hedge_budget
+
+
+def reset_hedging_state() -> None:
+    """Drop latency samples, budget and counters (used by tests)."""
+    global _hedge_budget
+    _latency_trackers.clear()
+    _hedge_budget = None
+    for key in _hedge_stats:
+        _hedge_stats[key] = 0
+
+
+def get_hedging_stats() -> Dict[str, Any]:
+    """Return hedging counters and per-provider p90 latency for monitoring."""
+    return {
+        "enabled": settings.ENABLE_EMAIL_HEDGING,
+        **_hedge_stats,
+        "providers": {
+            name: {
+                "samples": len(tracker),
+                "p90_seconds": tracker.percentile(settings.EMAIL_HEDGE_PERCENTILE),
+            }
+            for name, tracker in _latency_trackers.items()
+        },
+    }
+
+
+class HedgedEmailVerifier:
+    """
+    Drop-in ``verify_single_email`` provider that hedges a slow primary.
+
+    Results carry a ``provider`` key naming the provider that answered.
+    """
+
+    def __init__(self, primary: Any, primary_name: str, secondary: Any, secondary_name: str) -> None:
+        self.primary = primary
+        self.primary_name = primary_name
+        self.secondary = secondary
+        self.secondary_name = secondary_name
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait on the primary before hedging."""
+        p90 = get_latency_tracker(self.primary_name).percentile(settings.EMAIL_HEDGE_PERCENTILE)
+        if p90 is None:
+            return settings.EMAIL_HEDGE_DEFAULT_DELAY
+        return max(settings.EMAIL_HEDGE_MIN_DELAY, p90)
+
+    async def _timed_call(self, service: Any, provider: str, email: str) -> Dict[str, Any]:
+        started = time.monotonic()
+        try:
+            result = await service.verify_single_email(email)
+        except asyncio.CancelledError:
+            # A cancelled call ran at least this long; keep it so p90 is not biased low
+            get_latency_tracker(provider).record(time.monotonic() - started)
+            raise
+        get_latency_tracker(provider).record(time.monotonic() - started)
+        result = dict(result)
+        result.setdefault("provider", provider)
+        return result
+
+    async def verify_single_email(self, email: str) -> Dict[str, Any]:
+        """Verify one email, hedging to the secondary provider when the primary is slow."""
+        budget = get_hedge_budget()
+        budget.record_call()
+        _hedge_stats["calls"] += 1
+
+        primary_task = asyncio.create_task(self._timed_call(self.primary, self.primary_name, email))
+        tasks = [primary_task]
+        try:
+            delay = self.hedge_delay()
+            done, _ = await asyncio.wait({primary_task}, timeout=delay)
+            if done and primary_task.exception() is None:
+                return primary_task.result()
+
+            if not budget.try_acquire():
+                _hedge_stats["budget_denied"] += 1
+                return await primary_task
+
+            _hedge_stats["hedged"] += 1
+            logger.info(
+                "Hedging email verification to secondary provider",
+                extra={
+                    "context": {
+                        "primary": self.primary_name,
+                        "secondary": self.secondary_name,
+                        "delay_seconds": round(delay, 3),
+                        "primary_failed": bool(done),
+                    }
+                }
+            )
+            secondary_task = asyncio.create_task(self._timed_call(self.secondary, self.secondary_name, email))
+            tasks.append(secondary_task)
+            first_error: Optional[BaseException] = primary_task.exception() if done else None
+            pending = {task for task in tasks if not task.done()}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is secondary_task:
+                            _hedge_stats["hedge_wins"] += 1
+                        return task.result()
+                    first_error = first_error or task.exception()
+            raise first_error
+        finally:
+            # The losing call (or both, if we were cancelled) must not keep running
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+
+def build_single_email_verifier(provider: str, service: Any) -> Any:
+    """
+    Wrap a provider service with hedging when enabled and a secondary is configured.
+
+    Args:
+        provider: Primary provider name ("bulkmailverifier" or "truelist")
+        service: Primary provider service instance
+
+    Returns:
+        A ``HedgedEmailVerifier`` or the unchanged service
+    """
+    if not settings.ENABLE_EMAIL_HEDGING:
+        return service
+
+    if provider == "bulkmailverifier" and settings.TRUELIST_API_KEY:
+        return HedgedEmailVerifier(service, provider, TruelistService(), "truelist")
+    if provider == "truelist" and settings.BULKMAILVERIFIER_EMAIL and settings.BULKMAILVERIFIER_PASSWORD:
+        return HedgedEmailVerifier(service, provider, BulkMailVerifierService(), "bulkmailverifier")
+    return service
@@ -3,17 +3,145 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from typing import Any, Dict, Optional
 
 import httpx
 from fastapi import HTTPException, status
 
 from app.core.config import get_settings
+from app.utils.adaptive_limiter import get_provider_limiter
 from app.utils.logger import get_logger
 
 settings = get_settings()
 logger = get_logger(__name__)
 
+# Shared httpx client for connection pooling (reused across searches and polls)
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+
+async def close_http_client() -> None:
+    """Close the shared IcyPeas HTTP client (called on shutdown)."""
+    global _shared_http_client
+    if _shared_http_client is not None and not _shared_http_client.is_closed:
+        await _shared_http_client.aclose()
+    _shared_http_client = None
+
+
+class IcyPeasPoller:
+    """Polls all outstanding IcyPeas searches together on one schedule.
+
+    Callers register a search id and await a future. A single background loop
+    reads every outstanding search each tick and resolves futures once their
+    status is FOUND or DEBITED (or when their deadline passes). The tick
+    interval follows the observed completion time of recent searches.
+    """
+
+    def __init__(self, min_interval: float, max_interval: float) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self._avg_completion: Optional[float] = None
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._service: Optional["IcyPeasService"] = None
+
+    async def wait_for(
+        self,
+        service: "IcyPeasService",
+        search_id: str,
+        deadline_seconds: float,
+    ) -> Optional[Dict[str, Any]]:
+        """Wait up to ``deadline_seconds`` for the search; return its best email, or None."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Futures are bound to their loop; start fresh on a new one
+            self._loop = loop
+            self._pending = {}
+            self._task = None
+
+        self._service = service
+        entry = self._pending.get(search_id)
+        if entry is None:
+            now = time.monotonic()
+            entry = {"future": loop.create_future(), "started_at": now, "deadline": now + deadline_seconds}
+            self._pending[search_id] = entry
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+        return await asyncio.shield(entry["future"])
+
+    def _record_completion(self, elapsed: float) -> None:
+        """Move the tick interval towards a quarter of the typical completion time."""
+        if self._avg_completion is None:
+            self._avg_completion = elapsed
+        else:
+            self._avg_completion = 0.8 * self._avg_completion + 0.2 * elapsed
+        self.interval = min(self.max_interval, max(self.min_interval, self._avg_completion / 4))
+
+    def _resolve(self, search_id: str, result: Optional[Dict[str, Any]] = None, error: Optional[BaseException] = None) -> None:
+        entry = self._pending.pop(search_id, None)
+        if entry is None or entry["future"].done():
+            return
+        if error is not None:
+            entry["future"].set_exception(error)
+        else:
+            entry["future"].set_result(result)
+
+    async def _run(self) -> None:
+        try:
+            await self._poll_until_idle()
+        except Exception as exc:
+            # Never leave callers waiting on a dead loop
+            for search_id in list(self._pending):
+                self._resolve(search_id, error=exc)
+
+    async def _poll_until_idle(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self.interval)
+            service = self._service
+            search_ids = list(self._pending)
+            reads = await asyncio.gather(
+                *(service._read_search(search_id) for search_id in search_ids),
+                return_exceptions=True,
+            )
+            now = time.monotonic()
+            for search_id, item in zip(search_ids, reads):
+                entry = self._pending.get(search_id)
+                if entry is None:
+                    continue
+                if isinstance(item, BaseException):
+                    self._resolve(search_id, error=item)
+                    continue
+                if item and item.get("status") in ("FOUND", "DEBITED"):
+                    self._record_completion(now - entry["started_at"])
+                    results = item.get("results") or {}
+                    self._resolve(search_id, IcyPeasService._extract_best_email(results))
+                elif now >= entry["deadline"]:
+                    self._resolve(search_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return poller state for monitoring."""
+        return {
+            "outstanding": len(self._pending),
+            "interval_seconds": round(self.interval, 3),
+            "avg_completion_seconds": round(self._avg_completion, 3) if self._avg_completion else None,
+        }
+
+
+_poller: Optional[IcyPeasPoller] = None
+
+
+def get_icypeas_poller() -> IcyPeasPoller:
+    """Return the process-wide IcyPeas poller."""
+    global _poller
+    if _poller is None:
+        _poller = IcyPeasPoller(
+            min_interval=settings.ICYPEAS_POLL_MIN_INTERVAL,
+            max_interval=settings.ICYPEAS_POLL_MAX_INTERVAL,
+        )
+    return _poller
+
 
 class IcyPeasService:
     """Service for IcyPeas email finder API.
@@ -21,6 +149,7 @@ class IcyPeasService:
     Two-step process:
     1. POST /api/email-search -> returns search id
     2. Poll /api/bulk-single-searchs/read with id until status is DEBITED
+       (all outstanding searches are polled together by IcyPeasPoller)
     """
 
     def __init__(self) -> None:
@@ -43,6 +172,16 @@ class IcyPeasService:
             "Accept": "application/json",
         }
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get or create shared HTTP client for connection reuse."""
+        global _shared_http_client
+        if _shared_http_client is None or _shared_http_client.is_closed:
+            _shared_http_client = httpx.AsyncClient(
+                timeout=15.0,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            )
+        return _shared_http_client
+
     async def _initiate_search(
         self,
         first_name: str,
@@ -57,21 +196,22 @@ class IcyPeasService:
             "domainOrCompany": domain,
         }
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            try:
+        client = self._get_http_client()
+        try:
+            async with get_provider_limiter("icypeas"):
                 resp = await client.post(url, json=payload, headers=self._headers())
                 resp.raise_for_status()
-                data = resp.json()
-            except httpx.HTTPStatusError as exc:
-                raise HTTPException(
-                    status_code=exc.response.status_code,
-                    detail=f"IcyPeas email-search failed: {exc.response.text}",
-                ) from exc
-            except Exception as exc:  # pragma: no cover
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to reach IcyPeas: {str(exc)}",
-                ) from exc
+            data = resp.json()
+        except httpx.HTTPStatusError as exc:
+            raise HTTPException(
+                status_code=exc.response.status_code,
+                detail=f"IcyPeas email-search failed: {exc.response.text}",
+            ) from exc
+        except Exception as exc:  # pragma: no cover
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to reach IcyPeas: {str(exc)}",
+            ) from exc
 
         if not data.get("success"):
             # Check if it's an insufficient credits error - if so, raise to fail fast
@@ -89,70 +229,51 @@ class IcyPeasService:
         search_id = item.get("_id")
         return search_id
 
+    async def _read_search(self, search_id: str) -> Optional[Dict[str, Any]]:
+        """Read a search once; return its item, or None if it is not available yet."""
+        url = f"{self.base_url}/bulk-single-searchs/read"
+        payload = {"id": search_id}
+
+        client = self._get_http_client()
+        try:
+            async with get_provider_limiter("icypeas"):
+                resp = await client.post(url, json=payload, headers=self._headers())
+                resp.raise_for_status()
+            data = resp.json()
+        except httpx.HTTPStatusError as exc:
+            raise HTTPException(
+                status_code=exc.response.status_code,
+                detail=f"IcyPeas bulk-single-searchs/read failed: {exc.response.text}",
+            ) from exc
+        except Exception as exc:  # pragma: no cover
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to reach IcyPeas: {str(exc)}",
+            ) from exc
+
+        if not data.get("success"):
+            return None
+        items = data.get("items") or []
+        return items[0] if items else None
+
     async def _poll_result(
         self,
         search_id: str,
         max_attempts: int = 5,
         poll_interval: float = 0.3,  # Start with shorter interval
     ) -> Optional[Dict[str, Any]]:
-        """Poll IcyPeas for search results using exponential backoff.
+        """Wait for a search result through the shared poller.
         
-        Returns as soon as status is FOUND or DEBITED (optimized for speed).
-        Uses exponential backoff: 0.3s, 0.5s, 0.8s, 1.0s, 1.5s
+        Returns as soon as status is FOUND or DEBITED. The wait is bounded by the
+        time the previous backoff schedule allowed for max_attempts polls
+        (0.3s, 0.5s, 0.8s, 1.0s, 1.5s...).
         """
-        url = f"{self.base_url}/bulk-single-searchs/read"
-        payload = {"id": search_id}
-
-        # Exponential backoff intervals (in seconds)
-        backoff_intervals = [0.3, 0.5, 0.8, 1.0, 1.5]
-
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            for attempt in range(max_attempts):
-                try:
-                    resp = await client.post(url, json=payload, headers=self._headers())
-                    resp.raise_for_status()
-                    data = resp.json()
-                except httpx.HTTPStatusError as exc:
-                    raise HTTPException(
-                        status_code=exc.response.status_code,
-                        detail=f"IcyPeas bulk-single-searchs/read failed: {exc.response.text}",
-                    ) from exc
-                except Exception as exc:  # pragma: no cover
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail=f"Failed to reach IcyPeas: {str(exc)}",
-                    ) from exc
-
-                if not data.get("success"):
-                    # If not successful, wait and retry
-                    if attempt < max_attempts - 1:
-                        interval = backoff_intervals[min(attempt, len(backoff_intervals) - 1)]
-                        await asyncio.sleep(interval)
-                    continue
-
-                items = data.get("items") or []
-                if not items:
-                    if attempt < max_attempts - 1:
-                        interval = backoff_intervals[min(attempt, len(backoff_intervals) - 1)]
-                        await asyncio.sleep(interval)
-                    continue
-
-                item = items[0]
-                status_value = item.get("status")
-                results = item.get("results") or {}
-
-                # Return immediately if status is FOUND or DEBITED (both indicate results are ready)
-                if status_value in ("FOUND", "DEBITED"):
-                    # Extract best email from results
-                    return self._extract_best_email(results)
-
-                # Status is NONE or other, wait and retry
-                if attempt < max_attempts - 1:
-                    interval = backoff_intervals[min(attempt, len(backoff_intervals) - 1)]
-                    await asyncio.sleep(interval)
-
-            # Max attempts reached
-            return None
+        backoff_intervals = [poll_interval, 0.5, 0.8, 1.0, 1.5]
+        deadline_seconds = sum(
+            backoff_intervals[min(attempt, len(backoff_intervals) - 1)]
+            for attempt in range(max_attempts)
+        )
+        return await get_icypeas_poller().wait_for(self, search_id, deadline_seconds)
 
     @staticmethod
     def _extract_best_email(results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
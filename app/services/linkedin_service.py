@@ -33,12 +33,14 @@ from app.schemas.metadata import ContactMetadataOut
 from app.services.credit_service import CreditService
 from app.services.vql_transformer import VQLTransformer
 from app.utils.normalization import PLACEHOLDER_VALUE, normalize_text
+from app.utils.sales_navigator_utils import canonical_linkedin_key
 
 settings = get_settings()
 
 # Performance optimization constants
 MAX_LINKEDIN_SEARCH_RESULTS = 1000  # Maximum results per search to prevent memory issues
 LINKEDIN_UUID_BATCH_SIZE = 1000  # PostgreSQL IN clause limit
+LINKEDIN_URL_BATCH_SIZE = 100  # URLs per Connectra IN query
 
 
 class LinkedInService:
@@ -237,11 +239,14 @@ class LinkedInService:
         """
         Search for contacts and companies by multiple LinkedIn URLs.
         
-        Processes URLs in parallel for better performance. Collects all unique
-        contact and company UUIDs, and tracks which URLs didn't match anything.
+        Resolves the whole list at once: URLs are stripped and deduplicated,
+        then matched with one IN query per entity type (chunked by
+        LINKEDIN_URL_BATCH_SIZE), with the contact and company queries running
+        concurrently. Matches are mapped back to the input URLs through
+        ``canonical_linkedin_key`` to find URLs that matched nothing.
         
         Args:
-            session: Database session
+            session: Database session (kept for API compatibility; lookups go through Connectra)
             linkedin_urls: List of LinkedIn URLs to search for
             
         Returns:
@@ -250,74 +255,47 @@ class LinkedInService:
         if not linkedin_urls:
             return [], [], []
         
-        # Normalize URLs
-        normalized_urls = [url.strip() for url in linkedin_urls if url and url.strip()]
+        # Normalize and dedupe URLs, keeping input order
+        normalized_urls = list(dict.fromkeys(url.strip() for url in linkedin_urls if url and url.strip()))
         if not normalized_urls:
             return [], [], []
         
-        # Search all URLs sequentially to avoid concurrent session operations
-        async def search_single_url(url: str) -> tuple[str, LinkedInSearchResponse]:
-            """Search a single URL and return the URL with results."""
-            try:
-                # Use sequential execution (use_parallel=False) to avoid concurrent session operations
-                # Flush any pending operations to ensure session is ready
-                await session.flush()
-                result = await self.search_by_url(url, use_parallel=False)
-                # Flush after search to ensure session is ready for next operation
-                await session.flush()
-                return url, result
-            except Exception as exc:
-                # Rollback on error to ensure session is clean
-                try:
-                    await session.rollback()
-                except Exception:
-                    # If rollback fails, session might be in invalid state
-                    # Log but continue - the next operation will handle it
-                    pass
-                # Return empty result for failed searches
-                return url, LinkedInSearchResponse(contacts=[], companies=[], total_contacts=0, total_companies=0)
-        
-        # Execute all searches sequentially to avoid concurrent session operations
-        # Ensure session is ready before starting
-        await session.flush()
-        search_results = []
-        for url in normalized_urls:
-            result = await search_single_url(url)
-            search_results.append(result)
-        
-        # Collect unique UUIDs and track unmatched URLs
-        contact_uuids_set: set[str] = set()
-        company_uuids_set: set[str] = set()
-        unmatched_urls: list[str] = []
+        try:
+            async with ConnectraClient() as client:
+                contact_items, company_items = await asyncio.gather(
+                    client.batch_search_by_linkedin_urls(
+                        normalized_urls,
+                        entity_type="contact",
+                        batch_size=LINKEDIN_URL_BATCH_SIZE,
+                        limit=MAX_LINKEDIN_SEARCH_RESULTS,
+                    ),
+                    client.batch_search_by_linkedin_urls(
+                        normalized_urls,
+                        entity_type="company",
+                        batch_size=LINKEDIN_URL_BATCH_SIZE,
+                        limit=MAX_LINKEDIN_SEARCH_RESULTS,
+                    ),
+                )
+        except Exception as exc:
+            logger.error(f"Connectra multi-URL LinkedIn search failed: {exc}")
+            return [], [], normalized_urls
         
-        for url, result in search_results:
-            found_contact = False
-            found_company = False
-            
-            # Collect contact UUIDs
-            for contact_rel in result.contacts:
-                if contact_rel.contact and contact_rel.contact.uuid:
-                    contact_uuids_set.add(contact_rel.contact.uuid)
-                    found_contact = True
-            
-            # Collect company UUIDs
-            for company_rel in result.companies:
-                if company_rel.company and company_rel.company.uuid:
-                    company_uuids_set.add(company_rel.company.uuid)
-                    found_company = True
-                
-                # Also collect contact UUIDs from company relations
-                for contact_rel in company_rel.contacts:
-                    if contact_rel.contact and contact_rel.contact.uuid:
-                        contact_uuids_set.add(contact_rel.contact.uuid)
-                        found_contact = True
-            
-            # Track unmatched URLs
-            if not found_contact and not found_company:
-                unmatched_urls.append(url)
+        # Collect unique UUIDs (in response order) and the canonical keys they matched
+        contact_uuids: dict[str, None] = {}
+        company_uuids: dict[str, None] = {}
+        matched_keys: set[str] = set()
+        for items, uuids in ((contact_items, contact_uuids), (company_items, company_uuids)):
+            for item in items:
+                if not item.get("uuid"):
+                    continue
+                uuids[item["uuid"]] = None
+                linkedin_key = canonical_linkedin_key(item.get("linkedin_url"))
+                if linkedin_key:
+                    matched_keys.add(linkedin_key)
         
-        contact_uuids = list(contact_uuids_set)
-        company_uuids = list(company_uuids_set)
+        unmatched_urls = [
+            url for url in normalized_urls
+            if (canonical_linkedin_key(url) or url) not in matched_keys
+        ]
         
-        return contact_uuids, company_uuids, unmatched_urls
-
+        return list(contact_uuids), list(company_uuids), unmatched_urls
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import time
-from collections import OrderedDict
+import asyncio
 from typing import Any, Dict, Iterable, Optional
 
 import httpx
@@ -11,16 +10,14 @@ from fastapi import HTTPException, status
 
 from app.core.config import get_settings
 from app.schemas.email import EmailVerificationStatus
+from app.services.email_verification_store import EmailVerificationStore
+from app.utils.adaptive_limiter import get_provider_limiter
+from app.utils.email_precheck import precheck_emails
 from app.utils.logger import get_logger
 
 settings = get_settings()
 logger = get_logger(__name__)
 
-# In-memory cache for Truelist responses (LRU cache)
-_truelist_cache: OrderedDict[str, tuple[Dict[str, Dict[str, Any]], float]] = OrderedDict()
-_cache_max_size = 10000  # Cache up to 10k email verifications
-_cache_ttl_seconds = 3600  # 1 hour TTL
-
 # Shared httpx client for connection pooling (reused across requests)
 _shared_http_client: Optional[httpx.AsyncClient] = None
 
@@ -45,6 +42,7 @@ class TruelistService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Truelist base URL not configured. Please set TRUELIST_BASE_URL.",
             )
+        self.verification_store = EmailVerificationStore()
 
     def _headers(self) -> Dict[str, str]:
         return {
@@ -102,36 +100,37 @@ class TruelistService:
     async def verify_emails(self, emails: Iterable[str]) -> Dict[str, Dict[str, Any]]:
         """
         Verify up to 51 emails per call; chunk requests accordingly.
-        Uses in-memory cache to avoid re-verifying same emails.
+        Uses the shared verification store to avoid re-verifying same emails.
+        Chunks are dispatched concurrently (TRUELIST_MAX_CONCURRENT_CHUNKS at a time)
+        and all results are read from and written to the store in bulk.
         """
         email_list = [e.strip() for e in emails if e and e.strip()]
         if not email_list:
             return {}
 
-        # Check cache first
-        global _truelist_cache
+        # Check the shared store first (results from any provider are reused)
         aggregated: Dict[str, Dict[str, Any]] = {}
-        emails_to_verify = []
-        cache_hits = 0
-        current_time = time.time()
-        
-        for email in email_list:
-            email_key = email.lower().strip()
-            if email_key in _truelist_cache:
-                cached_result, timestamp = _truelist_cache[email_key]
-                if current_time - timestamp < _cache_ttl_seconds:
-                    # Cache hit - use cached result
-                    aggregated[email_key] = cached_result
-                    cache_hits += 1
-                    # Move to end (LRU)
-                    _truelist_cache.move_to_end(email_key)
-                    continue
-                else:
-                    # Expired - remove from cache
-                    del _truelist_cache[email_key]
-            
-            # Cache miss - need to verify
-            emails_to_verify.append(email)
+        stored = await self.verification_store.lookup_many(email_list)
+        for email_key, entry in stored.items():
+            aggregated[email_key] = {
+                "address": email_key,
+                "mapped_status": entry["status"],
+                "provider": entry["provider"],
+                "cached": True,
+            }
+        emails_to_verify = [
+            email for email in dict.fromkeys(email_list) if email.lower().strip() not in aggregated
+        ]
+
+        # Undeliverable addresses are answered locally without spending a credit
+        rejected = await precheck_emails(emails_to_verify)
+        for email_key, reason in rejected.items():
+            aggregated[email_key] = {
+                "address": email_key,
+                "mapped_status": EmailVerificationStatus.INVALID.value,
+                "precheck": reason,
+            }
+        emails_to_verify = [email for email in emails_to_verify if email.lower().strip() not in rejected]
         
         # If all cached, return early
         if not emails_to_verify:
@@ -139,30 +138,45 @@ class TruelistService:
 
         url = f"{self.base_url}/api/v1/verify_inline"
         headers = self._headers()
-
         client = self._get_http_client()
-        for i in range(0, len(emails_to_verify), 51):
-            chunk = emails_to_verify[i : i + 51]
-            params = {"email": " ".join(chunk)}
-            
-            try:
-                resp = await client.post(url, params=params, headers=headers)
-                resp.raise_for_status()
-                data = resp.json()
-            except httpx.HTTPStatusError as exc:
-                raise HTTPException(
-                    status_code=exc.response.status_code,
-                    detail=f"Truelist verification failed: {exc.response.text}",
-                ) from exc
-            except Exception as exc:  # pragma: no cover
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to reach Truelist: {str(exc)}",
-                ) from exc
+        # Chunks are sent concurrently; the shared provider limiter still adapts
+        # the overall rate to what Truelist accepts
+        semaphore = asyncio.Semaphore(max(1, settings.TRUELIST_MAX_CONCURRENT_CHUNKS))
 
+        async def _verify_chunk(chunk: list[str]) -> list[Dict[str, Any]]:
+            params = {"email": " ".join(chunk)}
+            async with semaphore:
+                try:
+                    async with get_provider_limiter("truelist"):
+                        resp = await client.post(url, params=params, headers=headers)
+                        resp.raise_for_status()
+                    data = resp.json()
+                except httpx.HTTPStatusError as exc:
+                    raise HTTPException(
+                        status_code=exc.response.status_code,
+                        detail=f"Truelist verification failed: {exc.response.text}",
+                    ) from exc
+                except Exception as exc:  # pragma: no cover
+                    raise HTTPException(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        detail=f"Failed to reach Truelist: {str(exc)}",
+                    ) from exc
             # Extract emails array from response
-            truelist_emails_returned = data.get("emails", [])
-            for item in truelist_emails_returned:
+            return data.get("emails", [])
+
+        chunks = [emails_to_verify[i : i + 51] for i in range(0, len(emails_to_verify), 51)]
+        chunk_results = await asyncio.gather(
+            *(_verify_chunk(chunk) for chunk in chunks),
+            return_exceptions=True,
+        )
+
+        verified: Dict[str, str] = {}
+        first_error: Optional[BaseException] = None
+        for chunk_result in chunk_results:
+            if isinstance(chunk_result, BaseException):
+                first_error = first_error or chunk_result
+                continue
+            for item in chunk_result:
                 address = (item.get("address") or "").lower().strip()
                 email_state = item.get("email_state")
                 email_sub_state = item.get("email_sub_state")
@@ -170,12 +184,12 @@ class TruelistService:
                 
                 item["mapped_status"] = mapped_status
                 aggregated[address] = item
-                
-                # Store in cache with LRU eviction
-                while len(_truelist_cache) >= _cache_max_size:
-                    _truelist_cache.popitem(last=False)  # Remove oldest
-                _truelist_cache[address] = (item, time.time())
+                verified[address] = mapped_status
 
+        # Keep results of successful chunks even if another chunk failed
+        await self.verification_store.store_many(verified, provider="truelist")
+        if first_error is not None:
+            raise first_error
         return aggregated
 
     async def list_batches(self) -> Dict[str, Any]:
@@ -1,10 +1,10 @@
 """Feature usage tracking service for managing user feature usage limits."""
 
 from datetime import datetime, timezone
-from typing import Dict
+from typing import Dict, Tuple
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_, select
+from sqlalchemy import and_, case, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.constants import ADMIN, FREE_USER, PRO_USER, SUPER_ADMIN
@@ -188,31 +188,77 @@ class UsageService:
         
         user_role = profile.role or FREE_USER
         
-        # Get or create usage record
-        usage = await self._get_or_create_usage(session, user_id, feature, user_role)
-        
-        # Update limit if it changed (e.g., user upgraded)
-        limit = self._get_feature_limit(feature, user_role)
-        if limit is not None:
-            usage.limit = limit
-        
-        # Increment usage (only if not unlimited)
-        if usage.limit is None or usage.limit == 0:
-            # Unlimited or no access
-            usage.used = 0
-        else:
-            usage.used = min(usage.used + amount, usage.limit)
+        try:
+            feature_enum = FeatureType(feature)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid feature: {feature}"
+            )
         
-        usage.updated_at = datetime.now(timezone.utc)
-        await session.flush()
+        row = await self._increment_usage(session, user_id, feature_enum, user_role, amount)
+        if row is None:
+            # No record for the current period yet: create or reset it, then increment
+            await self._get_or_create_usage(session, user_id, feature, user_role)
+            row = await self._increment_usage(session, user_id, feature_enum, user_role, amount)
+        used, limit = row
         
         return {
             "feature": feature,
-            "used": usage.used,
-            "limit": usage.limit if usage.limit is not None else 999999,  # Large number for unlimited
+            "used": used,
+            "limit": limit if limit is not None else 999999,  # Large number for unlimited
             "success": True
         }
 
+    async def _increment_usage(
+        self,
+        session: AsyncSession,
+        user_id: str,
+        feature_enum: FeatureType,
+        user_role: str,
+        amount: int,
+    ) -> Tuple[int, int] | None:
+        """
+        Increment usage for the current period in a single conditional UPDATE.
+        
+        The limit is refreshed from the user's role (e.g. after an upgrade) and
+        ``used`` is capped at it in SQL, so concurrent requests cannot lose
+        increments or overshoot the limit. As before, ``used`` stays 0 when
+        the limit is NULL or 0 (no access, and unlimited features, which are
+        stored with limit 0).
+        
+        Returns:
+            (used, limit) after the update, or None if there is no usage record
+            whose period is still open
+        """
+        now = datetime.now(timezone.utc)
+        role_limit = self._get_feature_limit(feature_enum.value, user_role)
+        limit = FeatureUsage.limit if role_limit is None else literal(role_limit)
+        incremented = FeatureUsage.used + amount
+        stmt = (
+            update(FeatureUsage)
+            .where(
+                FeatureUsage.user_id == user_id,
+                FeatureUsage.feature == feature_enum.value,
+                FeatureUsage.period_end > now,
+            )
+            .values(
+                used=case(
+                    (limit.is_(None), 0),  # Unlimited: usage is not counted
+                    (limit == 0, 0),  # No access
+                    (incremented > limit, limit),
+                    else_=incremented,
+                ),
+                limit=limit,
+                updated_at=now,
+            )
+            .returning(FeatureUsage.used, FeatureUsage.limit)
+        )
+        result = await session.execute(stmt)
+        row = result.first()
+        await session.flush()
+        return (row[0], row[1]) if row is not None else None
+
     async def get_current_usage(
         self,
         session: AsyncSession,
@@ -29,6 +29,7 @@ from app.schemas.user import (
     UserLogin,
     UserRegister,
 )
+from app.services.activity_sink import get_activity_sink
 from app.services.s3_service import S3Service
 from app.utils.logger import get_logger, log_error, log_api_error
 from app.utils.query_cache import get_query_cache
@@ -524,35 +525,52 @@ class UserService:
         if login_data.geolocation:
             try:
                 geolocation = login_data.geolocation
-                # Create a savepoint to isolate history creation
-                # If it fails, we rollback only the savepoint, not the entire transaction
-                async with session.begin_nested():
-                    await self.history_repo.create_history(
-                        session,
-                        user_id=user_uuid,
-                        event_type=UserHistoryEventType.LOGIN,
-                        ip=geolocation.ip,
-                        continent=geolocation.continent,
-                        continent_code=geolocation.continent_code,
-                        country=geolocation.country,
-                        country_code=geolocation.country_code,
-                        region=geolocation.region,
-                        region_name=geolocation.region_name,
-                        city=geolocation.city,
-                        district=geolocation.district,
-                        zip=geolocation.zip,
-                        lat=geolocation.lat,
-                        lon=geolocation.lon,
-                        timezone=geolocation.timezone,
-                        currency=geolocation.currency,
-                        isp=geolocation.isp,
-                        org=geolocation.org,
-                        asname=geolocation.asname,
-                        reverse=geolocation.reverse,
-                        device=geolocation.device,
-                        proxy=geolocation.proxy,
-                        hosting=geolocation.hosting,
+                geo_fields = {
+                    "ip": geolocation.ip,
+                    "continent": geolocation.continent,
+                    "continent_code": geolocation.continent_code,
+                    "country": geolocation.country,
+                    "country_code": geolocation.country_code,
+                    "region": geolocation.region,
+                    "region_name": geolocation.region_name,
+                    "city": geolocation.city,
+                    "district": geolocation.district,
+                    "zip": geolocation.zip,
+                    "lat": geolocation.lat,
+                    "lon": geolocation.lon,
+                    "timezone": geolocation.timezone,
+                    "currency": geolocation.currency,
+                    "isp": geolocation.isp,
+                    "org": geolocation.org,
+                    "asname": geolocation.asname,
+                    "reverse": geolocation.reverse,
+                    "device": geolocation.device,
+                    # Same defaulting as UserHistoryRepository.create_history so
+                    # both write paths store identical rows
+                    "proxy": geolocation.proxy if geolocation.proxy is not None else False,
+                    "hosting": geolocation.hosting if geolocation.hosting is not None else False,
+                }
+                if settings.ENABLE_ACTIVITY_SINK:
+                    # Written in a batch after the request instead of inside the login transaction
+                    get_activity_sink().submit(
+                        UserHistory,
+                        {
+                            "user_id": user_uuid,
+                            "event_type": UserHistoryEventType.LOGIN,
+                            **geo_fields,
+                            "created_at": datetime.now(timezone.utc),
+                        },
                     )
+                else:
+                    # Create a savepoint to isolate history creation
+                    # If it fails, we rollback only the savepoint, not the entire transaction
+                    async with session.begin_nested():
+                        await self.history_repo.create_history(
+                            session,
+                            user_id=user_uuid,
+                            event_type=UserHistoryEventType.LOGIN,
+                            **geo_fields,
+                        )
                 logger.debug(
                     "User history created for login",
                     extra={
@@ -0,0 +1,130 @@
+"""Compaction job for the hourly ``user_activity_rollups`` table.
+
+Activity stats read per-hour counts from ``user_activity_rollups`` and only
+scan raw ``user_activities`` after the rollup watermark. This job moves the
+watermark forward: each hour between the current watermark and
+``now - ACTIVITY_ROLLUP_SETTLE_HOURS`` is recounted from the raw table with a
+single ``INSERT ... SELECT ... GROUP BY``. The settle delay keeps recent
+activities raw while their status can still change (exports are updated when
+they finish). Run it periodically, e.g. hourly from cron:
+
+    python scripts/compact_activity_rollups.py
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import delete, func, insert, select
+
+from app.core.config import get_settings
+from app.db.session import BackgroundSessionLocal
+from app.models.activity_rollups import UserActivityRollup
+from app.models.user import UserActivity
+from app.repositories.user import UserActivityRepository, floor_to_hour
+from app.utils.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+def _bucket_expression(dialect_name: str):
+    """SQL expression truncating ``created_at`` to the start of its UTC hour."""
+    if dialect_name == "postgresql":
+        # date_trunc on a timestamptz truncates in the session TimeZone; convert to
+        # UTC first (created_at AT TIME ZONE 'UTC') and back so buckets match
+        # floor_to_hour regardless of the connection's time zone
+        return func.timezone(
+            "UTC", func.date_trunc("hour", func.timezone("UTC", UserActivity.created_at))
+        )
+    # SQLite: match the format SQLAlchemy stores datetimes in so comparisons hold
+    return func.strftime("%Y-%m-%d %H:00:00.000000", UserActivity.created_at)
+
+
+async def compact_activity_rollups(
+    session_factory=None,
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """
+    Roll settled raw activities up into hourly buckets.
+
+    Hours are rebuilt (delete then insert) in chunks of ACTIVITY_ROLLUP_CHUNK_HOURS,
+    each in its own transaction, so the job is idempotent and can be stopped and
+    re-run safely.
+
+    Args:
+        session_factory: Session factory to use (defaults to BackgroundSessionLocal)
+        now: Current time (defaults to the wall clock; used by tests)
+
+    Returns:
+        {"from", "to", "chunks", "buckets"}: the compacted hour range and the
+        number of chunks and rollup rows written
+    """
+    session_factory = session_factory or BackgroundSessionLocal
+    now = now or datetime.now(timezone.utc)
+    target = floor_to_hour(now - timedelta(hours=settings.ACTIVITY_ROLLUP_SETTLE_HOURS))
+    stats: Dict[str, Any] = {"from": None, "to": target, "chunks": 0, "buckets": 0}
+    start_time = time.time()
+
+    async with session_factory() as session:
+        lower = await UserActivityRepository().get_rollup_watermark(session)
+        if lower is None:
+            oldest = (await session.execute(select(func.min(UserActivity.created_at)))).scalar_one_or_none()
+            if oldest is None:
+                return stats
+            lower = floor_to_hour(oldest)
+    stats["from"] = lower
+
+    chunk = timedelta(hours=max(1, settings.ACTIVITY_ROLLUP_CHUNK_HOURS))
+    while lower < target:
+        upper = min(lower + chunk, target)
+        async with session_factory() as session:
+            bucket = _bucket_expression(session.bind.dialect.name).label("bucket_start")
+            aggregated = (
+                select(
+                    UserActivity.user_id,
+                    bucket,
+                    UserActivity.service_type,
+                    UserActivity.action_type,
+                    UserActivity.status,
+                    func.count(UserActivity.id),
+                )
+                .where(UserActivity.created_at >= lower, UserActivity.created_at < upper)
+                .group_by(
+                    UserActivity.user_id,
+                    bucket,
+                    UserActivity.service_type,
+                    UserActivity.action_type,
+                    UserActivity.status,
+                )
+            )
+            await session.execute(
+                delete(UserActivityRollup).where(
+                    UserActivityRollup.bucket_start >= lower,
+                    UserActivityRollup.bucket_start < upper,
+                )
+            )
+            result = await session.execute(
+                insert(UserActivityRollup).from_select(
+                    ["user_id", "bucket_start", "service_type", "action_type", "status", "activity_count"],
+                    aggregated,
+                )
+            )
+            await session.commit()
+        stats["chunks"] += 1
+        stats["buckets"] += max(result.rowcount or 0, 0)
+        lower = upper
+
+    logger.info(
+        "Activity rollup compaction finished",
+        extra={
+            "context": {
+                "from": stats["from"].isoformat(),
+                "to": target.isoformat(),
+                "chunks": stats["chunks"],
+                "buckets": stats["buckets"],
+                "duration_seconds": round(time.time() - start_time, 2),
+            }
+        }
+    )
+    return stats
@@ -0,0 +1,83 @@
+"""Backfill job for ``companies_metadata.normalized_domain``.
+
+Domain lookups match ``normalized_domain`` by equality on an indexed column, so
+rows written before the column was maintained must be backfilled from their
+website using the same ``extract_domain_from_url`` logic as the write paths.
+"""
+
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import select, update
+
+from app.db.session import BackgroundSessionLocal
+from app.models.companies import CompanyMetadata
+from app.utils.domain import extract_domain_from_url
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+async def backfill_company_normalized_domains(
+    batch_size: int = 1000,
+    session_factory=None,
+    max_batches: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Populate ``normalized_domain`` for rows whose value is missing or stale.
+
+    Walks ``companies_metadata`` in primary-key order (keyset pagination), so
+    every batch is an index range scan and each batch commits on its own; the
+    job can be stopped and re-run safely.
+
+    Args:
+        batch_size: Rows read and committed per batch
+        session_factory: Session factory to use (defaults to BackgroundSessionLocal)
+        max_batches: Optional cap on batches processed in this run
+
+    Returns:
+        {"scanned": rows read, "updated": rows changed, "batches": batches processed}
+    """
+    session_factory = session_factory or BackgroundSessionLocal
+    stats = {"scanned": 0, "updated": 0, "batches": 0}
+    last_id = 0
+    start_time = time.time()
+
+    while max_batches is None or stats["batches"] < max_batches:
+        async with session_factory() as session:
+            result = await session.execute(
+                select(CompanyMetadata.id, CompanyMetadata.website, CompanyMetadata.normalized_domain)
+                .where(CompanyMetadata.id > last_id)
+                .order_by(CompanyMetadata.id)
+                .limit(batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                break
+
+            for row_id, website, current_domain in rows:
+                domain = extract_domain_from_url(website)
+                if domain and domain != current_domain:
+                    await session.execute(
+                        update(CompanyMetadata)
+                        .where(CompanyMetadata.id == row_id)
+                        .values(normalized_domain=domain)
+                    )
+                    stats["updated"] += 1
+            await session.commit()
+
+        last_id = rows[-1][0]
+        stats["scanned"] += len(rows)
+        stats["batches"] += 1
+
+    logger.info(
+        "Company normalized_domain backfill finished",
+        extra={
+            "context": {
+                **stats,
+                "last_id": last_id,
+                "duration_seconds": round(time.time() - start_time, 2),
+            }
+        }
+    )
+    return stats
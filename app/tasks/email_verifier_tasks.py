@@ -9,13 +9,17 @@ import time
 from typing import Dict, List, Optional
 
 from app.core.config import get_settings
+from app.db.session import BackgroundSessionLocal
+from app.schemas.email import EmailVerificationStatus
 from app.services.bulkmailverifier_service import BulkMailVerifierService
+from app.services.email_verification_store import EmailVerificationStore
 from app.utils.domain import extract_domain_from_url
 from app.utils.email_generator import generate_email_combinations
 from app.utils.logger import get_logger
 
 settings = get_settings()
 logger = get_logger(__name__)
+verification_store = EmailVerificationStore(session_factory=BackgroundSessionLocal)
 
 
 async def _verify_email_batch(
@@ -46,6 +50,18 @@ async def _verify_email_batch(
         # Generate random emails
         emails = generate_email_combinations(first_name, last_name, domain, count=email_count)
         
+        # Serve known results from the shared store and only upload the rest
+        stored = await verification_store.lookup_many(emails)
+        stored_valid = [
+            email for email, entry in stored.items()
+            if entry["status"] == EmailVerificationStatus.VALID.value
+        ]
+        if stored_valid:
+            return stored_valid, batches_processed
+        emails = [email for email in emails if email.lower().strip() not in stored]
+        if not emails:
+            return valid_emails, batches_processed
+        
         # Upload file
         upload_result = await service.upload_file(emails)
         slug = upload_result["slug"]
@@ -82,6 +98,10 @@ async def _verify_email_batch(
             valid_email_file_url = results.get("valid_email_file")
             if valid_email_file_url:
                 valid_emails = await service.download_valid_emails(valid_email_file_url)
+                await verification_store.store_many(
+                    {email: EmailVerificationStatus.VALID.value for email in valid_emails},
+                    provider="bulkmailverifier",
+                )
             else:
                 pass  # No valid_email_file URL in results
             
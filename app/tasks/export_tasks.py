@@ -16,20 +16,26 @@ from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
-from app.db.session import AsyncSessionLocal
+from app.db.session import BackgroundSessionLocal
 from app.models.companies import Company, CompanyMetadata
 from app.models.contacts import Contact, ContactMetadata
 from app.models.exports import ExportStatus, UserExport
 from app.models.user import ActivityStatus
 from app.repositories.user import UserProfileRepository
+from app.schemas.email import EmailVerificationStatus
 from app.services.activity_service import ActivityService
 from app.services.bulkmailverifier_service import BulkMailVerifierService
 from app.services.credit_service import CreditService
 from app.services.email_finder_service import EmailFinderService
+from app.services.email_pattern_service import EmailPatternService
 from app.services.export_service import ExportService
+from app.utils.catchall_handler import handle_catchall_email
 from app.utils.domain import extract_domain_from_url
+from app.utils.domain_verdicts import is_catchall_domain
 from app.utils.email_generator import generate_email_combinations
+from app.utils.email_precheck import precheck_emails
 from app.utils.logger import get_logger, log_error
+from app.utils.normalization import normalize_person_key
 
 settings = get_settings()
 export_service = ExportService()
@@ -147,6 +153,12 @@ async def _update_export_status(
         export.status = status
         if error_message:
             export.error_message = error_message
+        # Timestamps feed the export cost model calibration
+        now = datetime.now(UTC)
+        if status == ExportStatus.processing and export.started_at is None:
+            export.started_at = now
+        elif status in (ExportStatus.completed, ExportStatus.failed):
+            export.completed_at = now
         
         await session.commit()
         
@@ -199,7 +211,32 @@ async def _update_export_status(
             )
 
 
-async def process_contact_export(export_id: str, contact_uuids: list[str]) -> None:
+async def _finalize_delta_export(
+    session: AsyncSession,
+    export_id: str,
+    tombstone_uuids: Optional[list[str]],
+) -> None:
+    """Write the tombstone file and advance the segment watermark of a delta export."""
+    stmt = select(UserExport).where(UserExport.export_id == export_id)
+    result = await session.execute(stmt)
+    export = result.scalar_one_or_none()
+    if not export or not export.is_delta:
+        return
+    
+    if tombstone_uuids is not None:
+        export.tombstone_file_path = await export_service.generate_tombstone_csv(
+            export_id, tombstone_uuids
+        )
+        await session.commit()
+    
+    await export_service.advance_watermark(session, export_id)
+
+
+async def process_contact_export(
+    export_id: str,
+    contact_uuids: list[str],
+    tombstone_uuids: Optional[list[str]] = None,
+) -> None:
     """
     Process a contact export in the background.
     
@@ -209,6 +246,8 @@ async def process_contact_export(export_id: str, contact_uuids: list[str]) -> No
     Args:
         export_id: The UUID of the export record
         contact_uuids: List of contact UUIDs to export
+        tombstone_uuids: For delta exports with tombstones enabled, the requested
+            UUIDs that no longer exist (written to a separate tombstone CSV)
     """
     start_time = time.time()
     logger.info(
@@ -221,7 +260,7 @@ async def process_contact_export(export_id: str, contact_uuids: list[str]) -> No
         }
     )
     
-    async with AsyncSessionLocal() as session:
+    async with BackgroundSessionLocal() as session:
         try:
             # Check if export was cancelled before starting
             stmt = select(UserExport).where(UserExport.export_id == export_id)
@@ -281,6 +320,8 @@ async def process_contact_export(export_id: str, contact_uuids: list[str]) -> No
                 contact_count=len(contact_uuids),
             )
             
+            await _finalize_delta_export(session, export_id, tombstone_uuids)
+            
             duration = time.time() - start_time
             logger.info(
                 "Contact export completed successfully",
@@ -316,7 +357,11 @@ async def process_contact_export(export_id: str, contact_uuids: list[str]) -> No
                 )
 
 
-async def process_company_export(export_id: str, company_uuids: list[str]) -> None:
+async def process_company_export(
+    export_id: str,
+    company_uuids: list[str],
+    tombstone_uuids: Optional[list[str]] = None,
+) -> None:
     """
     Process a company export in the background.
     
@@ -326,6 +371,8 @@ async def process_company_export(export_id: str, company_uuids: list[str]) -> No
     Args:
         export_id: The UUID of the export record
         company_uuids: List of company UUIDs to export
+        tombstone_uuids: For delta exports with tombstones enabled, the requested
+            UUIDs that no longer exist (written to a separate tombstone CSV)
     """
     start_time = time.time()
     logger.info(
@@ -338,7 +385,7 @@ async def process_company_export(export_id: str, company_uuids: list[str]) -> No
         }
     )
     
-    async with AsyncSessionLocal() as session:
+    async with BackgroundSessionLocal() as session:
         try:
             # Check if export was cancelled before starting
             stmt = select(UserExport).where(UserExport.export_id == export_id)
@@ -397,6 +444,8 @@ async def process_company_export(export_id: str, company_uuids: list[str]) -> No
                 company_count=len(company_uuids),
             )
             
+            await _finalize_delta_export(session, export_id, tombstone_uuids)
+            
             duration = time.time() - start_time
             logger.info(
                 "Company export completed successfully",
@@ -436,6 +485,7 @@ async def _verify_email_sequential(
     emails: list[str],
     service,
     verified_emails_set: Optional[set[str]] = None,
+    valid_emails_set: Optional[set[str]] = None,
 ) -> tuple[Optional[str], int]:
     """
     Verify emails sequentially until first valid email is found.
@@ -447,15 +497,30 @@ async def _verify_email_sequential(
         emails: List of email addresses to verify
         service: BulkMailVerifierService instance
         verified_emails_set: Optional set to track verified emails (will be updated in-place)
+        valid_emails_set: Optional set of emails already verified as valid. Matching
+            candidates are returned without another provider call (updated in-place).
     """
     if verified_emails_set is None:
         verified_emails_set = set()
+    if valid_emails_set is None:
+        valid_emails_set = set()
+    
+    # Undeliverable candidates are never sent to the provider
+    rejected = await precheck_emails(
+        email for email in emails if email not in valid_emails_set and email not in verified_emails_set
+    )
     
     emails_checked = 0
     for email in emails:
+        # Reuse a previous valid verdict for the same mailbox
+        if email in valid_emails_set:
+            return email, emails_checked
         # Skip if already verified
         if email in verified_emails_set:
             continue
+        if email.lower().strip() in rejected:
+            verified_emails_set.add(email)
+            continue
         
         emails_checked += 1
         try:
@@ -466,7 +531,11 @@ async def _verify_email_sequential(
             verified_emails_set.add(email)
             
             if mapped_status == "valid":
+                valid_emails_set.add(email)
                 return email, emails_checked
+            if mapped_status == "catchall":
+                # Catch-all domain: the other candidates would be CATCHALL as well
+                break
         except Exception as e:
             # Still add to verified set to avoid retrying failed emails
             verified_emails_set.add(email)
@@ -475,6 +544,29 @@ async def _verify_email_sequential(
     return None, emails_checked
 
 
+async def _resolve_catchall_email(
+    first_name: str,
+    last_name: str,
+    domain: str,
+    candidate: str,
+) -> Optional[str]:
+    """
+    Resolve a person on a catch-all domain through the catch-all lookup.
+
+    Returns the email only when the lookup confirms it as valid.
+    """
+    email, email_status, _ = await handle_catchall_email(
+        first_name=first_name,
+        last_name=last_name,
+        domain=domain,
+        catchall_email=candidate,
+        catchall_status=EmailVerificationStatus.CATCHALL,
+    )
+    if email_status == EmailVerificationStatus.VALID:
+        return email
+    return None
+
+
 async def _find_or_create_company_by_domain(
     session: AsyncSession,
     domain: str,
@@ -492,9 +584,10 @@ async def _find_or_create_company_by_domain(
     if not domain or not domain.strip():
         return None
     
-    normalized_domain = domain.lower().strip()
-    if normalized_domain.startswith("www."):
-        normalized_domain = normalized_domain[4:]
+    # Same normalization as the maintained companies_metadata.normalized_domain column
+    normalized_domain = extract_domain_from_url(domain)
+    if not normalized_domain:
+        return None
     
     try:
         # Try to find existing company by normalized_domain in CompanyMetadata
@@ -979,7 +1072,7 @@ async def process_email_export(export_id: str, contacts_data: list[dict], activi
     """
     start_time = time.time()
     
-    async with AsyncSessionLocal() as session:
+    async with BackgroundSessionLocal() as session:
         try:
             # Check if export was cancelled before starting
             stmt = select(UserExport).where(UserExport.export_id == export_id)
@@ -997,6 +1090,7 @@ async def process_email_export(export_id: str, contacts_data: list[dict], activi
             # Use services (already imported at top)
             settings = get_settings()
             email_finder_service = EmailFinderService()
+            pattern_service = EmailPatternService(session_factory=BackgroundSessionLocal)
             bulk_verifier_service = BulkMailVerifierService() if (
                 settings.BULKMAILVERIFIER_EMAIL and settings.BULKMAILVERIFIER_PASSWORD
             ) else None
@@ -1031,6 +1125,14 @@ async def process_email_export(export_id: str, contacts_data: list[dict], activi
             contacts_saved = 0
             contacts_failed = 0
             
+            # Dedup state shared across rows: results per normalized person and
+            # candidate emails already sent to the verifier in this job
+            person_results: dict[tuple[str, str, str], str] = {}
+            job_verified_emails: set[str] = set()
+            job_valid_emails: set[str] = set()
+            duplicate_rows = 0
+            candidate_checks_skipped = 0
+            
             # Update initial progress
             await _update_export_progress(
                 session,
@@ -1103,14 +1205,39 @@ async def process_email_export(export_id: str, contacts_data: list[dict], activi
                 email_found = None
                 finder_start_time = time.time()
                 
+                # Fan out the result already computed for the same person. A row
+                # carrying its own email is only reused when a result was found.
+                person_key = normalize_person_key(first_name, last_name, extracted_domain)
+                cached_email = person_results.get(person_key)
+                if cached_email is not None and (cached_email or not existing_email):
+                    duplicate_rows += 1
+                    email_found = cached_email or None
+                    row_for_csv = dict(raw_row) if raw_row else {}
+                    if "domain" in csv_headers and "domain" not in row_for_csv:
+                        row_for_csv["domain"] = extracted_domain or ""
+                    row_for_csv[email_column_name] = email_found or ""
+                    results.append({
+                        "first_name": first_name,
+                        "last_name": last_name,
+                        "domain": extracted_domain,
+                        "email": email_found or "",
+                    })
+                    csv_rows.append(row_for_csv)
+                    if not email_found:
+                        not_found += 1
+                    continue
+                
                 # Step 0: If an existing email was provided, try to verify and reuse it
                 if existing_email and bulk_verifier_service:
                     try:
+                        if existing_email.lower() in job_verified_emails:
+                            candidate_checks_skipped += 1
                         # Reuse the same sequential verification helper with a single email
                         valid_email, _ = await _verify_email_sequential(
-                            emails=[existing_email],
+                            emails=[existing_email.lower()],
                             service=bulk_verifier_service,
-                            verified_emails_set=set(),
+                            verified_emails_set=job_verified_emails,
+                            valid_emails_set=job_valid_emails,
                         )
                         if valid_email:
                             email_found = valid_email
@@ -1182,11 +1309,14 @@ async def process_email_export(export_id: str, contacts_data: list[dict], activi
                         email_count = 1000
                         
                         # Generate all unique email patterns once
+                        # Try the formats this domain is known to use first
+                        pattern_weights = await pattern_service.get_domain_weights(extracted_domain)
                         all_unique_emails = generate_email_combinations(
                             first_name=first_name,
                             last_name=last_name,
                             domain=extracted_domain,
                             count=email_count,
+                            pattern_weights=pattern_weights,
                         )
                         total_unique_patterns = len(all_unique_emails)
                         
@@ -1194,8 +1324,10 @@ async def process_email_export(export_id: str, contacts_data: list[dict], activi
                             # Calculate number of batches needed
                             total_batches = (total_unique_patterns + email_count - 1) // email_count
                             
-                            # Track verified emails to prevent duplicates
-                            verified_emails_set = set()
+                            # Track verified emails to prevent duplicates. The set is
+                            # shared across the job so candidates common to several
+                            # people are only verified once.
+                            verified_emails_set = job_verified_emails
                             found_valid = False
                             total_emails_verified = 0
                             
@@ -1208,18 +1340,38 @@ async def process_email_export(export_id: str, contacts_data: list[dict], activi
                                 end_idx = min(start_idx + email_count, total_unique_patterns)
                                 batch_emails = all_unique_emails[start_idx:end_idx]
                                 
-                                # Filter out already verified emails
-                                batch_emails_to_check = [e for e in batch_emails if e not in verified_emails_set]
+                                # Filter out already verified emails, keeping known-valid ones
+                                batch_emails_to_check = [
+                                    e for e in batch_emails
+                                    if e not in verified_emails_set or e in job_valid_emails
+                                ]
+                                candidate_checks_skipped += len(batch_emails) - len(batch_emails_to_check)
                                 
                                 if not batch_emails_to_check:
                                     continue
                                 
-                                # Verify emails sequentially until first valid is found
-                                valid_email, emails_verified = await _verify_email_sequential(
-                                    emails=batch_emails_to_check,
-                                    service=bulk_verifier_service,
-                                    verified_emails_set=verified_emails_set,
-                                )
+                                if is_catchall_domain(extracted_domain):
+                                    # Every candidate on a catch-all domain verifies as
+                                    # CATCHALL, so skip the checks and resolve the person
+                                    # through the catch-all lookup instead
+                                    candidate_checks_skipped += len(batch_emails_to_check)
+                                    valid_email = await _resolve_catchall_email(
+                                        first_name, last_name, extracted_domain, batch_emails_to_check[0]
+                                    )
+                                    emails_verified = 0
+                                else:
+                                    # Verify emails sequentially until first valid is found
+                                    valid_email, emails_verified = await _verify_email_sequential(
+                                        emails=batch_emails_to_check,
+                                        service=bulk_verifier_service,
+                                        verified_emails_set=verified_emails_set,
+                                        valid_emails_set=job_valid_emails,
+                                    )
+                                    if not valid_email and is_catchall_domain(extracted_domain):
+                                        # The domain turned out to be catch-all on this person
+                                        valid_email = await _resolve_catchall_email(
+                                            first_name, last_name, extracted_domain, batch_emails_to_check[0]
+                                        )
                                 
                                 # Track verified emails
                                 verified_emails_set.update(batch_emails_to_check[:emails_verified])
@@ -1231,6 +1383,12 @@ async def process_email_export(export_id: str, contacts_data: list[dict], activi
                                     found_valid = True
                                     verifier_elapsed = time.time() - verifier_start_time
                                     verifier_found += 1
+                                    await pattern_service.record_valid_email(
+                                        email=valid_email,
+                                        first_name=first_name,
+                                        last_name=last_name,
+                                        domain=extracted_domain,
+                                    )
                                     
                                     # Save verified email to contact table
                                     try:
@@ -1252,6 +1410,10 @@ async def process_email_export(export_id: str, contacts_data: list[dict], activi
                                     except Exception as save_error:
                                         contacts_failed += 1
                                     break
+                                
+                                if is_catchall_domain(extracted_domain):
+                                    # Remaining batches would only return CATCHALL
+                                    break
                             
                     except Exception:
                         verifier_elapsed = time.time() - verifier_start_time
@@ -1270,6 +1432,8 @@ async def process_email_export(export_id: str, contacts_data: list[dict], activi
                 # Set/override the email column
                 row_for_csv[email_column_name] = email_found or ""
 
+                person_results[person_key] = email_found or ""
+                
                 contact_elapsed = time.time() - contact_start_time
                 results.append({
                     "first_name": first_name,
@@ -1284,6 +1448,20 @@ async def process_email_export(export_id: str, contacts_data: list[dict], activi
             
             processing_elapsed = time.time() - start_time
             
+            if duplicate_rows or candidate_checks_skipped:
+                logger.info(
+                    "Email export deduplication savings",
+                    extra={
+                        "context": {
+                            "export_id": export_id,
+                            "total_rows": total_records,
+                            "unique_people": len(person_results),
+                            "duplicate_rows": duplicate_rows,
+                            "candidate_checks_skipped": candidate_checks_skipped,
+                        }
+                    }
+                )
+            
             # Update progress to 100% after completion
             await _update_export_progress(
                 session,
@@ -1335,6 +1513,9 @@ async def process_email_export(export_id: str, contacts_data: list[dict], activi
                         "finder_found": finder_found,
                         "verifier_found": verifier_found,
                         "not_found": not_found,
+                        "unique_people": len(person_results),
+                        "duplicate_rows": duplicate_rows,
+                        "candidate_checks_skipped": candidate_checks_skipped,
                     }
                     await activity_service.update_export_activity(
                         session=session,
@@ -0,0 +1,82 @@
+"""Backfill job for the canonical ``linkedin_key`` columns.
+
+LinkedIn lookups match ``contacts_metadata.linkedin_key`` and
+``companies_metadata.linkedin_key`` by equality, so rows written before the
+key was maintained must be backfilled with ``canonical_linkedin_key``.
+"""
+
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import select, update
+
+from app.db.session import BackgroundSessionLocal
+from app.models.companies import CompanyMetadata
+from app.models.contacts import ContactMetadata
+from app.utils.logger import get_logger
+from app.utils.sales_navigator_utils import canonical_linkedin_key
+
+logger = get_logger(__name__)
+
+
+async def _backfill_model(model, batch_size: int, session_factory, max_batches: Optional[int]) -> Dict[str, int]:
+    stats = {"scanned": 0, "updated": 0, "batches": 0}
+    last_id = 0
+    while max_batches is None or stats["batches"] < max_batches:
+        async with session_factory() as session:
+            result = await session.execute(
+                select(model.id, model.linkedin_url, model.linkedin_key)
+                .where(model.id > last_id)
+                .order_by(model.id)
+                .limit(batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                break
+
+            for row_id, linkedin_url, current_key in rows:
+                linkedin_key = canonical_linkedin_key(linkedin_url)
+                if linkedin_key != current_key:
+                    await session.execute(
+                        update(model).where(model.id == row_id).values(linkedin_key=linkedin_key)
+                    )
+                    stats["updated"] += 1
+            await session.commit()
+
+        last_id = rows[-1][0]
+        stats["scanned"] += len(rows)
+        stats["batches"] += 1
+    return stats
+
+
+async def backfill_linkedin_keys(
+    batch_size: int = 1000,
+    session_factory=None,
+    max_batches: Optional[int] = None,
+) -> Dict[str, Dict[str, int]]:
+    """
+    Populate ``linkedin_key`` on contact and company metadata.
+
+    Each table is walked in primary-key order (keyset pagination) and every
+    batch commits on its own, so the job can be stopped and re-run safely.
+
+    Args:
+        batch_size: Rows read and committed per batch
+        session_factory: Session factory to use (defaults to BackgroundSessionLocal)
+        max_batches: Optional cap on batches processed per table in this run
+
+    Returns:
+        {"contacts_metadata": stats, "companies_metadata": stats} where stats is
+        {"scanned", "updated", "batches"}
+    """
+    session_factory = session_factory or BackgroundSessionLocal
+    start_time = time.time()
+    results = {
+        "contacts_metadata": await _backfill_model(ContactMetadata, batch_size, session_factory, max_batches),
+        "companies_metadata": await _backfill_model(CompanyMetadata, batch_size, session_factory, max_batches),
+    }
+    logger.info(
+        "LinkedIn key backfill finished",
+        extra={"context": {**results, "duration_seconds": round(time.time() - start_time, 2)}}
+    )
+    return results
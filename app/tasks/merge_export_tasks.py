@@ -6,7 +6,7 @@ import time
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import AsyncSessionLocal
+from app.db.session import BackgroundSessionLocal
 from app.models.exports import ExportStatus, UserExport
 from app.services.export_service import ExportService
 from app.utils.logger import get_logger
@@ -30,7 +30,7 @@ async def check_and_merge_chunks(
         max_attempts: Maximum number of polling attempts (default: 60 = 5 minutes)
         check_interval: Seconds between checks (default: 5)
     """
-    async with AsyncSessionLocal() as session:
+    async with BackgroundSessionLocal() as session:
         try:
             for attempt in range(max_attempts):
                 # Check if main export was cancelled
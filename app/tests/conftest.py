@@ -8,7 +8,7 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.api.deps import get_current_user
+from app.api.deps import get_admin_read_db, get_current_user, get_read_db
 from app.core.config import get_settings
 from app.db.base import Base
 from app.db.session import get_db
@@ -16,6 +16,8 @@ from app.main import app
 from app.models.companies import Company, CompanyMetadata
 from app.models.contacts import Contact, ContactMetadata
 from app.models.user import User, UserProfile
+from app.services.activity_sink import ActivitySink, set_activity_sink
+from app.utils.email_precheck import StubMXResolver, set_mx_resolver
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
@@ -37,6 +39,26 @@ async def prepare_database() -> AsyncGenerator[None, None]:
     yield
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def stub_mx_resolver() -> StubMXResolver:
+    """Keep tests off the network: every domain has a mail host unless a test says otherwise."""
+    resolver = StubMXResolver()
+    set_mx_resolver(resolver)
+    yield resolver
+    set_mx_resolver(None)
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def activity_sink() -> AsyncGenerator[ActivitySink, None]:
+    """Write buffered activity/history records to the test database."""
+    sink = ActivitySink(session_factory=TestingSessionLocal, flush_interval=0.01, max_retries=0)
+    set_activity_sink(sink)
+    yield sink
+    await sink.drain()
+    set_activity_sink(None)
 
 
 @pytest_asyncio.fixture
@@ -63,8 +85,12 @@ async def override_get_db(db_session: AsyncSession) -> AsyncGenerator[None, None
         yield db_session
 
     app.dependency_overrides[get_db] = _get_test_db
+    app.dependency_overrides[get_read_db] = _get_test_db
+    app.dependency_overrides[get_admin_read_db] = _get_test_db
     yield
     app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(get_read_db, None)
+    app.dependency_overrides.pop(get_admin_read_db, None)
 
 
 @pytest_asyncio.fixture(autouse=True)
@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select
+
+from app.models.activity_rollups import UserActivityRollup
+from app.models.user import ActivityActionType, ActivityServiceType, ActivityStatus, UserActivity
+from app.repositories.user import UserActivityRepository
+from app.tasks.activity_rollup_tasks import compact_activity_rollups
+from app.tests.conftest import TestingSessionLocal
+
+USER_ID = "0b5e7a52-3f7c-4c1e-9d1a-4a0f2f6b1c11"
+NOW = datetime(2026, 10, 19, 12, 30, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clean_activities(db_session):
+    for table in (UserActivityRollup, UserActivity):
+        await db_session.execute(delete(table))
+    await db_session.commit()
+    yield
+    for table in (UserActivityRollup, UserActivity):
+        await db_session.execute(delete(table))
+    await db_session.commit()
+
+
+def _activity(hours_ago: float, service=ActivityServiceType.EMAIL, status=ActivityStatus.SUCCESS):
+    return UserActivity(
+        user_id=USER_ID,
+        service_type=service,
+        action_type=ActivityActionType.SEARCH,
+        status=status,
+        created_at=NOW - timedelta(hours=hours_ago),
+    )
+
+
+@pytest.mark.asyncio
+async def test_stats_match_raw_counts_after_compaction(db_session):
+    db_session.add_all(
+        [
+            _activity(72.2),
+            _activity(72.1, service=ActivityServiceType.LINKEDIN),
+            _activity(50, status=ActivityStatus.FAILED),
+            _activity(30.5),
+            _activity(2),  # still settling: stays raw
+        ]
+    )
+    await db_session.commit()
+    repo = UserActivityRepository()
+    ranges = [(None, None), (NOW - timedelta(hours=72.15), None), (None, NOW - timedelta(hours=40))]
+    before = [await repo.get_activity_stats(db_session, USER_ID, start, end) for start, end in ranges]
+
+    stats = await compact_activity_rollups(session_factory=TestingSessionLocal, now=NOW)
+    assert stats["buckets"] == 4
+    assert await repo.get_rollup_watermark(db_session) == datetime(2026, 10, 18, 7, tzinfo=timezone.utc)
+
+    after = [await repo.get_activity_stats(db_session, USER_ID, start, end) for start, end in ranges]
+    assert after == before
+    assert after[0]["total_activities"] == 5
+    assert after[0]["by_service_type"] == {"email": 4, "linkedin": 1}
+    assert after[0]["by_status"] == {"success": 4, "failed": 1}
+    assert after[1]["total_activities"] == 4
+    assert after[2]["total_activities"] == 3
+
+
+@pytest.mark.asyncio
+async def test_compaction_is_idempotent(db_session):
+    db_session.add_all([_activity(48), _activity(47.9), _activity(30)])
+    await db_session.commit()
+
+    await compact_activity_rollups(session_factory=TestingSessionLocal, now=NOW)
+    second = await compact_activity_rollups(session_factory=TestingSessionLocal, now=NOW)
+    assert second["buckets"] == 0
+
+    counts = (await db_session.execute(select(UserActivityRollup.activity_count))).scalars().all()
+    assert sorted(counts) == [1, 2]
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, func, select
+
+from app.models.user import ActivityActionType, ActivityServiceType, ActivityStatus, UserActivity
+from app.services.activity_service import ActivityService
+from app.services.activity_sink import ActivitySink
+from app.tests.conftest import TestingSessionLocal
+from app.utils.background_tasks import wait_for_active_tasks
+
+USER_ID = "6f1d2c3b-8a4e-4b6f-9c2d-1e0f3a5b7c9d"
+
+
+def _values(n: int) -> dict:
+    return {
+        "user_id": USER_ID,
+        "service_type": ActivityServiceType.EMAIL,
+        "action_type": ActivityActionType.SEARCH,
+        "status": ActivityStatus.SUCCESS,
+        "result_count": n,
+    }
+
+
+async def _activity_count(db_session) -> int:
+    return (await db_session.execute(select(func.count(UserActivity.id)))).scalar_one()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clean_activities(db_session):
+    await db_session.execute(delete(UserActivity))
+    await db_session.commit()
+    yield
+    await db_session.execute(delete(UserActivity))
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_records_are_written_in_batches(db_session):
+    sink = ActivitySink(session_factory=TestingSessionLocal, batch_size=3, flush_interval=0.05)
+    for n in range(7):
+        assert sink.submit(UserActivity, _values(n))
+
+    await asyncio.sleep(0.2)
+    stats = sink.get_stats()
+    assert stats["written"] == 7
+    assert stats["flushes"] == 3
+    assert stats["avg_write_latency_ms"] is not None
+    assert await _activity_count(db_session) == 7
+    await sink.drain()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_and_shutdown_drains(db_session):
+    sink = ActivitySink(session_factory=TestingSessionLocal, max_queue=2, flush_interval=60)
+    results = [sink.submit(UserActivity, _values(n)) for n in range(4)]
+    # The flusher has not run yet, so only two records fit in the queue
+    assert results == [True, True, False, False]
+    assert sink.get_stats()["dropped"] == 2
+
+    await sink.drain()
+    assert await _activity_count(db_session) == 2
+    assert sink.get_stats()["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_search_activity_goes_through_sink(db_session, activity_sink):
+    await ActivityService().log_search_activity(
+        db_session,
+        user_id=USER_ID,
+        service_type=ActivityServiceType.LINKEDIN,
+        request_params={"url": "linkedin.com/in/jane"},
+        result_count=1,
+    )
+    assert activity_sink.get_stats()["submitted"] == 1
+
+    # Graceful shutdown flushes the buffer through the registered hook
+    assert await wait_for_active_tasks(timeout=5) is True
+    assert await _activity_count(db_session) == 1
@@ -0,0 +1,72 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.utils.adaptive_limiter import AdaptiveConcurrencyLimiter, parse_retry_after
+
+
+def _status_error(status_code: int, headers: dict | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://provider.test/verify")
+    response = httpx.Response(status_code, headers=headers or {}, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+def _limiter(**overrides) -> AdaptiveConcurrencyLimiter:
+    options = dict(name="test", initial_limit=4, min_limit=1, max_limit=8, latency_target=1.0)
+    options.update(overrides)
+    return AdaptiveConcurrencyLimiter(**options)
+
+
+def test_parse_retry_after_accepts_seconds_and_rejects_garbage():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+@pytest.mark.asyncio
+async def test_limiter_bounds_concurrency():
+    limiter = _limiter(initial_limit=2, max_limit=2)
+    running = 0
+    peak = 0
+
+    async def call():
+        nonlocal running, peak
+        async with limiter:
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(call() for _ in range(10)))
+    assert peak <= 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_halves_on_429_and_honours_retry_after():
+    limiter = _limiter()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        async with limiter:
+            raise _status_error(429, {"Retry-After": "0.05"})
+
+    assert limiter.limit == 2
+    assert limiter.get_stats()["blocked_for_seconds"] > 0
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    async with limiter:
+        pass
+    assert loop.time() - started >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_limiter_grows_additively_when_saturated_and_healthy():
+    limiter = _limiter(initial_limit=1)
+
+    for _ in range(3):
+        async with limiter:
+            pass
+
+    assert limiter.limit == 2
+    assert limiter.limit <= limiter.max_limit
@@ -0,0 +1,47 @@
+import pytest
+
+from app.models.companies import Company, CompanyMetadata
+from app.models.contacts import Contact, ContactMetadata
+from app.repositories.email_finder import EmailFinderRepository
+from app.repositories.linkedin import LinkedInRepository
+from app.utils.batch_lookup import fetch_contacts_with_relations
+
+
+async def _seed(db_session):
+    db_session.add_all(
+        [
+            Company(id=1, uuid="company-1", name="Acme"),
+            CompanyMetadata(id=1, uuid="company-1", normalized_domain="acme.io"),
+            Contact(id=1, uuid="contact-1", email="jane@acme.io", company_id="company-1"),
+            ContactMetadata(id=1, uuid="contact-1", linkedin_url="https://www.linkedin.com/in/jane-doe"),
+            # No metadata and no company: still returned, with None in those positions
+            Contact(id=2, uuid="contact-2", email="solo@example.com"),
+        ]
+    )
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_joined_hydration_returns_four_tuples(db_session):
+    await _seed(db_session)
+
+    rows = await fetch_contacts_with_relations(db_session, Contact.uuid.in_(["contact-1", "contact-2"]))
+    by_uuid = {row[0].uuid: row for row in rows}
+
+    contact, contact_meta, company, company_meta = by_uuid["contact-1"]
+    assert contact_meta.uuid == "contact-1"
+    assert company.name == "Acme"
+    assert company_meta.normalized_domain == "acme.io"
+    assert by_uuid["contact-2"][1:] == (None, None, None)
+
+
+@pytest.mark.asyncio
+async def test_repositories_hydrate_in_one_query(db_session):
+    await _seed(db_session)
+
+    rows = await EmailFinderRepository().get_contacts_by_emails(db_session, ["jane@acme.io", "solo@example.com"])
+    assert sorted(row[0].uuid for row in rows) == ["contact-1", "contact-2"]
+
+    rows = await LinkedInRepository().search_contacts_by_linkedin_url(db_session, "linkedin.com/in/Jane-Doe/")
+    assert len(rows) == 1
+    assert rows[0][2].uuid == "company-1"
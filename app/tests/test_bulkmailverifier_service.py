@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+import app.services.bulkmailverifier_service as bmv_module
+from app.services.bulkmailverifier_service import BulkMailVerifierService
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_tokens(monkeypatch):
+    monkeypatch.setattr(bmv_module, "_access_token", None)
+    monkeypatch.setattr(bmv_module, "_refresh_token", None)
+    monkeypatch.setattr(bmv_module, "_login_lock", None)
+
+
+def _counting_login(service: BulkMailVerifierService, calls: list[int]):
+    async def login():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        service._access_token = f"token-{len(calls)}"
+        return {"access": service._access_token, "refresh": None}
+
+    return login
+
+
+@pytest.mark.asyncio
+async def test_concurrent_authentication_logs_in_once():
+    """Concurrent callers share one login, across service instances."""
+    calls: list[int] = []
+    services = [BulkMailVerifierService() for _ in range(5)]
+    for service in services:
+        service.login = _counting_login(service, calls)
+
+    await asyncio.gather(*(service._ensure_authenticated() for service in services))
+
+    assert len(calls) == 1
+    assert {service._access_token for service in services} == {"token-1"}
+
+
+@pytest.mark.asyncio
+async def test_refresh_is_skipped_when_token_already_replaced():
+    """A stale 401 does not trigger another login once someone refreshed the token."""
+    calls: list[int] = []
+    service = BulkMailVerifierService()
+    service.login = _counting_login(service, calls)
+
+    await service._ensure_authenticated()
+    await asyncio.gather(
+        service._refresh_access_token("token-1"),
+        service._refresh_access_token("token-1"),
+    )
+
+    assert len(calls) == 2
+    assert service._access_token == "token-2"
+
+
+def test_http_client_is_shared_between_instances():
+    assert BulkMailVerifierService()._get_http_client() is BulkMailVerifierService()._get_http_client()
@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import select, update
+
+from app.models.companies import CompanyMetadata
+from app.repositories.email_finder import EmailFinderRepository
+from app.tasks.company_domain_tasks import backfill_company_normalized_domains
+from app.tests.conftest import TestingSessionLocal
+
+
+@pytest.mark.asyncio
+async def test_orm_writes_keep_normalized_domain_in_sync(db_session):
+    meta = CompanyMetadata(id=1, uuid="company-1", website="https://www.Example.com/about")
+    db_session.add(meta)
+    await db_session.flush()
+    assert meta.normalized_domain == "example.com"
+
+    meta.website = "http://acme.io:8080"
+    await db_session.flush()
+    assert meta.normalized_domain == "acme.io"
+
+    assert await EmailFinderRepository().check_companies_exist_by_domain(db_session, "WWW.ACME.IO")
+    assert not await EmailFinderRepository().check_companies_exist_by_domain(db_session, "example.com")
+
+
+@pytest.mark.asyncio
+async def test_backfill_fills_missing_domains(db_session):
+    db_session.add_all(
+        [
+            CompanyMetadata(id=1, uuid="company-1", website="https://www.example.com"),
+            CompanyMetadata(id=2, uuid="company-2", website=None),
+            CompanyMetadata(id=3, uuid="company-3", website="acme.io/contact"),
+        ]
+    )
+    await db_session.commit()
+    # Simulate rows written before the column was maintained (bypasses ORM hooks)
+    await db_session.execute(update(CompanyMetadata).values(normalized_domain=None))
+    await db_session.commit()
+
+    stats = await backfill_company_normalized_domains(batch_size=2, session_factory=TestingSessionLocal)
+
+    assert stats == {"scanned": 3, "updated": 2, "batches": 2}
+    async with TestingSessionLocal() as session:
+        rows = (
+            await session.execute(select(CompanyMetadata.id, CompanyMetadata.normalized_domain).order_by(CompanyMetadata.id))
+        ).all()
+    assert rows == [(1, "example.com"), (2, None), (3, "acme.io")]
@@ -0,0 +1,89 @@
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from app.core.constants import FREE_USER, PRO_USER
+from app.models.billing import CreditLedgerEntry
+from app.models.user import FeatureType, User, UserProfile
+from app.services.credit_service import CreditService, InsufficientCreditsError
+from app.services.usage_service import UsageService
+
+
+@pytest_asyncio.fixture
+async def profile(db_session):
+    user = User(id=str(uuid4()), email=f"{uuid4().hex}@example.com", hashed_password="x", is_active=True)
+    db_session.add(user)
+    await db_session.flush()
+    profile = UserProfile(user_id=user.id, role=FREE_USER, credits=10)
+    db_session.add(profile)
+    await db_session.flush()
+    return profile
+
+
+async def _ledger(db_session, user_id):
+    result = await db_session.execute(
+        select(CreditLedgerEntry.delta, CreditLedgerEntry.balance_after, CreditLedgerEntry.reference)
+        .where(CreditLedgerEntry.user_id == user_id)
+        .order_by(CreditLedgerEntry.id)
+    )
+    return [tuple(row) for row in result.all()]
+
+
+@pytest.mark.asyncio
+async def test_deduct_and_add_record_ledger(db_session, profile):
+    service = CreditService()
+    assert await service.deduct_credits(db_session, profile.user_id, 3, reason="email_export", reference="e1") == 7
+    assert await service.add_credits(db_session, profile.user_id, 5, reason="addon_purchase") == 12
+    assert profile.credits == 12
+    assert await _ledger(db_session, profile.user_id) == [(-3, 7, "e1"), (5, 12, None)]
+
+
+@pytest.mark.asyncio
+async def test_insufficient_credits_leave_balance_unchanged(db_session, profile):
+    with pytest.raises(InsufficientCreditsError) as exc_info:
+        await CreditService().deduct_credits(db_session, profile.user_id, 11)
+    assert exc_info.value.balance == 10
+    await db_session.refresh(profile)
+    assert profile.credits == 10
+    assert await _ledger(db_session, profile.user_id) == []
+
+
+@pytest.mark.asyncio
+async def test_batch_deduction_writes_entry_per_charge(db_session, profile):
+    balance = await CreditService().deduct_credits_batch(
+        db_session, profile.user_id, [2, 3, 4], reason="contact_export", references=["c1", "c2", "c3"]
+    )
+    assert balance == 1
+    assert await _ledger(db_session, profile.user_id) == [(-2, 8, "c1"), (-3, 5, "c2"), (-4, 1, "c3")]
+
+
+@pytest.mark.asyncio
+async def test_track_usage_increments_up_to_limit(db_session, profile):
+    service = UsageService()
+    first = await service.track_usage(db_session, profile.user_id, FeatureType.VERIFIER.value, amount=3)
+    second = await service.track_usage(db_session, profile.user_id, FeatureType.VERIFIER.value, amount=3)
+    assert (first["used"], first["limit"]) == (3, 5)
+    assert (second["used"], second["limit"]) == (5, 5)
+
+
+@pytest.mark.asyncio
+async def test_track_usage_does_not_count_unlimited_features(db_session, profile):
+    profile.role = PRO_USER
+    await db_session.flush()
+    service = UsageService()
+    await service.track_usage(db_session, profile.user_id, FeatureType.VERIFIER.value, amount=3)
+    usage = await service.track_usage(db_session, profile.user_id, FeatureType.VERIFIER.value, amount=3)
+    # Unlimited features are stored with limit 0 and their usage is not counted
+    assert usage["used"] == 0
+
+
+@pytest.mark.asyncio
+async def test_post_hoc_charge_overdraws_and_is_recorded(db_session, profile):
+    balance = await CreditService().deduct_credits(
+        db_session, profile.user_id, 15, reason="contact_export", reference="e2", allow_overdraft=True
+    )
+    assert balance == -5
+    assert profile.credits == -5
+    assert await _ledger(db_session, profile.user_id) == [(-15, -5, "e2")]
@@ -0,0 +1,29 @@
+from app.core.config import get_settings
+from app.db import session as db_session_module
+from app.db.session import (
+    ADMIN_POOL,
+    BACKGROUND_POOL,
+    REQUEST_POOL,
+    check_database_health,
+    get_pool_stats,
+)
+
+settings = get_settings()
+
+
+def test_named_pools_use_their_own_settings():
+    background_pool = db_session_module.background_engine.sync_engine.pool
+    admin_pool = db_session_module.admin_engine.sync_engine.pool
+    assert background_pool.size() == settings.DATABASE_BACKGROUND_POOL_SIZE
+    assert background_pool.timeout() == settings.DATABASE_BACKGROUND_POOL_TIMEOUT
+    assert admin_pool.size() == settings.DATABASE_ADMIN_POOL_SIZE
+    assert db_session_module.BackgroundSessionLocal.kw["bind"] is db_session_module.background_engine
+
+
+def test_pool_stats_are_reported_per_pool():
+    health = check_database_health()
+    assert health["stats"]["pool"] == REQUEST_POOL
+    assert set(health["pools"]) >= {REQUEST_POOL, BACKGROUND_POOL, ADMIN_POOL}
+    for name, pool_health in health["pools"].items():
+        assert pool_health["stats"]["pool"] == name
+    assert get_pool_stats(BACKGROUND_POOL)["size"] == settings.DATABASE_BACKGROUND_POOL_SIZE
@@ -0,0 +1,71 @@
+import pytest
+
+from app.tasks.export_tasks import _verify_email_sequential
+from app.utils import domain_verdicts
+from app.utils.domain_verdicts import (
+    DOMAIN_CATCH_ALL,
+    DOMAIN_NORMAL,
+    clear_domain_verdicts,
+    get_domain_verdict,
+    is_catchall_domain,
+    record_verification_results,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_verdicts():
+    clear_domain_verdicts()
+    yield
+    clear_domain_verdicts()
+
+
+def test_verdicts_are_learned_from_results():
+    record_verification_results({"a@catch.com": "catchall", "b@catch.com": "invalid"})
+    record_verification_results({"a@normal.com": "invalid", "b@normal.com": "unknown"})
+    record_verification_results({"x@open.com": "valid", "y@open.com": "valid"})
+
+    assert get_domain_verdict("Catch.com") == DOMAIN_CATCH_ALL
+    assert get_domain_verdict("normal.com") == DOMAIN_NORMAL
+    # Valid aliases for one person are common on normal domains and prove nothing
+    assert get_domain_verdict("open.com") is None
+    assert is_catchall_domain("catch.com")
+    assert not is_catchall_domain("normal.com")
+    assert not is_catchall_domain("open.com")
+
+
+def test_invalid_does_not_downgrade_catch_all():
+    record_verification_results({"a@catch.com": "catchall"})
+    record_verification_results({"b@catch.com": "invalid"})
+    assert get_domain_verdict("catch.com") == DOMAIN_CATCH_ALL
+
+    record_verification_results({"a@normal.com": "invalid"})
+    record_verification_results({"b@normal.com": "catchall"})
+    assert get_domain_verdict("normal.com") == DOMAIN_CATCH_ALL
+
+
+def test_verdicts_expire(monkeypatch):
+    record_verification_results({"a@catch.com": "catchall"})
+    monkeypatch.setattr(domain_verdicts.settings, "DOMAIN_VERDICT_TTL_SECONDS", -1)
+    record_verification_results({"a@expired.com": "catchall"})
+    assert is_catchall_domain("catch.com")
+    assert get_domain_verdict("expired.com") is None
+
+
+class _CatchallService:
+    def __init__(self):
+        self.calls = []
+
+    async def verify_single_email(self, email):
+        self.calls.append(email)
+        return {"mapped_status": "catchall"}
+
+
+@pytest.mark.asyncio
+async def test_sequential_verification_stops_on_catchall():
+    service = _CatchallService()
+    valid_email, checked = await _verify_email_sequential(
+        ["a@catch.com", "b@catch.com", "c@catch.com"], service
+    )
+    assert valid_email is None
+    assert checked == 1
+    assert service.calls == ["a@catch.com"]
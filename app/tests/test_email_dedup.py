@@ -0,0 +1,49 @@
+import pytest
+
+from app.tasks.export_tasks import _verify_email_sequential
+from app.utils.normalization import dedupe_emails, normalize_person_key
+
+
+class _CountingVerifier:
+    """Minimal verifier that records every email it is asked to check."""
+
+    def __init__(self, valid: set[str]):
+        self.valid = valid
+        self.calls: list[str] = []
+
+    async def verify_single_email(self, email: str) -> dict:
+        self.calls.append(email)
+        return {"mapped_status": "valid" if email in self.valid else "invalid"}
+
+
+def test_normalize_person_key_ignores_case_whitespace_and_www():
+    assert normalize_person_key(" John ", "SMITH", "www.Example.com") == normalize_person_key(
+        "john", "smith", "example.com"
+    )
+    assert normalize_person_key("Mary  Ann", "Lee", None) == ("mary ann", "lee", "")
+
+
+def test_dedupe_emails_preserves_first_seen_order():
+    assert dedupe_emails(["B@x.com", "a@x.com", "b@x.com ", "", None]) == ["b@x.com", "a@x.com"]
+
+
+@pytest.mark.asyncio
+async def test_verify_email_sequential_shares_results_across_rows():
+    """Candidates verified for one person are not sent to the provider again for another."""
+    verifier = _CountingVerifier(valid={"j.smith@x.com"})
+    verified: set[str] = set()
+    valid: set[str] = set()
+
+    first, _ = await _verify_email_sequential(
+        ["john@x.com", "j.smith@x.com"], verifier, verified_emails_set=verified, valid_emails_set=valid
+    )
+    second, checked = await _verify_email_sequential(
+        ["jane@x.com", "john@x.com", "j.smith@x.com"],
+        verifier,
+        verified_emails_set=verified,
+        valid_emails_set=valid,
+    )
+
+    assert first == second == "j.smith@x.com"
+    assert checked == 1
+    assert verifier.calls == ["john@x.com", "j.smith@x.com", "jane@x.com"]
@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.email_finder_cache import EmailFinderCacheEntry
+from app.services import email_finder_cache as finder_cache_module
+from app.services.email_finder_cache import EmailFinderCache, clear_finder_cache
+from app.tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture(autouse=True)
+def reset_finder_cache():
+    clear_finder_cache()
+    yield
+    clear_finder_cache()
+
+
+@pytest.mark.asyncio
+async def test_lookup_reads_normalized_key_from_table(db_session):
+    now = datetime.now(timezone.utc)
+    db_session.add(
+        EmailFinderCacheEntry(
+            scope="global",
+            first_name="jane",
+            last_name="van doe",
+            domain="example.com",
+            email="jane.vandoe@example.com",
+            status="valid",
+            source="verifier",
+            found_at=now,
+            expires_at=now + timedelta(days=1),
+        )
+    )
+    await db_session.commit()
+
+    cache = EmailFinderCache(session_factory=TestingSessionLocal)
+    entry = await cache.lookup(" Jane ", "Van  Doe", "EXAMPLE.com", user_id="user-1")
+    assert entry["email"] == "jane.vandoe@example.com"
+    assert entry["status"] == "valid"
+    assert await cache.lookup("Jane", "Smith", "example.com") is None
+
+
+@pytest.mark.asyncio
+async def test_stored_results_are_shared_unless_scoped_per_user(monkeypatch):
+    cache = EmailFinderCache(session_factory=TestingSessionLocal)
+    await cache.store("Jane", "Doe", "example.com", "Jane.Doe@example.com", status="valid", user_id="user-1")
+    assert (await cache.lookup("jane", "doe", "example.com", user_id="user-2"))["email"] == "jane.doe@example.com"
+
+    clear_finder_cache()
+    monkeypatch.setattr(finder_cache_module.settings, "EMAIL_FINDER_CACHE_SHARED", False)
+    await cache.store("Jane", "Doe", "example.com", "jane.doe@example.com", user_id="user-1")
+    assert await cache.lookup("Jane", "Doe", "example.com", user_id="user-2") is None
+    assert await cache.lookup("Jane", "Doe", "example.com", user_id="user-1") is not None
+
+
+@pytest.mark.asyncio
+async def test_failed_store_leaves_caller_session_usable(db_session, monkeypatch):
+    cache = EmailFinderCache(session_factory=TestingSessionLocal)
+
+    async def failing_execute(*args, **kwargs):
+        raise RuntimeError("write failed")
+
+    original_execute = db_session.execute
+    monkeypatch.setattr(db_session, "execute", failing_execute)
+    await cache.store("Jane", "Doe", "example.com", "jane.doe@example.com", session=db_session)
+    monkeypatch.setattr(db_session, "execute", original_execute)
+
+    # The failed write was rolled back to its savepoint, not the whole transaction
+    assert db_session.in_transaction()
+    await db_session.execute(select(func.count()).select_from(EmailFinderCacheEntry))
+    # The in-process entry is still served
+    assert (await cache.lookup("Jane", "Doe", "example.com"))["email"] == "jane.doe@example.com"
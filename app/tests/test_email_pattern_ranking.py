@@ -0,0 +1,63 @@
+import pytest
+from sqlalchemy import select
+
+from app.models.companies import CompanyMetadata
+from app.models.email_patterns import EmailPattern
+from app.services.email_pattern_service import EmailPatternService, clear_pattern_index
+from app.tests.conftest import TestingSessionLocal
+from app.utils.email_generator import (
+    detect_pattern_format,
+    generate_email_combinations,
+    normalize_pattern_format,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_pattern_index():
+    clear_pattern_index()
+    yield
+    clear_pattern_index()
+
+
+def test_default_order_is_unchanged_without_weights():
+    emails = generate_email_combinations("Jane", "Doe", "example.com", count=3)
+    assert emails == ["jane.doe@example.com", "janedoe@example.com", "jane@example.com"]
+
+
+def test_weights_move_learned_formats_first():
+    emails = generate_email_combinations(
+        "Jane", "Doe", "example.com", count=3, pattern_weights={"flast": 40, "{first}_{last}": 10}
+    )
+    assert emails == ["jdoe@example.com", "jane_doe@example.com", "jane.doe@example.com"]
+
+
+def test_detect_and_normalize_pattern_format():
+    assert detect_pattern_format("JDoe@Example.com", "Jane", "Doe") == "flast"
+    assert detect_pattern_format("someone@example.com", "Jane", "Doe") is None
+    assert normalize_pattern_format("{first_initial}.{last}") == "f.last"
+
+
+@pytest.mark.asyncio
+async def test_domain_weights_load_and_learn_from_valid_emails(db_session):
+    db_session.add(CompanyMetadata(id=1, uuid="company-1", normalized_domain="example.com"))
+    db_session.add_all(
+        [
+            EmailPattern(id=1, uuid="p-1", company_uuid="company-1", pattern_format="flast", contact_count=5),
+            EmailPattern(id=2, uuid="p-2", company_uuid="company-1", pattern_format="first.last", contact_count=2),
+        ]
+    )
+    await db_session.commit()
+
+    service = EmailPatternService(session_factory=TestingSessionLocal)
+    assert await service.get_domain_weights("Example.com") == {"flast": 5.0, "first.last": 2.0}
+
+    detected = await service.record_valid_email("jane.doe@example.com", "Jane", "Doe", "example.com")
+    assert detected == "first.last"
+    # Index is updated immediately, without waiting for a reload
+    assert (await service.get_domain_weights("example.com"))["first.last"] == 3.0
+
+    async with TestingSessionLocal() as session:
+        count = (
+            await session.execute(select(EmailPattern.contact_count).where(EmailPattern.uuid == "p-2"))
+        ).scalar_one()
+    assert count == 3
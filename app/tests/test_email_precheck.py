@@ -0,0 +1,63 @@
+import pytest
+
+from app.utils import email_precheck
+from app.utils.email_precheck import (
+    PRECHECK_INVALID_SYNTAX,
+    PRECHECK_NO_MX,
+    StubMXResolver,
+    is_valid_email_syntax,
+    precheck_emails,
+    set_mx_resolver,
+)
+
+
+def test_syntax_rules():
+    assert is_valid_email_syntax("jane.doe@example.com")
+    assert not is_valid_email_syntax("jane..doe@example.com")
+    assert not is_valid_email_syntax("jane doe@example.com")
+    assert not is_valid_email_syntax("jane@localhost")
+    assert not is_valid_email_syntax(f"{'a' * 65}@example.com")
+
+
+def test_syntax_accepts_punycode_tlds():
+    assert is_valid_email_syntax("ivan@example.xn--p1ai")
+    assert is_valid_email_syntax("info@xn--80ak6aa92e.xn--80asehdb")
+    assert not is_valid_email_syntax("jane@example.c0m")
+    assert not is_valid_email_syntax("jane@example.xn--")
+
+
+@pytest.mark.asyncio
+async def test_precheck_rejects_bad_syntax_and_domains_without_mail_host():
+    resolver = StubMXResolver({"nomail.com": False, "flaky.com": None})
+    set_mx_resolver(resolver)
+
+    rejected = await precheck_emails(
+        ["Jane@NoMail.com", "john@nomail.com", "bad..dots@example.com", "ok@example.com", "x@flaky.com"]
+    )
+
+    assert rejected == {
+        "jane@nomail.com": PRECHECK_NO_MX,
+        "john@nomail.com": PRECHECK_NO_MX,
+        "bad..dots@example.com": PRECHECK_INVALID_SYNTAX,
+    }
+    # One lookup per domain
+    assert sorted(resolver.lookups) == ["example.com", "flaky.com", "nomail.com"]
+
+
+@pytest.mark.asyncio
+async def test_mx_answers_are_cached_but_resolver_errors_are_not(monkeypatch):
+    resolver = StubMXResolver({"nomail.com": False, "flaky.com": None})
+    set_mx_resolver(resolver)
+
+    await precheck_emails(["a@nomail.com", "a@example.com", "a@flaky.com"])
+    await precheck_emails(["b@nomail.com", "b@example.com", "b@flaky.com"])
+    assert resolver.lookups.count("nomail.com") == 1
+    assert resolver.lookups.count("example.com") == 1
+    assert resolver.lookups.count("flaky.com") == 2
+
+    # Negative answers use their own, shorter TTL
+    monkeypatch.setattr(email_precheck.settings, "EMAIL_PRECHECK_NEGATIVE_TTL", -1)
+    set_mx_resolver(resolver)
+    await precheck_emails(["c@nomail.com"])
+    await precheck_emails(["d@nomail.com"])
+    assert resolver.lookups.count("nomail.com") == 3
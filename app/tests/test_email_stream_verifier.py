@@ -0,0 +1,104 @@
+import json
+
+import pytest
+from sqlalchemy import delete, select
+
+from app.api.v3.endpoints import email as email_module
+from app.models.user import ActivityServiceType, UserActivity
+from app.services.truelist_service import TruelistService
+from app.tests.conftest import TestingSessionLocal
+
+
+@pytest.mark.asyncio
+async def test_stream_verifier_emits_ndjson_per_row(async_client, monkeypatch):
+    monkeypatch.setattr(email_module.settings, "TRUELIST_API_KEY", "test-key")
+    monkeypatch.setattr(email_module.settings, "EMAIL_STREAM_BATCH_ROWS", 2)
+    verified_chunks = []
+
+    async def fake_verify_emails(self, emails):
+        verified_chunks.append(list(emails))
+        return {
+            email: {"mapped_status": "valid" if email.startswith("good") else "invalid"}
+            for email in emails
+        }
+
+    monkeypatch.setattr(TruelistService, "verify_emails", fake_verify_emails)
+
+    csv_body = "Name,Work Email\nA,good@example.com\nB,bad@example.com\nC,\nD,GOOD@example.com\n"
+    response = await async_client.post(
+        "/api/v3/email/bulk/verifier/stream/",
+        data={"provider": "truelist"},
+        files={"file": ("people.csv", csv_body.encode(), "text/csv")},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    rows = sorted((line for line in lines if "row" in line), key=lambda line: line["row"])
+
+    assert [(row["row"], row["status"]) for row in rows] == [
+        (1, "valid"),
+        (2, "invalid"),
+        (3, None),
+        (4, "valid"),
+    ]
+    assert rows[0]["raw_row"] == {"Name": "A", "Work Email": "good@example.com"}
+    assert lines[-1]["summary"]["total"] == 4
+    assert lines[-1]["summary"]["missing_email"] == 1
+    # Rows are read and verified in batches of two
+    assert verified_chunks == [["good@example.com", "bad@example.com"], ["good@example.com"]]
+
+
+@pytest.mark.asyncio
+async def test_stream_verifier_requires_email_column(async_client, monkeypatch):
+    monkeypatch.setattr(email_module.settings, "TRUELIST_API_KEY", "test-key")
+    response = await async_client.post(
+        "/api/v3/email/bulk/verifier/stream/",
+        data={"provider": "truelist"},
+        files={"file": ("people.csv", b"Name,Company\nA,Acme\n", "text/csv")},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_stream_verifier_logs_activity_on_its_own_session(async_client, monkeypatch):
+    monkeypatch.setattr(email_module.settings, "TRUELIST_API_KEY", "test-key")
+    monkeypatch.setattr(email_module.settings, "ENABLE_ACTIVITY_SINK", False)
+    opened = []
+
+    def session_factory():
+        session = TestingSessionLocal()
+        opened.append(session)
+        return session
+
+    # The request-scoped session is gone by the time the body streams, so the
+    # endpoint must not rely on it; route its own session to the test database
+    monkeypatch.setattr(email_module, "AsyncSessionLocal", session_factory)
+    async with TestingSessionLocal() as session:
+        await session.execute(delete(UserActivity))
+        await session.commit()
+
+    async def fake_verify_emails(self, emails):
+        return {email: {"mapped_status": "valid"} for email in emails}
+
+    monkeypatch.setattr(TruelistService, "verify_emails", fake_verify_emails)
+
+    response = await async_client.post(
+        "/api/v3/email/bulk/verifier/stream/",
+        data={"provider": "truelist"},
+        files={"file": ("people.csv", b"Email\na@example.com\nb@example.com\n", "text/csv")},
+    )
+    assert response.status_code == 200
+    assert len(opened) == 1
+
+    async with TestingSessionLocal() as session:
+        activities = (
+            await session.execute(
+                select(UserActivity).where(UserActivity.service_type == ActivityServiceType.EMAIL)
+            )
+        ).scalars().all()
+        assert [(activity.result_count, activity.request_params) for activity in activities] == [
+            (2, {"email_count": 2, "streaming": True})
+        ]
+        await session.execute(delete(UserActivity))
+        await session.commit()
@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.email_verifications import EmailVerificationResult
+from app.services.email_verification_store import EmailVerificationStore, clear_verification_cache
+from app.tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture(autouse=True)
+def reset_store_cache():
+    clear_verification_cache()
+    yield
+    clear_verification_cache()
+
+
+def test_ttl_depends_on_status():
+    assert EmailVerificationStore.ttl_for_status("valid") == timedelta(days=30)
+    assert EmailVerificationStore.ttl_for_status("invalid") == timedelta(days=90)
+    assert EmailVerificationStore.ttl_for_status("unknown") == timedelta(days=1)
+
+
+@pytest.mark.asyncio
+async def test_lookup_many_reads_fresh_rows_and_skips_expired(db_session):
+    """Persisted results are found case-insensitively; expired rows are ignored."""
+    now = datetime.now(timezone.utc)
+    db_session.add_all(
+        [
+            EmailVerificationResult(
+                email="fresh@example.com",
+                status="valid",
+                provider="truelist",
+                verified_at=now,
+                expires_at=now + timedelta(days=1),
+            ),
+            EmailVerificationResult(
+                email="stale@example.com",
+                status="unknown",
+                provider="bulkmailverifier",
+                verified_at=now - timedelta(days=2),
+                expires_at=now - timedelta(days=1),
+            ),
+        ]
+    )
+    await db_session.commit()
+
+    store = EmailVerificationStore(session_factory=TestingSessionLocal)
+    found = await store.lookup_many(["Fresh@Example.com", "stale@example.com", "missing@example.com"])
+
+    assert list(found) == ["fresh@example.com"]
+    assert found["fresh@example.com"]["status"] == "valid"
+    assert found["fresh@example.com"]["provider"] == "truelist"
+
+    await db_session.delete(await db_session.get(EmailVerificationResult, "fresh@example.com"))
+    await db_session.delete(await db_session.get(EmailVerificationResult, "stale@example.com"))
+    await db_session.commit()
+
+    # Served from the in-process LRU once loaded
+    assert await store.lookup("fresh@example.com") is not None
+
+
+@pytest.mark.asyncio
+async def test_store_many_serves_from_memory_when_database_write_fails():
+    """A failed database write still leaves results in the LRU for this process."""
+
+    class BrokenSession:
+        async def __aenter__(self):
+            raise RuntimeError("database down")
+
+        async def __aexit__(self, *args):
+            return False
+
+    store = EmailVerificationStore(session_factory=BrokenSession)
+    await store.store_many({"A@x.com": "invalid"}, provider="bulkmailverifier")
+
+    result = await store.lookup("a@x.com")
+    assert result["status"] == "invalid"
+    assert result["provider"] == "bulkmailverifier"
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.exports import ExportStatus, ExportType, UserExport
+from app.services import export_admission_service
+from app.services.export_admission_service import (
+    ADMISSION_ADMIT,
+    ADMISSION_DELAY,
+    ADMISSION_REJECT,
+    ExportAdmissionService,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_calibration_cache():
+    export_admission_service._calibration_cache.clear()
+    yield
+    export_admission_service._calibration_cache.clear()
+
+
+def test_estimate_cost_scales_with_columns_and_provider_calls():
+    service = ExportAdmissionService()
+    assert service.estimate_cost(ExportType.contacts, 10) == 480.0
+    assert service.estimate_cost(ExportType.emails, 10, provider_calls_per_row=2) == 120.0
+
+
+@pytest.mark.asyncio
+async def test_evaluate_uses_calibrated_rate_and_backlog(db_session, monkeypatch):
+    """Completed exports calibrate the rate; pending work pushes new exports into delay or reject."""
+    settings = export_admission_service.settings
+    monkeypatch.setattr(settings, "ENABLE_EXPORT_ADMISSION_CONTROL", True)
+    monkeypatch.setattr(settings, "EXPORT_ADMISSION_DELAY_THRESHOLD", 100.0)
+    monkeypatch.setattr(settings, "EXPORT_ADMISSION_REJECT_THRESHOLD", 1000.0)
+    monkeypatch.setattr(settings, "MAX_CONCURRENT_BACKGROUND_TASKS", 1)
+
+    started = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    db_session.add_all(
+        [
+            UserExport(
+                id=1,
+                export_id="done",
+                user_id="user-1",
+                export_type=ExportType.companies,
+                status=ExportStatus.completed,
+                estimated_cost=1000.0,
+                started_at=started,
+                completed_at=started + timedelta(seconds=100),
+            ),
+            UserExport(
+                id=2,
+                export_id="queued",
+                user_id="user-1",
+                export_type=ExportType.companies,
+                status=ExportStatus.pending,
+                estimated_cost=1500.0,
+            ),
+        ]
+    )
+    await db_session.flush()
+
+    service = ExportAdmissionService()
+    assert await service.get_seconds_per_unit(db_session, ExportType.companies) == pytest.approx(0.1)
+
+    # Backlog is 150s, so even a tiny export is delayed
+    small = await service.evaluate(db_session, ExportType.companies, 1)
+    assert small["decision"] == ADMISSION_DELAY
+    assert small["backlog_seconds"] == pytest.approx(150.0)
+    assert small["start_delay_seconds"] == pytest.approx(50.0)
+
+    # The export's own size does not count against the thresholds
+    large = await service.evaluate(db_session, ExportType.companies, 1000)
+    assert large["decision"] == ADMISSION_DELAY
+    assert large["retry_after_seconds"] is None
+
+    # Once the queued work passes the reject threshold, retry after it drains below it
+    monkeypatch.setattr(settings, "EXPORT_ADMISSION_REJECT_THRESHOLD", 120.0)
+    rejected = await service.evaluate(db_session, ExportType.companies, 1)
+    assert rejected["decision"] == ADMISSION_REJECT
+    assert rejected["retry_after_seconds"] == 30
+
+    monkeypatch.setattr(settings, "ENABLE_EXPORT_ADMISSION_CONTROL", False)
+    disabled = await service.evaluate(db_session, ExportType.companies, 1000)
+    assert disabled["decision"] == ADMISSION_ADMIT
+
+    await db_session.rollback()
+
+
+@pytest.mark.asyncio
+async def test_email_export_is_rejected_with_retry_after(async_client, db_session, monkeypatch):
+    settings = export_admission_service.settings
+    monkeypatch.setattr(settings, "ENABLE_EXPORT_ADMISSION_CONTROL", True)
+    monkeypatch.setattr(settings, "EXPORT_ADMISSION_REJECT_THRESHOLD", 10.0)
+    monkeypatch.setattr(settings, "EXPORT_DEFAULT_SECONDS_PER_COST_UNIT", 1.0)
+    monkeypatch.setattr(settings, "MAX_CONCURRENT_BACKGROUND_TASKS", 1)
+    db_session.add(
+        UserExport(
+            id=3,
+            export_id="queued-emails",
+            user_id="user-1",
+            export_type=ExportType.emails,
+            status=ExportStatus.processing,
+            estimated_cost=25.0,
+        )
+    )
+    await db_session.flush()
+
+    response = await async_client.post(
+        "/api/v3/email/export",
+        json={"contacts": [{"first_name": "Ada", "last_name": "Lovelace", "domain": "example.com"}]},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "15"
+    await db_session.rollback()
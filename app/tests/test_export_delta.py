@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.contacts import Contact
+from app.models.exports import ExportType, ExportWatermark
+from app.services import export_service as export_service_module
+from app.services.export_service import ExportService
+
+
+class _FakeConnectraClient:
+    """Connectra stand-in returning fixed records for UUID searches."""
+
+    def __init__(self, records):
+        self.records = records
+        self.calls = []
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def batch_search_by_uuids(self, uuids, entity_type="contact", batch_size=100, select_columns=None):
+        self.calls.append((list(uuids), entity_type, select_columns))
+        return [record for record in self.records if record["uuid"] in uuids]
+
+
+@pytest.mark.asyncio
+async def test_select_delta_uuids_filters_by_watermark(db_session, monkeypatch):
+    """Only rows updated after the segment watermark are selected; missing rows become tombstones."""
+    watermark = datetime(2024, 1, 1, 12, 0, 0)
+    client = _FakeConnectraClient(
+        [
+            {"uuid": "old", "updated_at": "2023-12-31T12:00:00Z"},
+            {"uuid": "new", "updated_at": "2024-01-01T13:00:00+00:00"},
+            {"uuid": "no-ts", "updated_at": None},
+        ]
+    )
+    monkeypatch.setattr(export_service_module, "ConnectraClient", client)
+    db_session.add(
+        ExportWatermark(
+            id=1,
+            user_id="user-1",
+            export_type=ExportType.contacts,
+            segment_key="nightly",
+            watermark=watermark,
+        )
+    )
+    await db_session.flush()
+
+    selection = await ExportService().select_delta_uuids(
+        db_session,
+        "user-1",
+        ExportType.contacts,
+        "nightly",
+        ["old", "new", "no-ts", "gone", "new"],
+    )
+
+    assert selection["changed_uuids"] == ["new", "no-ts"]
+    assert selection["deleted_uuids"] == ["gone"]
+    assert selection["unchanged_count"] == 1
+    assert selection["since"] == watermark
+    assert selection["watermark"] == watermark + timedelta(hours=1)
+    assert client.calls == [(["old", "new", "no-ts", "gone"], "contact", ["uuid", "updated_at"])]
+
+    await db_session.rollback()
+
+
+@pytest.mark.asyncio
+async def test_select_delta_uuids_reads_connectra_not_local_rows(db_session, monkeypatch):
+    """Rows that exist only in Connectra are exported, not reported as deleted."""
+    db_session.add(Contact(id=10, uuid="local-only", updated_at=datetime(2024, 1, 1)))
+    await db_session.flush()
+    client = _FakeConnectraClient([{"uuid": "a", "updated_at": "2024-01-01T00:00:00"}])
+    monkeypatch.setattr(export_service_module, "ConnectraClient", client)
+
+    selection = await ExportService().select_delta_uuids(
+        db_session,
+        "user-1",
+        ExportType.contacts,
+        "first-run",
+        ["a", "local-only"],
+    )
+
+    assert selection["changed_uuids"] == ["a"]
+    assert selection["deleted_uuids"] == ["local-only"]
+    assert selection["since"] is None
+    assert selection["watermark"] == datetime(2024, 1, 1)
+
+    await db_session.rollback()
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from app.services import hedged_verifier as hedged_module
+from app.services.hedged_verifier import HedgedEmailVerifier, get_hedging_stats, reset_hedging_state
+
+
+class FakeProvider:
+    def __init__(self, delay, status="valid"):
+        self.delay = delay
+        self.status = status
+        self.calls = 0
+        self.cancelled = 0
+
+    async def verify_single_email(self, email):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return {"email": email, "mapped_status": self.status}
+
+
+@pytest.fixture(autouse=True)
+def hedging_settings(monkeypatch):
+    monkeypatch.setattr(hedged_module.settings, "EMAIL_HEDGE_DEFAULT_DELAY", 0.05)
+    monkeypatch.setattr(hedged_module.settings, "EMAIL_HEDGE_MIN_DELAY", 0.01)
+    monkeypatch.setattr(hedged_module.settings, "EMAIL_HEDGE_BUDGET_RATIO", 0.1)
+    reset_hedging_state()
+    yield
+    reset_hedging_state()
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    primary, secondary = FakeProvider(0), FakeProvider(0)
+    verifier = HedgedEmailVerifier(primary, "bulkmailverifier", secondary, "truelist")
+
+    result = await verifier.verify_single_email("jane@example.com")
+
+    assert result["provider"] == "bulkmailverifier"
+    assert secondary.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_stalled_primary_is_hedged_and_cancelled():
+    primary, secondary = FakeProvider(5, status="unknown"), FakeProvider(0, status="invalid")
+    verifier = HedgedEmailVerifier(primary, "bulkmailverifier", secondary, "truelist")
+
+    result = await asyncio.wait_for(verifier.verify_single_email("jane@example.com"), timeout=1)
+
+    assert result == {"email": "jane@example.com", "mapped_status": "invalid", "provider": "truelist"}
+    await asyncio.sleep(0)
+    assert primary.cancelled == 1
+    assert get_hedging_stats()["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hedges_stay_within_budget():
+    primary, secondary = FakeProvider(0.1), FakeProvider(0)
+    verifier = HedgedEmailVerifier(primary, "bulkmailverifier", secondary, "truelist")
+
+    results = [await verifier.verify_single_email(f"user{i}@example.com") for i in range(3)]
+
+    # One hedge is always allowed; 10% of three calls allows no second one
+    assert [r["provider"] for r in results] == ["truelist", "bulkmailverifier", "bulkmailverifier"]
+    assert get_hedging_stats()["budget_denied"] == 2
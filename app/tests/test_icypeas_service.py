@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from app.services.icypeas_service import IcyPeasService
@@ -30,3 +32,40 @@ async def test_extract_best_email_returns_none_when_no_certainty():
 
     best = service._extract_best_email(results)  # type: ignore[attr-defined]
     assert best is None
+
+
+@pytest.mark.asyncio
+async def test_shared_poller_polls_outstanding_searches_together(monkeypatch):
+    """Concurrent searches share one poll schedule and each caller gets its own result."""
+    from app.services import icypeas_service as icypeas_module
+
+    monkeypatch.setattr(icypeas_module.settings, "ICYPEAS_API_KEY", "test-key")
+    monkeypatch.setattr(icypeas_module, "_poller", icypeas_module.IcyPeasPoller(0.01, 0.05))
+
+    reads: list[str] = []
+    ready_after = {"s1": 2, "s2": 3, "s3": 100}
+
+    async def fake_read(self, search_id):
+        reads.append(search_id)
+        if reads.count(search_id) < ready_after[search_id]:
+            return {"status": "NONE"}
+        return {
+            "status": "DEBITED",
+            "results": {"emails": [{"email": f"{search_id}@example.com", "certainty": "sure"}]},
+        }
+
+    monkeypatch.setattr(IcyPeasService, "_read_search", fake_read)
+    service = IcyPeasService()
+
+    results = await asyncio.gather(
+        service._poll_result("s1"),
+        service._poll_result("s2"),
+        service._poll_result("s3", max_attempts=1, poll_interval=0.05),
+    )
+
+    assert results[0]["email"] == "s1@example.com"
+    assert results[1]["email"] == "s2@example.com"
+    assert results[2] is None
+    # s1 and s2 were read on the same ticks until each completed
+    assert reads[:3] == ["s1", "s2", "s3"]
+    assert icypeas_module.get_icypeas_poller().get_stats()["outstanding"] == 0
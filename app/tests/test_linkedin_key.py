@@ -0,0 +1,52 @@
+import pytest
+from sqlalchemy import update
+
+from app.models.companies import CompanyMetadata
+from app.models.contacts import ContactMetadata
+from app.repositories.linkedin import LinkedInRepository
+from app.tasks.linkedin_key_tasks import backfill_linkedin_keys
+from app.tests.conftest import TestingSessionLocal
+from app.utils.sales_navigator_utils import canonical_linkedin_key
+
+
+def test_canonical_linkedin_key():
+    assert canonical_linkedin_key("https://www.LinkedIn.com/in/Jane-Doe/?trk=abc") == "linkedin.com/in/jane-doe"
+    assert canonical_linkedin_key("linkedin.com/company/acme#about") == "linkedin.com/company/acme"
+    assert canonical_linkedin_key("https://www.linkedin.com/sales/lead/ACwAA,NAME_SEARCH,x") == (
+        "linkedin.com/sales/lead/acwaa,name_search,x"
+    )
+    assert canonical_linkedin_key("_") is None
+    assert canonical_linkedin_key(None) is None
+
+
+@pytest.mark.asyncio
+async def test_lookups_match_canonical_key_exactly(db_session):
+    db_session.add_all(
+        [
+            ContactMetadata(id=1, uuid="contact-1", linkedin_url="https://www.linkedin.com/in/jane-doe/"),
+            ContactMetadata(id=2, uuid="contact-2", linkedin_url="https://www.linkedin.com/in/jane-doe-2"),
+            CompanyMetadata(id=1, uuid="company-1", linkedin_url="http://linkedin.com/company/acme"),
+        ]
+    )
+    await db_session.commit()
+    repo = LinkedInRepository()
+
+    contacts = await repo.find_contacts_metadata_by_linkedin_url(db_session, "linkedin.com/in/Jane-Doe?utm=1")
+    assert [m.uuid for m in contacts] == ["contact-1"]
+    companies = await repo.find_companies_metadata_by_linkedin_url(db_session, "https://www.linkedin.com/company/ACME/")
+    assert [m.uuid for m in companies] == ["company-1"]
+
+
+@pytest.mark.asyncio
+async def test_backfill_sets_missing_keys(db_session):
+    db_session.add(ContactMetadata(id=1, uuid="contact-1", linkedin_url="https://linkedin.com/in/jane/"))
+    await db_session.commit()
+    await db_session.execute(update(ContactMetadata).values(linkedin_key=None))
+    await db_session.commit()
+
+    results = await backfill_linkedin_keys(session_factory=TestingSessionLocal)
+
+    assert results["contacts_metadata"]["updated"] == 1
+    async with TestingSessionLocal() as session:
+        metadata = await LinkedInRepository().find_contacts_metadata_by_linkedin_url(session, "linkedin.com/in/jane")
+    assert [m.uuid for m in metadata] == ["contact-1"]
@@ -0,0 +1,36 @@
+import pytest
+
+from app.clients.connectra_client import ConnectraClient
+from app.services.linkedin_service import LinkedInService
+
+
+@pytest.mark.asyncio
+async def test_multiple_urls_resolve_in_batched_queries(monkeypatch):
+    calls = []
+
+    def fake_search(entity_type):
+        async def search(self, vql_query):
+            urls = vql_query.filters.and_[0].value
+            calls.append((entity_type, len(urls)))
+            data = []
+            if entity_type == "contact" and "https://www.linkedin.com/in/jane-doe/" in urls:
+                data.append({"uuid": "contact-1", "linkedin_url": "https://linkedin.com/in/Jane-Doe"})
+            if entity_type == "company" and "https://linkedin.com/company/acme" in urls:
+                data.append({"uuid": "company-1", "linkedin_url": "https://linkedin.com/company/acme"})
+            return {"data": data}
+        return search
+
+    monkeypatch.setattr(ConnectraClient, "search_contacts", fake_search("contact"))
+    monkeypatch.setattr(ConnectraClient, "search_companies", fake_search("company"))
+
+    urls = ["https://www.linkedin.com/in/jane-doe/", "https://linkedin.com/company/acme"]
+    urls += [f"https://linkedin.com/in/person-{i}" for i in range(148)]
+    urls.append(" https://linkedin.com/company/acme ")  # duplicate after stripping
+
+    contact_uuids, company_uuids, unmatched = await LinkedInService().search_by_multiple_urls(None, urls)
+
+    assert contact_uuids == ["contact-1"]
+    assert company_uuids == ["company-1"]
+    assert len(unmatched) == 148 and "https://linkedin.com/in/person-0" in unmatched
+    # 150 unique URLs: two chunks per entity type instead of 300 single-URL requests
+    assert sorted(calls) == [("company", 50), ("company", 100), ("contact", 50), ("contact", 100)]
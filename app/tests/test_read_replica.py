@@ -0,0 +1,68 @@
+from collections import OrderedDict
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from app.db import session as db_session_module
+from app.db.session import pin_to_primary, read_session, should_use_replica
+from app.models.user import User
+from app.tests.conftest import TestingSessionLocal, engine
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    """Point the replica at the test database with fresh routing state."""
+    monkeypatch.setattr(db_session_module, "replica_engine", engine)
+    monkeypatch.setattr(db_session_module, "ReplicaSessionLocal", TestingSessionLocal)
+    monkeypatch.setattr(db_session_module, "_recent_writers", OrderedDict())
+    monkeypatch.setattr(db_session_module, "_replica_state", dict(db_session_module._replica_state, checked_at=None))
+    return db_session_module
+
+
+@pytest.mark.asyncio
+async def test_reads_use_primary_without_replica(monkeypatch):
+    monkeypatch.setattr(db_session_module, "ReplicaSessionLocal", None)
+    assert await should_use_replica("user-1") is False
+
+
+@pytest.mark.asyncio
+async def test_recent_writer_is_pinned_to_primary(replica):
+    async with read_session("user-1") as session:
+        assert session.info["using_replica"] is True
+
+    pin_to_primary("user-1")
+    async with read_session("user-1") as session:
+        assert session.info["using_replica"] is False
+    async with read_session("user-2") as session:
+        assert session.info["using_replica"] is True
+
+
+@pytest.mark.asyncio
+async def test_pin_expires_after_window(replica, monkeypatch):
+    monkeypatch.setattr(replica.settings, "READ_YOUR_WRITES_WINDOW_SECONDS", 0.0)
+    pin_to_primary("user-1")
+    assert replica.is_pinned_to_primary("user-1") is False
+
+
+@pytest.mark.asyncio
+async def test_lagging_replica_falls_back_to_primary(replica, monkeypatch):
+    async def lagging():
+        return replica.settings.REPLICA_MAX_LAG_SECONDS + 60
+
+    monkeypatch.setattr(replica, "measure_replica_lag", lagging)
+    assert await should_use_replica("user-1") is False
+    status = replica.get_replica_status()
+    assert status["healthy"] is False
+    assert status["lag_fallbacks"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_session_marks_writes():
+    async with TestingSessionLocal() as session:
+        await session.execute(select(User.id).limit(1))
+        assert "has_writes" not in session.info
+        session.add(User(id=str(uuid4()), email=f"{uuid4().hex}@example.com", hashed_password="x"))
+        await session.flush()
+        assert session.info["has_writes"] is True
+        await session.rollback()
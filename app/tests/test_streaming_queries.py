@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import select
+
+from app.models.companies import CompanyMetadata
+from app.utils.query_batch import QueryBatcher
+from app.utils.streaming_queries import (
+    STREAM_MODE_CURSOR,
+    STREAM_MODE_KEYSET,
+    resolve_stream_mode,
+    stream_query_results,
+    stream_query_scalars,
+)
+
+
+async def _seed(db_session, count=7):
+    db_session.add_all(
+        [CompanyMetadata(id=i, uuid=f"company-{i}", city=f"city-{i % 3}") for i in range(1, count + 1)]
+    )
+    await db_session.commit()
+
+
+def test_mode_is_picked_from_query_ordering():
+    mode, columns = resolve_stream_mode(select(CompanyMetadata))
+    assert mode == STREAM_MODE_KEYSET
+    assert [c.name for c in columns] == ["id"]
+
+    assert resolve_stream_mode(select(CompanyMetadata).order_by(CompanyMetadata.city))[0] == STREAM_MODE_CURSOR
+    # Column selects without the primary key cannot be continued by key
+    assert resolve_stream_mode(select(CompanyMetadata.uuid))[0] == STREAM_MODE_CURSOR
+    assert resolve_stream_mode(select(CompanyMetadata.id, CompanyMetadata.uuid))[0] == STREAM_MODE_KEYSET
+
+
+@pytest.mark.asyncio
+async def test_keyset_streaming_returns_every_row_once(db_session):
+    await _seed(db_session)
+
+    batches = [
+        batch async for batch in stream_query_results(db_session, select(CompanyMetadata), batch_size=3)
+    ]
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert [row[0].id for batch in batches for row in batch] == list(range(1, 8))
+
+    ids = [
+        value
+        async for batch in stream_query_scalars(
+            db_session, select(CompanyMetadata.id), batch_size=2, max_results=5
+        )
+        for value in batch
+    ]
+    assert ids == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_ordered_query_streams_through_cursor_in_order(db_session):
+    await _seed(db_session)
+
+    query = select(CompanyMetadata.uuid).order_by(CompanyMetadata.id.desc())
+    values = [value async for batch in stream_query_scalars(db_session, query, batch_size=3) for value in batch]
+    assert values == [f"company-{i}" for i in range(7, 0, -1)]
+
+    batcher = QueryBatcher(db_session, select(CompanyMetadata.id, CompanyMetadata.city), batch_size=4)
+    rows = await batcher.fetch_all()
+    assert [row.id for row in rows] == list(range(1, 8))
+
+
+@pytest.mark.asyncio
+async def test_keyset_streaming_with_supplied_unique_sort(db_session):
+    await _seed(db_session)
+
+    query = select(CompanyMetadata.city, CompanyMetadata.id)
+    rows = [
+        row
+        async for batch in stream_query_results(
+            db_session, query, batch_size=2, keyset_columns=[CompanyMetadata.city, CompanyMetadata.id]
+        )
+        for row in batch
+    ]
+    assert [(row.city, row.id) for row in rows] == sorted((f"city-{i % 3}", i) for i in range(1, 8))
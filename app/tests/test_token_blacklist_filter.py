@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from app.core.security import create_refresh_token
+from app.models.token_blacklist import TokenBlacklist
+from app.models.user import User
+from app.repositories import token_blacklist as blacklist_module
+from app.repositories.token_blacklist import TokenBlacklistRepository, reset_blacklist_filter
+from app.utils.bloom_filter import BloomFilter, ExpiringBloomFilter
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    members = [f"token-{i}" for i in range(1000)]
+    for member in members:
+        bloom.add(member)
+    assert all(member in bloom for member in members)
+    false_positives = sum(f"other-{i}" in bloom for i in range(1000))
+    assert false_positives < 50
+
+
+def test_expiring_filter_drops_expired_buckets():
+    now = datetime(2026, 10, 19, 12, tzinfo=timezone.utc)
+    bloom = ExpiringBloomFilter(bucket_seconds=3600, capacity_per_bucket=100)
+    soon, later = now + timedelta(minutes=30), now + timedelta(days=2)
+    bloom.add("a", soon, now=now)
+    bloom.add("b", later, now=now)
+    assert bloom.might_contain("a", soon) and bloom.might_contain("b", later)
+    assert not bloom.might_contain("a", later)
+
+    assert bloom.prune(now + timedelta(hours=1)) == 1
+    assert not bloom.might_contain("a", soon)
+    assert bloom.might_contain("b", later)
+
+
+@pytest_asyncio.fixture
+async def user_id(db_session):
+    reset_blacklist_filter()
+    user = User(id=str(uuid4()), email=f"{uuid4().hex}@example.com", hashed_password="x")
+    db_session.add(user)
+    await db_session.flush()
+    yield user.uuid
+    reset_blacklist_filter()
+
+
+@pytest.mark.asyncio
+async def test_filter_answers_misses_without_database(db_session, user_id):
+    repo = TokenBlacklistRepository()
+    await repo.load_blacklist_filter(db_session)
+    token = create_refresh_token({"sub": user_id})
+    db_checks = blacklist_module._filter_state["db_checks"]
+
+    assert await repo.is_token_blacklisted(db_session, token) is False
+    assert blacklist_module._filter_state["db_checks"] == db_checks
+
+    await repo.create_blacklist_entry(db_session, token, user_id)
+    assert await repo.is_token_blacklisted(db_session, token) is True
+    assert blacklist_module._filter_state["db_checks"] == db_checks + 1
+
+
+@pytest.mark.asyncio
+async def test_sync_picks_up_entries_from_other_workers(db_session, user_id, monkeypatch):
+    repo = TokenBlacklistRepository()
+    await repo.load_blacklist_filter(db_session)
+    token = create_refresh_token({"sub": user_id})
+    # Written by another worker: not added to this worker's filter
+    _, expires_at = blacklist_module._token_expiry(token)
+    db_session.add(TokenBlacklist(token=token, user_id=user_id, expires_at=expires_at))
+    await db_session.flush()
+
+    monkeypatch.setattr(blacklist_module.settings, "TOKEN_BLACKLIST_FILTER_SYNC_SECONDS", 0.0)
+    assert await repo.is_token_blacklisted(db_session, token) is True
+
+
+@pytest.mark.asyncio
+async def test_undecodable_tokens_are_checked_in_database(db_session, user_id):
+    repo = TokenBlacklistRepository()
+    db_session.add(TokenBlacklist(token="not-a-jwt", user_id=user_id))
+    await db_session.flush()
+    await repo.load_blacklist_filter(db_session)
+    assert await repo.is_token_blacklisted(db_session, "not-a-jwt") is True
+    assert await repo.is_token_blacklisted(db_session, "also-not-a-jwt") is False
+
+
+@pytest.mark.asyncio
+async def test_failed_sync_falls_back_to_database(db_session, user_id, monkeypatch):
+    repo = TokenBlacklistRepository()
+    await repo.load_blacklist_filter(db_session)
+    token = create_refresh_token({"sub": user_id})
+    await repo.create_blacklist_entry(db_session, token, user_id)
+
+    async def failing_sync(session):
+        raise RuntimeError("sync failed")
+
+    monkeypatch.setattr(repo, "sync_blacklist_filter", failing_sync)
+    monkeypatch.setattr(blacklist_module.settings, "TOKEN_BLACKLIST_FILTER_SYNC_SECONDS", 0.0)
+    failures = blacklist_module._filter_state["sync_failures"]
+
+    assert await repo.is_token_blacklisted(db_session, token) is True
+    assert blacklist_module._filter_state["sync_failures"] == failures + 1
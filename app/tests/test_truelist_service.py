@@ -7,39 +7,38 @@ import app.services.truelist_service as truelist_module
 from app.services.truelist_service import TruelistService
 
 
-@pytest.mark.asyncio
-async def test_truelist_verify_emails_chunks_by_51(monkeypatch):
-    """TruelistService.verify_emails should chunk requests by 51 emails."""
+class DummyResponse:
+    def __init__(self, emails=None):
+        self.status_code = 200
+        self._emails = emails or []
 
-    calls: list[Dict] = []
+    def raise_for_status(self):
+        return None
 
-    class DummyResponse:
-        def __init__(self):
-            self.status_code = 200
+    def json(self):
+        # Return a minimal valid Truelist-like payload
+        return {"emails": self._emails}
 
-        def raise_for_status(self):
-            return None
 
-        def json(self):
-            # Return a minimal valid Truelist-like payload
-            return {"emails": []}
+@pytest.fixture
+def truelist_settings(monkeypatch):
+    monkeypatch.setattr(truelist_module.settings, "TRUELIST_API_KEY", "test-key")
+    monkeypatch.setattr(truelist_module.settings, "ENABLE_EMAIL_VERIFICATION_STORE", False)
 
-    class DummyClient:
-        def __init__(self):
-            self.timeout = 30.0
 
-        async def __aenter__(self):
-            return self
+@pytest.mark.asyncio
+async def test_truelist_verify_emails_chunks_by_51(monkeypatch, truelist_settings):
+    """TruelistService.verify_emails should chunk requests by 51 emails."""
 
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
+    calls: list[Dict] = []
 
+    class DummyClient:
         async def post(self, url, params=None, headers=None):
             calls.append({"url": url, "params": params, "headers": headers})
             return DummyResponse()
 
-    # Patch httpx.AsyncClient used inside TruelistService
-    monkeypatch.setattr(truelist_module.httpx, "AsyncClient", lambda timeout=30.0: DummyClient())
+    # Patch the shared httpx client used inside TruelistService
+    monkeypatch.setattr(TruelistService, "_get_http_client", lambda self: DummyClient())
 
     service = TruelistService()
 
@@ -52,3 +51,31 @@ async def test_truelist_verify_emails_chunks_by_51(monkeypatch):
     assert len(calls) == 2
     assert calls[0]["params"]["email"].count("@example.com") == 51
     assert calls[1]["params"]["email"].count("@example.com") == 51
+
+
+@pytest.mark.asyncio
+async def test_truelist_verify_emails_sends_chunks_concurrently(monkeypatch, truelist_settings):
+    """Chunks are in flight together (bounded by TRUELIST_MAX_CONCURRENT_CHUNKS) and merged."""
+    monkeypatch.setattr(truelist_module.settings, "TRUELIST_MAX_CONCURRENT_CHUNKS", 3)
+    in_flight = 0
+    peak = 0
+
+    class DummyClient:
+        async def post(self, url, params=None, headers=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return DummyResponse(
+                [{"address": email, "email_state": "ok"} for email in params["email"].split(" ")]
+            )
+
+    monkeypatch.setattr(TruelistService, "_get_http_client", lambda self: DummyClient())
+
+    emails = [f"user{i}@example.com" for i in range(51 * 5)]
+    results = await TruelistService().verify_emails(emails)
+
+    assert peak == 3
+    assert len(results) == len(emails)
+    assert all(item["mapped_status"] == "valid" for item in results.values())
@@ -0,0 +1,213 @@
+"""Adaptive (AIMD) concurrency limiting for third-party provider calls.
+
+Each external verification provider gets one process-wide limiter. The
+concurrency limit grows additively while calls are fast and succeed, and is
+cut multiplicatively when the provider signals overload (HTTP 429, 5xx or
+timeouts). A ``Retry-After`` header pauses new calls to that provider until
+the given time.
+
+Usage:
+    limiter = get_provider_limiter("truelist")
+    async with limiter:
+        response = await client.post(...)
+        response.raise_for_status()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.core.config import get_settings
+from app.utils.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+_OVERLOAD_STATUS_CODES = {429, 502, 503, 504}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds from now.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        Non-negative number of seconds, or None if the header is missing/invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveConcurrencyLimiter:
+    """Async context manager limiting concurrent calls with AIMD feedback."""
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: float,
+        min_limit: float,
+        max_limit: float,
+        latency_target: float,
+        decrease_factor: float = 0.5,
+    ) -> None:
+        self.name = name
+        self.min_limit = max(1.0, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self._limit = min(self.max_limit, max(self.min_limit, initial_limit))
+        self._in_flight = 0
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+        self._started: Dict[int, float] = {}
+        self._stats = {"calls": 0, "overloads": 0, "increases": 0, "decreases": 0}
+
+    @property
+    def limit(self) -> int:
+        """Current whole-number concurrency limit."""
+        return int(self._limit)
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self) -> None:
+        """Wait for a free slot and for any Retry-After pause to pass."""
+        condition = self._get_condition()
+        while True:
+            delay = self._blocked_until - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            async with condition:
+                await condition.wait_for(lambda: self._in_flight < self.limit)
+                # A Retry-After may have arrived while waiting for a slot
+                if self._blocked_until > time.monotonic():
+                    continue
+                self._in_flight += 1
+                return
+
+    async def release(
+        self,
+        latency: float,
+        overloaded: bool = False,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """
+        Return a slot and adjust the limit from the call outcome.
+
+        Args:
+            latency: Call duration in seconds
+            overloaded: Whether the provider signalled overload (429/5xx/timeout)
+            retry_after: Seconds the provider asked us to wait, if any
+        """
+        now = time.monotonic()
+        self._stats["calls"] += 1
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+
+        if overloaded:
+            self._stats["overloads"] += 1
+            # Decrease at most once per latency window so a burst of failures
+            # from calls that were already in flight counts as one signal
+            if now - self._last_decrease >= self.latency_target:
+                previous = self._limit
+                self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+                self._last_decrease = now
+                self._stats["decreases"] += 1
+                logger.warning(
+                    "Provider overloaded, reducing concurrency",
+                    extra={
+                        "context": {
+                            "provider": self.name,
+                            "previous_limit": round(previous, 2),
+                            "limit": round(self._limit, 2),
+                            "retry_after": retry_after,
+                        }
+                    }
+                )
+        elif latency <= self.latency_target and self._in_flight >= self.limit:
+            # Additive increase: roughly +1 per full window of healthy calls,
+            # and only while the current limit is actually being used
+            self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+            self._stats["increases"] += 1
+
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            condition.notify_all()
+
+    async def __aenter__(self) -> "AdaptiveConcurrencyLimiter":
+        await self.acquire()
+        self._started[id(asyncio.current_task())] = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        started = self._started.pop(id(asyncio.current_task()), time.monotonic())
+        latency = time.monotonic() - started
+        overloaded = False
+        retry_after: Optional[float] = None
+        if isinstance(exc, httpx.HTTPStatusError):
+            status_code = exc.response.status_code
+            overloaded = status_code in _OVERLOAD_STATUS_CODES or status_code >= 500
+            retry_after = parse_retry_after(exc.response.headers.get("Retry-After"))
+        elif isinstance(exc, httpx.TimeoutException):
+            overloaded = True
+        await self.release(latency, overloaded=overloaded, retry_after=retry_after)
+        return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return current limiter state for monitoring."""
+        return {
+            "provider": self.name,
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "blocked_for_seconds": max(0.0, round(self._blocked_until - time.monotonic(), 2)),
+            **self._stats,
+        }
+
+
+_provider_limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+
+
+def get_provider_limiter(provider: str) -> AdaptiveConcurrencyLimiter:
+    """Return the process-wide limiter for a provider, creating it on first use."""
+    limiter = _provider_limiters.get(provider)
+    if limiter is None:
+        limiter = AdaptiveConcurrencyLimiter(
+            name=provider,
+            initial_limit=settings.PROVIDER_CONCURRENCY_INITIAL,
+            min_limit=settings.PROVIDER_CONCURRENCY_MIN,
+            max_limit=settings.PROVIDER_CONCURRENCY_MAX,
+            latency_target=settings.PROVIDER_LATENCY_TARGET_SECONDS,
+            decrease_factor=settings.PROVIDER_CONCURRENCY_DECREASE_FACTOR,
+        )
+        _provider_limiters[provider] = limiter
+    return limiter
+
+
+def get_provider_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """Return stats for every provider limiter created so far."""
+    return {name: limiter.get_stats() for name, limiter in _provider_limiters.items()}
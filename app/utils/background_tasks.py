@@ -35,7 +35,7 @@ logger = get_logger(__name__)
 from fastapi.concurrency import run_in_threadpool
 
 from app.core.config import get_settings
-from app.db.session import get_db
+from app.db.session import get_background_db
 
 settings = get_settings()
 
@@ -81,6 +81,9 @@ _active_tasks_lock = asyncio.Lock()
 _task_stats: Dict[str, Dict[str, Any]] = {}
 _task_stats_lock = asyncio.Lock()
 
+# Coroutine functions run by wait_for_active_tasks after tasks finish (e.g. buffer drains)
+_shutdown_hooks: list[Callable[[], Any]] = []
+
 
 def initialize_task_limiting(max_concurrent: Optional[int] = None) -> None:
     """
@@ -410,6 +413,7 @@ def add_background_task_safe(
     *args,
     track_status: bool = False,
     cpu_bound: Optional[bool] = None,
+    start_delay: float = 0.0,
     **kwargs,
 ) -> Optional[str]:
     """
@@ -421,6 +425,8 @@ def add_background_task_safe(
         *args: Positional arguments for the function
         track_status: Whether to track task status (returns task_id if True)
         cpu_bound: Explicitly mark task as CPU-bound (None = auto-detect)
+        start_delay: Seconds to wait before competing for a task slot (used by
+            export admission control to spread load when the backlog is high)
         **kwargs: Keyword arguments for the function
         
     Returns:
@@ -440,6 +446,10 @@ def add_background_task_safe(
                 _task_store[task_id].started_at = start_time
                 _task_store[task_id].is_cpu_bound = is_cpu_bound
         
+        # Delayed start (does not hold a concurrency slot while waiting)
+        if start_delay > 0:
+            await asyncio.sleep(start_delay)
+        
         # Rate limiting
         if _task_semaphore:
             await _task_semaphore.acquire()
@@ -529,10 +539,24 @@ def add_background_task_safe(
     return task_id
 
 
+def register_shutdown_hook(hook: Callable[[], Any]) -> None:
+    """
+    Register a coroutine function to run during graceful shutdown.
+    
+    Hooks run after active background tasks finish, so work those tasks
+    buffered (e.g. queued activity records) is flushed too. Registering the
+    same hook twice has no effect.
+    """
+    if hook not in _shutdown_hooks:
+        _shutdown_hooks.append(hook)
+
+
 async def wait_for_active_tasks(timeout: Optional[float] = None) -> bool:
     """
     Wait for all active background tasks to complete (for graceful shutdown).
     
+    Registered shutdown hooks run afterwards, even when waiting timed out.
+    
     Args:
         timeout: Maximum time to wait in seconds.
                 If None, uses BACKGROUND_TASK_TIMEOUT from settings.
@@ -546,14 +570,23 @@ async def wait_for_active_tasks(timeout: Optional[float] = None) -> bool:
     async with _active_tasks_lock:
         tasks = list(_active_tasks)
     
-    if not tasks:
-        return True
+    completed = True
+    if tasks:
+        try:
+            await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=timeout)
+        except asyncio.TimeoutError:
+            completed = False
     
-    try:
-        await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=timeout)
-        return True
-    except asyncio.TimeoutError:
-        return False
+    for hook in list(_shutdown_hooks):
+        try:
+            await asyncio.wait_for(hook(), timeout=timeout)
+        except Exception as exc:
+            logger.warning(
+                "Shutdown hook failed",
+                extra={"context": {"hook": getattr(hook, "__qualname__", repr(hook)), "error": str(exc)}}
+            )
+    
+    return completed
 
 
 # Guidelines for when to use BackgroundTasks vs Celery
@@ -773,7 +806,8 @@ async def background_task_with_db_session(
     Args:
         task_func: Async function that takes a session as first argument
         *args: Additional arguments for task_func
-        db_session_factory: Function to get database session (defaults to get_db)
+        db_session_factory: Function to get database session (defaults to
+            get_background_db, so jobs do not take connections from the request pool)
         **kwargs: Keyword arguments for task_func
         
     Example:
@@ -790,7 +824,7 @@ async def background_task_with_db_session(
         )
     """
     if db_session_factory is None:
-        db_session_factory = get_db
+        db_session_factory = get_background_db
     
     # Get session from connection pool
     async for session in db_session_factory():
@@ -804,7 +838,7 @@ async def background_task_with_db_session(
         except Exception as exc:
             raise
         finally:
-            # Session is automatically closed by get_db context manager
+            # Session is automatically closed by the session generator's context manager
             pass
 
 
@@ -1,14 +1,22 @@
 """Utility functions for batch fetching related entities using Connectra.
 
 This module provides efficient batch lookup functions using Connectra API
-instead of direct PostgreSQL queries.
+instead of direct PostgreSQL queries. Repositories that already read contacts
+from PostgreSQL can hydrate them with ``fetch_contacts_with_relations``, which
+loads contact, contact metadata, company and company metadata in one joined
+query instead of a round trip per related entity.
 """
 
 from __future__ import annotations
 
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.clients.connectra_client import ConnectraClient
+from app.models.companies import Company, CompanyMetadata
+from app.models.contacts import Contact, ContactMetadata
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -283,3 +291,47 @@ async def fetch_contacts_and_metadata_by_uuids(
 
     return combined
 
+
+
+ContactRow = Tuple[Contact, Optional[ContactMetadata], Optional[Company], Optional[CompanyMetadata]]
+
+
+def select_contacts_with_relations() -> Select:
+    """
+    Build a query selecting contacts with their metadata, company and company metadata.
+    
+    Related entities are LEFT OUTER JOINed, so a contact without metadata or a
+    company still yields a row with None in those positions. Callers add their
+    own ``where`` criteria.
+    
+    Returns:
+        Select of (Contact, ContactMetadata, Company, CompanyMetadata)
+    """
+    return (
+        select(Contact, ContactMetadata, Company, CompanyMetadata)
+        .outerjoin(ContactMetadata, ContactMetadata.uuid == Contact.uuid)
+        .outerjoin(Company, Company.uuid == Contact.company_id)
+        .outerjoin(CompanyMetadata, CompanyMetadata.uuid == Company.uuid)
+    )
+
+
+async def fetch_contacts_with_relations(
+    session: AsyncSession,
+    *criteria: Any,
+) -> list[ContactRow]:
+    """
+    Fetch contacts matching criteria together with their related entities in one query.
+    
+    Args:
+        session: Database session
+        *criteria: WHERE criteria applied to the joined query (e.g. ``Contact.email.in_(emails)``)
+        
+    Returns:
+        List of (Contact, ContactMetadata, Company, CompanyMetadata) tuples; the
+        last three are None when missing
+    """
+    stmt = select_contacts_with_relations()
+    if criteria:
+        stmt = stmt.where(*criteria)
+    result = await session.execute(stmt)
+    return [tuple(row) for row in result.all()]
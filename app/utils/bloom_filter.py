@@ -0,0 +1,110 @@
+"""Bloom filters for cheap "definitely not present" membership checks.
+
+A Bloom filter answers ``item in filter`` with no false negatives and a
+configurable false positive rate, so callers can skip a database lookup when
+the filter says an item is absent and only query for possible positives.
+``ExpiringBloomFilter`` buckets items by their expiry time and drops a whole
+bucket once everything in it has expired, since items cannot be removed from
+a Bloom filter individually.
+"""
+
+import hashlib
+import math
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter using double hashing over one blake2b digest."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        """
+        Size the filter for ``capacity`` items at ``error_rate`` false positives.
+
+        Adding more than ``capacity`` items keeps the filter correct but raises
+        its false positive rate.
+        """
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item: str) -> List[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item: str) -> None:
+        """Add an item to the filter."""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+class ExpiringBloomFilter:
+    """
+    Bloom filters bucketed by item expiry.
+
+    Each item goes into the filter of the time bucket its ``expires_at`` falls
+    in, and is looked up with the same ``expires_at``, so a lookup checks a
+    single bucket. ``prune`` drops buckets whose items have all expired. Items
+    without an expiry share one bucket that is never dropped.
+    """
+
+    def __init__(self, bucket_seconds: int, capacity_per_bucket: int, error_rate: float = 0.001) -> None:
+        self.bucket_seconds = max(1, bucket_seconds)
+        self.capacity_per_bucket = capacity_per_bucket
+        self.error_rate = error_rate
+        self._buckets: Dict[Optional[int], BloomFilter] = {}
+
+    def _bucket_key(self, expires_at: Optional[datetime]) -> Optional[int]:
+        if expires_at is None:
+            return None
+        return int(_as_utc(expires_at).timestamp()) // self.bucket_seconds
+
+    def _bucket_expired(self, key: Optional[int], now: datetime) -> bool:
+        return key is not None and (key + 1) * self.bucket_seconds <= now.timestamp()
+
+    def add(self, item: str, expires_at: Optional[datetime] = None, now: Optional[datetime] = None) -> None:
+        """Add an item that stops mattering at ``expires_at`` (None: never)."""
+        key = self._bucket_key(expires_at)
+        if self._bucket_expired(key, now or datetime.now(timezone.utc)):
+            return
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = BloomFilter(self.capacity_per_bucket, self.error_rate)
+        bucket.add(item)
+
+    def might_contain(self, item: str, expires_at: Optional[datetime] = None) -> bool:
+        """Return False if the item was definitely not added with this expiry."""
+        bucket = self._buckets.get(self._bucket_key(expires_at))
+        return bucket is not None and item in bucket
+
+    def prune(self, now: Optional[datetime] = None) -> int:
+        """Drop buckets whose items have all expired; return how many were dropped."""
+        now = now or datetime.now(timezone.utc)
+        expired = [key for key in self._buckets if self._bucket_expired(key, now)]
+        for key in expired:
+            del self._buckets[key]
+        return len(expired)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return bucket count, item count and memory used by the bit arrays."""
+        return {
+            "buckets": len(self._buckets),
+            "items": sum(bucket.count for bucket in self._buckets.values()),
+            "over_capacity_buckets": sum(
+                1 for bucket in self._buckets.values() if bucket.count > bucket.capacity
+            ),
+            "memory_bytes": sum(len(bucket._bits) for bucket in self._buckets.values()),
+        }
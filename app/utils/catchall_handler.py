@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Optional, Tuple
 
 from app.schemas.email import EmailVerificationStatus
+from app.services.email_verification_store import EmailVerificationStore
 from app.services.icypeas_service import IcyPeasService
 from app.utils.logger import get_logger
 
@@ -32,6 +33,13 @@ async def handle_catchall_email(
         - If IcyPeas succeeds: (icypeas_email, VALID, certainty)
         - If IcyPeas fails: (catchall_email, CATCHALL, None)
     """
+    store = EmailVerificationStore()
+
+    # A catchall address already confirmed valid needs no paid IcyPeas lookup
+    stored = await store.lookup(catchall_email)
+    if stored and stored["status"] == EmailVerificationStatus.VALID.value:
+        return catchall_email, EmailVerificationStatus.VALID, None
+
     # Fast path: if IcyPeas not configured, just return original catchall
     try:
         service = IcyPeasService()
@@ -55,6 +63,7 @@ async def handle_catchall_email(
 
     email = result.get("email") or catchall_email
     certainty = result.get("certainty")
+    await store.store(email, EmailVerificationStatus.VALID.value, provider="icypeas")
 
     # Consider any certainty value as acceptable (ultra_sure, sure, probable)
     return email, EmailVerificationStatus.VALID, certainty
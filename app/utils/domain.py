@@ -48,7 +48,7 @@ def extract_domain_from_url(url: str | None) -> str | None:
         parsed = urlparse(url)
         
         # Get domain from netloc (hostname) or path if netloc is empty
-        domain = parsed.netloc or parsed.path.split("/")[0]
+        domain = (parsed.netloc or parsed.path.split("/")[0]).lower()
         
         # Remove port if present
         if ":" in domain:
@@ -58,9 +58,7 @@ def extract_domain_from_url(url: str | None) -> str | None:
         if domain.startswith("www."):
             domain = domain[4:]
         
-        # Return lowercase normalized domain
-        normalized = domain.lower() if domain else None
-        return normalized
+        return domain or None
     except Exception as e:
         # If parsing fails, try to extract domain from the original string
         # Remove common prefixes
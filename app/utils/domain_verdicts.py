@@ -0,0 +1,108 @@
+"""Domain-level catch-all classification cache.
+
+A catch-all mail server accepts every address, so once a domain is known to be
+catch-all, verifying more candidates for it only spends credits to get the same
+CATCHALL answer. Verdicts are learned from provider verification results (not
+local precheck rejections) and kept in an in-process LRU with a TTL:
+
+- ``catch_all``: a provider reported a candidate on the domain as catch-all.
+  Only expiry clears it; a later INVALID does not downgrade it.
+- ``normal``: a provider rejected a candidate, so individual checks are meaningful
+
+Several valid permutations for one person are not treated as catch-all:
+providers commonly accept aliases such as first.last and flast on normal domains.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from app.core.config import get_settings
+from app.schemas.email import EmailVerificationStatus
+from app.utils.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+DOMAIN_CATCH_ALL = "catch_all"
+DOMAIN_NORMAL = "normal"
+
+# domain -> (verdict, expires_at epoch seconds)
+_domain_verdicts: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+
+
+def _domain_of(email: str) -> str:
+    return (email or "").strip().lower().rpartition("@")[2]
+
+
+def clear_domain_verdicts() -> None:
+    """Drop all cached domain verdicts."""
+    _domain_verdicts.clear()
+
+
+def get_domain_verdict(domain: Optional[str]) -> Optional[str]:
+    """Return the unexpired verdict for a domain, or None if unknown."""
+    domain = (domain or "").strip().lower()
+    entry = _domain_verdicts.get(domain)
+    if entry is None:
+        return None
+    verdict, expires_at = entry
+    if expires_at <= time.time():
+        del _domain_verdicts[domain]
+        return None
+    _domain_verdicts.move_to_end(domain)
+    return verdict
+
+
+def is_catchall_domain(domain: Optional[str]) -> bool:
+    """Return True when the domain is known to accept every address."""
+    if not settings.ENABLE_DOMAIN_VERDICT_CACHE:
+        return False
+    return get_domain_verdict(domain) == DOMAIN_CATCH_ALL
+
+
+def set_domain_verdict(domain: str, verdict: str) -> None:
+    """Record a verdict for a domain, replacing any previous one."""
+    domain = (domain or "").strip().lower()
+    if not domain:
+        return
+    previous = _domain_verdicts.get(domain)
+    _domain_verdicts[domain] = (verdict, time.time() + settings.DOMAIN_VERDICT_TTL_SECONDS)
+    _domain_verdicts.move_to_end(domain)
+    while len(_domain_verdicts) > settings.DOMAIN_VERDICT_CACHE_SIZE:
+        _domain_verdicts.popitem(last=False)
+    if previous is None or previous[0] != verdict:
+        logger.info(
+            "Domain verdict updated",
+            extra={"context": {"domain": domain, "verdict": verdict}}
+        )
+
+
+def record_verification_results(statuses: Dict[str, str]) -> None:
+    """
+    Update domain verdicts from provider results.
+
+    Args:
+        statuses: Mapping of email -> mapped status (valid, invalid, catchall, unknown)
+            as returned by a verification provider. Do not pass precheck rejections:
+            a local INVALID (bad syntax, no MX) says nothing about how the mail
+            server treats unknown recipients.
+    """
+    if not settings.ENABLE_DOMAIN_VERDICT_CACHE or not statuses:
+        return
+
+    by_domain: Dict[str, list[str]] = {}
+    for email, status_value in statuses.items():
+        domain = _domain_of(email)
+        if domain:
+            by_domain.setdefault(domain, []).append(str(getattr(status_value, "value", status_value)))
+
+    for domain, values in by_domain.items():
+        if EmailVerificationStatus.CATCHALL.value in values:
+            set_domain_verdict(domain, DOMAIN_CATCH_ALL)
+        elif EmailVerificationStatus.INVALID.value in values:
+            # A catch-all verdict stands until it expires
+            if get_domain_verdict(domain) != DOMAIN_CATCH_ALL:
+                set_domain_verdict(domain, DOMAIN_NORMAL)
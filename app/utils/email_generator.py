@@ -1,11 +1,77 @@
 """Utility functions for generating email combinations using probability-based formats."""
 
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
 
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Named formats used to rank candidates by learned per-domain statistics.
+# Names match the pattern_format values stored in the email_patterns table.
+PATTERN_FORMATS: Dict[str, Callable[[Dict[str, str]], str]] = {
+    "first.last": lambda v: f"{v['fn']}.{v['ln']}",
+    "firstlast": lambda v: f"{v['fn']}{v['ln']}",
+    "first": lambda v: v['fn'],
+    "f.last": lambda v: f"{v['f_initial']}.{v['ln']}",
+    "flast": lambda v: f"{v['f_initial']}{v['ln']}",
+    "first.l": lambda v: f"{v['fn']}.{v['l_initial']}",
+    "first_last": lambda v: f"{v['fn']}_{v['ln']}",
+    "first_l": lambda v: f"{v['fn']}_{v['l_initial']}",
+    "first-last": lambda v: f"{v['fn']}-{v['ln']}",
+    "first-l": lambda v: f"{v['fn']}-{v['l_initial']}",
+    "f.l": lambda v: f"{v['f_initial']}.{v['l_initial']}",
+    "fl": lambda v: f"{v['f_initial']}{v['l_initial']}",
+    "last.first": lambda v: f"{v['ln']}.{v['fn']}",
+    "lastfirst": lambda v: f"{v['ln']}{v['fn']}",
+    "last.f": lambda v: f"{v['ln']}.{v['f_initial']}",
+    "l.first": lambda v: f"{v['l_initial']}.{v['fn']}",
+    "l.f": lambda v: f"{v['l_initial']}.{v['f_initial']}",
+    "firstl": lambda v: f"{v['fn']}{v['l_initial']}",
+    "last_first": lambda v: f"{v['ln']}_{v['fn']}",
+    "last-first": lambda v: f"{v['ln']}-{v['fn']}",
+    "f_last": lambda v: f"{v['f_initial']}_{v['ln']}",
+}
+
+
+def normalize_pattern_format(pattern_format: Optional[str]) -> str:
+    """
+    Normalize a stored pattern format to a PATTERN_FORMATS key.
+
+    Accepts placeholder styles such as "{first}.{last}" or "{first_initial}{last}".
+    """
+    value = (pattern_format or "").strip().lower()
+    value = value.split("@", 1)[0]
+    for placeholder, short in (
+        ("first_initial", "f"),
+        ("last_initial", "l"),
+        ("firstname", "first"),
+        ("lastname", "last"),
+    ):
+        value = value.replace(placeholder, short)
+    return value.replace("{", "").replace("}", "").replace(" ", "")
+
+
+def detect_pattern_format(email: str, first_name: str, last_name: str) -> Optional[str]:
+    """
+    Return the named format an email's local part follows for the given name.
+
+    Args:
+        email: Email address (any case)
+        first_name: Contact first name
+        last_name: Contact last name
+
+    Returns:
+        PATTERN_FORMATS key, or None if the local part matches no named format
+    """
+    local_part = (email or "").strip().lower().split("@", 1)[0]
+    vars = _get_name_variations(first_name or "", last_name or "")
+    if not local_part or not vars['fn'] or not vars['ln']:
+        return None
+    for format_name, build in PATTERN_FORMATS.items():
+        if build(vars) == local_part:
+            return format_name
+    return None
+
 
 def _get_name_variations(first_name: str, last_name: str) -> Dict[str, str]:
     """
@@ -197,8 +263,30 @@ def _generate_tier3_patterns(vars: Dict[str, str]) -> List[str]:
     return unique_patterns
 
 
+def _rank_patterns(
+    patterns: List[str],
+    vars: Dict[str, str],
+    pattern_weights: Dict[str, float],
+) -> List[str]:
+    """Stable-sort patterns so formats with a higher learned weight come first."""
+    weight_by_pattern: Dict[str, float] = {}
+    for format_name, weight in pattern_weights.items():
+        build = PATTERN_FORMATS.get(normalize_pattern_format(format_name))
+        if build is None or weight <= 0:
+            continue
+        local_part = build(vars)
+        weight_by_pattern[local_part] = max(weight_by_pattern.get(local_part, 0), weight)
+    if not weight_by_pattern:
+        return patterns
+    return sorted(patterns, key=lambda pattern: -weight_by_pattern.get(pattern, 0))
+
+
 def generate_email_combinations(
-    first_name: str, last_name: str, domain: str, count: int = 1000
+    first_name: str,
+    last_name: str,
+    domain: str,
+    count: int = 1000,
+    pattern_weights: Optional[Dict[str, float]] = None,
 ) -> List[str]:
     """
     Generate email combinations using probability-based format patterns.
@@ -214,6 +302,9 @@ def generate_email_combinations(
         last_name: Contact last name (will be lowercased)
         domain: Email domain (e.g., "example.com")
         count: Number of unique emails to generate (default: 1000)
+        pattern_weights: Optional learned format frequencies for the domain
+            (pattern_format -> count). Matching formats are moved to the front,
+            highest weight first; the tier order is kept for everything else.
         
     Returns:
         List of unique email addresses in probability order (most common first)
@@ -240,6 +331,8 @@ def generate_email_combinations(
     
     # Combine all patterns in priority order
     all_patterns = tier1_patterns + tier2_patterns + tier3_patterns
+    if pattern_weights:
+        all_patterns = _rank_patterns(all_patterns, vars, pattern_weights)
     
     # Generate emails from patterns
     emails = []
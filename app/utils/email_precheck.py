@@ -0,0 +1,200 @@
+"""Free deliverability precheck run before paid email verification.
+
+Addresses that fail basic syntax rules, or whose domain has no mail host (no MX
+record and no A record fallback), cannot receive mail, so they are marked
+invalid without spending a provider credit. MX lookups go through a pluggable
+async resolver and are cached per domain: positive answers for
+EMAIL_PRECHECK_MX_TTL seconds and "no mail host" answers (negative caching) for
+EMAIL_PRECHECK_NEGATIVE_TTL seconds. Resolver errors never reject an address.
+
+Tests can swap in a ``StubMXResolver`` via ``set_mx_resolver``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Protocol, Tuple
+
+from app.core.config import get_settings
+from app.utils.domain import extract_domain_from_url
+from app.utils.logger import get_logger
+
+try:
+    import dns.asyncresolver
+    import dns.exception
+    import dns.resolver
+    DNS_AVAILABLE = True
+except ImportError:
+    DNS_AVAILABLE = False
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+PRECHECK_INVALID_SYNTAX = "invalid_syntax"
+PRECHECK_NO_MX = "no_mx"
+
+_LOCAL_PART_RE = re.compile(r"^[a-z0-9!#$%&'*+/=?^_`{|}~-]+(\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*$")
+_DOMAIN_LABEL_RE = re.compile(r"^[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?$")
+# Alphabetic TLDs, or punycode-encoded IDN TLDs such as xn--p1ai
+_TLD_RE = re.compile(r"^([a-z]+|xn--[a-z0-9-]+)$")
+
+
+class MXResolver(Protocol):
+    """Async resolver deciding whether a domain can receive mail."""
+
+    async def has_mail_host(self, domain: str) -> Optional[bool]:
+        """Return True/False when known, or None if the lookup failed."""
+        ...
+
+
+class DnsMXResolver:
+    """Resolver backed by dnspython; falls back to the A record per RFC 5321."""
+
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+
+    async def has_mail_host(self, domain: str) -> Optional[bool]:
+        if not DNS_AVAILABLE:
+            return None
+        resolver = dns.asyncresolver.Resolver()
+        resolver.lifetime = self.timeout
+        try:
+            answer = await resolver.resolve(domain, "MX")
+            return any(str(record.exchange).rstrip(".") for record in answer)
+        except dns.resolver.NXDOMAIN:
+            return False
+        except dns.resolver.NoAnswer:
+            pass
+        except (dns.exception.DNSException, OSError):
+            return None
+        try:
+            await resolver.resolve(domain, "A")
+            return True
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            return False
+        except (dns.exception.DNSException, OSError):
+            return None
+
+
+class StubMXResolver:
+    """In-memory resolver for tests: domain -> has mail host."""
+
+    def __init__(self, answers: Optional[Dict[str, Optional[bool]]] = None, default: Optional[bool] = True) -> None:
+        self.answers = {domain.lower(): value for domain, value in (answers or {}).items()}
+        self.default = default
+        self.lookups: List[str] = []
+
+    async def has_mail_host(self, domain: str) -> Optional[bool]:
+        self.lookups.append(domain)
+        return self.answers.get(domain, self.default)
+
+
+_resolver: Optional[MXResolver] = None
+
+# domain -> (has_mail_host, expires_at epoch seconds)
+_mx_cache: OrderedDict[str, Tuple[bool, float]] = OrderedDict()
+
+
+def set_mx_resolver(resolver: Optional[MXResolver]) -> None:
+    """Replace the MX resolver (None restores the DNS resolver) and clear the cache."""
+    global _resolver
+    _resolver = resolver
+    _mx_cache.clear()
+
+
+def get_mx_resolver() -> MXResolver:
+    """Return the active MX resolver."""
+    global _resolver
+    if _resolver is None:
+        _resolver = DnsMXResolver(timeout=settings.EMAIL_PRECHECK_DNS_TIMEOUT)
+    return _resolver
+
+
+def is_valid_email_syntax(email: str) -> bool:
+    """Check an address against practical RFC 5321/5322 syntax rules."""
+    email = (email or "").strip().lower()
+    local_part, sep, domain = email.rpartition("@")
+    if not sep or not local_part or not domain:
+        return False
+    if len(local_part) > 64 or len(email) > 254:
+        return False
+    if not _LOCAL_PART_RE.match(local_part):
+        return False
+    labels = domain.split(".")
+    if len(labels) < 2 or not _TLD_RE.match(labels[-1]):
+        return False
+    return all(_DOMAIN_LABEL_RE.match(label) for label in labels)
+
+
+async def domain_has_mail_host(domain: str) -> bool:
+    """
+    Return False only when the domain is known to have no mail host.
+
+    Results are cached; resolver failures are treated as deliverable and not cached.
+    """
+    domain = extract_domain_from_url(domain) or ""
+    if not domain:
+        return False
+
+    entry = _mx_cache.get(domain)
+    if entry is not None:
+        if entry[1] > time.time():
+            _mx_cache.move_to_end(domain)
+            return entry[0]
+        del _mx_cache[domain]
+
+    has_mail_host = await get_mx_resolver().has_mail_host(domain)
+    if has_mail_host is None:
+        return True
+
+    ttl = settings.EMAIL_PRECHECK_MX_TTL if has_mail_host else settings.EMAIL_PRECHECK_NEGATIVE_TTL
+    _mx_cache[domain] = (has_mail_host, time.time() + ttl)
+    _mx_cache.move_to_end(domain)
+    while len(_mx_cache) > settings.EMAIL_PRECHECK_CACHE_SIZE:
+        _mx_cache.popitem(last=False)
+    return has_mail_host
+
+
+async def precheck_emails(emails: Iterable[str]) -> Dict[str, str]:
+    """
+    Find addresses that cannot be delivered.
+
+    Args:
+        emails: Email addresses (any case)
+
+    Returns:
+        Mapping of lowercased email -> reason (PRECHECK_INVALID_SYNTAX or
+        PRECHECK_NO_MX) for undeliverable addresses only. Empty when the
+        precheck is disabled.
+    """
+    if not settings.ENABLE_EMAIL_PRECHECK:
+        return {}
+
+    rejected: Dict[str, str] = {}
+    by_domain: Dict[str, List[str]] = {}
+    for email in emails:
+        key = (email or "").strip().lower()
+        if not key or key in rejected:
+            continue
+        if not is_valid_email_syntax(key):
+            rejected[key] = PRECHECK_INVALID_SYNTAX
+            continue
+        by_domain.setdefault(key.rpartition("@")[2], []).append(key)
+
+    if by_domain:
+        domains = list(by_domain)
+        answers = await asyncio.gather(*(domain_has_mail_host(domain) for domain in domains))
+        for domain, has_mail_host in zip(domains, answers):
+            if not has_mail_host:
+                for key in by_domain[domain]:
+                    rejected[key] = PRECHECK_NO_MX
+
+    if rejected:
+        logger.debug(
+            "Email precheck rejected addresses",
+            extra={"context": {"rejected": len(rejected)}}
+        )
+    return rejected
@@ -151,3 +151,51 @@ def normalize_list_param(param_value: Optional[list[str]]) -> Optional[list[str]
     
     return normalized if normalized else None
 
+
+
+def normalize_person_key(
+    first_name: Optional[str],
+    last_name: Optional[str],
+    domain: Optional[str],
+) -> tuple[str, str, str]:
+    """
+    Build a case- and whitespace-insensitive key identifying a person at a domain.
+    
+    Used to deduplicate repeated (first_name, last_name, domain) rows inside
+    email export and verification jobs so each person is only looked up once.
+    
+    Args:
+        first_name: Person first name
+        last_name: Person last name
+        domain: Company domain (already extracted from any URL)
+        
+    Returns:
+        Tuple of (first_name, last_name, domain) lowercased with collapsed whitespace
+    """
+    def _part(value: Optional[str]) -> str:
+        return " ".join((value or "").split()).lower()
+
+    normalized_domain = _part(domain)
+    if normalized_domain.startswith("www."):
+        normalized_domain = normalized_domain[4:]
+    return _part(first_name), _part(last_name), normalized_domain
+
+
+def dedupe_emails(emails: Iterable[Optional[str]]) -> list[str]:
+    """
+    Return unique lowercased, trimmed emails preserving first-seen order.
+    
+    Args:
+        emails: Email addresses, possibly repeated or differing only in case
+        
+    Returns:
+        List of unique normalized email addresses (empty values dropped)
+    """
+    seen: set[str] = set()
+    unique: list[str] = []
+    for email in emails:
+        normalized = (email or "").strip().lower()
+        if normalized and normalized not in seen:
+            seen.add(normalized)
+            unique.append(normalized)
+    return unique
@@ -15,13 +15,13 @@ in the future, they can be re-implemented based on actual requirements.
 
 from __future__ import annotations
 
-from typing import AsyncIterator, Generic, Sequence, TypeVar
+from typing import AsyncIterator, Generic, Optional, Sequence, TypeVar
 
-from sqlalchemy import Select
-from sqlalchemy.engine import Result
+from sqlalchemy import ColumnElement, Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.utils.logger import get_logger
+from app.utils.streaming_queries import stream_query_results
 
 logger = get_logger(__name__)
 
@@ -36,6 +36,8 @@ class QueryBatcher(Generic[T]):
         session: AsyncSession,
         query: Select,
         batch_size: int = 1000,
+        mode: Optional[str] = None,
+        keyset_columns: Optional[Sequence[ColumnElement]] = None,
     ):
         """
         Initialize a query batcher.
@@ -44,10 +46,15 @@ class QueryBatcher(Generic[T]):
             session: Async database session
             query: SQLAlchemy select query
             batch_size: Number of rows to fetch per batch
+            mode: "keyset", "cursor" or "offset"; None picks keyset paging for
+                unordered queries and a server-side cursor for ordered ones
+            keyset_columns: Unique ascending sort to page by (defaults to the primary key)
         """
         self.session = session
         self.query = query
         self.batch_size = batch_size
+        self.mode = mode
+        self.keyset_columns = keyset_columns
 
     async def fetch_all_batches(self) -> AsyncIterator[Sequence[T]]:
         """
@@ -56,21 +63,14 @@ class QueryBatcher(Generic[T]):
         Yields:
             Sequences of results for each batch
         """
-        offset = 0
-        while True:
-            batch_query = self.query.offset(offset).limit(self.batch_size)
-            result: Result = await self.session.execute(batch_query)
-            batch = result.fetchall()
-            
-            if not batch:
-                break
-            
+        async for batch in stream_query_results(
+            self.session,
+            self.query,
+            batch_size=self.batch_size,
+            mode=self.mode,
+            keyset_columns=self.keyset_columns,
+        ):
             yield batch
-            
-            if len(batch) < self.batch_size:
-                break
-            
-            offset += self.batch_size
 
     async def fetch_all(self) -> list[T]:
         """
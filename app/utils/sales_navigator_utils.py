@@ -165,6 +165,38 @@ def convert_sales_nav_url_to_linkedin(profile_url: Optional[str]) -> str:
     return PLACEHOLDER_VALUE
 
 
+def canonical_linkedin_key(url: Optional[str]) -> Optional[str]:
+    """
+    Build the canonical lookup key for a LinkedIn URL.
+    
+    Sales Navigator URLs are converted with ``convert_sales_nav_url_to_linkedin``
+    first (and keyed as-is when they cannot be converted). The key is lowercase,
+    without scheme, ``www.``, query string, fragment or trailing slash, so
+    "https://www.linkedin.com/in/Jane-Doe/?trk=x" becomes "linkedin.com/in/jane-doe".
+    
+    Args:
+        url: LinkedIn profile, company or Sales Navigator URL
+        
+    Returns:
+        Canonical key, or None for empty and placeholder values
+    """
+    url = (url or "").strip()
+    if not url or url == PLACEHOLDER_VALUE:
+        return None
+    
+    if "/sales/" in url:
+        converted = convert_sales_nav_url_to_linkedin(url)
+        if converted != PLACEHOLDER_VALUE:
+            url = converted
+    
+    key = url.lower()
+    key = re.sub(r"^[a-z]+://", "", key)
+    key = key.split("?", 1)[0].split("#", 1)[0].rstrip("/")
+    if key.startswith("www."):
+        key = key[4:]
+    return key or None
+
+
 def generate_contact_uuid(linkedin_url: str, email: Optional[str] = None) -> str:
     """
     Generate deterministic UUID5 for contact.
@@ -2,7 +2,9 @@
 
 This module provides utilities for streaming large database result sets
 without loading everything into memory at once. This is essential for
-handling big data efficiently.
+handling big data efficiently. Unordered queries are paged by keyset on the
+primary key and ordered queries through a server-side cursor, so streaming
+N rows never costs O(N²) like offset paging does.
 
 Usage:
     from app.utils.streaming_queries import stream_query_results
@@ -17,10 +19,12 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import AsyncIterator
-from typing import Generic, Optional, Sequence, TypeVar
+from typing import Any, Generic, Optional, Sequence, TypeVar
 
-from sqlalchemy import Select
+from sqlalchemy import ColumnElement, Select, tuple_
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.engine import Result
+from sqlalchemy.exc import NoInspectionAvailable
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
@@ -32,17 +36,208 @@ settings = get_settings()
 T = TypeVar("T")
 
 
+STREAM_MODE_KEYSET = "keyset"
+STREAM_MODE_CURSOR = "cursor"
+STREAM_MODE_OFFSET = "offset"
+
+_MAX_CONSECUTIVE_ERRORS = 3
+
+
+def _is_ordered(query: Select) -> bool:
+    return bool(query._order_by_clauses)
+
+
+def _primary_key_columns(query: Select) -> Optional[list[ColumnElement]]:
+    """Return the primary key of the single mapped entity a query reads, if usable."""
+    descriptions = query.column_descriptions
+    entities = {d["entity"] for d in descriptions if d.get("entity") is not None}
+    if len(entities) != 1:
+        return None
+    entity = next(iter(entities))
+    try:
+        primary_key = list(sa_inspect(entity).primary_key)
+    except NoInspectionAvailable:
+        return None
+    if not primary_key:
+        return None
+    if any(d.get("expr") is entity for d in descriptions):
+        return primary_key
+    # Column selects must include the key so rows can be continued from
+    for column in primary_key:
+        if not any(selected.compare(column) for selected in query.selected_columns):
+            return None
+    return primary_key
+
+
+def _keyset_values(row: Any, columns: Sequence[ColumnElement]) -> tuple:
+    values = []
+    for column in columns:
+        try:
+            values.append(row._mapping[column])
+            continue
+        except (KeyError, AttributeError):
+            pass
+        for item in row:
+            mapper = getattr(sa_inspect(item, raiseerr=False), "mapper", None)
+            if mapper is not None:
+                values.append(getattr(item, mapper.get_property_by_column(column).key))
+                break
+        else:
+            raise ValueError(f"Keyset column {column} is not available in the result rows")
+    return tuple(values)
+
+
+def resolve_stream_mode(
+    query: Select,
+    mode: Optional[str] = None,
+    keyset_columns: Optional[Sequence[ColumnElement]] = None,
+) -> tuple[str, Optional[list[ColumnElement]]]:
+    """
+    Decide how a query is streamed.
+    
+    Unordered queries are paged by keyset on the entity's primary key (the
+    order is then free to choose); ordered queries use a server-side cursor so
+    their ORDER BY is preserved, unless a unique ``keyset_columns`` sort is
+    supplied. Queries without a usable primary key fall back to the cursor.
+    
+    Returns:
+        Tuple of (mode, keyset columns or None)
+    """
+    if mode not in (None, STREAM_MODE_KEYSET, STREAM_MODE_CURSOR, STREAM_MODE_OFFSET):
+        raise ValueError(f"Unknown stream mode: {mode}")
+    if mode in (STREAM_MODE_CURSOR, STREAM_MODE_OFFSET):
+        return mode, None
+    
+    columns = list(keyset_columns) if keyset_columns else None
+    if columns is None and (mode == STREAM_MODE_KEYSET or not _is_ordered(query)):
+        columns = _primary_key_columns(query)
+    if columns:
+        return STREAM_MODE_KEYSET, columns
+    if mode == STREAM_MODE_KEYSET:
+        raise ValueError("Keyset streaming needs keyset_columns or a single-entity query with its primary key")
+    return STREAM_MODE_CURSOR, None
+
+
+async def _stream_batches(
+    session: AsyncSession,
+    query: Select,
+    batch_size: Optional[int],
+    max_results: Optional[int],
+    mode: Optional[str],
+    keyset_columns: Optional[Sequence[ColumnElement]],
+    scalars: bool,
+) -> AsyncIterator[Sequence[Any]]:
+    if batch_size is None:
+        batch_size = settings.STREAMING_BATCH_SIZE
+    
+    # Validate batch_size
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be > 0, got {batch_size}")
+    
+    mode, columns = resolve_stream_mode(query, mode, keyset_columns)
+    
+    if mode == STREAM_MODE_CURSOR:
+        # One server-side cursor; rows are fetched yield_per at a time
+        stream_query = query.execution_options(yield_per=batch_size)
+        if scalars:
+            result = await session.stream_scalars(stream_query)
+        else:
+            result = await session.stream(stream_query)
+        total_fetched = 0
+        try:
+            async for batch in result.partitions(batch_size):
+                if max_results is not None:
+                    batch = batch[:max_results - total_fetched]
+                total_fetched += len(batch)
+                yield batch
+                if max_results is not None and total_fetched >= max_results:
+                    break
+        finally:
+            await result.close()
+        return
+    
+    if mode == STREAM_MODE_KEYSET:
+        base_query = query.order_by(None).order_by(*columns)
+    
+    offset = 0
+    last_key: Optional[tuple] = None
+    total_fetched = 0
+    consecutive_errors = 0
+    
+    while True:
+        limit = batch_size
+        if max_results is not None:
+            limit = min(batch_size, max_results - total_fetched)
+        
+        if mode == STREAM_MODE_KEYSET:
+            batch_query = base_query
+            if last_key is not None:
+                if len(columns) == 1:
+                    batch_query = batch_query.where(columns[0] > last_key[0])
+                else:
+                    batch_query = batch_query.where(tuple_(*columns) > tuple_(*last_key))
+            batch_query = batch_query.limit(limit)
+        else:
+            batch_query = query.offset(offset).limit(limit)
+        
+        try:
+            result: Result = await session.execute(batch_query)
+            if scalars and mode == STREAM_MODE_OFFSET:
+                batch = result.scalars().all()
+            else:
+                batch = result.fetchall()
+            consecutive_errors = 0  # Reset error counter on success
+        except Exception:
+            consecutive_errors += 1
+            
+            # If too many consecutive errors, give up
+            if consecutive_errors >= _MAX_CONSECUTIVE_ERRORS:
+                raise
+            
+            # Wait a bit before retrying (exponential backoff)
+            await asyncio.sleep(0.1 * (2 ** (consecutive_errors - 1)))
+            continue  # Retry the same batch
+        
+        if not batch:
+            break
+        
+        if mode == STREAM_MODE_KEYSET:
+            last_key = _keyset_values(batch[-1], columns)
+            if scalars:
+                batch = [row[0] for row in batch]
+        
+        yield batch
+        
+        total_fetched += len(batch)
+        
+        # Check max results limit
+        if max_results is not None and total_fetched >= max_results:
+            break
+        
+        # If we got fewer results than requested, we've reached the end
+        if len(batch) < limit:
+            break
+        
+        offset += len(batch)
+
+
 async def stream_query_results(
     session: AsyncSession,
     query: Select,
     batch_size: Optional[int] = None,
     max_results: Optional[int] = None,
+    mode: Optional[str] = None,
+    keyset_columns: Optional[Sequence[ColumnElement]] = None,
 ) -> AsyncIterator[Sequence[T]]:
     """
     Stream query results in batches to avoid loading everything into memory.
     
-    Uses efficient offset/limit pagination with configurable batch sizes.
-    Optimized for large datasets with proper memory management and error handling.
+    Three modes are available (see ``resolve_stream_mode`` for the automatic choice):
+    - keyset: ordered by a unique key and continued with ``WHERE key > last``, so
+      every batch is an index range scan instead of re-reading skipped rows
+    - cursor: a single server-side cursor (``AsyncSession.stream`` with yield_per)
+      that preserves any ORDER BY
+    - offset: legacy offset/limit paging, O(N²/batch) on large tables
     
     Best practices:
     - Use batch_size between 500-5000 for optimal performance
@@ -55,6 +250,9 @@ async def stream_query_results(
         query: SQLAlchemy Select query
         batch_size: Number of rows to fetch per batch (defaults to STREAMING_BATCH_SIZE)
         max_results: Maximum total results to stream (None = unlimited)
+        mode: "keyset", "cursor" or "offset"; None picks keyset for unordered
+            queries and cursor for ordered ones
+        keyset_columns: Unique ascending sort to page by (defaults to the primary key)
         
     Yields:
         Sequences of results for each batch
@@ -67,66 +265,10 @@ async def stream_query_results(
             for contact in batch:
                 process_contact(contact)
     """
-    if batch_size is None:
-        batch_size = settings.STREAMING_BATCH_SIZE
-    
-    # Validate batch_size
-    if batch_size <= 0:
-        raise ValueError(f"batch_size must be > 0, got {batch_size}")
-    
-    offset = 0
-    total_fetched = 0
-    consecutive_errors = 0
-    max_consecutive_errors = 3
-    
-    try:
-        while True:
-            # Apply limit and offset to query
-            batch_query = query.offset(offset).limit(batch_size)
-            
-            try:
-                result: Result = await session.execute(batch_query)
-                batch = result.fetchall()
-                consecutive_errors = 0  # Reset error counter on success
-            except Exception as exc:
-                consecutive_errors += 1
-                
-                # If too many consecutive errors, give up
-                if consecutive_errors >= max_consecutive_errors:
-                    raise
-                
-                # Wait a bit before retrying (exponential backoff)
-                await asyncio.sleep(0.1 * (2 ** (consecutive_errors - 1)))
-                continue  # Retry the same batch
-            
-            if not batch:
-                break
-            
-            try:
-                yield batch
-            except GeneratorExit:
-                # Consumer stopped iterating - cleanup and exit
-                break
-            except Exception as exc:
-                # Error in consumer - continue to next batch
-                pass
-            
-            total_fetched += len(batch)
-            
-            # Check max results limit
-            if max_results is not None and total_fetched >= max_results:
-                break
-            
-            # If we got fewer results than requested, we've reached the end
-            if len(batch) < batch_size:
-                break
-            
-            offset += batch_size
-            
-    except Exception as exc:
-        raise
-    finally:
-        pass
+    async for batch in _stream_batches(
+        session, query, batch_size, max_results, mode, keyset_columns, scalars=False
+    ):
+        yield batch
 
 
 async def stream_query_scalars(
@@ -134,18 +276,22 @@ async def stream_query_scalars(
     query: Select,
     batch_size: Optional[int] = None,
     max_results: Optional[int] = None,
+    mode: Optional[str] = None,
+    keyset_columns: Optional[Sequence[ColumnElement]] = None,
 ) -> AsyncIterator[list[T]]:
     """
     Stream query results as scalars (single values) in batches.
     
     Optimized for memory efficiency when only scalar values are needed.
-    Uses the same error handling and retry logic as stream_query_results.
+    Uses the same modes and retry logic as stream_query_results.
     
     Args:
         session: Async database session
         query: SQLAlchemy Select query that returns scalar values
         batch_size: Number of rows to fetch per batch (defaults to STREAMING_BATCH_SIZE)
         max_results: Maximum total results to stream (None = unlimited)
+        mode: "keyset", "cursor" or "offset" (None = automatic)
+        keyset_columns: Unique ascending sort to page by (defaults to the primary key)
         
     Yields:
         Lists of scalar results for each batch
@@ -158,60 +304,10 @@ async def stream_query_scalars(
             for contact_id in batch:
                 process_id(contact_id)
     """
-    if batch_size is None:
-        batch_size = settings.STREAMING_BATCH_SIZE
-    
-    offset = 0
-    total_fetched = 0
-    
-    # Validate batch_size
-    if batch_size <= 0:
-        raise ValueError(f"batch_size must be > 0, got {batch_size}")
-    
-    consecutive_errors = 0
-    max_consecutive_errors = 3
-    
-    try:
-        while True:
-            batch_query = query.offset(offset).limit(batch_size)
-            
-            try:
-                result: Result = await session.execute(batch_query)
-                batch = result.scalars().all()
-                consecutive_errors = 0
-            except Exception as exc:
-                consecutive_errors += 1
-                
-                if consecutive_errors >= max_consecutive_errors:
-                    raise
-                
-                await asyncio.sleep(0.1 * (2 ** (consecutive_errors - 1)))
-                continue
-            
-            if not batch:
-                break
-            
-            try:
-                yield batch
-            except GeneratorExit:
-                break
-            except Exception as exc:
-                pass
-            
-            total_fetched += len(batch)
-            
-            if max_results is not None and total_fetched >= max_results:
-                break
-            
-            if len(batch) < batch_size:
-                break
-            
-            offset += batch_size
-            
-    except Exception as exc:
-        raise
-    finally:
-        pass
+    async for batch in _stream_batches(
+        session, query, batch_size, max_results, mode, keyset_columns, scalars=True
+    ):
+        yield list(batch)
 
 
 class StreamingQuery(Generic[T]):
@@ -231,6 +327,7 @@ class StreamingQuery(Generic[T]):
         query: Select,
         batch_size: Optional[int] = None,
         max_results: Optional[int] = None,
+        mode: Optional[str] = None,
     ):
         """
         Initialize streaming query.
@@ -240,11 +337,13 @@ class StreamingQuery(Generic[T]):
             query: SQLAlchemy Select query
             batch_size: Number of rows per batch
             max_results: Maximum total results
+            mode: "keyset", "cursor" or "offset" (None = automatic)
         """
         self.session = session
         self.query = query
         self.batch_size = batch_size
         self.max_results = max_results
+        self.mode = mode
         self._iterator: Optional[AsyncIterator[Sequence[T]]] = None
     
     async def __aenter__(self) -> AsyncIterator[Sequence[T]]:
@@ -254,6 +353,7 @@ class StreamingQuery(Generic[T]):
             self.query,
             batch_size=self.batch_size,
             max_results=self.max_results,
+            mode=self.mode,
         )
         return self._iterator
     
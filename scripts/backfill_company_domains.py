@@ -0,0 +1,28 @@
+"""Backfill companies_metadata.normalized_domain from the website column."""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.tasks.company_domain_tasks import backfill_company_normalized_domains
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per committed batch")
+    parser.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches")
+    args = parser.parse_args()
+
+    stats = await backfill_company_normalized_domains(
+        batch_size=args.batch_size,
+        max_batches=args.max_batches,
+    )
+    print(f"✓ Scanned {stats['scanned']} rows, updated {stats['updated']} in {stats['batches']} batches")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,26 @@
+"""Backfill the canonical linkedin_key on contact and company metadata."""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.tasks.linkedin_key_tasks import backfill_linkedin_keys
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per committed batch")
+    parser.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches per table")
+    args = parser.parse_args()
+
+    results = await backfill_linkedin_keys(batch_size=args.batch_size, max_batches=args.max_batches)
+    for table, stats in results.items():
+        print(f"✓ {table}: scanned {stats['scanned']} rows, updated {stats['updated']} in {stats['batches']} batches")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
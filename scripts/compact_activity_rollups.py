@@ -0,0 +1,25 @@
+"""Roll settled user activities up into hourly user_activity_rollups buckets."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.tasks.activity_rollup_tasks import compact_activity_rollups
+
+
+async def main() -> None:
+    stats = await compact_activity_rollups()
+    if stats["from"] is None:
+        print("✓ No activities to compact")
+        return
+    print(
+        f"✓ Compacted {stats['from'].isoformat()} → {stats['to'].isoformat()}: "
+        f"{stats['buckets']} buckets in {stats['chunks']} chunks"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,9 @@
+-- ============================================================================
+-- companies_metadata.normalized_domain index
+-- ============================================================================
+-- Email finder and export domain lookups match normalized_domain by equality.
+-- Create the B-tree index without blocking writes, then backfill existing rows:
+--   python scripts/backfill_company_domains.py
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_companies_metadata_normalized_domain
+    ON companies_metadata (normalized_domain);
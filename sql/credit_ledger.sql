@@ -0,0 +1,19 @@
+-- ============================================================================
+-- Credit ledger
+-- ============================================================================
+-- Append-only history of credit balance changes. Every deduction and addon
+-- purchase updates user_profiles.credits with a single conditional UPDATE and
+-- inserts a row here in the same transaction.
+
+CREATE TABLE IF NOT EXISTS credit_ledger (
+    id BIGSERIAL PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    delta INTEGER NOT NULL,
+    balance_after INTEGER NOT NULL,
+    reason VARCHAR(50) NOT NULL,
+    reference TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_credit_ledger_user_created
+    ON credit_ledger (user_id, created_at);
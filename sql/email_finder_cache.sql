@@ -0,0 +1,25 @@
+-- ============================================================================
+-- Email finder cache
+-- ============================================================================
+-- Email found for a normalized (first name, last name, domain) lookup, keyed
+-- by scope ("global" or the owning user UUID) so repeated finder lookups are
+-- a primary-key read. Expired rows are ignored on read and can be pruned by
+-- expires_at.
+
+CREATE TABLE IF NOT EXISTS email_finder_cache (
+    scope TEXT NOT NULL,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    email TEXT NOT NULL,
+    status VARCHAR(32),
+    source VARCHAR(32),
+    contact_uuid TEXT,
+    found_by TEXT,
+    found_at TIMESTAMPTZ NOT NULL,
+    expires_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (scope, first_name, last_name, domain)
+);
+
+CREATE INDEX IF NOT EXISTS idx_email_finder_cache_expires_at
+    ON email_finder_cache (expires_at);
@@ -0,0 +1,17 @@
+-- ============================================================================
+-- Email verification result store
+-- ============================================================================
+-- Latest verdict per email address, shared by every verification provider so
+-- an address is not verified (and paid for) again while its result is fresh.
+-- Expired rows are ignored on read and can be pruned by expires_at.
+
+CREATE TABLE IF NOT EXISTS email_verification_results (
+    email TEXT PRIMARY KEY,
+    status VARCHAR(32) NOT NULL,
+    provider VARCHAR(64) NOT NULL,
+    verified_at TIMESTAMPTZ NOT NULL,
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_email_verification_results_expires_at
+    ON email_verification_results (expires_at);
@@ -0,0 +1,10 @@
+-- ============================================================================
+-- Export cost and timing columns
+-- ============================================================================
+-- Admission control stores each export's estimated cost in work units and
+-- calibrates seconds per unit from started_at/completed_at of recent
+-- completed exports.
+
+ALTER TABLE user_exports ADD COLUMN IF NOT EXISTS estimated_cost DOUBLE PRECISION;
+ALTER TABLE user_exports ADD COLUMN IF NOT EXISTS started_at TIMESTAMPTZ;
+ALTER TABLE user_exports ADD COLUMN IF NOT EXISTS completed_at TIMESTAMPTZ;
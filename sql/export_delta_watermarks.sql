@@ -0,0 +1,26 @@
+-- ============================================================================
+-- Delta export columns and per-segment watermarks
+-- ============================================================================
+-- Delta exports only write rows whose updated_at is newer than the segment's
+-- watermark, plus a tombstone CSV of deleted UUIDs. user_exports records what
+-- each delta export covered; export_watermarks holds the watermark promoted
+-- when a delta export completes.
+
+ALTER TABLE user_exports ADD COLUMN IF NOT EXISTS is_delta BOOLEAN NOT NULL DEFAULT FALSE;
+ALTER TABLE user_exports ADD COLUMN IF NOT EXISTS segment_key TEXT;
+ALTER TABLE user_exports ADD COLUMN IF NOT EXISTS delta_since TIMESTAMP;
+ALTER TABLE user_exports ADD COLUMN IF NOT EXISTS delta_watermark TIMESTAMP;
+ALTER TABLE user_exports ADD COLUMN IF NOT EXISTS tombstone_file_path TEXT;
+
+CREATE TABLE IF NOT EXISTS export_watermarks (
+    id BIGSERIAL PRIMARY KEY,
+    user_id TEXT NOT NULL REFERENCES users (uuid) ON DELETE CASCADE,
+    export_type export_type NOT NULL,
+    segment_key TEXT NOT NULL,
+    watermark TIMESTAMP,
+    last_export_id TEXT,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_export_watermarks_user_type_segment
+    ON export_watermarks (user_id, export_type, segment_key);
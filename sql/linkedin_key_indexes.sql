@@ -0,0 +1,16 @@
+-- ============================================================================
+-- Canonical LinkedIn key columns and indexes
+-- ============================================================================
+-- LinkedIn lookups match linkedin_key (lowercase URL without scheme, www.,
+-- query string or trailing slash) by equality instead of ILIKE '%url%'.
+-- Add the columns and build the B-tree indexes without blocking writes, then
+-- backfill existing rows:
+--   python scripts/backfill_linkedin_keys.py
+
+ALTER TABLE contacts_metadata ADD COLUMN IF NOT EXISTS linkedin_key TEXT;
+ALTER TABLE companies_metadata ADD COLUMN IF NOT EXISTS linkedin_key TEXT;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contacts_metadata_linkedin_key
+    ON contacts_metadata (linkedin_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_companies_metadata_linkedin_key
+    ON companies_metadata (linkedin_key);
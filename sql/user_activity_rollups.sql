@@ -0,0 +1,20 @@
+-- ============================================================================
+-- Hourly user activity rollups
+-- ============================================================================
+-- Activity stats read per-hour counts from this table and only scan raw
+-- user_activities after the compaction watermark (latest bucket_start + 1h).
+-- Create the table, then compact existing history (re-run hourly from cron):
+--   python scripts/compact_activity_rollups.py
+
+CREATE TABLE IF NOT EXISTS user_activity_rollups (
+    user_id TEXT NOT NULL,
+    bucket_start TIMESTAMPTZ NOT NULL,
+    service_type activity_service_type NOT NULL,
+    action_type activity_action_type NOT NULL,
+    status activity_status NOT NULL,
+    activity_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, bucket_start, service_type, action_type, status)
+);
+
+CREATE INDEX IF NOT EXISTS idx_user_activity_rollups_bucket_start
+    ON user_activity_rollups (bucket_start);